@@ -10,6 +10,7 @@ import {
   type DomainAllowlist,
   type DomainPermissionEntry,
   HEARTBEAT_INTERVAL_MS,
+  type LiveTopic,
   type MemorySection,
   type PageContext,
   RECONNECT_DELAY_MS,
@@ -34,6 +35,9 @@ let heartbeatTimer: ReturnType<typeof setInterval> | null = null;
 let deviceLabel: string | null = null;
 let connectionState: ConnectionState = CS.Disconnected;
 let currentPageContext: PageContext | null = null;
+// Live-update topics the page's visible tab shows — re-sent after every
+// (re)register, since the server drops a reconnected socket's subscription.
+let liveTopics: LiveTopic[] = [];
 
 // Let the trace logger read the live socket state without importing it back.
 setWsStateProvider(() => (ws ? ws.readyState : undefined));
@@ -181,13 +185,13 @@ function handleRuntimeMessage(message: RuntimeMessage): void {
   } else if (message.type === RuntimeMessageType.ScheduleDelete) {
     sendScheduleDelete(message.schedule_id);
   } else if (message.type === RuntimeMessageType.PromptLogsRequest) {
-    requestPromptLogs(message.agent_name, message.offset, message.query, message.flagged_only);
+    requestPromptLogs(message.agent_name, message.page_token, message.query, message.flagged_only);
   } else if (message.type === RuntimeMessageType.MemoriesRequest) {
     requestMemories(message.query);
   } else if (message.type === RuntimeMessageType.MemoryDetailRequest) {
     requestMemoryDetail(message.name, message.query);
   } else if (message.type === RuntimeMessageType.MemoryPageRequest) {
-    requestMemoryPage(message.name, message.section, message.offset, message.query);
+    requestMemoryPage(message.name, message.section, message.page_token, message.query);
   } else if (message.type === RuntimeMessageType.CollectionTrigger) {
     triggerCollection(message.name);
   } else if (message.type === RuntimeMessageType.MemoryCreate) {
@@ -206,6 +210,13 @@ function handleRuntimeMessage(message: RuntimeMessage): void {
     sendCursorSet(message.name, message.log_name, message.last_read_at);
   } else if (message.type === RuntimeMessageType.CursorClear) {
     sendCursorClear(message.name, message.log_name);
+  } else if (message.type === RuntimeMessageType.LiveSubscribe) {
+    liveTopics = message.topics;
+    sendSubscribe();
+  } else if (message.type === RuntimeMessageType.PromptDetailRequest) {
+    requestPromptDetail(message.id);
+  } else if (message.type === RuntimeMessageType.RunDetailRequest) {
+    requestRunDetail(message.run_id);
   }
 }
 
@@ -244,9 +255,12 @@ function connect(): void {
     if (data.type === WsIncomingType.Status && data.connected) {
       setConnectionState(CS.Connected);
       sendRegister();
+      sendSubscribe();
       sendCapabilities();
     } else if (data.type === WsIncomingType.Message) {
       broadcastToSidebar({ type: RuntimeMessageType.ChatMessage, content: data.content });
+    } else if (data.type === WsIncomingType.MessageDelta) {
+      broadcastToSidebar({ type: RuntimeMessageType.ChatDelta, active: data.active, content: data.content });
     } else if (data.type === WsIncomingType.Typing) {
       broadcastToSidebar({ type: RuntimeMessageType.Typing, active: data.active, content: data.content });
     } else if (data.type === WsIncomingType.ToolRequest) {
@@ -284,6 +298,7 @@ function connect(): void {
         type: RuntimeMessageType.PromptLogsResponse,
         runs: data.runs,
         has_more: data.has_more,
+        next_page_token: data.next_page_token,
       });
     } else if (data.type === WsIn.RunOutcomeUpdate) {
       broadcastToSidebar({
@@ -303,8 +318,10 @@ function connect(): void {
         memory: data.memory,
         entries: data.entries,
         entries_has_more: data.entries_has_more,
+        entries_next_page_token: data.entries_next_page_token,
         collector_runs: data.collector_runs,
         collector_runs_has_more: data.collector_runs_has_more,
+        collector_runs_next_page_token: data.collector_runs_next_page_token,
         cursors: data.cursors,
       });
     } else if (data.type === WsIn.MemoryPageResponse) {
@@ -315,12 +332,35 @@ function connect(): void {
         entries: data.entries,
         runs: data.runs,
         has_more: data.has_more,
+        next_page_token: data.next_page_token,
       });
     } else if (data.type === WsIn.MemoryChanged) {
       broadcastToSidebar({
         type: RuntimeMessageType.MemoryChanged,
         name: data.name,
+        entry_count: data.entry_count,
+        new_entries: data.new_entries,
+        more: data.more,
       });
+    } else if (data.type === WsIn.PromptDetailResponse) {
+      broadcastToSidebar({
+        type: RuntimeMessageType.PromptDetailResponse,
+        id: data.id,
+        messages: data.messages,
+        response: data.response,
+        thinking: data.thinking,
+      });
+    } else if (data.type === WsIn.RunDetailResponse) {
+      broadcastToSidebar({
+        type: RuntimeMessageType.RunDetailResponse,
+        run_id: data.run_id,
+        prompts: data.prompts,
+        done: data.done,
+        health: data.health,
+        record: data.record,
+      });
+    } else if (data.type === WsIn.LiveResync) {
+      broadcastToSidebar({ type: RuntimeMessageType.LiveResync, topic: data.topic });
     } else if (data.type === WsIn.CollectionTriggerResult) {
       broadcastToSidebar({
         type: RuntimeMessageType.CollectionTriggerResult,
@@ -382,6 +422,11 @@ function sendRegister(): void {
   ws.send(JSON.stringify({ type: WsOutgoingType.Register, sender: deviceLabel }));
 }
 
+function sendSubscribe(): void {
+  if (!ws || ws.readyState !== WebSocket.OPEN) return;
+  ws.send(JSON.stringify({ type: WsOutgoingType.Subscribe, topics: liveTopics }));
+}
+
 function sendHeartbeat(): void {
   if (!ws || ws.readyState !== WebSocket.OPEN) {
     logStep("heartbeat", "skipped — socket not open");
@@ -442,19 +487,29 @@ function sendScheduleDelete(scheduleId: number): void {
 
 function requestPromptLogs(
   agentName?: string,
-  offset?: number,
+  pageToken?: string,
   query?: string,
   flaggedOnly?: boolean,
 ): void {
   if (!ws || ws.readyState !== WebSocket.OPEN) return;
   const payload: Record<string, unknown> = { type: WsOutgoingType.PromptLogsRequest };
   if (agentName) payload.agent_name = agentName;
-  if (offset) payload.offset = offset;
+  if (pageToken) payload.page_token = pageToken;
   if (query) payload.query = query;
   if (flaggedOnly) payload.flagged_only = true;
   ws.send(JSON.stringify(payload));
 }
 
+function requestPromptDetail(id: number): void {
+  if (!ws || ws.readyState !== WebSocket.OPEN) return;
+  ws.send(JSON.stringify({ type: WsOutgoingType.PromptDetailRequest, id }));
+}
+
+function requestRunDetail(runId: string): void {
+  if (!ws || ws.readyState !== WebSocket.OPEN) return;
+  ws.send(JSON.stringify({ type: WsOutgoingType.RunDetailRequest, run_id: runId }));
+}
+
 function requestMemories(query?: string): void {
   if (!ws || ws.readyState !== WebSocket.OPEN) return;
   const payload: Record<string, unknown> = { type: WsOutgoingType.MemoriesRequest };
@@ -472,7 +527,7 @@ function requestMemoryDetail(name: string, query?: string): void {
 function requestMemoryPage(
   name: string,
   section: MemorySection,
-  offset: number,
+  pageToken: string,
   query?: string,
 ): void {
   if (!ws || ws.readyState !== WebSocket.OPEN) return;
@@ -480,7 +535,7 @@ function requestMemoryPage(
     type: WsOutgoingType.MemoryPageRequest,
     name,
     section,
-    offset,
+    page_token: pageToken,
   };
   if (query) payload.query = query;
   ws.send(JSON.stringify(payload));
@@ -8,6 +8,7 @@ import {
   type DomainAllowlist,
   DomainPermission as DP,
   type DomainPermissionEntry,
+  LiveTopic,
   type MemoryEntryRecord,
   type MemoryRecord,
   type MemorySection,
@@ -18,10 +19,13 @@ import {
   type RunOutcome,
   type RuntimeCollectionTriggerResult,
   type RuntimeConfigParam,
+  type RuntimeMemoryChanged,
   type RuntimeMemoryDetailResponse,
   type RuntimeMemoryPageResponse,
   type RuntimeMessage,
   RuntimeMessageType,
+  type RuntimePromptDetailResponse,
+  type RuntimeRunDetailResponse,
   type ScheduleItem,
   STORAGE_KEY_DOMAIN_ALLOWLIST,
   STORAGE_KEY_TOOL_USE,
@@ -69,10 +73,19 @@ const ACTIVE_TIMEOUT_MS = 60_000;
 
 let allRuns: PromptLogRun[] = [];
 let hasMore = false;
+// Keyset token for the next page of runs — stable while new runs arrive.
+let promptsNextPageToken: string | null = null;
 const runElements = new Map<string, HTMLElement>();
 let activeRunId: string | null = null;
 let activeTimer: ReturnType<typeof setTimeout> | null = null;
 let promptsLoaded = false;
+// Run-index rows and live prompt updates arrive without their messages /
+// response / thinking.  Each such row's placeholder detail waits here, by
+// promptlog id, until an expanded run (run detail) or row (prompt detail)
+// fills it in.
+const promptPlaceholders = new Map<number, { prompt: PromptLogEntry; detail: HTMLElement }[]>();
+const requestedPromptDetails = new Set<number>();
+const requestedRunDetails = new Set<string>();
 
 // --- Memories state ---
 
@@ -94,8 +107,10 @@ let memorySearch = "";
 let activeMemory: MemoryRecord | null = null;
 let memoryEntries: MemoryEntryRecord[] = [];
 let memoryEntriesHasMore = false;
+let memoryEntriesNextPageToken: string | null = null;
 let memoryRuns: PromptLogRun[] = [];
 let memoryRunsHasMore = false;
+let memoryRunsNextPageToken: string | null = null;
 let memoryCursors: CursorRecord[] = [];
 // Name of the collection whose extractor is currently running on demand
 // (drives the "run extractor" button's disabled/spinner state).
@@ -118,8 +133,12 @@ function init(): void {
   }
 
   // Load initial data for the prompts tab (default)
-  requestPromptLogs(0);
+  requestPromptLogs();
   promptsLoaded = true;
+  subscribeLive("prompts");
+  window.addEventListener("pagehide", () => {
+    browser.runtime.sendMessage({ type: RuntimeMessageType.LiveSubscribe, topics: [] });
+  });
 
   // Set up all panel interactions
   setupPrompts();
@@ -137,9 +156,11 @@ function switchTab(tab: Tab): void {
     panel.classList.toggle("hidden", panel.id !== `panel-${tab}`);
   }
 
+  subscribeLive(tab);
+
   // Request data for the activated tab
   if (tab === "prompts" && !promptsLoaded) {
-    requestPromptLogs(0);
+    requestPromptLogs();
     promptsLoaded = true;
   } else if (tab === "memories") {
     requestMemories();
@@ -153,6 +174,14 @@ function switchTab(tab: Tab): void {
   }
 }
 
+// Only the visible tab's live updates are pushed — the server publishes to
+// subscribed topics only, so hidden tabs cost nothing.
+function subscribeLive(tab: Tab): void {
+  const topics: LiveTopic[] =
+    tab === "prompts" ? [LiveTopic.Prompts] : tab === "memories" ? [LiveTopic.Memories] : [];
+  browser.runtime.sendMessage({ type: RuntimeMessageType.LiveSubscribe, topics });
+}
+
 // ============================================================
 // Message handler
 // ============================================================
@@ -167,9 +196,16 @@ function handleMessage(message: RuntimeMessage): void {
       renderPrompts();
     }
     hasMore = message.has_more;
+    promptsNextPageToken = message.next_page_token;
     promptsLoadMore.classList.toggle("hidden", !hasMore);
   } else if (message.type === RuntimeMessageType.PromptLogUpdate) {
     handlePromptUpdate(message.prompt);
+  } else if (message.type === RuntimeMessageType.PromptDetailResponse) {
+    fillPromptDetail(message);
+  } else if (message.type === RuntimeMessageType.RunDetailResponse) {
+    handleRunDetail(message);
+  } else if (message.type === RuntimeMessageType.LiveResync) {
+    handleLiveResync(message.topic);
   } else if (message.type === RuntimeMessageType.RunOutcomeUpdate) {
     handleRunOutcome(message.run_id, message.outcome, message.reason);
   } else if (message.type === RuntimeMessageType.SchedulesResponse) {
@@ -192,7 +228,7 @@ function handleMessage(message: RuntimeMessage): void {
   } else if (message.type === RuntimeMessageType.MemoryPageResponse) {
     handleMemoryPageResponse(message);
   } else if (message.type === RuntimeMessageType.MemoryChanged) {
-    handleMemoryChanged(message.name);
+    handleMemoryChanged(message);
   } else if (message.type === RuntimeMessageType.CollectionTriggerResult) {
     handleCollectionTriggerResult(message);
   }
@@ -218,18 +254,18 @@ function setupPrompts(): void {
         b.classList.toggle("active", b === btn);
       }
       allRuns = [];
-      requestPromptLogs(0);
+      requestPromptLogs();
     });
   }
   promptsLoadMoreBtn.addEventListener("click", () => {
-    requestPromptLogs(allRuns.length);
+    if (promptsNextPageToken) requestPromptLogs(promptsNextPageToken);
   });
   const flaggedToggle = document.getElementById("prompts-flagged-toggle");
   flaggedToggle?.addEventListener("click", () => {
     flaggedOnly = !flaggedOnly;
     flaggedToggle.classList.toggle("active", flaggedOnly);
     allRuns = [];
-    requestPromptLogs(0);
+    requestPromptLogs();
   });
   const search = document.getElementById("prompts-search") as HTMLInputElement | null;
   if (search) {
@@ -246,19 +282,19 @@ function setupPrompts(): void {
         promptsLoadMore.classList.add("hidden");
         promptsLoading.textContent = promptSearch ? "Searching…" : "Loading prompt logs…";
         promptsLoading.classList.remove("hidden");
-        requestPromptLogs(0);
+        requestPromptLogs();
       }, 250);
     });
   }
   wireSearchClear("prompts-search", "prompts-search-clear");
 }
 
-function requestPromptLogs(offset: number): void {
+function requestPromptLogs(pageToken?: string): void {
   const agentName = activeAgentFilter || undefined;
   browser.runtime.sendMessage({
     type: RuntimeMessageType.PromptLogsRequest,
     agent_name: agentName,
-    offset,
+    page_token: pageToken,
     query: promptSearch || undefined,
     flagged_only: flaggedOnly || undefined,
   });
@@ -276,6 +312,8 @@ function handlePromptUpdate(prompt: PromptLogEntry & { run_id: string }): void {
 }
 
 function updateExistingRun(run: PromptLogRun, prompt: PromptLogEntry): void {
+  // A resync's refetched page may already hold this prompt.
+  if (run.prompts.some((p) => p.id === prompt.id)) return;
   run.prompts.push(prompt);
   run.prompt_count = run.prompts.length;
   run.ended_at = prompt.timestamp;
@@ -324,6 +362,88 @@ function insertNewRun(prompt: PromptLogEntry & { run_id: string }): void {
   markRunActive(run.run_id, row);
 }
 
+function fillPromptDetail(full: RuntimePromptDetailResponse | PromptLogEntry): void {
+  const pending = promptPlaceholders.get(full.id);
+  if (!pending) return;
+  promptPlaceholders.delete(full.id);
+  requestedPromptDetails.delete(full.id);
+  for (const { prompt, detail } of pending) {
+    prompt.messages = full.messages;
+    prompt.response = full.response;
+    prompt.thinking = full.thinking;
+    detail.replaceWith(createPromptDetail(prompt));
+  }
+}
+
+// Forget placeholders whose rows a re-render has removed from the page.
+function prunePromptPlaceholders(): void {
+  for (const [id, pending] of promptPlaceholders) {
+    const live = pending.filter(({ detail }) => detail.isConnected);
+    if (live.length > 0) {
+      promptPlaceholders.set(id, live);
+    } else {
+      promptPlaceholders.delete(id);
+      requestedPromptDetails.delete(id);
+    }
+  }
+}
+
+// Expanding a run card from the index fetches its prompts in full — streamed
+// a few per frame, each filling its rows' details as it lands.
+function requestRunDetail(run: PromptLogRun): void {
+  if (requestedRunDetails.has(run.run_id)) return;
+  if (run.prompts.every((p) => promptPlaceholders.get(p.id) === undefined)) return;
+  requestedRunDetails.add(run.run_id);
+  for (const prompt of run.prompts) requestedPromptDetails.add(prompt.id);
+  browser.runtime.sendMessage({ type: RuntimeMessageType.RunDetailRequest, run_id: run.run_id });
+}
+
+// The last frame of a run's detail carries its full health (the index's is
+// classified from light columns) and its record, which gets the Record tab.
+function handleRunDetail(message: RuntimeRunDetailResponse): void {
+  for (const prompt of message.prompts) fillPromptDetail(prompt);
+  if (!message.done) return;
+  requestedRunDetails.delete(message.run_id);
+  for (const run of [...allRuns, ...memoryRuns]) {
+    if (run.run_id !== message.run_id) continue;
+    if (message.health) run.health = message.health;
+    if (message.record) run.record = message.record;
+    const row = runElements.get(run.run_id);
+    if (row) refreshRunAssessment(row, run);
+  }
+}
+
+function refreshRunAssessment(row: HTMLElement, run: PromptLogRun): void {
+  const summary = row.querySelector(".run-summary")!;
+  summary.querySelector(".run-health")?.remove();
+  const badges = createHealthBadges(run.health);
+  if (badges) summary.appendChild(badges);
+
+  const body = row.querySelector(".run-prompts")!;
+  const prompts = body.querySelector<HTMLElement>(".run-view-prompts")!;
+  if (!run.record || run.run_outcome === null || body.querySelector(".run-view-record")) return;
+  const record = createRecordView(run.record);
+  body.insertBefore(createRunViewTabs(prompts, record), prompts);
+  body.appendChild(record);
+}
+
+// The server dropped live updates this page fell behind on — reload the view
+// instead of patching it.
+function handleLiveResync(topic: LiveTopic): void {
+  if (topic === LiveTopic.Prompts) {
+    allRuns = [];
+    requestPromptLogs();
+  } else if (activeMemoryName) {
+    browser.runtime.sendMessage({
+      type: RuntimeMessageType.MemoryDetailRequest,
+      name: activeMemoryName,
+      query: memorySearch || undefined,
+    });
+  } else {
+    requestMemories();
+  }
+}
+
 function handleRunOutcome(runId: string, outcome: RunOutcome, reason: string): void {
   const run = allRuns.find((r) => r.run_id === runId);
   if (!run) return;
@@ -367,6 +487,7 @@ function renderPrompts(): void {
   promptsLoading.classList.add("hidden");
   runsContainer.innerHTML = "";
   runElements.clear();
+  prunePromptPlaceholders();
   if (activeTimer) clearTimeout(activeTimer);
   activeTimer = null;
   activeRunId = null;
@@ -439,7 +560,9 @@ function createRunRow(run: PromptLogRun): HTMLElement {
 
   row.appendChild(summary);
   row.appendChild(createRunBody(run));
-  summary.addEventListener("click", () => row.classList.toggle("expanded"));
+  summary.addEventListener("click", () => {
+    if (row.classList.toggle("expanded")) requestRunDetail(run);
+  });
   return row;
 }
 
@@ -724,7 +847,8 @@ function createPromptRow(prompt: PromptLogEntry, step: number): HTMLElement {
     : '<i class="fa-solid fa-comment"></i>';
   header.appendChild(iconEl);
 
-  const snippet = extractLastTurnSnippet(prompt);
+  const snippet =
+    prompt.snippet !== undefined ? normalizeSnippet(prompt.snippet) : extractLastTurnSnippet(prompt);
   if (snippet) {
     const snippetEl = document.createElement("span");
     snippetEl.className = "prompt-snippet";
@@ -754,23 +878,43 @@ function createPromptRow(prompt: PromptLogEntry, step: number): HTMLElement {
 
   row.appendChild(header);
 
-  const detail = createPromptDetail(prompt);
+  const detail = prompt.messages ? createPromptDetail(prompt) : createPromptDetailPlaceholder();
   row.appendChild(detail);
 
+  if (!prompt.messages) {
+    const pending = promptPlaceholders.get(prompt.id) ?? [];
+    pending.push({ prompt, detail });
+    promptPlaceholders.set(prompt.id, pending);
+  }
+
   header.addEventListener("click", () => {
     row.classList.toggle("expanded");
+    if (promptPlaceholders.has(prompt.id) && !requestedPromptDetails.has(prompt.id)) {
+      requestedPromptDetails.add(prompt.id);
+      browser.runtime.sendMessage({ type: RuntimeMessageType.PromptDetailRequest, id: prompt.id });
+    }
   });
 
   return row;
 }
 
+function createPromptDetailPlaceholder(): HTMLElement {
+  const detail = document.createElement("div");
+  detail.className = "prompt-detail";
+  const loading = document.createElement("div");
+  loading.className = "panel-loading";
+  loading.textContent = "Loading prompt…";
+  detail.appendChild(loading);
+  return detail;
+}
+
 function createPromptDetail(prompt: PromptLogEntry): HTMLElement {
   const detail = document.createElement("div");
   detail.className = "prompt-detail";
 
   // Each turn (one message in this prompt's input) gets a copy button that
   // copies just that turn's JSON, tagged with the promptlog id for lookup.
-  for (const message of prompt.messages) {
+  for (const message of prompt.messages ?? []) {
     const role = String(message.role ?? "unknown");
     const content = extractMessageContent(message);
     detail.appendChild(
@@ -787,7 +931,7 @@ function createPromptDetail(prompt: PromptLogEntry): HTMLElement {
   }
 
   detail.appendChild(
-    createPromptSection("response", renderResponse(prompt.response), () =>
+    createPromptSection("response", renderResponse(prompt.response ?? {}), () =>
       jsonOf({ promptlog_id: prompt.id, response: prompt.response }),
     ),
   );
@@ -892,7 +1036,7 @@ function renderResponse(response: Record<string, unknown>): string {
 const SNIPPET_MAX_CHARS = 80;
 
 function extractLastTurnSnippet(prompt: PromptLogEntry): string {
-  const response = prompt.response as Record<string, unknown>;
+  const response = (prompt.response ?? {}) as Record<string, unknown>;
   const choices = response.choices as Record<string, unknown>[] | undefined;
   if (!choices || choices.length === 0) return "";
   const message = choices[0].message as Record<string, unknown> | undefined;
@@ -953,8 +1097,10 @@ function extractPromptType(run: PromptLogRun): string {
 }
 
 function extractLastUserMessage(prompt: PromptLogEntry): string {
-  for (let i = prompt.messages.length - 1; i >= 0; i--) {
-    const message = prompt.messages[i];
+  if (prompt.user_snippet !== undefined) return normalizeSnippet(prompt.user_snippet);
+  const messages = prompt.messages ?? [];
+  for (let i = messages.length - 1; i >= 0; i--) {
+    const message = messages[i];
     if (message.role !== "user") continue;
     const snippet = normalizeSnippet(message.content as string | null);
     if (snippet) return snippet;
@@ -1410,8 +1556,10 @@ function handleMemoryDetailResponse(message: RuntimeMemoryDetailResponse): void
   activeMemory = message.memory;
   memoryEntries = message.entries;
   memoryEntriesHasMore = message.entries_has_more;
+  memoryEntriesNextPageToken = message.entries_next_page_token;
   memoryRuns = message.collector_runs;
   memoryRunsHasMore = message.collector_runs_has_more;
+  memoryRunsNextPageToken = message.collector_runs_next_page_token;
   memoryCursors = message.cursors;
   showMemoryDetail();
   renderMemoryDetail();
@@ -1423,40 +1571,78 @@ function handleMemoryPageResponse(message: RuntimeMemoryPageResponse): void {
   if (message.section === "collector_runs") {
     memoryRuns = memoryRuns.concat(message.runs);
     memoryRunsHasMore = message.has_more;
+    memoryRunsNextPageToken = message.next_page_token;
   } else {
     memoryEntries = memoryEntries.concat(message.entries);
     memoryEntriesHasMore = message.has_more;
+    memoryEntriesNextPageToken = message.next_page_token;
   }
   renderMemoryDetail();
 }
 
-function requestMemoryPage(section: MemorySection, offset: number): void {
-  if (!activeMemory) return;
+function requestMemoryPage(section: MemorySection): void {
+  const pageToken =
+    section === "collector_runs" ? memoryRunsNextPageToken : memoryEntriesNextPageToken;
+  if (!activeMemory || !pageToken) return;
   browser.runtime.sendMessage({
     type: RuntimeMessageType.MemoryPageRequest,
     name: activeMemory.name,
     section,
-    offset,
+    page_token: pageToken,
     // Keep entry pagination filtered to the active search.
     query: section === "entries" ? memorySearch || undefined : undefined,
   });
 }
 
-function handleMemoryChanged(name: string | null): void {
+function handleMemoryChanged(change: RuntimeMemoryChanged): void {
   // The memories tab might not be visible — refresh data only if it is.
   const memoriesPanel = document.getElementById("panel-memories");
   if (!memoriesPanel || memoriesPanel.classList.contains("hidden")) return;
+  const { name } = change;
   if (activeMemoryName && (name === null || name === activeMemoryName)) {
-    browser.runtime.sendMessage({
-      type: RuntimeMessageType.MemoryDetailRequest,
-      name: activeMemoryName,
-      query: memorySearch || undefined,
-    });
+    if (!patchMemoryDetail(change)) {
+      browser.runtime.sendMessage({
+        type: RuntimeMessageType.MemoryDetailRequest,
+        name: activeMemoryName,
+        query: memorySearch || undefined,
+      });
+    }
   } else if (!activeMemoryName) {
-    requestMemories();
+    if (!patchMemoryCount(change)) requestMemories();
   }
 }
 
+// A change that only added entries — the count grew by exactly the rows the
+// event carries — is applied in place; anything else (edits, deletes, metadata,
+// collector activity, an active search) refetches the view.
+function isPureAppend(change: RuntimeMemoryChanged, memory: MemoryRecord): boolean {
+  const added = change.new_entries ?? [];
+  return (
+    change.entry_count != null &&
+    !change.more &&
+    added.length > 0 &&
+    change.entry_count - memory.entry_count === added.length
+  );
+}
+
+function patchMemoryDetail(change: RuntimeMemoryChanged): boolean {
+  if (!activeMemory || memorySearch || !isPureAppend(change, activeMemory)) return false;
+  const known = new Set(memoryEntries.map((entry) => entry.id));
+  memoryEntries = (change.new_entries ?? []).filter((e) => !known.has(e.id)).concat(memoryEntries);
+  activeMemory.entry_count = change.entry_count!;
+  renderMemoryDetail();
+  return true;
+}
+
+function patchMemoryCount(change: RuntimeMemoryChanged): boolean {
+  if (change.name === null || change.entry_count == null) return false;
+  const memory = allMemories.find((m) => m.name === change.name);
+  if (!memory || !isPureAppend(change, memory)) return false;
+  memory.entry_count = change.entry_count;
+  renderMemoriesList();
+  return true;
+}
+
 function showMemoriesList(): void {
   activeMemoryName = null;
   memoryDetail.classList.add("hidden");
@@ -1930,7 +2116,7 @@ function createCollectorRunsSection(
   }
   if (hasMore) {
     section.appendChild(
-      createLoadMoreButton(() => requestMemoryPage("collector_runs", runs.length)),
+      createLoadMoreButton(() => requestMemoryPage("collector_runs")),
     );
   }
   return section;
@@ -2136,7 +2322,7 @@ function createMemoryEntriesSection(
   }
 
   if (hasMore) {
-    section.appendChild(createLoadMoreButton(() => requestMemoryPage("entries", entries.length)));
+    section.appendChild(createLoadMoreButton(() => requestMemoryPage("entries")));
   }
 
   // Logs are append-only by the system — manual entry add is collection-only.
@@ -54,7 +54,10 @@ export type WsOutgoingType =
   | "entry_delete"
   | "collection_trigger"
   | "cursor_set"
-  | "cursor_clear";
+  | "cursor_clear"
+  | "subscribe"
+  | "prompt_detail_request"
+  | "run_detail_request";
 export const WsOutgoingType = {
   Message: "message",
   ToolResponse: "tool_response",
@@ -83,6 +86,9 @@ export const WsOutgoingType = {
   CollectionTrigger: "collection_trigger",
   CursorSet: "cursor_set",
   CursorClear: "cursor_clear",
+  Subscribe: "subscribe",
+  PromptDetailRequest: "prompt_detail_request",
+  RunDetailRequest: "run_detail_request",
 } as const satisfies Record<string, WsOutgoingType>;
 
 export interface WsOutgoingMessage {
@@ -142,6 +148,7 @@ export type WsOutgoing =
 
 export type WsIncomingType =
   | "message"
+  | "message_delta"
   | "typing"
   | "status"
   | "tool_request"
@@ -157,9 +164,13 @@ export type WsIncomingType =
   | "memory_detail_response"
   | "memory_page_response"
   | "memory_changed"
-  | "collection_trigger_result";
+  | "collection_trigger_result"
+  | "prompt_detail_response"
+  | "live_resync"
+  | "run_detail_response";
 export const WsIncomingType = {
   Message: "message",
+  MessageDelta: "message_delta",
   Typing: "typing",
   Status: "status",
   ToolRequest: "tool_request",
@@ -176,13 +187,30 @@ export const WsIncomingType = {
   MemoryPageResponse: "memory_page_response",
   MemoryChanged: "memory_changed",
   CollectionTriggerResult: "collection_trigger_result",
+  PromptDetailResponse: "prompt_detail_response",
+  LiveResync: "live_resync",
+  RunDetailResponse: "run_detail_response",
 } as const satisfies Record<string, WsIncomingType>;
 
+/** Live-update topics — the addon subscribes to the ones its open tab shows. */
+export type LiveTopic = "prompts" | "memories";
+export const LiveTopic = {
+  Prompts: "prompts",
+  Memories: "memories",
+} as const satisfies Record<string, LiveTopic>;
+
 export interface WsIncomingMessagePayload {
   type: typeof WsIncomingType.Message;
   content: string;
 }
 
+/** The reply decoded so far (active) or its withdrawal (inactive, no content). */
+export interface WsIncomingMessageDeltaPayload {
+  type: typeof WsIncomingType.MessageDelta;
+  active: boolean;
+  content?: string;
+}
+
 export interface WsIncomingTypingPayload {
   type: typeof WsIncomingType.Typing;
   active: boolean;
@@ -262,9 +290,13 @@ export interface PromptLogEntry {
   // The bound collection (collector cycles) / null (chat, schedule), stamped at
   // write time so a live run is labelled from its first prompt.
   run_target: string | null;
-  messages: Record<string, unknown>[];
-  response: Record<string, unknown>;
-  thinking: string;
+  // The heavy half.  The run index and live updates leave it out (fetched when
+  // the run or row is expanded) and send the collapsed row's snippets instead.
+  messages?: Record<string, unknown>[];
+  response?: Record<string, unknown>;
+  thinking?: string;
+  snippet?: string;
+  user_snippet?: string;
   has_tools: boolean;
 }
 
@@ -281,10 +313,14 @@ export interface PromptLogRun {
   run_reason: string | null;
   run_target: string | null;
   // Structural run-health (the same classifier Penny's quality collector reads)
-  // and the concise, copy-pasteable run record.  Present for collector runs.
+  // and the concise, copy-pasteable run record.  The run index classifies
+  // health from its light columns and leaves the record out; both arrive in
+  // full with the run's detail when the card is expanded.
   health: RunHealth;
-  record: string;
+  record?: string;
   prompts: PromptLogEntry[];
+  /** Keyset token for the page that continues after this run. */
+  page_token?: string;
 }
 
 /** First-class outcome of a collector cycle (mirrors penny's RunOutcome). */
@@ -313,6 +349,8 @@ export interface WsIncomingPromptLogsPayload {
   type: typeof WsIncomingType.PromptLogsResponse;
   runs: PromptLogRun[];
   has_more: boolean;
+  /** Keyset token for the next page — send it back instead of an offset. */
+  next_page_token: string | null;
 }
 
 export interface WsIncomingPromptLogUpdatePayload {
@@ -375,10 +413,12 @@ export interface WsIncomingMemoryDetailPayload {
   memory: MemoryRecord;
   entries: MemoryEntryRecord[];
   entries_has_more: boolean;
+  entries_next_page_token: string | null;
   // Collector runs render as the prompts tab's run → prompts → turns cards, so
   // each is a full run, not a flattened record.
   collector_runs: PromptLogRun[];
   collector_runs_has_more: boolean;
+  collector_runs_next_page_token: string | null;
   cursors: CursorRecord[];
 }
 
@@ -391,11 +431,37 @@ export interface WsIncomingMemoryPagePayload {
   entries: MemoryEntryRecord[];
   runs: PromptLogRun[];
   has_more: boolean;
+  next_page_token: string | null;
 }
 
 export interface WsIncomingMemoryChangedPayload {
   type: typeof WsIncomingType.MemoryChanged;
   name: string | null;
+  entry_count?: number | null;
+  new_entries?: MemoryEntryRecord[];
+  more?: boolean;
+}
+
+export interface WsIncomingPromptDetailPayload {
+  type: typeof WsIncomingType.PromptDetailResponse;
+  id: number;
+  messages: Record<string, unknown>[];
+  response: Record<string, unknown>;
+  thinking: string;
+}
+
+export interface WsIncomingRunDetailPayload {
+  type: typeof WsIncomingType.RunDetailResponse;
+  run_id: string;
+  prompts: PromptLogEntry[];
+  done: boolean;
+  health?: RunHealth | null;
+  record?: string | null;
+}
+
+export interface WsIncomingLiveResyncPayload {
+  type: typeof WsIncomingType.LiveResync;
+  topic: LiveTopic;
 }
 
 export interface WsIncomingCollectionTriggerResultPayload {
@@ -407,6 +473,7 @@ export interface WsIncomingCollectionTriggerResultPayload {
 
 export type WsIncomingPayload =
   | WsIncomingMessagePayload
+  | WsIncomingMessageDeltaPayload
   | WsIncomingTypingPayload
   | WsIncomingStatusPayload
   | WsIncomingToolRequestPayload
@@ -422,13 +489,17 @@ export type WsIncomingPayload =
   | WsIncomingMemoryDetailPayload
   | WsIncomingMemoryPagePayload
   | WsIncomingMemoryChangedPayload
-  | WsIncomingCollectionTriggerResultPayload;
+  | WsIncomingCollectionTriggerResultPayload
+  | WsIncomingPromptDetailPayload
+  | WsIncomingRunDetailPayload
+  | WsIncomingLiveResyncPayload;
 
 // --- Runtime messages (sidebar ↔ background) ---
 
 export type RuntimeMessageType =
   | "send_chat"
   | "chat_message"
+  | "chat_delta"
   | "typing"
   | "connection_state"
   | "permission_request"
@@ -468,11 +539,18 @@ export type RuntimeMessageType =
   | "collection_trigger"
   | "collection_trigger_result"
   | "cursor_set"
-  | "cursor_clear";
+  | "cursor_clear"
+  | "live_subscribe"
+  | "live_resync"
+  | "prompt_detail_request"
+  | "prompt_detail_response"
+  | "run_detail_request"
+  | "run_detail_response";
 
 export const RuntimeMessageType = {
   SendChat: "send_chat",
   ChatMessage: "chat_message",
+  ChatDelta: "chat_delta",
   Typing: "typing",
   ConnectionState: "connection_state",
   PermissionRequest: "permission_request",
@@ -513,6 +591,12 @@ export const RuntimeMessageType = {
   CollectionTriggerResult: "collection_trigger_result",
   CursorSet: "cursor_set",
   CursorClear: "cursor_clear",
+  LiveSubscribe: "live_subscribe",
+  LiveResync: "live_resync",
+  PromptDetailRequest: "prompt_detail_request",
+  PromptDetailResponse: "prompt_detail_response",
+  RunDetailRequest: "run_detail_request",
+  RunDetailResponse: "run_detail_response",
 } as const satisfies Record<string, RuntimeMessageType>;
 
 /** Sidebar → background: user typed a chat message */
@@ -528,6 +612,13 @@ export interface RuntimeChatMessage {
   content: string;
 }
 
+/** Background → sidebar: streaming reply preview (replaced by the final chat_message) */
+export interface RuntimeChatDelta {
+  type: typeof RuntimeMessageType.ChatDelta;
+  active: boolean;
+  content?: string;
+}
+
 /** Background → sidebar: typing indicator */
 export interface RuntimeTyping {
   type: typeof RuntimeMessageType.Typing;
@@ -655,7 +746,8 @@ export interface RuntimeScheduleDelete {
 export interface RuntimePromptLogsRequest {
   type: typeof RuntimeMessageType.PromptLogsRequest;
   agent_name?: string;
-  offset?: number;
+  /** Continue after the page this token came from; omit for the first page. */
+  page_token?: string;
   /** Substring filter over each run's sent messages / response / thinking. */
   query?: string;
   /** Keep only regressive runs (a bail / incomplete / tool-failure / half-formed send). */
@@ -667,6 +759,7 @@ export interface RuntimePromptLogsResponse {
   type: typeof RuntimeMessageType.PromptLogsResponse;
   runs: PromptLogRun[];
   has_more: boolean;
+  next_page_token: string | null;
 }
 
 /** Background → prompts page: single prompt logged in real time */
@@ -707,15 +800,18 @@ export interface RuntimeMemoryDetailRequest {
 /** Background → memories tab: drill-in payload (metadata + first page of
  *  entries + first page of this collection's matching ``collector-runs``
  *  entries — empty for logs).  Each section paginates independently; the
- *  ``*_has_more`` flags drive the per-section "load more" controls. */
+ *  ``*_has_more`` flags drive the per-section "load more" controls, which send
+ *  the matching ``*_next_page_token`` back. */
 export interface RuntimeMemoryDetailResponse {
   type: typeof RuntimeMessageType.MemoryDetailResponse;
   memory: MemoryRecord;
   entries: MemoryEntryRecord[];
   entries_has_more: boolean;
+  entries_next_page_token: string | null;
   /** Full runs (run → prompts → turns), rendered with the prompts-tab cards. */
   collector_runs: PromptLogRun[];
   collector_runs_has_more: boolean;
+  collector_runs_next_page_token: string | null;
   /** Read positions over the logs this collection reads (empty for logs). */
   cursors: CursorRecord[];
 }
@@ -725,7 +821,8 @@ export interface RuntimeMemoryPageRequest {
   type: typeof RuntimeMessageType.MemoryPageRequest;
   name: string;
   section: MemorySection;
-  offset: number;
+  /** The section's ``next_page_token`` from the previous page. */
+  page_token: string;
   /** Active list search — keeps entry pagination filtered to matches. */
   query?: string;
 }
@@ -739,12 +836,18 @@ export interface RuntimeMemoryPageResponse {
   entries: MemoryEntryRecord[];
   runs: PromptLogRun[];
   has_more: boolean;
+  next_page_token: string | null;
 }
 
-/** Background → memories tab: a memory was mutated, refresh */
+/** Background → memories tab: a memory was mutated.  Changes are coalesced
+ *  per memory; ``entry_count`` and ``new_entries`` (created since the last
+ *  event, newest first) let the view patch itself instead of refetching. */
 export interface RuntimeMemoryChanged {
   type: typeof RuntimeMessageType.MemoryChanged;
   name: string | null;
+  entry_count?: number | null;
+  new_entries?: MemoryEntryRecord[];
+  more?: boolean;
 }
 
 /** Memories tab → background: run a collection's extractor on demand */
@@ -834,9 +937,54 @@ export interface RuntimeEntryDelete {
   key: string;
 }
 
+/** Page → background: the live-update topics the visible tab shows */
+export interface RuntimeLiveSubscribe {
+  type: typeof RuntimeMessageType.LiveSubscribe;
+  topics: LiveTopic[];
+}
+
+/** Background → page: live updates for a topic were dropped, refetch it */
+export interface RuntimeLiveResync {
+  type: typeof RuntimeMessageType.LiveResync;
+  topic: LiveTopic;
+}
+
+/** Prompts page → background: fetch an expanded prompt's full messages */
+export interface RuntimePromptDetailRequest {
+  type: typeof RuntimeMessageType.PromptDetailRequest;
+  id: number;
+}
+
+/** Background → prompts page: one prompt's messages, response and thinking */
+export interface RuntimePromptDetailResponse {
+  type: typeof RuntimeMessageType.PromptDetailResponse;
+  id: number;
+  messages: Record<string, unknown>[];
+  response: Record<string, unknown>;
+  thinking: string;
+}
+
+/** Page → background: fetch an expanded run's prompts in full */
+export interface RuntimeRunDetailRequest {
+  type: typeof RuntimeMessageType.RunDetailRequest;
+  run_id: string;
+}
+
+/** Background → page: one chunk of a run's prompts, oldest first; the last
+ *  (``done``) carries the run's full health and record */
+export interface RuntimeRunDetailResponse {
+  type: typeof RuntimeMessageType.RunDetailResponse;
+  run_id: string;
+  prompts: PromptLogEntry[];
+  done: boolean;
+  health?: RunHealth | null;
+  record?: string | null;
+}
+
 export type RuntimeMessage =
   | RuntimeSendChat
   | RuntimeChatMessage
+  | RuntimeChatDelta
   | RuntimeTyping
   | RuntimeConnectionState
   | RuntimePermissionRequest
@@ -876,7 +1024,13 @@ export type RuntimeMessage =
   | RuntimeEntryUpdate
   | RuntimeEntryDelete
   | RuntimeCursorSet
-  | RuntimeCursorClear;
+  | RuntimeCursorClear
+  | RuntimeLiveSubscribe
+  | RuntimeLiveResync
+  | RuntimePromptDetailRequest
+  | RuntimePromptDetailResponse
+  | RuntimeRunDetailRequest
+  | RuntimeRunDetailResponse;
 
 // --- Domain permissions ---
 
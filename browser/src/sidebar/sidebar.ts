@@ -112,6 +112,7 @@ function handleBackgroundMessage(message: RuntimeMessage): void {
     setStatus(message.state);
   } else if (message.type === RuntimeMessageType.ChatMessage) {
     setTyping(false);
+    setStreaming(false);
     let content = message.content;
     if (pendingPageRef) {
       content = buildPageHeader(pendingPageRef) + content.replace(/<img[^>]*><br>/g, "");
@@ -119,6 +120,8 @@ function handleBackgroundMessage(message: RuntimeMessage): void {
     }
     addMessage(content, MS.Penny);
     setInputEnabled(true);
+  } else if (message.type === RuntimeMessageType.ChatDelta) {
+    setStreaming(message.active, message.content);
   } else if (message.type === RuntimeMessageType.Typing) {
     setTyping(message.active, message.content);
   } else if (message.type === RuntimeMessageType.PermissionRequest) {
@@ -300,7 +303,28 @@ function typingHTML(text: string): string {
     .join("<br>");
 }
 
+/** Show the reply decoded so far in a provisional bubble (not persisted —
+ * the final chat_message replaces it), or drop the bubble when inactive. */
+function setStreaming(active: boolean, content?: string): void {
+  let bubble = document.getElementById("streaming");
+  if (!active) {
+    bubble?.remove();
+    return;
+  }
+  setTyping(false);
+  if (!bubble) {
+    bubble = document.createElement("div");
+    bubble.id = "streaming";
+    bubble.className = `message ${MS.Penny}`;
+    messagesEl.appendChild(bubble);
+  }
+  bubble.innerHTML = content ?? "";
+  messagesEl.scrollTop = messagesEl.scrollHeight;
+}
+
 function setTyping(active: boolean, content?: string): void {
+  // The streaming bubble already shows Penny is answering.
+  if (active && document.getElementById("streaming")) return;
   const text = content ?? "Penny is thinking";
   const isToolStatus = content != null && content.includes("<br>");
   let indicator = document.getElementById("typing");
@@ -3,7 +3,10 @@ set -e
 
 PROD_DB="/penny/data/penny/penny.db"
 
-# Create production backup only when SNAPSHOT=1 (set by make up / make prod)
+# Create production backup only when SNAPSHOT=1 (set by make up / make prod).
+# The snapshot is penny.db alone: browsed image bytes live beside it in
+# /penny/data/penny/media/ and aren't copied. Restoring an old snapshot is
+# safe — a media row whose blob is missing is just sent without its image.
 if [ "${SNAPSHOT:-0}" = "1" ] && [ -f "$PROD_DB" ]; then
     BACKUP_DIR="/penny/data/penny/backups"
     mkdir -p "$BACKUP_DIR"
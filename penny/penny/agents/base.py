@@ -11,18 +11,29 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any, assert_never
 
+from penny.agents.context_budget import ContextBudget
 from penny.agents.models import ChatMessage, ControllerResponse, MessageRole, ToolCallRecord
+from penny.agents.reply_stream import ReplyStream
 from penny.config import Config
 from penny.constants import PennyConstants
 from penny.database import Database
-from penny.llm import LlmClient
-from penny.llm.models import LlmError, LlmResponse, LlmTimeoutError, LlmToolParseError
+from penny.llm import LlmClient, ModelTiers
+from penny.llm.models import (
+    LlmDegenerateOutputError,
+    LlmError,
+    LlmResponse,
+    LlmTimeoutError,
+    LlmToolParseError,
+)
+from penny.llm.streaming import DegenerateStreamGuard
+from penny.llm.tokens import estimate_message_tokens, estimate_tokens
 from penny.prompts import Prompt
 from penny.responses import PennyResponse
 from penny.text_validity import is_degenerate_run
 from penny.tools import Tool, ToolCall, ToolExecutor, ToolRegistry
 from penny.tools.browse import BrowseTool
 from penny.tools.memory_tools import CursorReadTool, DoneTool, build_memory_tools
+from penny.tools.page_cache import PageCache
 from penny.tools.send_message import SendMessageTool
 from penny.validation import (
     ConditionKey,
@@ -136,6 +147,7 @@ class Agent:
         embedding_model_client: LlmClient | None = None,
         allow_repeat_tools: bool = False,
         *,
+        small_model_client: LlmClient | None = None,
         system_prompt: str | None = None,
         tools: list[Tool] | None = None,
     ):
@@ -154,12 +166,25 @@ class Agent:
         self._model_client = model_client
         self._vision_model_client = vision_model_client
         self._embedding_model_client = embedding_model_client
+        # The tier serving the current run: the small model when
+        # ``SMALL_MODEL_TASKS`` names this agent or its collection, until a
+        # rejected output escalates the rest of the run to the main model.
+        self._small_model_client = small_model_client
+        self._tier_client = model_client
 
         self._browse_tool: BrowseTool | None = None
         self._browse_provider: Callable[[], Any] | None = None
+        # Shared by every agent's BrowseTool so one agent's reads serve another's.
+        self._page_cache: PageCache | None = None
         self._channel: MessageChannel | None = None
         self._current_user: str | None = None
         self._tool_result_text: list[str] = []
+        # Unbudgeted outside a chat turn — ChatAgent.handle installs a real
+        # budget for the turn it assembles (see ``context_budget``).
+        self._context_budget = ContextBudget(0)
+        # Set by ChatAgent.handle for a turn whose channel previews replies;
+        # when present every model call streams (see ``reply_stream``).
+        self._reply_stream: ReplyStream | None = None
 
         if system_prompt is not None:
             self.system_prompt = system_prompt
@@ -284,6 +309,11 @@ class Agent:
         """Cap on agentic loop iterations — reads the shared runtime config."""
         return int(self.config.runtime.MAX_STEPS)
 
+    def hedge_percentile(self) -> int:
+        """Latency percentile past which model calls are hedged to a second
+        endpoint (0 = never).  Only the foreground chat agent hedges."""
+        return 0
+
     # ── Agentic loop entry ───────────────────────────────────────────────
 
     async def run(
@@ -309,6 +339,7 @@ class Agent:
         if run_id is None:
             run_id = uuid.uuid4().hex
         self._tool_result_text = []
+        self._tier_client = self._model_tiers.client_for(self.name, self._memory_scope())
         messages = self._build_messages(prompt, history, system_prompt, injected_context)
         tools = self._tool_registry.get_ollama_tools()
         return await self._run_agentic_loop(
@@ -330,6 +361,10 @@ class Agent:
         source_urls: list[str] = []
         called_tools: set[tuple[str, ...]] = set()
         tool_call_records: list[ToolCallRecord] = []
+        # The messages the loop was handed (system prompt, history, opening turn)
+        # are the cached prefix — compaction never touches them.
+        prefix_length = len(messages)
+        elided_tokens = 0
 
         for step in range(steps):
             logger.info("Agent step %d/%d", step + 1, steps)
@@ -337,6 +372,8 @@ class Agent:
             # preventing context growth beyond what the 1-per-step case allows.
             is_final_step = step == steps - 1 or len(tool_call_records) >= steps - 1
             step_tools = self._tools_for_step(tools, is_final_step)
+            elided_tokens += self._compact_context(messages, prefix_length, called_tools)
+            self._report_prompt_size(step, messages, elided_tokens)
 
             response = await self._call_model_validated(messages, step_tools, run_id, prompt_type)
             if response is None:
@@ -533,22 +570,25 @@ class Agent:
         ``Proceed`` returns the (possibly-repaired) response.  Tool-call responses
         with tools available short-circuit unvalidated.  ``LlmToolParseError``
         (no response to inspect) routes through the same retried-set bookkeeping
-        as a ``TOOL_PARSE_ERROR`` retry.
+        as a ``TOOL_PARSE_ERROR`` retry.  Escalating off the small model isn't a
+        retry: the main model's answer doesn't count against the budget.
         """
         max_retries = PennyConstants.RESPONSE_VALIDATION_RETRIES
         effective_tools = tools if tools else None
         retried: set[ConditionKey] = set()
         response = None
 
-        for attempt in range(max_retries):
+        attempt = 0
+        while attempt < max_retries:
             try:
                 response = await self._invoke_nondegenerate(
                     messages, effective_tools, run_id, prompt_type
                 )
             except LlmToolParseError:
-                if self._retry_tool_parse_error(messages, retried, attempt, max_retries):
-                    continue
-                return None
+                if not self._retry_tool_parse_error(messages, retried, attempt, max_retries):
+                    return None
+                attempt += 1
+                continue
             if response is None:
                 return None
 
@@ -567,6 +607,8 @@ class Agent:
                 case Proceed(response=validated):
                     return validated if validated is not None else response
                 case Retry(condition=condition, nudge=nudge):
+                    if self._escalate_tier(condition):
+                        continue
                     # Append the post-repair response (tool calls stripped when
                     # tools were unavailable) — the chain may have stripped a
                     # hallucinated call before a content validator asked to retry.
@@ -574,6 +616,7 @@ class Agent:
                     self._apply_retry(
                         messages, appended, condition, nudge, retried, attempt, max_retries
                     )
+                    attempt += 1
                 case Repair() | RejectToolCall() | NudgeContinue() | Stop():
                     raise AssertionError("response validators produced an unexpected disposition")
                 case unreachable:
@@ -659,13 +702,27 @@ class Agent:
         Re-raises ``LlmToolParseError`` so ``_call_model_validated`` can inject a
         format nudge and retry — the model needs a different message, not the same one.
 
+        An error from the small model escalates the run to the main model, which
+        answers in its place — as ``ModelTiers.generate`` does.
+
         Timeouts are logged at WARNING — they're transient (the model may be slow
         or temporarily busy) and are already retried by the LLM client before
         this method is called.  Other LlmErrors (connection refused, server error,
         model not found) are logged at ERROR.
+
+        Every call streams through a ``DegenerateStreamGuard``, which cuts the
+        decode off at the first token of a degeneration collapse and raises
+        ``LlmDegenerateOutputError`` — re-raised for ``_invoke_nondegenerate`` to
+        re-roll.  With a ``ReplyStream`` bound, clean answer tokens are also
+        forwarded as they decode; the returned response is the assembled whole.
         """
+        forward = None
+        if self._reply_stream is not None:
+            await self._reply_stream.start_decode()
+            forward = self._reply_stream.on_delta
+        guard = DegenerateStreamGuard(forward)
         try:
-            return await self._model_client.chat(
+            return await self._tier_client.chat(
                 messages=messages,
                 tools=effective_tools,
                 agent_name=self.name,
@@ -675,14 +732,22 @@ class Agent:
                 # known from the first prompt — stamp it on every row so the run
                 # is identifiable at write time, not retroactively at cycle end.
                 run_target=self._memory_scope(),
+                on_delta=guard.on_delta,
+                hedge_percentile=self.hedge_percentile(),
             )
-        except LlmToolParseError:
+        except LlmDegenerateOutputError:
             raise
-        except LlmTimeoutError as exception:
-            logger.warning("LLM request timed out (model slow or temporarily busy): %s", exception)
-            return None
         except LlmError as exception:
-            logger.error("LLM chat failed: %s", exception)
+            if self._escalate_tier(str(exception)):
+                return await self._invoke_model(messages, effective_tools, run_id, prompt_type)
+            if isinstance(exception, LlmToolParseError):
+                raise
+            if isinstance(exception, LlmTimeoutError):
+                logger.warning(
+                    "LLM request timed out (model slow or temporarily busy): %s", exception
+                )
+            else:
+                logger.error("LLM chat failed: %s", exception)
             return None
 
     async def _invoke_nondegenerate(
@@ -706,21 +771,51 @@ class Agent:
         returns ``None`` so the caller throws out the whole run rather than act on,
         or store, poison.  ``LlmToolParseError`` propagates unchanged — the
         format-nudge retry in ``_call_model_validated`` still owns that path.
+
+        Most collapses never reach the post-hoc check: the stream guard aborts
+        them mid-decode, so a collapse costs the tokens up to it rather than a
+        full decode to the token cap.  The check stays as the backstop for
+        anything the incremental watch can't judge until the output is complete.
+        Escalating off the small model isn't a re-roll and isn't counted as one.
         """
         attempts = PennyConstants.DEGENERATE_REROLL_ATTEMPTS
-        for attempt in range(attempts):
-            response = await self._invoke_model(messages, effective_tools, run_id, prompt_type)
-            if response is None or not self._response_is_degenerate(response):
-                return response
+        attempt = 0
+        while attempt < attempts:
+            try:
+                response = await self._invoke_model(messages, effective_tools, run_id, prompt_type)
+            except LlmDegenerateOutputError as exception:
+                reason = str(exception)
+            else:
+                if response is None or not self._response_is_degenerate(response):
+                    return response
+                reason = ConditionKey.DEGENERATE_OUTPUT
+            if self._escalate_tier(reason):
+                continue
             logger.warning(
                 "Degenerate model output (%s) — discarding and re-rolling %d/%d",
-                ConditionKey.DEGENERATE_OUTPUT,
+                reason,
                 attempt + 1,
                 attempts,
             )
+            attempt += 1
         logger.error("Model output still degenerate after %d re-rolls — aborting run", attempts)
         return None
 
+    @property
+    def _model_tiers(self) -> ModelTiers:
+        return ModelTiers(self._model_client, self._small_model_client, self.config.runtime)
+
+    def _escalate_tier(self, reason: str) -> bool:
+        """Move the rest of the run from the small model to the main one after
+        the small model's output was rejected.  Returns False when the run is
+        already on the main model — the caller retries as usual.  The rejected
+        output is dropped and the main model answers the unchanged context."""
+        if self._tier_client is self._model_client:
+            return False
+        self._model_tiers.log_escalation(self.name, reason)
+        self._tier_client = self._model_client
+        return True
+
     @staticmethod
     def _response_is_degenerate(response: LlmResponse) -> bool:
         """True if the raw output — text content OR any tool-call argument — carries
@@ -744,7 +839,7 @@ class Agent:
         if not content:
             logger.error(
                 "Model returned empty content! model=%s, preceding_tool_calls=%d",
-                self._model_client.model,
+                self._tier_client.model,
                 len(tool_call_records),
             )
             fallback = (
@@ -786,6 +881,143 @@ class Agent:
             tool_calls=tool_call_records,
         )
 
+    # ── Intra-run context compaction ─────────────────────────────────────
+
+    def _compact_context(
+        self, messages: list[dict], prefix_length: int, called_tools: set[tuple[str, ...]]
+    ) -> int:
+        """Compact the loop's own turns in place before they're resent; return the
+        estimated tokens removed.
+
+        Every step re-sends the whole conversation, so without this a browse-heavy
+        run pays prefill for every earlier page on every later step.  The first
+        ``prefix_length`` messages are never touched — the server's KV cache keeps
+        hitting on them byte-for-byte.  Past them, inline reasoning is stripped from
+        assistant turns (``to_input_message`` already drops the ``thinking``
+        field), and earlier tool results beyond ``TOOL_RESULT_TOKEN_BUDGET`` are
+        digested.  Both are sticky: a turn is changed at most once, so a compaction
+        only invalidates the cache from the first turn it changed onward.
+        """
+        elided = self._strip_resent_thinking(messages, prefix_length)
+        budget = int(self.config.runtime.TOOL_RESULT_TOKEN_BUDGET)
+        if budget > 0:
+            elided += self._digest_old_tool_results(messages, prefix_length, called_tools, budget)
+        return elided
+
+    @staticmethod
+    def _report_prompt_size(step: int, messages: list[dict], elided_tokens: int) -> None:
+        """Log the step's estimated prompt size, after and before compaction."""
+        after = estimate_message_tokens(messages)
+        logger.info(
+            "Step %d prompt ~%d tokens (~%d before compaction)",
+            step + 1,
+            after,
+            after + elided_tokens,
+        )
+
+    @staticmethod
+    def _strip_resent_thinking(messages: list[dict], prefix_length: int) -> int:
+        """Drop reasoning from the loop's assistant turns — a ``thinking`` field or
+        inline ``<think>`` blocks in the content.  The model never needs its own
+        past reasoning to act on its past tool calls."""
+        elided = 0
+        for message in messages[prefix_length:]:
+            if message.get("role") != MessageRole.ASSISTANT:
+                continue
+            thinking = message.pop("thinking", None) or ""
+            content = message.get("content") or ""
+            if "<think" in content:
+                message["content"], inline = strip_think_tags(content)
+                thinking += inline or ""
+            elided += estimate_tokens(thinking)
+        return elided
+
+    def _digest_old_tool_results(
+        self,
+        messages: list[dict],
+        prefix_length: int,
+        called_tools: set[tuple[str, ...]],
+        budget: int,
+    ) -> int:
+        """Digest earlier tool results once their undigested total passes ``budget``.
+
+        Only results the model has already answered (those before the last
+        assistant turn) are candidates — the latest step's results always go out
+        whole.  Once over budget, the newest results are kept up to half of it and
+        every older one is digested, so the next compaction is several steps away
+        rather than one (each moves the cache boundary back to the first turn it
+        changed)."""
+        candidates = self._answered_tool_results(messages, prefix_length)
+        if sum(tokens for _, tokens in candidates) <= budget:
+            return 0
+        elided = kept = 0
+        keeping = True
+        for index, tokens in reversed(candidates):
+            keeping = keeping and kept + tokens <= budget // 2
+            if keeping:
+                kept += tokens
+            else:
+                elided += self._digest_tool_result(messages, index, called_tools)
+        return elided
+
+    @staticmethod
+    def _answered_tool_results(messages: list[dict], prefix_length: int) -> list[tuple[int, int]]:
+        """``(index, estimated tokens)`` of each undigested tool result the model
+        has already seen a response to, oldest first."""
+        last_assistant = max(
+            (i for i, m in enumerate(messages) if m.get("role") == MessageRole.ASSISTANT),
+            default=-1,
+        )
+        return [
+            (index, estimate_tokens(messages[index].get("content") or ""))
+            for index in range(prefix_length, last_assistant)
+            if messages[index].get("role") == MessageRole.TOOL
+            and PennyConstants.COMPACTED_RESULT_MARKER not in (messages[index].get("content") or "")
+        ]
+
+    def _digest_tool_result(
+        self, messages: list[dict], index: int, called_tools: set[tuple[str, ...]]
+    ) -> int:
+        """Replace one tool result with its digest; return the tokens saved.
+
+        The originating call's dedup key is released so the model can repeat the
+        call to re-open the full result — the digest tells it so."""
+        message = messages[index]
+        content = message.get("content") or ""
+        message["content"] = self._tool_result_digest(content)
+        self._release_call_key(messages, index, called_tools)
+        return estimate_tokens(content) - estimate_tokens(message["content"])
+
+    @staticmethod
+    def _tool_result_digest(content: str) -> str:
+        """A compacted stand-in for a framed tool result: the framing line, the
+        body's first line, and every ``## `` section header (for browse, the
+        ``## browse: <url>`` lines the run-health tally counts), closed by the
+        compaction marker."""
+        lines = content.splitlines()
+        kept = lines[:2] + [line for line in lines[2:] if line.startswith("## ")]
+        note = (
+            f"{PennyConstants.COMPACTED_RESULT_MARKER} ~{estimate_tokens(content)} tokens "
+            "elided to save context — repeat the same call to read it in full]"
+        )
+        return "\n".join([*kept, note])
+
+    def _release_call_key(
+        self, messages: list[dict], index: int, called_tools: set[tuple[str, ...]]
+    ) -> None:
+        """Drop the dedup key of the call that produced ``messages[index]`` —
+        found on the nearest preceding assistant turn carrying its ``tool_call_id``."""
+        tool_call_id = messages[index].get("tool_call_id")
+        for message in reversed(messages[:index]):
+            for tool_call in message.get("tool_calls") or []:
+                if tool_call.get("id") != tool_call_id:
+                    continue
+                function = tool_call.get("function") or {}
+                arguments = json.loads(function.get("arguments") or "{}")
+                arguments.pop("reasoning", None)
+                called_tools.discard(self._make_call_key(function.get("name") or "", arguments))
+                return
+
     # ── Tool management ──────────────────────────────────────────────────
 
     def set_channel(self, channel: MessageChannel) -> None:
@@ -841,6 +1073,8 @@ class Agent:
             db=self.db,
             embedding_client=self._embedding_model_client,
             author=author,
+            page_cache=self._page_cache,
+            page_token_budget=int(self.config.runtime.BROWSE_PAGE_TOKEN_BUDGET),
         )
         if self._browse_provider:
             tool.set_browse_provider(self._browse_provider)
@@ -1147,7 +1381,9 @@ class Agent:
         ends with the entry count so the model has a sense of which
         collections / logs are worth pulling from.  Goes in every
         agent's system prompt — chat and background alike — so the model
-        never needs to call ``list_memories``.
+        never needs to call ``list_memories``.  Never fitted to the turn's
+        ``ContextBudget``: it sits in the cached system prefix, which must
+        not change with how much the turn's volatile sections used.
         """
         memories = sorted(
             (m for m in self.db.memories.list_all() if not m.archived),
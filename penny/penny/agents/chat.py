@@ -14,8 +14,10 @@ from typing import TYPE_CHECKING, Any
 from similarity.embeddings import cosine_similarity, deserialize_embedding
 
 from penny.agents.base import Agent
+from penny.agents.context_budget import ContextBudget, ContextSectionName
 from penny.agents.models import ControllerResponse
-from penny.channels.base import PageContext
+from penny.agents.reply_stream import ReplyStream
+from penny.channels.base import PageContext, ReplyPreview
 from penny.constants import ChatPromptType, PennyConstants
 from penny.database.memory import Inclusion, Memory, RecallMode
 from penny.database.models import MemoryEntry
@@ -66,6 +68,9 @@ class ChatAgent(Agent):
         """Bind the Collector so test_extraction_prompt is available in chat."""
         self._collector = collector
 
+    def hedge_percentile(self) -> int:
+        return int(self.config.runtime.CHAT_HEDGE_PERCENTILE)
+
     def get_tools(self) -> list[Tool]:
         tools = super().get_tools()
         if self._collector is not None:
@@ -82,24 +87,33 @@ class ChatAgent(Agent):
         page_context: PageContext | None = None,
         quoted_text: str | None = None,
         on_tool_start: Callable[[list[tuple[str, dict]]], Awaitable[None]] | None = None,
+        reply_preview: ReplyPreview | None = None,
     ) -> ControllerResponse:
         """Handle an incoming message — summary method.
 
-        Builds context, processes images, runs agentic loop.
+        Builds context, processes images, runs agentic loop.  The turn's
+        variable context is fitted to ``CONTEXT_TOKEN_BUDGET`` section by
+        section, in priority order (see ``context_budget``).  With a
+        ``reply_preview`` the turn's model calls stream and the answer is
+        shown as it decodes (see ``reply_stream``).
         """
         self._current_user = sender
-        self._pending_page_context = page_context
+        self._context_budget = ContextBudget(int(self.config.runtime.CONTEXT_TOKEN_BUDGET))
+        self._reply_stream = ReplyStream(reply_preview) if reply_preview is not None else None
         try:
             content, has_images = await self._process_images(content, images)
-            history = self.get_history(sender, quoted_text=quoted_text)
+            # Fit order is budget priority: history, page, recall.
+            history = self._fit_history(self.get_history(sender, quoted_text=quoted_text))
+            self._pending_page_context = self._fit_page_context(page_context)
 
             if has_images:
                 logger.info("Handling vision message from %s", sender)
                 self._install_tools([])
+                injected_context = await self._build_injected_context(sender, content)
                 system_prompt = await self._build_system_prompt(
                     sender, instructions=Prompt.VISION_RESPONSE_PROMPT
                 )
-                injected_context = await self._build_injected_context(sender, content)
+                self._context_budget.log_allocation()
                 return await self.run(
                     prompt=content,
                     history=history,
@@ -111,8 +125,9 @@ class ChatAgent(Agent):
 
             logger.info("Handling message from %s (conversation mode)", sender)
             self._install_tools(self.get_tools())
-            system_prompt = await self._build_system_prompt(sender)
             injected_context = await self._build_injected_context(sender, content)
+            system_prompt = await self._build_system_prompt(sender)
+            self._context_budget.log_allocation()
             return await self.run(
                 prompt=content,
                 max_steps=self.get_max_steps(),
@@ -125,6 +140,42 @@ class ChatAgent(Agent):
         finally:
             self._current_user = None
             self._pending_page_context = None
+            self._context_budget = ContextBudget(0)
+            self._reply_stream = None
+
+    async def prefix_probe(self) -> tuple[list[dict], list[dict]]:
+        """A minimal conversation-mode request: the turn's cacheable prefix
+        (system prompt + tool schemas) followed by a one-character user turn.
+
+        ``PrefixWarmer`` sends it to keep that prefix in the server's KV cache.
+        Built without installing the tools, so a turn in flight is unaffected.
+        """
+        sender = self.db.users.get_primary_sender()
+        system_prompt = await self._build_system_prompt(sender)
+        messages = self._build_messages(
+            PennyConstants.PREFIX_WARM_PROBE, system_prompt=system_prompt
+        )
+        tools = [tool.to_ollama_tool() for tool in self.get_tools()]
+        return messages, tools
+
+    def _fit_history(self, history: list[tuple[str, str]] | None) -> list[tuple[str, str]] | None:
+        """Budget the conversation history, newest turns ranked first — a cut
+        drops the oldest turns, never a gap in the middle."""
+        if not history:
+            return history
+        kept = self._context_budget.fit(
+            ContextSectionName.HISTORY, [content for _, content in reversed(history)]
+        )
+        return history[len(history) - len(kept) :] or None
+
+    def _fit_page_context(self, page_context: PageContext | None) -> PageContext | None:
+        """Budget the browser page text, truncating it to what's left."""
+        if page_context is None or not page_context.text:
+            return page_context
+        kept = self._context_budget.fit(
+            ContextSectionName.PAGE, [page_context.text], truncatable=True
+        )
+        return page_context.model_copy(update={"text": kept[0] if kept else ""})
 
     # ── Message building ────────────────────────────────────────────────
 
@@ -279,6 +330,10 @@ class ChatAgent(Agent):
         ``db.memories.active_memories()`` — the renderers call methods on it and
         log-only behaviour (temporal-neighbor expansion) is the object's own
         override, so this path never branches on the memory's shape.
+
+        The rendered entries are then fitted to the turn's ``ContextBudget``:
+        memories in inclusion order, each memory's entries in its recall order,
+        so a tight budget drops the lowest-ranked entries first.
         """
         anchors = await self._embed_conversation_anchors(current_message, conversation_history)
         anchor_contents = self._anchor_contents(current_message, conversation_history)
@@ -286,14 +341,13 @@ class ChatAgent(Agent):
             t for t in [*(conversation_history or []), current_message or ""] if t
         )
         current_anchor = anchors[-1] if anchors else None
-        sections: list[str] = []
+        pieces: list[str] = []
         for memory in self._included_memories(current_anchor):
-            section = self._render_recall_memory(
-                memory, anchors, query_text, limit, anchor_contents
+            pieces.extend(
+                self._render_recall_memory(memory, anchors, query_text, limit, anchor_contents)
             )
-            if section:
-                sections.append(section)
-        return "\n\n".join(sections) if sections else None
+        kept = self._context_budget.fit(ContextSectionName.RECALL, pieces)
+        return "\n\n".join(kept) if kept else None
 
     def _active_memories(self) -> list[Memory]:
         """Memory objects for every non-archived, routable memory (inclusion != 'never')."""
@@ -397,7 +451,7 @@ class ChatAgent(Agent):
         query_text: str,
         limit: int,
         anchor_contents: set[str],
-    ) -> str | None:
+    ) -> list[str]:
         """Dispatch to the correct renderer for a single memory's recall mode."""
         mode = RecallMode(memory.recall)
         if mode == RecallMode.RECENT:
@@ -407,10 +461,8 @@ class ChatAgent(Agent):
         elif mode == RecallMode.ALL:
             entries = memory.read_all()[:limit]
         else:
-            return None
-        if not entries:
-            return None
-        return self._format_recall_section(memory, entries)
+            return []
+        return self._format_recall_pieces(memory, entries)
 
     def _relevant_entries(
         self,
@@ -456,8 +508,11 @@ class ChatAgent(Agent):
         )
 
     @staticmethod
-    def _format_recall_section(memory: Memory, entries: list[MemoryEntry]) -> str:
-        """Render a single memory's header + entries as a context subsection.
+    def _format_recall_pieces(memory: Memory, entries: list[MemoryEntry]) -> list[str]:
+        """Render a single memory's header + entries as a context subsection,
+        one budgetable piece per entry (the memory header rides on the first, so
+        a kept piece is never an orphaned header).  Joined with blank lines, the
+        pieces read as one contiguous subsection.
 
         Each entry gets its own ``####`` sub-header carrying the entry's key
         (when keyed) and the ``created_at`` timestamp, followed by the
@@ -468,14 +523,14 @@ class ChatAgent(Agent):
         about temporal context ("we talked about this last week" vs
         "earlier today") without needing an extra tool call.
         """
-        lines = [f"### {memory.name}", memory.description]
+        pieces: list[str] = []
         for entry in entries:
             timestamp = format_log_timestamp(entry.created_at)
             header = f"#### [{entry.key}] · {timestamp}" if entry.key else f"#### {timestamp}"
-            lines.append("")
-            lines.append(header)
-            lines.append(entry.content)
-        return "\n".join(lines)
+            pieces.append(f"{header}\n{entry.content}")
+        if pieces:
+            pieces[0] = f"### {memory.name}\n{memory.description}\n\n{pieces[0]}"
+        return pieces
 
     # ── Vision ────────────────────────────────────────────────────────────
 
@@ -500,6 +555,9 @@ class ChatAgent(Agent):
             agent_name=self.name,
             prompt_type=ChatPromptType.VISION_CAPTION,
             run_id=uuid.uuid4().hex,
+            # The same image always gets the same caption — reuse it.
+            temperature=0.0,
+            cacheable=True,
         )
         return response.content.strip()
 
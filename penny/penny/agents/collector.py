@@ -1,12 +1,12 @@
 """Collector — single dispatcher agent for per-collection extraction.
 
 One ``Collector`` instance runs in the background.  Each cycle it picks
-the most-overdue ready collection from ``memory`` (where
-``extraction_prompt IS NOT NULL`` and
-``now - last_collected_at >= collector_interval_seconds``), binds itself
-to that target, runs the agent loop with the target's extraction prompt
-as instructions and a tool surface scoped to writes against that
-collection only, then stamps ``last_collected_at = now``.
+a ready collection from ``memory`` (where ``extraction_prompt IS NOT NULL``
+and ``now - last_collected_at >= collector_interval_seconds``) — the one
+whose recent runs yielded the most work per GPU-second, unless another is
+starving — binds itself to that target, runs the agent loop with the
+target's extraction prompt as instructions and a tool surface scoped to
+writes against that collection only, then stamps ``last_collected_at = now``.
 
 Readiness has a second gate beyond the interval: a *log-driven* collection
 (one that reads a log via ``log_read``, leaving a read cursor) is skipped
@@ -64,7 +64,7 @@ logger = logging.getLogger(__name__)
 # collection or reached out to the user.  Reads and ``done()`` don't count; a
 # run of only those is "idle" and feeds the auto-throttle counter.
 class Collector(BackgroundAgent):
-    """Single dispatcher agent — picks the most-overdue ready collection per cycle."""
+    """Single dispatcher agent — picks the highest-yield ready collection per cycle."""
 
     name = "collector"
 
@@ -106,6 +106,7 @@ class Collector(BackgroundAgent):
         *,
         embedding_model_client: LlmClient | None = None,
         vision_model_client: LlmClient | None = None,
+        small_model_client: LlmClient | None = None,
     ) -> None:
         super().__init__(
             model_client=model_client,
@@ -113,6 +114,7 @@ class Collector(BackgroundAgent):
             config=config,
             embedding_model_client=embedding_model_client,
             vision_model_client=vision_model_client,
+            small_model_client=small_model_client,
         )
         # Set per-cycle inside ``_execute_cycle``.  The scheduler runs cycles
         # one at a time, but on-demand triggers (chat's extraction-prompt test
@@ -444,12 +446,51 @@ class Collector(BackgroundAgent):
     # ── Dispatcher selection ──────────────────────────────────────────────
 
     def _next_ready_collection(self) -> MemoryRow | None:
-        """Pick the most-overdue ready collection, or None if all caught up."""
+        """Pick the next ready collection to run, or None if all caught up."""
         now = datetime.now(UTC)
         ready = [m for m in self.db.memories.list_all() if self._is_ready(m, now)]
         if not ready:
             return None
-        return min(ready, key=self._overdue_sort_key)
+        return self._prioritize(ready, now)
+
+    def _prioritize(self, ready: list[MemoryRow], now: datetime) -> MemoryRow:
+        """Order the ready set by expected value per GPU-second, starvation first.
+
+        Idle windows on a single local GPU are the scarce resource, so the
+        collection whose recent runs turned model time into durable work most
+        efficiently (``RunYield.productive_per_gpu_second``) goes first.  Two
+        classes bypass the ranking and run most-overdue first: collections with
+        no completed history yet (nothing to estimate — explore them), and
+        *starving* ones, left uncollected ``COLLECTOR_STARVATION_FACTOR``
+        intervals or more, so a low-yield collection is delayed, never dropped.
+        ``COLLECTOR_YIELD_WINDOW = 0`` restores plain most-overdue ordering.
+        """
+        window = int(self.config.runtime.COLLECTOR_YIELD_WINDOW)
+        if window <= 0:
+            return min(ready, key=self._overdue_sort_key)
+        yields = {memory.name: self.db.messages.run_yield(memory.name, window) for memory in ready}
+        starving = [m for m in ready if yields[m.name].runs == 0 or self._is_starving(m, now)]
+        if starving:
+            return min(starving, key=self._overdue_sort_key)
+        chosen = max(
+            ready,
+            key=lambda m: (yields[m.name].productive_per_gpu_second, -self._overdue_timestamp(m)),
+        )
+        logger.debug(
+            "Collector picked '%s' by yield (%.4f productive/GPU-s over %d runs)",
+            chosen.name,
+            yields[chosen.name].productive_per_gpu_second,
+            yields[chosen.name].runs,
+        )
+        return chosen
+
+    def _is_starving(self, memory: MemoryRow, now: datetime) -> bool:
+        """Has ``memory`` waited ``COLLECTOR_STARVATION_FACTOR`` intervals or more?"""
+        if memory.last_collected_at is None or memory.collector_interval_seconds is None:
+            return True
+        factor = float(self.config.runtime.COLLECTOR_STARVATION_FACTOR)
+        elapsed = (now - _aware(memory.last_collected_at)).total_seconds()
+        return elapsed >= factor * memory.collector_interval_seconds
 
     def _is_ready(self, memory: MemoryRow, now: datetime) -> bool:
         if memory.archived or memory.extraction_prompt is None:
@@ -581,6 +622,11 @@ class Collector(BackgroundAgent):
             else datetime.min.replace(tzinfo=UTC)
         )
 
+    @classmethod
+    def _overdue_timestamp(cls, memory: MemoryRow) -> float:
+        """``_overdue_sort_key`` as plain seconds, for use inside a numeric key tuple."""
+        return (cls._overdue_sort_key(memory) - datetime.min.replace(tzinfo=UTC)).total_seconds()
+
 
 def _aware(dt: datetime) -> datetime:
     """SQLite returns naive datetimes; assume UTC and attach tzinfo."""
@@ -0,0 +1,92 @@
+"""Token-budgeted context assembly for the chat prompt.
+
+The chat prompt's variable sections — conversation history, the browser page
+and ambient recall — each grow with the data behind them, and nothing bounded
+their sum: a long page or a large ``recall=all`` collection could push a turn
+far past what's useful, and prefill on a local model is the dominant latency.
+
+``ContextBudget`` is a per-turn allocator.  Each section is offered as a list
+of *pieces* ranked most-important first; ``fit`` keeps the longest prefix of
+them that fits what the sections fitted before it left over, so the order the
+sections are fitted in *is* their priority.  A truncatable section (the page
+text) has its first overflowing piece cut to the remainder instead of dropped.
+Each fit is recorded so the turn's allocation can be logged in one line.
+
+Only volatile sections are budgeted.  The memory inventory sits in the
+system prompt, whose bytes must not depend on what a turn's history, page
+and recall used, or the model server's cached prompt prefix stops matching.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from enum import StrEnum
+
+from penny.constants import PennyConstants
+from penny.llm.tokens import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class ContextSectionName(StrEnum):
+    """The budgeted chat context sections, in the order ChatAgent fits them."""
+
+    HISTORY = "history"
+    PAGE = "page"
+    RECALL = "recall"
+
+
+@dataclass
+class SectionFit:
+    """How one section fared against the budget (estimated tokens)."""
+
+    requested_tokens: int
+    used_tokens: int
+    offered_pieces: int
+    kept_pieces: int
+    truncated: bool = False
+
+
+class ContextBudget:
+    """Per-turn token allocator across ranked context sections.
+
+    ``total_tokens = 0`` means unbudgeted: every piece is kept (and still
+    recorded, so the allocation log shows what the turn cost)."""
+
+    def __init__(self, total_tokens: int) -> None:
+        self.total_tokens = total_tokens
+        self.remaining_tokens = total_tokens
+        self.fits: dict[ContextSectionName, SectionFit] = {}
+
+    def fit(
+        self, name: ContextSectionName, pieces: list[str], *, truncatable: bool = False
+    ) -> list[str]:
+        """Keep the longest ranked prefix of ``pieces`` that fits the remainder."""
+        costs = [estimate_tokens(piece) for piece in pieces]
+        kept: list[str] = []
+        used = 0
+        truncated = False
+        for piece, cost in zip(pieces, costs, strict=True):
+            if self.total_tokens > 0 and used + cost > self.remaining_tokens:
+                room = self.remaining_tokens - used
+                if truncatable and room > 0:
+                    kept.append(piece[: room * PennyConstants.CHARS_PER_TOKEN])
+                    used += room
+                    truncated = True
+                break
+            kept.append(piece)
+            used += cost
+        self.remaining_tokens -= used
+        self.fits[name] = SectionFit(sum(costs), used, len(pieces), len(kept), truncated)
+        return kept
+
+    def log_allocation(self) -> None:
+        """One INFO line: each section's used/requested tokens and kept/offered pieces."""
+        parts = [
+            f"{name} {fit.used_tokens}/{fit.requested_tokens}t "
+            f"({fit.kept_pieces}/{fit.offered_pieces}{', truncated' if fit.truncated else ''})"
+            for name, fit in self.fits.items()
+        ]
+        budget = self.total_tokens if self.total_tokens > 0 else "unbounded"
+        logger.info("Context budget %s: %s", budget, "; ".join(parts) or "empty")
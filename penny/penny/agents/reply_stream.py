@@ -0,0 +1,72 @@
+"""Incremental delivery of a chat reply while it decodes.
+
+The chat agent streams every model call of a turn, but only the *final answer*
+belongs in front of the user — a call that turns into a tool call, or one the
+response validators reject, was never the reply.  The loop can't know which
+call is final until it ends, so ``ReplyStream`` previews optimistically: content
+fragments are shown as they arrive and the preview is retracted the moment the
+decode proves otherwise (a tool-call fragment, a retried request, or simply a
+new model call starting after one that was shown).  Inline ``<think>`` blocks
+are held back, exactly as the final answer strips them.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from penny.llm.models import LlmDelta
+from penny.validation.response_validators import strip_think_tags
+
+if TYPE_CHECKING:
+    from penny.channels.base import ReplyPreview
+
+_THINK_OPEN_TAG = "<think>"
+
+
+class ReplyStream:
+    """Forwards one chat turn's answer tokens to the channel's ``ReplyPreview``."""
+
+    def __init__(self, preview: ReplyPreview) -> None:
+        self._preview = preview
+        self._text = ""
+        self._has_tool_call = False
+        self._shown = False
+
+    async def start_decode(self) -> None:
+        """A new model call is starting — whatever the previous call previewed
+        was not the reply (the loop only calls again when it wasn't final)."""
+        await self._reset()
+
+    async def on_delta(self, delta: LlmDelta) -> None:
+        """``LlmClient.chat`` stream callback."""
+        if delta.restart:
+            await self._reset()
+            return
+        if delta.tool_call_index is not None:
+            self._has_tool_call = True
+            await self._retract()
+            return
+        if not delta.content or self._has_tool_call:
+            return
+        self._text += delta.content
+        visible = self._visible_text(self._text)
+        if visible:
+            self._shown = True
+            await self._preview.show(visible)
+
+    @staticmethod
+    def _visible_text(text: str) -> str:
+        """The decoded text minus closed ``<think>`` blocks and any still-open one."""
+        cleaned, _ = strip_think_tags(text)
+        open_at = cleaned.lower().find(_THINK_OPEN_TAG)
+        return (cleaned if open_at < 0 else cleaned[:open_at]).strip()
+
+    async def _reset(self) -> None:
+        await self._retract()
+        self._text = ""
+        self._has_tool_call = False
+
+    async def _retract(self) -> None:
+        if self._shown:
+            self._shown = False
+            await self._preview.retract()
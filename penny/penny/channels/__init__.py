@@ -15,6 +15,7 @@ if TYPE_CHECKING:
     from penny.agents import ChatAgent
     from penny.commands import CommandRegistry
     from penny.database import Database
+    from penny.http_transport import HttpTransport
 
 
 def create_channel_manager(
@@ -22,6 +23,7 @@ def create_channel_manager(
     message_agent: ChatAgent,
     db: Database,
     command_registry: CommandRegistry | None = None,
+    transport: HttpTransport | None = None,
 ) -> ChannelManager:
     """Create a ChannelManager with all configured channels registered."""
     manager = ChannelManager(
@@ -30,7 +32,7 @@ def create_channel_manager(
         command_registry=command_registry,
     )
 
-    _register_primary_channel(config, message_agent, db, command_registry, manager)
+    _register_primary_channel(config, message_agent, db, command_registry, manager, transport)
 
     if config.browser_enabled:
         _register_browser_channel(config, message_agent, db, command_registry, manager)
@@ -44,6 +46,7 @@ def _register_primary_channel(
     db: Database,
     command_registry: CommandRegistry | None,
     manager: ChannelManager,
+    transport: HttpTransport | None,
 ) -> None:
     """Create and register the primary channel (Signal or Discord)."""
     if config.channel_type == ChannelType.DISCORD:
@@ -68,6 +71,7 @@ def _register_primary_channel(
             command_registry=command_registry,
             max_retries=config.llm_max_retries,
             retry_delay=config.llm_retry_delay,
+            transport=transport,
         )
         manager.register_channel(ChannelType.SIGNAL, channel)
         # Seed the Signal device
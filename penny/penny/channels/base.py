@@ -13,6 +13,8 @@ from typing import TYPE_CHECKING, Any
 from pydantic import BaseModel, Field
 from sqlalchemy.exc import SQLAlchemyError
 
+from penny.channels.coalescer import MessageCoalescer
+from penny.channels.ingress import IngressQueue
 from penny.config import Config
 from penny.constants import PennyConstants
 from penny.database.models import MessageLog
@@ -82,6 +84,34 @@ class ProgressTracker(ABC):
         """Remove any in-flight progress indicator. Idempotent."""
 
 
+class ReplyPreview(ABC):
+    """Progressive preview of a chat reply while the model is still decoding it.
+
+    Channels that can render a reply incrementally return one of these from
+    ``MessageChannel._begin_reply_preview``.  The chat agent calls ``show``
+    with the whole answer decoded so far (raw model text — the preview applies
+    ``prepare_outgoing`` itself) and ``retract`` when a decode it previewed
+    turns out not to be the reply: it became a tool call, or the validators
+    rejected it and the model is asked again.
+
+    The final answer is still delivered through ``send_response`` so logging,
+    the embedding and media attachment are unchanged; the channel's
+    ``_send_raw`` supersedes the preview (replacing or editing it in place).
+    The dispatch loop calls ``retract`` once more when the run finishes —
+    after delivery or on an exception — so it must be idempotent and a no-op
+    for a preview the delivery already superseded; the channel forgets the
+    preview then too (``_end_reply_preview``).
+    """
+
+    @abstractmethod
+    async def show(self, text: str) -> None:
+        """Render the reply decoded so far, replacing the previous preview."""
+
+    @abstractmethod
+    async def retract(self) -> None:
+        """Withdraw the preview. Idempotent."""
+
+
 class MessageChannel(ABC):
     """Abstract base class for communication channels."""
 
@@ -104,6 +134,8 @@ class MessageChannel(ABC):
         self._command_registry = command_registry
         self._scheduler: BackgroundScheduler | None = None
         self._config: Config | None = None
+        self._coalescer = MessageCoalescer(self._dispatch_to_agent, self._coalesce_window)
+        self._ingress = IngressQueue(type(self).__name__)
 
     def set_scheduler(self, scheduler: BackgroundScheduler) -> None:
         """Set the scheduler for message notifications."""
@@ -117,6 +149,7 @@ class MessageChannel(ABC):
         model_client: LlmClient,
         embedding_model_client: LlmClient | None = None,
         image_model_client: OllamaImageClient | None = None,
+        small_model_client: LlmClient | None = None,
     ) -> None:
         """
         Set command context for command execution.
@@ -128,6 +161,7 @@ class MessageChannel(ABC):
             model_client: Shared LlmClient for commands
             embedding_model_client: Shared embedding LlmClient for similarity
             image_model_client: Shared image generation LlmClient for /draw
+            small_model_client: Shared small-model LlmClient for SMALL_MODEL_TASKS
         """
         self._config = config
         self._model_client = model_client
@@ -145,6 +179,7 @@ class MessageChannel(ABC):
             embedding_model_client=embedding_model_client,
             image_model_client=image_model_client,
             scheduler=self._scheduler,
+            small_model_client=small_model_client,
         )
 
     @property
@@ -229,6 +264,20 @@ class MessageChannel(ABC):
         """
         pass
 
+    def extract_typing(self, raw_data: dict) -> str | None:
+        """The sender of a started-typing event, or None for anything else.
+
+        Channels whose platform reports the user typing override this so the
+        message coalescer keeps waiting for the rest of a burst.
+        """
+        return None
+
+    def _coalesce_window(self) -> float:
+        """The ``MESSAGE_COALESCE_SECONDS`` debounce (0 before a config is set)."""
+        if self._config is None:
+            return 0.0
+        return float(self._config.runtime.MESSAGE_COALESCE_SECONDS)
+
     @abstractmethod
     def extract_message(self, raw_data: dict) -> IncomingMessage | None:
         """
@@ -402,6 +451,8 @@ class MessageChannel(ABC):
         Otherwise ``select_image`` prefers the image captured from a page the
         message links (exact URL, then domain) and falls back to a jittered
         embedding-nearest pick — so replies carry an image whenever one matches.
+        A blob that's missing or damaged on disk costs the attachment, not the
+        reply.
         """
         if attachments:
             return attachments
@@ -409,7 +460,12 @@ class MessageChannel(ABC):
         media = self._db.media.select_image(urls, embedding)
         if media is None:
             return attachments
-        encoded = base64.b64encode(media.data).decode()
+        try:
+            with self._db.media.open(media) as data:
+                encoded = base64.b64encode(data).decode()
+        except OSError as e:
+            logger.warning("Sending without media %s: %s", media.id, e)
+            return attachments
         return [f"data:{media.mime_type};base64,{encoded}"]
 
     async def handle_message(self, envelope_data: dict) -> None:
@@ -419,6 +475,11 @@ class MessageChannel(ABC):
         This is the main message handling logic, shared by all channel implementations.
         """
         try:
+            typing_sender = self.extract_typing(envelope_data)
+            if typing_sender is not None:
+                self._coalescer.typing(typing_sender)
+                return
+
             message = self.extract_message(envelope_data)
             if message is None:
                 return
@@ -438,7 +499,7 @@ class MessageChannel(ABC):
             if await self._reject_unsupported_thread(message):
                 return
 
-            await self._dispatch_to_agent(message)
+            await self._coalescer.submit(message)
 
         except Exception as e:
             logger.exception("Error handling message: %s", e)
@@ -528,6 +589,24 @@ class MessageChannel(ABC):
         """
         return None
 
+    async def _begin_reply_preview(self, message: IncomingMessage) -> ReplyPreview | None:
+        """Start a progressive preview of the reply to this message.
+
+        Channels that can show a reply while it streams (the browser sidebar,
+        Discord message edits) override this and return a ``ReplyPreview``.
+        Default returns ``None`` — the reply arrives whole, as before.
+        """
+        return None
+
+    def _end_reply_preview(self, recipient: str, preview: ReplyPreview) -> None:
+        """Forget ``preview`` once the run that started it has finished.
+
+        Channels that keep their previews per recipient (so ``_send_raw`` can
+        supersede them) override this to drop the entry — a run that fails,
+        or ends without sending, must not leave its preview for the next one.
+        """
+        return
+
     async def _dispatch_to_agent(self, message: IncomingMessage) -> None:
         """Run the message through the agent loop with typing indicators."""
         device_id = self._resolve_device_id(message)
@@ -539,14 +618,21 @@ class MessageChannel(ABC):
 
         typing_task = asyncio.create_task(self._typing_loop(message.sender))
         progress: ProgressTracker | None = None
+        preview: ReplyPreview | None = None
         try:
             if self._scheduler:
                 self._scheduler.notify_foreground_start()
             progress = await self._begin_progress(message)
-            await self._run_message_through_agent(message, user_sender, device_id, progress)
+            preview = await self._begin_reply_preview(message)
+            await self._run_message_through_agent(
+                message, user_sender, device_id, progress, preview
+            )
         finally:
             if progress is not None:
                 await progress.clear()
+            if preview is not None:
+                self._end_reply_preview(message.sender, preview)
+                await preview.retract()
             typing_task.cancel()
             await self.send_typing(message.sender, False)
             if self._scheduler:
@@ -571,6 +657,7 @@ class MessageChannel(ABC):
         user_sender: str,
         device_id: int | None,
         progress: ProgressTracker | None,
+        preview: ReplyPreview | None = None,
     ) -> None:
         """Invoke the agent, log the incoming message, and deliver the response.
 
@@ -591,8 +678,10 @@ class MessageChannel(ABC):
             images=message.images or None,
             page_context=message.page_context,
             quoted_text=message.quoted_text,
+            reply_preview=preview,
             **self._make_handle_kwargs(message, progress),
         )
+        self._coalescer.begin_delivery(message.sender)
         incoming_embedding = await embed_text(self._embedding_model_client, message.content)
         incoming_id = self._db.messages.log_message(
             PennyConstants.MessageDirection.INCOMING,
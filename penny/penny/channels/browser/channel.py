@@ -9,6 +9,7 @@ import json
 import logging
 import re
 import uuid
+from collections import Counter
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -19,7 +20,14 @@ from pydantic import BaseModel, ValidationError
 from sqlmodel import Session, select
 from websockets.asyncio.server import Server, ServerConnection
 
-from penny.channels.base import IncomingMessage, MessageChannel, PageContext, ProgressTracker
+from penny.channels.base import (
+    IncomingMessage,
+    MessageChannel,
+    PageContext,
+    ProgressTracker,
+    ReplyPreview,
+)
+from penny.channels.browser.live import LiveOutbox, prompt_summary
 from penny.channels.browser.models import (
     BROWSER_MSG_TYPE_CAPABILITIES_UPDATE,
     BROWSER_MSG_TYPE_COLLECTION_TRIGGER,
@@ -41,20 +49,27 @@ from penny.channels.browser.models import (
     BROWSER_MSG_TYPE_MEMORY_UPDATE,
     BROWSER_MSG_TYPE_MESSAGE,
     BROWSER_MSG_TYPE_PERMISSION_DECISION,
+    BROWSER_MSG_TYPE_PROMPT_DETAIL_REQUEST,
     BROWSER_MSG_TYPE_PROMPT_LOGS_REQUEST,
     BROWSER_MSG_TYPE_REGISTER,
+    BROWSER_MSG_TYPE_RUN_DETAIL_REQUEST,
     BROWSER_MSG_TYPE_SCHEDULE_ADD,
     BROWSER_MSG_TYPE_SCHEDULE_DELETE,
     BROWSER_MSG_TYPE_SCHEDULE_UPDATE,
     BROWSER_MSG_TYPE_SCHEDULES_REQUEST,
+    BROWSER_MSG_TYPE_SUBSCRIBE,
     BROWSER_MSG_TYPE_TOOL_RESPONSE,
     BROWSER_RESP_TYPE_CONFIG,
     BROWSER_RESP_TYPE_MESSAGE,
+    BROWSER_RESP_TYPE_MESSAGE_DELTA,
     BROWSER_RESP_TYPE_PROMPT_LOG_UPDATE,
     BROWSER_RESP_TYPE_PROMPT_LOGS,
     BROWSER_RESP_TYPE_SCHEDULES,
     BROWSER_RESP_TYPE_STATUS,
     BROWSER_RESP_TYPE_TYPING,
+    BROWSER_TOPIC_MEMORIES,
+    BROWSER_TOPIC_PROMPTS,
+    BROWSER_TOPICS,
     MEMORY_SECTION_COLLECTOR_RUNS,
     BrowserCapabilitiesUpdate,
     BrowserCollectionTrigger,
@@ -82,11 +97,16 @@ from penny.channels.browser.models import (
     BrowserPermissionDecision,
     BrowserPermissionDismiss,
     BrowserPermissionPrompt,
+    BrowserPromptDetailRequest,
+    BrowserPromptDetailResponse,
     BrowserRegister,
+    BrowserRunDetailRequest,
+    BrowserRunDetailResponse,
     BrowserRunOutcomeUpdate,
     BrowserScheduleAdd,
     BrowserScheduleDelete,
     BrowserScheduleUpdate,
+    BrowserSubscribe,
     BrowserToolRequest,
     BrowserToolResponse,
     CursorRecord,
@@ -108,6 +128,7 @@ from penny.database.memory import (
     RecallMode,
 )
 from penny.database.models import RuntimeConfig, Schedule, UserInfo
+from penny.database.paging import PageKey
 from penny.prompts import Prompt
 from penny.tools.base import Tool
 
@@ -120,6 +141,23 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Frames handled in the socket's receive loop rather than queued: tool
+# responses and permission decisions unblock a waiting agent, heartbeats and
+# capability updates keep routing current, and register / chat messages set
+# the connection's device label (a chat message's agent turn is queued
+# separately, per sender), and a subscription must land right after register.
+_FAST_LANE_TYPES = frozenset(
+    {
+        BROWSER_MSG_TYPE_REGISTER,
+        BROWSER_MSG_TYPE_TOOL_RESPONSE,
+        BROWSER_MSG_TYPE_PERMISSION_DECISION,
+        BROWSER_MSG_TYPE_HEARTBEAT,
+        BROWSER_MSG_TYPE_CAPABILITIES_UPDATE,
+        BROWSER_MSG_TYPE_MESSAGE,
+        BROWSER_MSG_TYPE_SUBSCRIBE,
+    }
+)
+
 
 def _attachment_to_src(attachment: str) -> str | None:
     """Convert an attachment string to an <img> src value."""
@@ -140,6 +178,44 @@ class ConnectionInfo:
     ws: ServerConnection
     tool_use_enabled: bool = False
     last_heartbeat: datetime = field(default_factory=lambda: datetime.now(UTC))
+    topics: set[str] = field(default_factory=set)  # live-update topics it subscribed to
+    outbox: LiveOutbox = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Sends through whichever socket the entry points at — a reconnect
+        # re-points ``ws``, and still-queued updates follow it.
+        self.outbox = LiveOutbox(lambda frame: self.ws.send(frame))
+
+
+class BrowserReplyPreview(ReplyPreview):
+    """Streams a reply into a provisional sidebar bubble (``message_delta``).
+
+    Each ``show`` sends the whole decoded prefix re-rendered — the markdown to
+    HTML conversion isn't incremental.  The sidebar swaps the bubble for the
+    final ``message`` when it arrives and drops it on a retract.
+    """
+
+    def __init__(self, channel: BrowserChannel, recipient: str) -> None:
+        self._channel = channel
+        self._recipient = recipient
+        self._visible = False
+        self._delivered = False
+
+    async def show(self, text: str) -> None:
+        if self._delivered:
+            return
+        self._visible = True
+        await self._channel.send_reply_delta(self._recipient, self._channel.prepare_outgoing(text))
+
+    async def retract(self) -> None:
+        if not self._visible or self._delivered:
+            return
+        self._visible = False
+        await self._channel.send_reply_delta(self._recipient, None)
+
+    def mark_delivered(self) -> None:
+        """The final message replaced the bubble — later calls are no-ops."""
+        self._delivered = True
 
 
 class BrowserChannel(MessageChannel):
@@ -159,33 +235,96 @@ class BrowserChannel(MessageChannel):
         self._server: Server | None = None
         self._connections: dict[str, ConnectionInfo] = {}
         self._pending_requests: dict[str, asyncio.Future[tuple[str, str | None]]] = {}
+        # The socket each pending tool request went out on — a browser's
+        # outstanding work, and what a dropped socket has to give back.
+        self._request_sockets: dict[str, ServerConnection] = {}
+        # Set whenever a request finishes or a browser comes or goes, waking
+        # dispatches waiting for a browser below its concurrency cap.
+        self._tool_capacity = asyncio.Event()
         self._permission_manager: PermissionManager | None = None
         self._collector: Collector | None = None
+        self._reply_previews: dict[str, BrowserReplyPreview] = {}
+        # Memory changes waiting out the debounce, and per memory the time of
+        # its last event — the next event's new entries are those created since.
+        self._changed_memories: set[str | None] = set()
+        self._memory_flush: asyncio.Task[None] | None = None
+        self._live_since = datetime.now(UTC)
+        self._memory_watermarks: dict[str, datetime] = {}
         db.messages._on_prompt_logged = self._on_prompt_logged
         db.messages._on_run_outcome_set = self._on_run_outcome_set
         db.memories._on_memory_changed = self._on_memory_changed
 
     def _on_prompt_logged(self, prompt_data: dict) -> None:
-        """Callback fired after each prompt is logged — broadcast to browsers."""
-        message = json.dumps({"type": BROWSER_RESP_TYPE_PROMPT_LOG_UPDATE, "prompt": prompt_data})
-        for conn in self._connections.values():
-            asyncio.ensure_future(conn.ws.send(message))
+        """Callback fired after each prompt is logged — publish its summary to
+        browsers showing prompts (the full prompt is fetched on expand).  With
+        nobody watching, the summary isn't built at all."""
+        if not self._subscribed(BROWSER_TOPIC_PROMPTS):
+            return
+        message = json.dumps(
+            {"type": BROWSER_RESP_TYPE_PROMPT_LOG_UPDATE, "prompt": prompt_summary(prompt_data)}
+        )
+        self._publish(BROWSER_TOPIC_PROMPTS, f"prompt:{prompt_data['id']}", message)
 
     def _on_run_outcome_set(self, run_id: str, outcome: str, reason: str) -> None:
-        """Callback fired when a run outcome is set — broadcast to browsers."""
+        """Callback fired when a run outcome is set — publish to browsers."""
+        if not self._subscribed(BROWSER_TOPIC_PROMPTS):
+            return
         payload = BrowserRunOutcomeUpdate(run_id=run_id, outcome=outcome, reason=reason)
-        message = payload.model_dump_json()
-        for conn in self._connections.values():
-            asyncio.ensure_future(conn.ws.send(message))
+        self._publish(BROWSER_TOPIC_PROMPTS, f"outcome:{run_id}", payload.model_dump_json())
 
     def _on_memory_changed(self, name: str | None) -> None:
-        """Callback fired after any memory mutation — broadcast to browsers
-        so the Memories tab can refresh.  ``name`` is the affected memory
-        when the change is scoped to one (writes, archives, metadata edits);
-        ``None`` for fan-out events."""
-        message = BrowserMemoryChanged(name=name).model_dump_json()
+        """Callback fired after any memory mutation.  ``name`` is the affected
+        memory when the change is scoped to one (writes, archives, metadata
+        edits); ``None`` for fan-out events.  Changes are collected for
+        ``BROWSER_LIVE_DEBOUNCE_SECONDS`` and published as one event per memory.
+        With nobody watching nothing is queued — a later subscriber loads the
+        view afresh."""
+        if not self._subscribed(BROWSER_TOPIC_MEMORIES):
+            return
+        self._changed_memories.add(name)
+        if self._memory_flush is None or self._memory_flush.done():
+            self._memory_flush = asyncio.ensure_future(self._flush_memory_changes())
+
+    async def _flush_memory_changes(self) -> None:
+        await asyncio.sleep(PennyConstants.BROWSER_LIVE_DEBOUNCE_SECONDS)
+        names, self._changed_memories = self._changed_memories, set()
+        now = datetime.now(UTC)
+        if not self._subscribed(BROWSER_TOPIC_MEMORIES):
+            return
+        counts = self._db.memories.entry_counts()
+        for name in names:
+            event = self._memory_change_event(name, counts, now)
+            self._publish(BROWSER_TOPIC_MEMORIES, f"memory:{name}", event.model_dump_json())
+
+    def _memory_change_event(
+        self, name: str | None, counts: dict[str, int], now: datetime
+    ) -> BrowserMemoryChanged:
+        """The coalesced event for one memory: its new entry count and the
+        entries created since its previous event, newest first."""
+        if name is None:
+            return BrowserMemoryChanged()
+        since = self._memory_watermarks.get(name, self._live_since)
+        self._memory_watermarks[name] = now
+        memory = self._db.memory(name)
+        if memory is None:
+            return BrowserMemoryChanged(name=name)
+        cap = PennyConstants.BROWSER_LIVE_DELTA_ROWS
+        rows = memory.read_since(since, cap + 1)
+        return BrowserMemoryChanged(
+            name=name,
+            entry_count=counts.get(name, 0),
+            new_entries=[self._entry_to_record(row) for row in reversed(rows[:cap])],
+            more=len(rows) > cap,
+        )
+
+    def _subscribed(self, topic: str) -> bool:
+        return any(topic in conn.topics for conn in self._connections.values())
+
+    def _publish(self, topic: str, key: str, message: str) -> None:
+        """Queue a live update on every socket subscribed to ``topic``."""
         for conn in self._connections.values():
-            asyncio.ensure_future(conn.ws.send(message))
+            if topic in conn.topics:
+                conn.outbox.offer(topic, key, message)
 
     @property
     def sender_id(self) -> str:
@@ -251,7 +390,7 @@ class BrowserChannel(MessageChannel):
         device_label: str | None = None
         try:
             async for raw in ws:
-                device_label = await self._process_raw_message(ws, raw, device_label)
+                device_label = await self._ingest_raw(ws, raw, device_label)
         except websockets.ConnectionClosed:
             pass
         except Exception:
@@ -289,26 +428,60 @@ class BrowserChannel(MessageChannel):
                 logger.info(
                     "Browser %s already reconnected on a newer socket; keeping it", device_label
                 )
-        # Reject any pending tool requests — they were sent on this socket and
-        # can't be answered now it's gone; the browse tool retries on whatever
-        # connection is live.
-        for _request_id, future in list(self._pending_requests.items()):
-            if not future.done():
+        # Reject the tool requests sent on this socket — they can't be answered
+        # now it's gone; ``send_tool_request`` re-sends them on another browser.
+        # Requests in flight on other browsers are untouched.
+        for request_id, sent_on in list(self._request_sockets.items()):
+            future = self._pending_requests.get(request_id)
+            if sent_on is ws and future is not None and not future.done():
                 future.set_exception(ConnectionError("Browser disconnected"))
+        self._tool_capacity.set()
         logger.info("Browser disconnected: %s", device_label or "unregistered")
 
     # --- Message dispatch ---
 
+    async def _ingest_raw(
+        self, ws: ServerConnection, raw: str | bytes, device_label: str | None
+    ) -> str | None:
+        """Route one frame off the socket: fast-lane frames are handled in the
+        receive loop; the rest queue per device so a slow page or log request
+        never holds up the tool responses and heartbeats behind it."""
+        data = self._parse_frame(raw)
+        if data is None:
+            return device_label
+        if data.get("type", "") in _FAST_LANE_TYPES:
+            self._ingress.record_fast()
+            return await self._dispatch_frame(ws, data, device_label)
+
+        async def dispatch() -> None:
+            # Queued frames never re-register the device, so the label the
+            # dispatch returns is dropped.
+            await self._dispatch_frame(ws, data, device_label)
+
+        await self._ingress.submit(f"requests:{device_label or id(ws)}", dispatch)
+        return device_label
+
     async def _process_raw_message(
         self, ws: ServerConnection, raw: str | bytes, device_label: str | None
     ) -> str | None:
         """Parse and dispatch a single WebSocket message. Returns updated device_label."""
+        data = self._parse_frame(raw)
+        if data is None:
+            return device_label
+        return await self._dispatch_frame(ws, data, device_label)
+
+    @staticmethod
+    def _parse_frame(raw: str | bytes) -> dict | None:
         try:
-            data = json.loads(raw)
+            return json.loads(raw)
         except json.JSONDecodeError:
             logger.warning("Invalid JSON from browser: %s", str(raw)[:200])
-            return device_label
+            return None
 
+    async def _dispatch_frame(
+        self, ws: ServerConnection, data: dict, device_label: str | None
+    ) -> str | None:
+        """Dispatch one parsed frame to its handler. Returns updated device_label."""
         msg_type = data.get("type", "")
 
         if msg_type == BROWSER_MSG_TYPE_REGISTER:
@@ -333,6 +506,10 @@ class BrowserChannel(MessageChannel):
             self._handle_heartbeat(device_label)
             return device_label
 
+        if msg_type == BROWSER_MSG_TYPE_SUBSCRIBE:
+            self._handle_subscribe(data, device_label)
+            return device_label
+
         if msg_type == BROWSER_MSG_TYPE_CAPABILITIES_UPDATE:
             self._handle_capabilities_update(data, device_label)
             return device_label
@@ -373,6 +550,14 @@ class BrowserChannel(MessageChannel):
             await self._handle_prompt_logs_request(ws, data)
             return device_label
 
+        if msg_type == BROWSER_MSG_TYPE_PROMPT_DETAIL_REQUEST:
+            await self._handle_prompt_detail_request(ws, data)
+            return device_label
+
+        if msg_type == BROWSER_MSG_TYPE_RUN_DETAIL_REQUEST:
+            await self._handle_run_detail_request(ws, data)
+            return device_label
+
         if msg_type == BROWSER_MSG_TYPE_MEMORIES_REQUEST:
             await self._handle_memories_request(ws, data)
             return device_label
@@ -387,7 +572,7 @@ class BrowserChannel(MessageChannel):
 
         if msg_type == BROWSER_MSG_TYPE_COLLECTION_TRIGGER:
             await self._handle_collection_trigger(ws, data)
-            return
+            return device_label
 
         if msg_type == BROWSER_MSG_TYPE_CURSOR_SET:
             self._handle_cursor_set(data)
@@ -439,6 +624,20 @@ class BrowserChannel(MessageChannel):
             if conn:
                 conn.last_heartbeat = datetime.now(UTC)
 
+    def _handle_subscribe(self, data: dict, device_label: str | None) -> None:
+        """Replace the connection's live-update topics with the ones the
+        addon's open tabs show, and drop anything queued for the rest."""
+        try:
+            req = BrowserSubscribe(**data)
+        except ValidationError:
+            logger.warning("Invalid subscribe: %s", str(data)[:200])
+            return
+        conn = self._connections.get(device_label) if device_label else None
+        if conn is None:
+            return
+        conn.topics = set(req.topics) & BROWSER_TOPICS
+        conn.outbox.retain(conn.topics)
+
     def _handle_capabilities_update(self, data: dict, device_label: str | None) -> None:
         """Update a connection's tool-use capability."""
         update = BrowserCapabilitiesUpdate(**data)
@@ -446,6 +645,7 @@ class BrowserChannel(MessageChannel):
             conn = self._connections.get(device_label)
             if conn:
                 conn.tool_use_enabled = update.tool_use_enabled
+                self._tool_capacity.set()
                 logger.info("Browser %s tool_use_enabled=%s", device_label, update.tool_use_enabled)
 
     def _handle_register(self, ws: ServerConnection, data: dict) -> str:
@@ -459,6 +659,9 @@ class BrowserChannel(MessageChannel):
             # liveness so the freshly reconnected addon isn't judged stale by
             # ``_get_tool_connection`` on its old (pre-suspension) timestamp.
             existing.last_heartbeat = datetime.now(UTC)
+            # The reconnected addon re-sends its subscription after registering.
+            existing.topics = set()
+            existing.outbox.retain(existing.topics)
         else:
             self._connections[device_label] = ConnectionInfo(ws=ws)
         self._auto_register_device(device_label)
@@ -531,33 +734,79 @@ class BrowserChannel(MessageChannel):
     _PROMPT_LOG_PAGE_SIZE = 50
 
     async def _handle_prompt_logs_request(self, ws: ServerConnection, data: dict) -> None:
-        """Query prompt logs grouped by run_id and send them to the browser."""
+        """Query the prompt-log run index (light prompt rows grouped by run_id)
+        and send it to the browser; an expanded run fetches the rest."""
         agent_name = data.get("agent_name") or None
         offset = int(data.get("offset", 0))
         query = (data.get("query") or "").strip() or None
         flagged_only = bool(data.get("flagged_only", False))
+        try:
+            after = PageKey.from_token(data.get("page_token"))
+        except ValueError:
+            logger.warning("Invalid prompt_logs_request page_token: %s", str(data)[:200])
+            return
+        if after is not None:
+            offset = 0  # the page token supersedes the older offset paging
         runs = self._db.messages.get_prompt_log_runs(
             limit=self._PROMPT_LOG_PAGE_SIZE,
             offset=offset,
             agent_name=agent_name,
             query=query,
             flagged_only=flagged_only,
+            after=after,
         )
+        # Flagged-only is a single-shot view of the recent-runs window — it
+        # returns every flagged run at once, so there's no further page.
+        has_more = (not flagged_only) and len(runs) == self._PROMPT_LOG_PAGE_SIZE
         response = {
             "type": BROWSER_RESP_TYPE_PROMPT_LOGS,
             "runs": runs,
-            # Flagged-only is a single-shot view of the recent-runs window — it
-            # returns every flagged run at once, so there's no further page.
-            "has_more": (not flagged_only) and len(runs) == self._PROMPT_LOG_PAGE_SIZE,
+            "has_more": has_more,
+            "next_page_token": runs[-1]["page_token"] if has_more else None,
         }
         with contextlib.suppress(websockets.ConnectionClosed):
             await ws.send(json.dumps(response))
 
+    async def _handle_prompt_detail_request(self, ws: ServerConnection, data: dict) -> None:
+        """Send one prompt's messages, response and thinking — the part live
+        updates leave out — when the addon expands its row."""
+        try:
+            req = BrowserPromptDetailRequest(**data)
+        except ValidationError:
+            logger.warning("Invalid prompt_detail_request: %s", str(data)[:200])
+            return
+        detail = self._db.messages.get_prompt_detail(req.id)
+        if detail is None:
+            logger.warning("prompt_detail_request for unknown prompt: %s", req.id)
+            return
+        payload = BrowserPromptDetailResponse(**detail)
+        with contextlib.suppress(websockets.ConnectionClosed):
+            await ws.send(payload.model_dump_json())
+
+    async def _handle_run_detail_request(self, ws: ServerConnection, data: dict) -> None:
+        """Stream an expanded run's prompts in full, a few per frame, then a
+        final frame with its full health and record."""
+        try:
+            req = BrowserRunDetailRequest(**data)
+        except ValidationError:
+            logger.warning("Invalid run_detail_request: %s", str(data)[:200])
+            return
+        pages = self._db.messages.get_run_detail_pages(
+            req.run_id, PennyConstants.BROWSER_RUN_DETAIL_CHUNK
+        )
+        with contextlib.suppress(websockets.ConnectionClosed):
+            for prompts in pages:
+                chunk = BrowserRunDetailResponse(run_id=req.run_id, prompts=prompts)
+                await ws.send(chunk.model_dump_json())
+            assessment = self._db.messages.get_run_assessment(req.run_id) or {}
+            done = BrowserRunDetailResponse(run_id=req.run_id, done=True, **assessment)
+            await ws.send(done.model_dump_json())
+
     async def _handle_memories_request(self, ws: ServerConnection, data: dict) -> None:
         """List every memory (collections + logs, archived included) with
         metadata + entry counts for the addon's Memories tab list view.  An
         optional ``query`` keeps memories matching by name / description /
-        intent OR holding an entry whose key or content contains the text."""
+        intent OR holding an entry whose key or content matches it (word prefixes)."""
         memories = self._db.memories.list_all()
         query = (data.get("query") or "").strip()
         if query:
@@ -610,14 +859,16 @@ class BrowserChannel(MessageChannel):
         counts = self._db.memories.entry_counts()
         query = (data.get("query") or "").strip() or None
         record = self._memory_to_record(memory, counts.get(memory.name, 0))
-        entries, entries_has_more = self._entries_page(memory, 0, query)
-        runs, runs_has_more = self._collector_runs_page(memory, 0)
+        entries, entries_token = self._entries_page(memory, 0, None, query)
+        runs, runs_token = self._collector_runs_page(memory, 0, None)
         return BrowserMemoryDetailResponse(
             memory=record,
             entries=entries,
-            entries_has_more=entries_has_more,
+            entries_has_more=entries_token is not None,
+            entries_next_page_token=entries_token,
             collector_runs=runs,
-            collector_runs_has_more=runs_has_more,
+            collector_runs_has_more=runs_token is not None,
+            collector_runs_next_page_token=runs_token,
             cursors=self._cursors_for(memory),
         )
 
@@ -626,31 +877,42 @@ class BrowserChannel(MessageChannel):
         collector runs), advancing past the rows the addon already holds."""
         try:
             req = BrowserMemoryPageRequest(**data)
-        except ValidationError:
+            after = PageKey.from_token(req.page_token)
+        except ValidationError, ValueError:
             logger.warning("Invalid memory_page_request: %s", str(data)[:200])
             return
         memory = self._db.memories.get(req.name)
         if memory is None:
             logger.warning("memory_page_request for unknown memory: %s", req.name)
             return
-        payload = self._memory_page_payload(memory, req, data)
+        payload = self._memory_page_payload(memory, req, after, data)
         with contextlib.suppress(websockets.ConnectionClosed):
             await ws.send(payload.model_dump_json())
 
     def _memory_page_payload(
-        self, memory, req: BrowserMemoryPageRequest, data: dict
+        self, memory, req: BrowserMemoryPageRequest, after: PageKey | None, data: dict
     ) -> BrowserMemoryPageResponse:
-        """One page of the requested section: collector runs serialize as full
-        runs (run → prompts → turns), entries as entry records."""
+        """One page of the requested section: collector runs serialize as
+        run-index runs (run → prompts → turns), entries as entry records.  A
+        page token supersedes the older ``offset``."""
+        offset = req.offset if after is None else 0
         if req.section == MEMORY_SECTION_COLLECTOR_RUNS:
-            runs, has_more = self._collector_runs_page(memory, req.offset)
+            runs, token = self._collector_runs_page(memory, offset, after)
             return BrowserMemoryPageResponse(
-                name=req.name, section=req.section, runs=runs, has_more=has_more
+                name=req.name,
+                section=req.section,
+                runs=runs,
+                has_more=token is not None,
+                next_page_token=token,
             )
         query = (data.get("query") or "").strip() or None
-        entries, has_more = self._entries_page(memory, req.offset, query)
+        entries, token = self._entries_page(memory, offset, after, query)
         return BrowserMemoryPageResponse(
-            name=req.name, section=req.section, entries=entries, has_more=has_more
+            name=req.name,
+            section=req.section,
+            entries=entries,
+            has_more=token is not None,
+            next_page_token=token,
         )
 
     async def _handle_collection_trigger(self, ws: ServerConnection, data: dict) -> None:
@@ -696,40 +958,46 @@ class BrowserChannel(MessageChannel):
         self._on_memory_changed(req.name)
 
     def _entries_page(
-        self, memory, offset: int, query: str | None = None
-    ) -> tuple[list[MemoryEntryRecord], bool]:
-        """One newest-first page of a memory's entries.  ``has_more`` is true
-        when the page filled the page size, matching the prompts tab.  ``query``
-        filters to matching key/content so the detail view mirrors the
-        Memories-list search."""
+        self, memory, offset: int, after: PageKey | None, query: str | None = None
+    ) -> tuple[list[MemoryEntryRecord], str | None]:
+        """One newest-first page of a memory's entries, resuming past ``after``,
+        plus the next page's token — set when the page filled the page size,
+        matching the prompts tab.  ``query`` filters to matching key/content so
+        the detail view mirrors the Memories-list search."""
         if memory.name == PennyConstants.MEMORY_COLLECTOR_RUNS_LOG:
             # The collector-runs log is itself a facade over promptlog — its
             # "entries" are runs (every collection's), not stored rows.
             run_log = self._db.memories.run_log()
             rows = (
-                run_log.newest_entries(self._MEMORY_PAGE_SIZE, offset)
+                run_log.newest_entries(self._MEMORY_PAGE_SIZE, offset, after=after)
                 if run_log is not None
                 else []
             )
         else:
             content = self._db.memory(memory.name)
             rows = (
-                content.newest_entries(self._MEMORY_PAGE_SIZE, offset, search=query)
+                content.newest_entries(self._MEMORY_PAGE_SIZE, offset, search=query, after=after)
                 if content is not None
                 else []
             )
         records = [self._entry_to_record(row) for row in rows]
-        return records, len(records) == self._MEMORY_PAGE_SIZE
-
-    def _collector_runs_page(self, memory, offset: int) -> tuple[list[dict], bool]:
-        """One newest-first page of this collection's collector runs as full
-        serialized runs (run → prompts → turns), so the Activity tab renders the
-        same cards as the prompts tab.  Empty for logs (collectors only target
-        collections)."""
+        if len(rows) < self._MEMORY_PAGE_SIZE:
+            return records, None
+        return records, PageKey(rows[-1].created_at, rows[-1].id or 0).token()
+
+    def _collector_runs_page(
+        self, memory, offset: int, after: PageKey | None
+    ) -> tuple[list[dict], str | None]:
+        """One newest-first page of this collection's collector runs from the
+        run index (run → prompts → turns), so the Activity tab renders — and
+        expands — the same cards as the prompts tab, plus the next page's
+        token.  Empty for logs (collectors only target collections)."""
         if memory.type != "collection":
-            return [], False
-        runs = self._db.messages.get_target_runs(memory.name, self._MEMORY_PAGE_SIZE, offset)
-        return runs, len(runs) == self._MEMORY_PAGE_SIZE
+            return [], None
+        runs = self._db.messages.get_target_runs(memory.name, self._MEMORY_PAGE_SIZE, offset, after)
+        if len(runs) < self._MEMORY_PAGE_SIZE:
+            return runs, None
+        return runs, runs[-1]["page_token"]
 
     def _cursors_for(self, memory) -> list[CursorRecord]:
         """The collection's read positions over the logs it reads, oldest log
@@ -1143,7 +1411,7 @@ class BrowserChannel(MessageChannel):
                 url=msg.page_context.url,
                 text=msg.page_context.text,
             )
-        asyncio.create_task(self.handle_message(envelope))
+        await self._ingress.submit(device_label, lambda: self.handle_message(envelope))
         return device_label
 
     # --- Tool requests ---
@@ -1155,6 +1423,13 @@ class BrowserChannel(MessageChannel):
     ) -> tuple[str, str | None]:
         """Send a tool request to a connected browser and await the response.
 
+        Requests spread across every tool-enabled browser: each goes to the
+        one with the least outstanding work (``_dispatch_tool_connection``),
+        waiting while all are at ``BROWSER_TOOL_CONCURRENCY``.  If its socket
+        drops mid-flight the request is re-sent on another browser straight
+        away, up to ``BROWSER_TOOL_REDISPATCHES`` times, rather than surfacing
+        the disconnect to the browse tool's backoff.
+
         The per-request timeout is owned by the caller: the browse tool wraps
         each call in ``asyncio.wait_for(BROWSE_REQUEST_TIMEOUT)`` and drives the
         retry/backoff loop.  This transport simply delivers the request and
@@ -1164,13 +1439,31 @@ class BrowserChannel(MessageChannel):
         in the gap between the two would be discarded as "No pending request".
         Returns (result_text, image_url).
         """
-        ws = self._get_tool_connection()
-        if ws is None:
-            raise RuntimeError("No browser with tool-use enabled is connected")
-
+        redispatches = 0
+        while True:
+            ws = await self._dispatch_tool_connection()
+            if ws is None:
+                raise RuntimeError("No browser with tool-use enabled is connected")
+            try:
+                return await self._send_tool_request_on(ws, tool, arguments)
+            except ConnectionError:
+                # With no browser left, the disconnect goes to the browse
+                # tool's backoff, which waits for the addon to reconnect.
+                if redispatches >= PennyConstants.BROWSER_TOOL_REDISPATCHES:
+                    raise
+                if not self.has_tool_connection:
+                    raise
+                redispatches += 1
+                logger.info("Browser dropped a %s request mid-flight — re-sending it", tool)
+
+    async def _send_tool_request_on(
+        self, ws: ServerConnection, tool: str, arguments: dict
+    ) -> tuple[str, str | None]:
+        """Send one tool request on ``ws`` and await its response."""
         request_id = str(uuid.uuid4())
         future: asyncio.Future[tuple[str, str | None]] = asyncio.get_event_loop().create_future()
         self._pending_requests[request_id] = future
+        self._request_sockets[request_id] = ws
 
         request = BrowserToolRequest(
             request_id=request_id,
@@ -1178,12 +1471,36 @@ class BrowserChannel(MessageChannel):
             arguments=arguments,
         )
         logger.debug("Sending browser tool request %s (tool=%s)", request_id, tool)
-        await self._send_ws(ws, request)
-
         try:
+            await self._send_ws(ws, request)
             return await future
         finally:
             self._pending_requests.pop(request_id, None)
+            self._request_sockets.pop(request_id, None)
+            self._tool_capacity.set()
+
+    async def _dispatch_tool_connection(self) -> ServerConnection | None:
+        """The browser to send the next tool request to — the least-loaded
+        one under its cap, waiting for a slot while every browser is full.
+        ``None`` when no tool-enabled browser is connected."""
+        while True:
+            pool = self._tool_pool()
+            if not pool:
+                return None
+            load = Counter(self._request_sockets.values())
+            open_slots = [c for c in pool if load[c.ws] < PennyConstants.BROWSER_TOOL_CONCURRENCY]
+            if open_slots:
+                # Least outstanding work first; the freshest heartbeat breaks ties.
+                return min(open_slots, key=lambda c: (load[c.ws], -c.last_heartbeat.timestamp())).ws
+            self._tool_capacity.clear()
+            await self._tool_capacity.wait()
+
+    def _tool_pool(self) -> list[ConnectionInfo]:
+        """Tool-enabled connections, narrowed to those still heartbeating when
+        any are — a quiet socket is only used when nothing fresher is there."""
+        tool_conns = [c for c in self._connections.values() if c.tool_use_enabled]
+        fresh = [c for c in tool_conns if self._has_fresh_heartbeat(c)]
+        return fresh or tool_conns
 
     def _get_tool_connection(self) -> ServerConnection | None:
         """Get the best browser connection for tool execution.
@@ -1193,12 +1510,12 @@ class BrowserChannel(MessageChannel):
         requests) and pick the most recent.  If none are fresh, fall back to the
         most-recently-seen connection rather than refusing — a lone quiet socket
         is still worth trying (it may just be an addon without the keepalive).
+        Tool requests themselves are spread by ``_dispatch_tool_connection``;
+        this single pick is where the background tool-status indicator shows.
         """
-        tool_conns = [c for c in self._connections.values() if c.tool_use_enabled]
-        if not tool_conns:
+        pool = self._tool_pool()
+        if not pool:
             return None
-        fresh = [c for c in tool_conns if self._has_fresh_heartbeat(c)]
-        pool = fresh or tool_conns
         return max(pool, key=lambda c: c.last_heartbeat).ws
 
     # --- Device registration ---
@@ -1237,8 +1554,12 @@ class BrowserChannel(MessageChannel):
         """Deliver a prepared message to a browser client by device label.
 
         Logging happens in the base ``_log_and_send`` chokepoint before this
-        is called.
+        is called.  The message supersedes the recipient's streaming reply
+        preview, if any — the sidebar replaces the bubble with it.
         """
+        preview = self._reply_previews.pop(recipient, None)
+        if preview is not None:
+            preview.mark_delivered()
         conn = self._connections.get(recipient)
         if not conn:
             logger.warning("No browser connection for device: %s", recipient)
@@ -1249,6 +1570,28 @@ class BrowserChannel(MessageChannel):
         )
         return 1
 
+    async def _begin_reply_preview(self, message: IncomingMessage) -> ReplyPreview | None:
+        """Stream the reply into the sidebar as it decodes."""
+        preview = BrowserReplyPreview(self, message.sender)
+        self._reply_previews[message.sender] = preview
+        return preview
+
+    def _end_reply_preview(self, recipient: str, preview: ReplyPreview) -> None:
+        if self._reply_previews.get(recipient) is preview:
+            del self._reply_previews[recipient]
+
+    async def send_reply_delta(self, recipient: str, content: str | None) -> None:
+        """Replace the sidebar's provisional reply bubble (``None`` removes it)."""
+        conn = self._connections.get(recipient)
+        if not conn:
+            return
+        await self._send_ws(
+            conn.ws,
+            BrowserOutgoing(
+                type=BROWSER_RESP_TYPE_MESSAGE_DELTA, content=content, active=content is not None
+            ),
+        )
+
     @staticmethod
     def _prepend_images(message: str, attachments: list[str] | None) -> str:
         """Prepend image attachments as <img> tags before the message HTML."""
@@ -1416,9 +1759,14 @@ class BrowserChannel(MessageChannel):
 
     async def close(self) -> None:
         """Shut down the WebSocket server."""
+        await self._coalescer.close()
         if self._server:
             self._server.close()
             await self._server.wait_closed()
+        for conn in self._connections.values():
+            await conn.outbox.close()
+        await self._ingress.close()
+        self._ingress.log_stats()
         logger.info("Browser channel closed")
 
     @staticmethod
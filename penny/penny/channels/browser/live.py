@@ -0,0 +1,114 @@
+"""Live updates to the addon — compact, subscribed, and bounded per socket.
+
+Prompt logs, run outcomes and memory changes are pushed to the addon as they
+happen.  Three things keep that stream cheap:
+
+- **Summaries, not payloads.**  A prompt update carries the fields the
+  collapsed row shows plus two short snippets (``prompt_summary``); the full
+  messages / response / thinking are fetched by id when the row is expanded.
+- **Subscriptions.**  The addon subscribes to the topics its open tabs show,
+  and the channel only publishes to subscribers.
+- **A coalescing outbox per socket.**  ``LiveOutbox.offer`` never blocks the
+  DB hook that publishes.  One drain task sends frames in order, awaiting
+  each send so the socket's write buffer paces it; while it waits, a newer
+  frame for a key that's still queued replaces the stale one, and once
+  ``BROWSER_LIVE_QUEUE_DEPTH`` frames are waiting the oldest topic's frames
+  are dropped for a single ``live_resync`` telling the addon to refetch.
+  ``close`` cancels the drain when the channel shuts down.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+
+import websockets
+
+from penny.channels.browser.models import BrowserLiveResync
+from penny.constants import PennyConstants
+from penny.database.message_store import prompt_snippet, user_snippet
+
+logger = logging.getLogger(__name__)
+
+# Prompt fields left out of live updates — fetched on expand instead.
+_HEAVY_PROMPT_FIELDS = frozenset({"messages", "response", "thinking"})
+
+
+def prompt_summary(prompt: dict) -> dict:
+    """A logged prompt without its heavy fields, plus ``snippet`` (the last
+    turn: the tool calls or the reply) and ``user_snippet`` (the last user
+    message) for the collapsed row."""
+    summary = {key: value for key, value in prompt.items() if key not in _HEAVY_PROMPT_FIELDS}
+    summary["snippet"] = prompt_snippet(prompt.get("response") or {})
+    summary["user_snippet"] = user_snippet(prompt.get("messages") or [])
+    return summary
+
+
+class LiveOutbox:
+    """One socket's outbound live updates, coalesced by key."""
+
+    def __init__(
+        self,
+        send: Callable[[str], Awaitable[None]],
+        max_depth: int = PennyConstants.BROWSER_LIVE_QUEUE_DEPTH,
+    ) -> None:
+        self._send = send
+        self._max_depth = max_depth
+        self._pending: OrderedDict[str, tuple[str, str]] = OrderedDict()  # key → (topic, frame)
+        self._resync: set[str] = set()
+        self._drain: asyncio.Task[None] | None = None
+        self.coalesced = 0
+        self.dropped = 0
+
+    def offer(self, topic: str, key: str, frame: str) -> None:
+        """Queue ``frame``, replacing a still-queued frame with the same key."""
+        if key in self._pending:
+            self._pending[key] = (topic, frame)
+            self.coalesced += 1
+        else:
+            if len(self._pending) >= self._max_depth:
+                self._drop_oldest_topic()
+            self._pending[key] = (topic, frame)
+        if self._drain is None or self._drain.done():
+            self._drain = asyncio.create_task(self._run())
+
+    def retain(self, topics: set[str]) -> None:
+        """Drop queued frames for topics the addon no longer shows."""
+        for key, (topic, _) in list(self._pending.items()):
+            if topic not in topics:
+                del self._pending[key]
+        self._resync &= topics
+
+    async def close(self) -> None:
+        """Drop what's queued and cancel the drain — the channel is shutting down."""
+        self._pending.clear()
+        self._resync.clear()
+        if self._drain is not None:
+            self._drain.cancel()
+            await asyncio.gather(self._drain, return_exceptions=True)
+
+    def _drop_oldest_topic(self) -> None:
+        """The client is behind: drop every queued frame of the oldest frame's
+        topic and queue one resync for it instead."""
+        _, (stale, _) = next(iter(self._pending.items()))
+        dropped = [key for key, (topic, _) in self._pending.items() if topic == stale]
+        for key in dropped:
+            del self._pending[key]
+        self.dropped += len(dropped)
+        self._resync.add(stale)
+        logger.info("Browser live queue full — dropped %d %s update(s)", len(dropped), stale)
+
+    async def _run(self) -> None:
+        while self._resync or self._pending:
+            if self._resync:
+                frame = BrowserLiveResync(topic=self._resync.pop()).model_dump_json()
+            else:
+                _, (_, frame) = self._pending.popitem(last=False)
+            try:
+                await self._send(frame)
+            except websockets.ConnectionClosed:
+                self._pending.clear()
+                self._resync.clear()
+                return
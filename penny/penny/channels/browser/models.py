@@ -37,9 +37,13 @@ BROWSER_MSG_TYPE_ENTRY_DELETE = "entry_delete"
 BROWSER_MSG_TYPE_COLLECTION_TRIGGER = "collection_trigger"
 BROWSER_MSG_TYPE_CURSOR_SET = "cursor_set"
 BROWSER_MSG_TYPE_CURSOR_CLEAR = "cursor_clear"
+BROWSER_MSG_TYPE_SUBSCRIBE = "subscribe"
+BROWSER_MSG_TYPE_PROMPT_DETAIL_REQUEST = "prompt_detail_request"
+BROWSER_MSG_TYPE_RUN_DETAIL_REQUEST = "run_detail_request"
 
 # Outgoing message types (server → browser)
 BROWSER_RESP_TYPE_MESSAGE = "message"
+BROWSER_RESP_TYPE_MESSAGE_DELTA = "message_delta"
 BROWSER_RESP_TYPE_TYPING = "typing"
 BROWSER_RESP_TYPE_STATUS = "status"
 BROWSER_RESP_TYPE_TOOL_REQUEST = "tool_request"
@@ -56,6 +60,14 @@ BROWSER_RESP_TYPE_MEMORY_DETAIL = "memory_detail_response"
 BROWSER_RESP_TYPE_MEMORY_PAGE = "memory_page_response"
 BROWSER_RESP_TYPE_MEMORY_CHANGED = "memory_changed"
 BROWSER_RESP_TYPE_COLLECTION_TRIGGER_RESULT = "collection_trigger_result"
+BROWSER_RESP_TYPE_PROMPT_DETAIL = "prompt_detail_response"
+BROWSER_RESP_TYPE_LIVE_RESYNC = "live_resync"
+BROWSER_RESP_TYPE_RUN_DETAIL = "run_detail_response"
+
+# Live-update topics the addon subscribes to (one per page tab that shows them)
+BROWSER_TOPIC_PROMPTS = "prompts"  # prompt_log_update + run_outcome_update
+BROWSER_TOPIC_MEMORIES = "memories"  # memory_changed
+BROWSER_TOPICS = frozenset({BROWSER_TOPIC_PROMPTS, BROWSER_TOPIC_MEMORIES})
 
 # Sections of a memory's detail view that paginate independently.
 MEMORY_SECTION_ENTRIES = "entries"
@@ -235,12 +247,15 @@ class BrowserMemoryDetailRequest(BaseModel):
 
 class BrowserMemoryPageRequest(BaseModel):
     """A request for one more page of a memory-detail section (entries or
-    collector runs), advancing past ``offset`` already-shown rows."""
+    collector runs), resuming from the section's ``page_token`` — the keyset
+    continuation the previous page carried.  ``offset`` (skip that many
+    already-shown rows) is the older form, still honoured without a token."""
 
     type: str
     name: str
     section: Literal["entries", "collector_runs"]
     offset: int = 0
+    page_token: str | None = None
 
 
 class MemoryRecord(BaseModel):
@@ -290,24 +305,28 @@ class BrowserMemoryDetailResponse(BaseModel):
     the first page of this collection's collector runs when the memory is a
     collection (empty for logs).  The addon's Activity tab renders the runs with
     the same run → prompts → turns cards as the prompts tab, so each run is a
-    full serialized :class:`PromptLogRun` (dict), not a flattened record.  Each
+    run-index :class:`PromptLogRun` (dict), not a flattened record, and expands
+    through :class:`BrowserRunDetailRequest` the same way.  Each
     section paginates independently via :class:`BrowserMemoryPageRequest`; the
-    ``*_has_more`` flags tell the addon whether to show a "load more" control."""
+    ``*_has_more`` flags tell the addon whether to show a "load more" control,
+    and the ``*_next_page_token`` it sends back to load it."""
 
     type: str = BROWSER_RESP_TYPE_MEMORY_DETAIL
     memory: MemoryRecord
     entries: list[MemoryEntryRecord]
     entries_has_more: bool = False
-    collector_runs: list[dict] = []  # full serialized runs (run → prompts → turns)
+    collector_runs: list[dict] = []  # run-index runs (run → prompts → turns)
     collector_runs_has_more: bool = False
+    entries_next_page_token: str | None = None
+    collector_runs_next_page_token: str | None = None
     cursors: list[CursorRecord] = []  # read positions over the logs this collection reads
 
 
 class BrowserMemoryPageResponse(BaseModel):
     """One more page of a single memory-detail section, newest-first, in
     response to a :class:`BrowserMemoryPageRequest`.  ``entries`` carries the
-    entries section; ``runs`` carries the collector-runs section (full
-    serialized runs) — exactly one is populated per response, keyed by
+    entries section; ``runs`` carries the collector-runs section (run-index
+    runs) — exactly one is populated per response, keyed by
     ``section``."""
 
     type: str = BROWSER_RESP_TYPE_MEMORY_PAGE
@@ -316,6 +335,7 @@ class BrowserMemoryPageResponse(BaseModel):
     entries: list[MemoryEntryRecord] = []
     runs: list[dict] = []
     has_more: bool
+    next_page_token: str | None = None
 
 
 class BrowserCollectionTrigger(BaseModel):
@@ -337,10 +357,75 @@ class BrowserCollectionTriggerResult(BaseModel):
 
 class BrowserMemoryChanged(BaseModel):
     """Push notification: a memory was mutated.  ``name`` is the affected
-    memory, or ``None`` for fan-out events not scoped to one memory."""
+    memory, or ``None`` for fan-out events not scoped to one memory.
+
+    Changes are debounced and coalesced per memory, so one event can cover
+    several writes.  It carries the memory's new ``entry_count`` and the
+    entries created since its previous event, newest first (``more`` when
+    there were too many to send) — enough for the addon to patch its view
+    in place instead of refetching it."""
 
     type: str = BROWSER_RESP_TYPE_MEMORY_CHANGED
     name: str | None = None
+    entry_count: int | None = None
+    new_entries: list[MemoryEntryRecord] = []
+    more: bool = False
+
+
+class BrowserSubscribe(BaseModel):
+    """The live-update topics the addon is currently showing; replaces any
+    earlier subscription.  Only subscribed topics are pushed."""
+
+    type: str
+    topics: list[str]
+
+
+class BrowserPromptDetailRequest(BaseModel):
+    """Fetch-on-expand: live prompt updates carry only a summary, and the
+    addon asks for the heavy half when the user opens the prompt's row."""
+
+    type: str
+    id: int
+
+
+class BrowserPromptDetailResponse(BaseModel):
+    """One logged prompt's sent messages, response and thinking."""
+
+    type: str = BROWSER_RESP_TYPE_PROMPT_DETAIL
+    id: int
+    messages: list[dict]
+    response: dict
+    thinking: str
+
+
+class BrowserRunDetailRequest(BaseModel):
+    """Fetch-on-expand for a run card: the prompt-log run index carries each
+    prompt's light fields only, and the addon asks for the rest of the run
+    when the user opens it."""
+
+    type: str
+    run_id: str
+
+
+class BrowserRunDetailResponse(BaseModel):
+    """One chunk of an expanded run's prompts in full, oldest first.  The
+    detail streams as several of these; the last has ``done`` set and carries
+    the run's full ``health`` and its concise ``record``."""
+
+    type: str = BROWSER_RESP_TYPE_RUN_DETAIL
+    run_id: str
+    prompts: list[dict] = []
+    done: bool = False
+    health: dict | None = None
+    record: str | None = None
+
+
+class BrowserLiveResync(BaseModel):
+    """Push notification: the addon fell behind and updates for ``topic``
+    were dropped — refetch that view rather than patching it."""
+
+    type: str = BROWSER_RESP_TYPE_LIVE_RESYNC
+    topic: str
 
 
 class BrowserMemoryCreate(BaseModel):
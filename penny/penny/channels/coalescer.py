@@ -0,0 +1,146 @@
+"""Ingress coalescing — one agent turn per burst of messages from a sender.
+
+People often send a thought as several short messages in a row.  Dispatched
+one by one, each would start its own ``ChatAgent.handle`` run — recall,
+browsing, generation — and the runs would race to answer half a question
+each.  ``MessageCoalescer`` holds a sender's message for the
+``MESSAGE_COALESCE_SECONDS`` window instead, restarting the wait on every new
+message or typing indicator, then merges the burst into one
+``IncomingMessage`` and dispatches that.
+
+A message that arrives while the previous turn is still running supersedes
+it: the turn is cancelled and its messages are folded into the new burst, so
+the agent answers everything at once.  Once a turn has its answer and starts
+delivering it, it can no longer be superseded — the follow-up simply starts
+the next burst.  A window of 0 dispatches every message immediately, exactly
+as without coalescing.  ``close`` (on channel shutdown) cancels the waiting
+bursts and turns in flight.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from penny.channels.base import IncomingMessage
+
+logger = logging.getLogger(__name__)
+
+
+def merge_messages(messages: list[IncomingMessage]) -> IncomingMessage:
+    """One message carrying a burst: the texts joined by newlines, every
+    image, the first quote, and the latest message's routing and page."""
+    if len(messages) == 1:
+        return messages[0]
+    latest = messages[-1]
+    return latest.model_copy(
+        update={
+            "content": "\n".join(m.content for m in messages if m.content),
+            "images": [image for m in messages for image in m.images],
+            "quoted_text": next((m.quoted_text for m in messages if m.quoted_text), None),
+            "page_context": next(
+                (m.page_context for m in reversed(messages) if m.page_context), None
+            ),
+        }
+    )
+
+
+@dataclass
+class _Turn:
+    """An agent turn in flight and the messages it answers."""
+
+    messages: list[IncomingMessage]
+    task: asyncio.Task[None]
+    delivering: bool = False
+
+
+class MessageCoalescer:
+    """Per-sender debounce in front of a channel's agent dispatch."""
+
+    def __init__(
+        self,
+        dispatch: Callable[[IncomingMessage], Awaitable[None]],
+        window: Callable[[], float],
+    ) -> None:
+        self._dispatch = dispatch
+        self._window = window
+        self._pending: dict[str, list[IncomingMessage]] = {}
+        self._timers: dict[str, asyncio.Task[None]] = {}
+        self._turns: dict[str, _Turn] = {}
+
+    async def submit(self, message: IncomingMessage) -> None:
+        """Queue ``message`` for its sender's next turn (or run it now, with no window)."""
+        window = self._window()
+        if window <= 0:
+            await self._dispatch(message)
+            return
+        pending = self._pending.setdefault(message.sender, [])
+        turn = self._turns.get(message.sender)
+        if turn is not None and not turn.delivering and not turn.task.done():
+            logger.info(
+                "Superseding in-flight turn for %s (%d message(s) folded into the next)",
+                message.sender,
+                len(turn.messages),
+            )
+            del self._turns[message.sender]
+            turn.task.cancel()
+            pending[:0] = turn.messages
+        pending.append(message)
+        self._arm(message.sender, window)
+
+    def typing(self, sender: str) -> None:
+        """The sender is typing — keep waiting for the rest of their burst."""
+        window = self._window()
+        if window > 0 and sender in self._pending:
+            self._arm(sender, window)
+
+    def begin_delivery(self, sender: str) -> None:
+        """The sender's turn has its answer; it can no longer be superseded."""
+        turn = self._turns.get(sender)
+        if turn is not None:
+            turn.delivering = True
+
+    async def close(self) -> None:
+        """Cancel every waiting burst and in-flight turn — the channel is shutting down."""
+        dropped = sum(len(messages) for messages in self._pending.values())
+        if dropped:
+            logger.warning("Dropping %d coalesced message(s) on shutdown", dropped)
+        tasks = [*self._timers.values(), *(turn.task for turn in self._turns.values())]
+        self._pending.clear()
+        self._timers.clear()
+        self._turns.clear()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _arm(self, sender: str, window: float) -> None:
+        timer = self._timers.pop(sender, None)
+        if timer is not None:
+            timer.cancel()
+        self._timers[sender] = asyncio.create_task(self._flush_after(sender, window))
+
+    async def _flush_after(self, sender: str, window: float) -> None:
+        await asyncio.sleep(window)
+        self._timers.pop(sender, None)
+        messages = self._pending.pop(sender, [])
+        if not messages:
+            return
+        if len(messages) > 1:
+            logger.info("Coalesced %d messages from %s into one turn", len(messages), sender)
+        turn = _Turn(messages, asyncio.create_task(self._run(merge_messages(messages))))
+        self._turns[sender] = turn
+        turn.task.add_done_callback(lambda _: self._forget(sender, turn))
+
+    async def _run(self, message: IncomingMessage) -> None:
+        try:
+            await self._dispatch(message)
+        except Exception as e:
+            logger.exception("Error handling message: %s", e)
+
+    def _forget(self, sender: str, turn: _Turn) -> None:
+        if self._turns.get(sender) is turn:
+            del self._turns[sender]
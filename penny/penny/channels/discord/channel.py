@@ -3,14 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import time
 from typing import TYPE_CHECKING
 
 import discord
 
-from penny.channels.base import IncomingMessage, MessageChannel
+from penny.channels.base import IncomingMessage, MessageChannel, ReplyPreview
 from penny.channels.discord.models import DiscordMessage, DiscordUser
-from penny.constants import ChannelType
+from penny.constants import ChannelType, PennyConstants
 
 if TYPE_CHECKING:
     from penny.agents import ChatAgent
@@ -24,6 +26,50 @@ logger = logging.getLogger(__name__)
 DISCORD_SENDER_ID = "penny"
 
 
+class DiscordReplyPreview(ReplyPreview):
+    """Shows a streaming reply as one Discord message edited in place.
+
+    The first ``show`` posts the message; later ones edit it, at most every
+    ``DISCORD_PREVIEW_EDIT_INTERVAL_SECONDS``.  The final send takes the
+    message over (``take_message``) and edits the complete reply into it, so
+    the user sees one message grow rather than a preview plus a repost.
+    """
+
+    def __init__(self, channel: DiscordChannel) -> None:
+        self._channel = channel
+        self._message: discord.Message | None = None
+        self._last_edit = 0.0
+
+    async def show(self, text: str) -> None:
+        now = time.monotonic()
+        if now - self._last_edit < PennyConstants.DISCORD_PREVIEW_EDIT_INTERVAL_SECONDS:
+            return
+        target = self._channel.text_channel
+        if target is None:
+            return
+        self._last_edit = now
+        head = self._channel.preview_head(text)
+        try:
+            if self._message is None:
+                self._message = await target.send(head)
+            else:
+                await self._message.edit(content=head)
+        except discord.HTTPException as e:
+            logger.warning("Failed to update Discord reply preview: %s", e)
+
+    async def retract(self) -> None:
+        message = self.take_message()
+        self._last_edit = 0.0
+        if message is not None:
+            with contextlib.suppress(discord.HTTPException):
+                await message.delete()
+
+    def take_message(self) -> discord.Message | None:
+        """Hand the preview message to the caller; the preview forgets it."""
+        message, self._message = self._message, None
+        return message
+
+
 class DiscordChannel(MessageChannel):
     """
     Discord channel implementation using discord.py.
@@ -68,6 +114,7 @@ class DiscordChannel(MessageChannel):
         self.client = discord.Client(intents=intents)
         self._channel: discord.TextChannel | None = None
         self._ready = asyncio.Event()
+        self._reply_previews: dict[str, DiscordReplyPreview] = {}
 
         # Register event handlers
         self._setup_events()
@@ -79,6 +126,11 @@ class DiscordChannel(MessageChannel):
         """Get the identifier for outgoing messages."""
         return DISCORD_SENDER_ID
 
+    @property
+    def text_channel(self) -> discord.TextChannel | None:
+        """The resolved target channel (None until ready or if not found)."""
+        return self._channel
+
     def _setup_events(self) -> None:
         """Set up Discord event handlers."""
 
@@ -212,9 +264,14 @@ class DiscordChannel(MessageChannel):
             attachments: Optional list of base64-encoded attachments (not yet implemented)
             quote_message: Optional message to quote-reply to (not yet implemented for Discord)
 
+        A streaming reply preview for the recipient is taken over: its message
+        is edited into the first chunk instead of posting a new one.
+
         Returns:
             Discord message ID on success, None on failure
         """
+        preview = self._reply_previews.pop(recipient, None)
+        preview_message = preview.take_message() if preview is not None else None
         try:
             await self._ready.wait()
 
@@ -222,7 +279,7 @@ class DiscordChannel(MessageChannel):
                 logger.error("Discord channel not available")
                 return None
 
-            sent_message = await self._send_discord_message(self._channel, message)
+            sent_message = await self._send_discord_message(self._channel, message, preview_message)
             logger.info("Sent message to Discord channel (length: %d)", len(message))
             return int(sent_message.id) if sent_message else None
 
@@ -233,6 +290,10 @@ class DiscordChannel(MessageChannel):
             logger.error("Unexpected error sending Discord message: %s", e)
             return None
 
+    def preview_head(self, text: str) -> str:
+        """The part of a partial reply a single preview message can show."""
+        return self._chunk_message(self.prepare_outgoing(text))[0]
+
     def _chunk_message(self, text: str, limit: int = 2000) -> list[str]:
         """Split text into chunks that fit within Discord's character limit."""
         if len(text) <= limit:
@@ -240,14 +301,34 @@ class DiscordChannel(MessageChannel):
         return [text[i : i + limit] for i in range(0, len(text), limit)]
 
     async def _send_discord_message(
-        self, channel: discord.TextChannel, text: str
+        self,
+        channel: discord.TextChannel,
+        text: str,
+        preview_message: discord.Message | None = None,
     ) -> discord.Message | None:
-        """Send a message to a Discord channel, chunking if necessary."""
+        """Send a message to a Discord channel, chunking if necessary.
+
+        With a ``preview_message`` the first chunk is edited into it in place.
+        """
         sent_message: discord.Message | None = None
         for chunk in self._chunk_message(text):
-            sent_message = await channel.send(chunk)
+            if preview_message is not None:
+                sent_message = await preview_message.edit(content=chunk)
+                preview_message = None
+            else:
+                sent_message = await channel.send(chunk)
         return sent_message
 
+    async def _begin_reply_preview(self, message: IncomingMessage) -> ReplyPreview | None:
+        """Grow the reply in one message, edited in place as it decodes."""
+        preview = DiscordReplyPreview(self)
+        self._reply_previews[message.sender] = preview
+        return preview
+
+    def _end_reply_preview(self, recipient: str, preview: ReplyPreview) -> None:
+        if self._reply_previews.get(recipient) is preview:
+            del self._reply_previews[recipient]
+
     async def send_typing(self, recipient: str, typing: bool) -> bool:
         """
         Send a typing indicator via Discord.
@@ -335,6 +416,7 @@ class DiscordChannel(MessageChannel):
     async def close(self) -> None:
         """Stop listening and close Discord client."""
         self._running = False
+        await self._coalescer.close()
         logger.info("Closing Discord client...")
         await self.client.close()
         logger.info("Discord channel closed")
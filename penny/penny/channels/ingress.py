@@ -0,0 +1,141 @@
+"""Ingress pipeline — bounded, per-sender ordered handling of inbound frames.
+
+A channel's receive loop hands each inbound frame to an ``IngressQueue``
+instead of spawning a task per frame (Signal) or awaiting its handler inline
+(the browser socket):
+
+- **Bounded.**  At most ``INGRESS_QUEUE_DEPTH`` frames wait or run at once;
+  ``submit`` blocks while the queue is full, so the receive loop stops
+  reading and the transport's own flow control pushes back on the sender.
+- **Per-sender ordering.**  Frames with the same key run one at a time, in
+  arrival order; different keys run side by side.
+- **Worker cap.**  At most ``INGRESS_WORKERS`` frames run concurrently.
+- **Fast lane.**  Latency-critical frames (tool responses, heartbeats,
+  permission decisions, reactions) don't queue at all: the channel handles
+  them in the receive loop, and ``record_fast`` just counts them.
+- **Metrics.**  ``stats`` reports the depth, the high-water mark and how long
+  frames waited for a worker; ``log_stats`` logs them at shutdown.
+
+``close`` cancels whatever is still queued or running when the channel shuts
+down.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+from penny.constants import PennyConstants
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class IngressStats:
+    """One channel's ingress counters."""
+
+    name: str
+    processed: int = 0
+    fast: int = 0
+    failed: int = 0
+    full: int = 0  # submits that had to wait for room in the queue
+    depth: int = 0
+    max_depth: int = 0
+    wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+    @property
+    def mean_wait_ms(self) -> float:
+        return self.wait_ms / self.processed if self.processed else 0.0
+
+
+class IngressQueue:
+    """Bounded queue of inbound work, ordered per key, run by capped workers."""
+
+    def __init__(
+        self,
+        name: str,
+        max_depth: int = PennyConstants.INGRESS_QUEUE_DEPTH,
+        workers: int = PennyConstants.INGRESS_WORKERS,
+    ) -> None:
+        self._stats = IngressStats(name)
+        self._room = asyncio.Semaphore(max_depth)
+        self._workers = asyncio.Semaphore(workers)
+        self._backlog: dict[str, deque[tuple[float, Callable[[], Awaitable[None]]]]] = {}
+        self._drains: set[asyncio.Task[None]] = set()
+
+    async def submit(self, key: str, work: Callable[[], Awaitable[None]]) -> None:
+        """Queue ``work`` behind earlier work for ``key``; waits while the queue is full."""
+        if self._room.locked():
+            self._stats.full += 1
+            logger.warning("Ingress queue %s is full — holding the receive loop", self._stats.name)
+        await self._room.acquire()
+        self._stats.depth += 1
+        self._stats.max_depth = max(self._stats.max_depth, self._stats.depth)
+        backlog = self._backlog.get(key)
+        if backlog is not None:
+            backlog.append((time.monotonic(), work))
+            return
+        self._backlog[key] = deque([(time.monotonic(), work)])
+        drain = asyncio.create_task(self._drain(key))
+        self._drains.add(drain)
+        drain.add_done_callback(self._drains.discard)
+
+    def record_fast(self) -> None:
+        """Count a frame handled in the fast lane."""
+        self._stats.fast += 1
+
+    def stats(self) -> IngressStats:
+        return IngressStats(**vars(self._stats))
+
+    async def close(self) -> None:
+        """Cancel every drain, running handlers included — the channel is shutting down."""
+        drains = list(self._drains)
+        for drain in drains:
+            drain.cancel()
+        await asyncio.gather(*drains, return_exceptions=True)
+
+    def log_stats(self) -> None:
+        stats = self.stats()
+        if not stats.processed and not stats.fast:
+            return
+        logger.info(
+            "Ingress %s: %d queued (%d failed, %d hit a full queue), %d fast-lane, "
+            "peak depth %d, wait mean %.0fms / max %.0fms",
+            stats.name,
+            stats.processed,
+            stats.failed,
+            stats.full,
+            stats.fast,
+            stats.max_depth,
+            stats.mean_wait_ms,
+            stats.max_wait_ms,
+        )
+
+    async def _drain(self, key: str) -> None:
+        """Run ``key``'s backlog in order until it's empty."""
+        backlog = self._backlog[key]
+        while backlog:
+            enqueued, work = backlog[0]
+            try:
+                async with self._workers:
+                    self._record_wait(enqueued)
+                    await work()
+            except Exception:
+                self._stats.failed += 1
+                logger.exception("Ingress %s: handler for %s failed", self._stats.name, key)
+            finally:
+                backlog.popleft()
+                self._stats.depth -= 1
+                self._room.release()
+        del self._backlog[key]
+
+    def _record_wait(self, enqueued: float) -> None:
+        wait_ms = (time.monotonic() - enqueued) * 1000
+        self._stats.processed += 1
+        self._stats.wait_ms += wait_ms
+        self._stats.max_wait_ms = max(self._stats.max_wait_ms, wait_ms)
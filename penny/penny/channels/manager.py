@@ -164,6 +164,7 @@ class ChannelManager(MessageChannel):
         model_client: LlmClient,
         embedding_model_client: LlmClient | None = None,
         image_model_client: OllamaImageClient | None = None,
+        small_model_client: LlmClient | None = None,
     ) -> None:
         """Forward command context to all registered channels."""
         super().set_command_context(
@@ -173,6 +174,7 @@ class ChannelManager(MessageChannel):
             model_client,
             embedding_model_client,
             image_model_client,
+            small_model_client,
         )
         for ch_type, channel in self._channels.items():
             channel.set_command_context(
@@ -182,6 +184,7 @@ class ChannelManager(MessageChannel):
                 model_client,
                 embedding_model_client,
                 image_model_client,
+                small_model_client,
             )
 
     async def validate_connectivity(self) -> None:
@@ -28,6 +28,7 @@ from penny.channels.signal.models import (
     TypingIndicatorRequest,
 )
 from penny.constants import ChannelType, PennyConstants, ProgressEmoji
+from penny.http_transport import HttpTransport, http_client
 from penny.tools.base import Tool
 
 # Error substrings that indicate a transient signal-cli transport failure.
@@ -57,6 +58,7 @@ class SignalChannel(MessageChannel):
         command_registry: CommandRegistry | None = None,
         max_retries: int = 3,
         retry_delay: float = 0.5,
+        transport: HttpTransport | None = None,
     ):
         """
         Initialize Signal channel.
@@ -69,12 +71,13 @@ class SignalChannel(MessageChannel):
             command_registry: Optional command registry for handling commands
             max_retries: Number of retry attempts for transient send failures (default: 3)
             retry_delay: Base delay in seconds between retries, doubled each attempt (default: 0.5)
+            transport: Shared HTTP pool to lease connections from (default: a private client)
         """
         super().__init__(message_agent=message_agent, db=db, command_registry=command_registry)
         self.api_url = api_url.rstrip("/")
         self.phone_number = phone_number
         self._running = True
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        self.http_client = http_client(transport, timeout=30.0)
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self._reaction_callbacks: dict[str, Callable[[str], None]] = {}
@@ -217,7 +220,7 @@ class SignalChannel(MessageChannel):
                 envelope = json.loads(message)
                 logger.info("Parsed envelope with keys: %s", envelope.keys())
 
-                asyncio.create_task(self.handle_message(envelope))
+                await self._ingest(envelope)
 
             except TimeoutError:
                 continue
@@ -226,6 +229,18 @@ class SignalChannel(MessageChannel):
                 logger.warning("Failed to parse message JSON: %s", e)
                 continue
 
+    async def _ingest(self, envelope: dict) -> None:
+        """Queue a data message behind its sender's earlier ones; handle the
+        rest — reactions (permission answers among them), typing, receipts —
+        right away in the fast lane."""
+        inner = envelope.get("envelope") or {}
+        data_message = inner.get("dataMessage")
+        if not data_message or data_message.get("reaction"):
+            self._ingress.record_fast()
+            await self.handle_message(envelope)
+            return
+        await self._ingress.submit(inner.get("source") or "", lambda: self.handle_message(envelope))
+
     async def _handle_reconnect(self, context: str, error: Exception) -> None:
         """Log a reconnection message and sleep before retrying."""
         logger.info("%s: %s - reconnecting in 5 seconds...", context, error)
@@ -638,6 +653,17 @@ class SignalChannel(MessageChannel):
         ws_url = self.api_url.replace("http://", "ws://").replace("https://", "wss://")
         return f"{ws_url}/v1/receive/{self.phone_number}"
 
+    def extract_typing(self, raw_data: dict) -> str | None:
+        """The sender of a Signal typing-started envelope."""
+        if "typingMessage" not in raw_data.get("envelope", {}):
+            return None
+        envelope = self._parse_envelope(raw_data)
+        if envelope is None or envelope.envelope.typingMessage is None:
+            return None
+        if envelope.envelope.typingMessage.action != "STARTED":
+            return None
+        return envelope.envelope.source
+
     def extract_message(self, raw_data: dict) -> IncomingMessage | None:
         """Extract a message from a Signal WebSocket envelope."""
         envelope = self._parse_envelope(raw_data)
@@ -791,7 +817,10 @@ class SignalChannel(MessageChannel):
     async def close(self) -> None:
         """Stop listening and close the HTTP client."""
         self._running = False
+        await self._coalescer.close()
         await self.http_client.aclose()
+        await self._ingress.close()
+        self._ingress.log_stats()
         logger.info("Signal channel closed")
 
     # --- In-flight progress indicator (emoji reactions on the user's msg) ---
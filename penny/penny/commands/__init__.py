@@ -19,6 +19,7 @@ from penny.commands.unschedule import UnscheduleCommand
 if TYPE_CHECKING:
     from github_api.api import GitHubAPI
 
+    from penny.http_transport import HttpTransport
     from penny.llm.image_client import OllamaImageClient
     from penny.zoho.models import ZohoCredentials
 
@@ -37,6 +38,7 @@ def create_command_registry(
     image_model_client: OllamaImageClient | None = None,
     fastmail_api_token: str | None = None,
     zoho_credentials: ZohoCredentials | None = None,
+    transport: HttpTransport | None = None,
 ) -> CommandRegistry:
     """
     Factory to create registry with builtin commands.
@@ -46,6 +48,7 @@ def create_command_registry(
         image_model_client: Optional image generation OllamaImageClient (required for draw command)
         fastmail_api_token: Optional Fastmail API token (required for email command)
         zoho_credentials: Optional ZohoCredentials for Zoho Mail API (required for zoho command)
+        transport: Optional shared HTTP pool for the email clients the commands build
 
     Returns:
         CommandRegistry with all builtin commands registered
@@ -86,7 +89,7 @@ def create_command_registry(
     if fastmail_api_token:
         from penny.commands.email import EmailCommand
 
-        registry.register(EmailCommand(fastmail_api_token))
+        registry.register(EmailCommand(fastmail_api_token, transport))
 
     # Register zoho command if Zoho credentials are configured
     if zoho_credentials:
@@ -97,6 +100,7 @@ def create_command_registry(
                 zoho_credentials.client_id,
                 zoho_credentials.client_secret,
                 zoho_credentials.refresh_token,
+                transport,
             )
         )
 
@@ -7,6 +7,7 @@ import logging
 from penny.agents.base import Agent
 from penny.commands.base import Command
 from penny.commands.models import CommandContext, CommandResult
+from penny.http_transport import HttpTransport
 from penny.jmap import JmapClient
 from penny.prompts import Prompt
 from penny.responses import PennyResponse
@@ -32,8 +33,9 @@ class EmailCommand(Command):
         "• /email any emails from mom this week"
     )
 
-    def __init__(self, fastmail_api_token: str) -> None:
+    def __init__(self, fastmail_api_token: str, transport: HttpTransport | None = None) -> None:
         self._fastmail_api_token = fastmail_api_token
+        self._transport = transport
 
     async def execute(self, args: str, context: CommandContext) -> CommandResult:
         """Execute the email command."""
@@ -47,6 +49,7 @@ class EmailCommand(Command):
             timeout=context.config.runtime.JMAP_REQUEST_TIMEOUT,
             max_body_length=int(context.config.runtime.EMAIL_BODY_MAX_LENGTH),
             search_limit=int(context.config.runtime.EMAIL_SEARCH_LIMIT),
+            transport=self._transport,
         )
         agent: Agent | None = None
         try:
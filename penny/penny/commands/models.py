@@ -10,7 +10,7 @@ from pydantic import BaseModel
 
 from penny.config import Config
 from penny.database import Database
-from penny.llm import LlmClient
+from penny.llm import LlmClient, ModelTiers
 from penny.llm.image_client import OllamaImageClient
 
 if TYPE_CHECKING:
@@ -32,6 +32,12 @@ class CommandContext:
     image_model_client: OllamaImageClient | None = None
     scheduler: BackgroundScheduler | None = None  # Background task scheduler
     message: IncomingMessage | None = None  # The incoming message (for quote-reply metadata)
+    small_model_client: LlmClient | None = None  # Small/fast tier for SMALL_MODEL_TASKS
+
+    @property
+    def model_tiers(self) -> ModelTiers:
+        """The main and small model clients, routed by ``SMALL_MODEL_TASKS``."""
+        return ModelTiers(self.model_client, self.small_model_client, self.config.runtime)
 
 
 class CommandResult(BaseModel):
@@ -11,6 +11,7 @@ from sqlmodel import Session, select
 from penny.commands.base import Command
 from penny.commands.models import CommandContext, CommandResult
 from penny.database.models import Schedule, UserInfo
+from penny.llm.models import LlmResponse
 from penny.prompts import Prompt
 from penny.responses import PennyResponse
 
@@ -25,6 +26,15 @@ class ScheduleParseResult(BaseModel):
     cron_expression: str = Field(description="Cron expression (5 fields)")
 
 
+def _parses_as_schedule(response: LlmResponse) -> bool:
+    """Whether the model's reply is a schedule with a 5-field cron expression."""
+    try:
+        result = ScheduleParseResult.model_validate_json(response.message.content)
+    except ValueError:
+        return False
+    return len(result.cron_expression.split()) == 5
+
+
 class ScheduleCommand(Command):
     """Create and list recurring background tasks."""
 
@@ -83,9 +93,14 @@ class ScheduleCommand(Command):
         prompt = Prompt.SCHEDULE_PARSE_PROMPT.format(timezone=user_timezone, command=command)
 
         try:
-            response = await context.model_client.generate(
-                prompt=prompt,
+            # Parsing a timing is a pure function of the command — cache it.
+            response = await context.model_tiers.generate(
+                self.name,
+                prompt,
+                _parses_as_schedule,
                 format="json",
+                temperature=0.0,
+                cacheable=True,
             )
 
             # Parse JSON from response
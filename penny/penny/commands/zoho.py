@@ -7,6 +7,7 @@ import logging
 from penny.agents.base import Agent
 from penny.commands.base import Command
 from penny.commands.models import CommandContext, CommandResult
+from penny.http_transport import HttpTransport
 from penny.prompts import Prompt
 from penny.responses import PennyResponse
 from penny.tools import Tool
@@ -40,10 +41,12 @@ class ZohoCommand(Command):
         client_id: str,
         client_secret: str,
         refresh_token: str,
+        transport: HttpTransport | None = None,
     ) -> None:
         self._client_id = client_id
         self._client_secret = client_secret
         self._refresh_token = refresh_token
+        self._transport = transport
 
     async def execute(self, args: str, context: CommandContext) -> CommandResult:
         """Execute the zoho email command."""
@@ -60,6 +63,7 @@ class ZohoCommand(Command):
             max_body_length=int(context.config.runtime.EMAIL_BODY_MAX_LENGTH),
             search_limit=int(context.config.runtime.EMAIL_SEARCH_LIMIT),
             list_limit=int(context.config.runtime.EMAIL_LIST_LIMIT),
+            transport=self._transport,
         )
         agent: Agent | None = None
         try:
@@ -70,6 +70,27 @@ def _validate_channel_config(channel_type: str) -> None:
             raise ValueError("DISCORD_CHANNEL_ID is required for Discord channel")
 
 
+def _validate_llm_urls() -> None:
+    """Each LLM URL setting must name at least one endpoint.
+
+    A setting may list several comma-separated endpoints; one that is all
+    commas and whitespace would leave the client with none.  The vision and
+    embedding URLs are optional — unset or empty falls back to ``LLM_API_URL``.
+    """
+    for key, required in (
+        ("LLM_API_URL", True),
+        ("LLM_VISION_API_URL", False),
+        ("LLM_EMBEDDING_API_URL", False),
+    ):
+        value = os.getenv(key)
+        if value is None or (not value and not required):
+            continue
+        if not any(url.strip() for url in value.split(",")):
+            raise ValueError(
+                f"{key} lists no URL (got {value!r}) — set one URL or a comma-separated list"
+            )
+
+
 def _collect_env_vars(channel_type: str) -> dict:
     """Read all config environment variables and return as constructor kwargs."""
     return {
@@ -81,6 +102,7 @@ def _collect_env_vars(channel_type: str) -> dict:
         "llm_api_url": os.getenv("LLM_API_URL", "http://host.docker.internal:11434"),
         "llm_model": os.getenv("LLM_MODEL", "gpt-oss:20b"),
         "llm_api_key": os.getenv("LLM_API_KEY", "not-needed"),
+        "llm_small_model": os.getenv("LLM_SMALL_MODEL"),
         "llm_vision_model": os.getenv("LLM_VISION_MODEL"),
         "llm_vision_api_url": os.getenv("LLM_VISION_API_URL"),
         "llm_vision_api_key": os.getenv("LLM_VISION_API_KEY"),
@@ -108,6 +130,7 @@ def _collect_env_vars(channel_type: str) -> dict:
         "browser_enabled": os.getenv("BROWSER_ENABLED", "").lower() in ("1", "true", "yes"),
         "browser_host": os.getenv("BROWSER_HOST", "localhost"),
         "browser_port": int(os.getenv("BROWSER_PORT", "9090")),
+        "http2_enabled": os.getenv("HTTP2_ENABLED", "").lower() in ("1", "true", "yes"),
     }
 
 
@@ -152,6 +175,7 @@ class Config:
     log_file: str | None = None
     log_max_bytes: int = 10 * 1024 * 1024  # 10 MB
     log_backup_count: int = 5
+    llm_small_model: str | None = None  # Small/fast model for SMALL_MODEL_TASKS
     llm_vision_model: str | None = None  # Vision model for image understanding
     llm_vision_api_url: str | None = None  # Override API URL for vision model
     llm_vision_api_key: str | None = None  # Override API key for vision model
@@ -194,6 +218,9 @@ class Config:
     browser_host: str = "localhost"
     browser_port: int = 9090
 
+    # Negotiate HTTP/2 on the shared outbound HTTP pool (needs the h2 package)
+    http2_enabled: bool = False
+
     # Runtime-configurable params (DB override → env override → default)
     runtime: RuntimeParams = field(default_factory=RuntimeParams)
 
@@ -203,6 +230,7 @@ class Config:
         _load_dotenv()
         channel_type = _detect_channel_type()
         _validate_channel_config(channel_type)
+        _validate_llm_urls()
         return cls(**_collect_env_vars(channel_type), runtime=_build_runtime_params(db))
 
 
@@ -99,6 +99,19 @@ def _validate_positive_float(value: str) -> float:
     return parsed
 
 
+def _validate_non_negative_float(value: str) -> float:
+    """Validate a non-negative float (0 allowed — e.g. to disable a feature)."""
+    try:
+        parsed = float(value)
+    except ValueError as e:
+        raise ValueError("must be a non-negative number") from e
+
+    if parsed < 0:
+        raise ValueError("must be a non-negative number")
+
+    return parsed
+
+
 def _validate_non_empty_string(value: str) -> str:
     """Validate non-empty string."""
     stripped = value.strip()
@@ -112,6 +125,22 @@ DOMAIN_MODE_ALLOW_ALL = "allow_all"
 _VALID_DOMAIN_MODES = {DOMAIN_MODE_RESTRICT, DOMAIN_MODE_ALLOW_ALL}
 
 
+def _validate_name_list(value: str) -> str:
+    """Validate a comma-separated list of names ("none" or empty for no names)."""
+    if value.strip().lower() == "none":
+        return ""
+    return ",".join(name.strip() for name in value.split(",") if name.strip())
+
+
+def _validate_budgets(value: str) -> str:
+    """Validate an LLM_BUDGETS spec ("none" or empty for no budgets)."""
+    from penny.llm.budgets import format_budgets, parse_budgets
+
+    if value.strip().lower() == "none":
+        return ""
+    return format_budgets(parse_budgets(value))
+
+
 def _validate_domain_mode(value: str) -> str:
     """Validate domain permission mode."""
     stripped = value.strip().lower()
@@ -133,6 +162,19 @@ def _validate_unit_float(value: str) -> float:
     return parsed
 
 
+def _validate_percentile(value: str) -> int:
+    """Validate an integer percentile in [0, 99] (0 disables the feature)."""
+    try:
+        parsed = int(value)
+    except ValueError as e:
+        raise ValueError("must be an integer between 0 and 99") from e
+
+    if not (0 <= parsed <= 99):
+        raise ValueError("must be an integer between 0 and 99")
+
+    return parsed
+
+
 # ── Chat — foreground conversation ───────────────────────────────────────────
 
 ConfigParam(
@@ -153,6 +195,65 @@ ConfigParam(
     group=GROUP_CHAT,
 )
 
+ConfigParam(
+    key="MESSAGE_COALESCE_SECONDS",
+    description=(
+        "How long a sender's message waits for follow-ups before the chat agent "
+        "runs; messages in the same burst (and a turn they supersede) become one "
+        "agent turn.  Each new message or typing indicator restarts the wait.  "
+        "0 runs every message immediately."
+    ),
+    type=float,
+    default=1.5,
+    validator=_validate_non_negative_float,
+    group=GROUP_CHAT,
+)
+
+ConfigParam(
+    key="CHAT_HEDGE_PERCENTILE",
+    description=(
+        "Hedge chat model calls when LLM_API_URL lists several endpoints: if the "
+        "chosen endpoint hasn't started answering within this percentile of recent "
+        "latencies, the same request is sent to another endpoint and the first to "
+        "answer wins.  Background agents never hedge.  0 disables hedging."
+    ),
+    type=int,
+    default=0,
+    validator=_validate_percentile,
+    group=GROUP_CHAT,
+)
+
+ConfigParam(
+    key="CONTEXT_TOKEN_BUDGET",
+    description=(
+        "Estimated-token budget for a chat turn's variable context, spent in "
+        "priority order: conversation history (newest turns first), the browser "
+        "page text (truncated to fit), then ambient recall (highest-ranked entries "
+        "first).  Whatever doesn't fit is dropped and the allocation is logged.  "
+        "The system prompt (memory inventory included) is never trimmed.  0 "
+        "disables the budget."
+    ),
+    type=int,
+    default=12000,
+    validator=_validate_non_negative_int,
+    group=GROUP_CHAT,
+)
+
+ConfigParam(
+    key="TOOL_RESULT_TOKEN_BUDGET",
+    description=(
+        "Estimated tokens of earlier tool results an agent loop keeps in full.  "
+        "Past this, older results are compacted to a short digest (their section "
+        "headers plus a note the call can be repeated) so long browse-heavy runs "
+        "stop re-sending every page on every step.  Results of the latest step are "
+        "never compacted.  0 disables compaction."
+    ),
+    type=int,
+    default=16000,
+    validator=_validate_non_negative_int,
+    group=GROUP_CHAT,
+)
+
 # ── Background — every background agent (thinking, notify, extractors) ───────
 
 ConfigParam(
@@ -222,6 +323,33 @@ ConfigParam(
     group=GROUP_BACKGROUND,
 )
 
+ConfigParam(
+    key="COLLECTOR_YIELD_WINDOW",
+    description=(
+        "How many of each collection's recent completed runs the dispatcher reads "
+        "to estimate its yield — productive cycles (worked / incomplete) per "
+        "GPU-second of model time.  Among ready collections the highest expected "
+        "yield runs first.  0 disables yield ordering (plain most-overdue first)."
+    ),
+    type=int,
+    default=20,
+    validator=_validate_non_negative_int,
+    group=GROUP_BACKGROUND,
+)
+
+ConfigParam(
+    key="COLLECTOR_STARVATION_FACTOR",
+    description=(
+        "Starvation guard for yield ordering: a ready collection left uncollected "
+        "for this many multiples of its own interval jumps ahead of every "
+        "higher-yield one, so low-yield collections still run eventually."
+    ),
+    type=float,
+    default=3.0,
+    validator=_validate_positive_float,
+    group=GROUP_BACKGROUND,
+)
+
 ConfigParam(
     key="IDLE_SECONDS",
     description="Seconds of silence before idle-gated background agents become eligible",
@@ -231,6 +359,72 @@ ConfigParam(
     group=GROUP_BACKGROUND,
 )
 
+ConfigParam(
+    key="PREFIX_WARM_IDLE_SECONDS",
+    description=(
+        "Seconds the chat model may go unused before its cached prompt prefix "
+        "counts as cold and is re-warmed during idle time — keep it under the "
+        "server's keep-alive.  The prefix is also re-warmed whenever it drifts "
+        "(inventory changes, new day) or other work displaced it.  0 disables warming."
+    ),
+    type=int,
+    default=240,
+    validator=_validate_non_negative_int,
+    group=GROUP_BACKGROUND,
+)
+
+ConfigParam(
+    key="PREFIX_WARM_WINDOW_SECONDS",
+    description=(
+        "Seconds after the user's last message (or browser activity) during which "
+        "the chat prefix is kept warm.  Past it the warmer stops until they're back, "
+        "rather than re-warming all night.  0 warms with no time limit."
+    ),
+    type=int,
+    default=1800,
+    validator=_validate_non_negative_int,
+    group=GROUP_BACKGROUND,
+)
+
+ConfigParam(
+    key="SMALL_MODEL_TASKS",
+    description=(
+        "Agents, commands and collections whose prompts go to LLM_SMALL_MODEL "
+        "(comma-separated, e.g. startup,schedule,collector or a collection name; "
+        "none = all on the main model).  Output a validator rejects is redone "
+        "on the main model."
+    ),
+    type=str,
+    default="startup,schedule",
+    validator=_validate_name_list,
+    group=GROUP_BACKGROUND,
+)
+
+ConfigParam(
+    key="LLM_BUDGETS",
+    description=(
+        "Reasoning effort and output-token caps per agent or prompt type, as "
+        "comma-separated key=effort:max_tokens (e.g. collector=low:2048,chat=medium; "
+        "key may be agent/prompt_type or *).  none = server defaults everywhere."
+    ),
+    type=str,
+    default="",
+    validator=_validate_budgets,
+    group=GROUP_BACKGROUND,
+)
+
+ConfigParam(
+    key="LLM_CACHE_TTL_SECONDS",
+    description=(
+        "How long a cached response to a deterministic (temperature 0) call marked "
+        "cacheable is reused (0 = cache off)"
+    ),
+    type=int,
+    default=86400,
+    validator=_validate_non_negative_int,
+    group=GROUP_BACKGROUND,
+)
+
 ConfigParam(
     key="EMBEDDING_BACKFILL_BATCH_LIMIT",
     description="Max items per embedding backfill cycle on startup",
@@ -366,6 +560,36 @@ ConfigParam(
     group=GROUP_BROWSE,
 )
 
+ConfigParam(
+    key="BROWSE_CACHE_PAGE_TTL_SECONDS",
+    description="How long a page read is reused for the same URL (0 = always re-read)",
+    type=int,
+    default=3600,
+    validator=_validate_non_negative_int,
+    group=GROUP_BROWSE,
+)
+
+ConfigParam(
+    key="BROWSE_CACHE_SEARCH_TTL_SECONDS",
+    description="How long search results are reused for the same query (0 = always re-search)",
+    type=int,
+    default=900,
+    validator=_validate_non_negative_int,
+    group=GROUP_BROWSE,
+)
+
+ConfigParam(
+    key="BROWSE_PAGE_TOKEN_BUDGET",
+    description=(
+        "Max tokens of one browsed page shown to the model; longer pages show their "
+        "most relevant sections (0 = whole page)"
+    ),
+    type=int,
+    default=2500,
+    validator=_validate_non_negative_int,
+    group=GROUP_BROWSE,
+)
+
 ConfigParam(
     key="DOMAIN_PERMISSION_MODE",
     description="Domain mode: restrict (prompt) or allow_all (auto-allow unknown)",
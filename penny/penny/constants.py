@@ -65,6 +65,21 @@ class ChatPromptType(StrEnum):
     USER_MESSAGE = "user_message"
     VISION_MESSAGE = "vision_message"
     VISION_CAPTION = "vision_caption"
+    PREFIX_WARM = "prefix_warm"
+
+
+class LlmLane(StrEnum):
+    """Admission lanes of the ``LlmScheduler``, highest priority first.
+
+    Interactive chat and embedding serve a user who is waiting; background is
+    the scheduler's collector / schedule / drainer work; backfill is bulk
+    re-embedding that only needs to finish eventually.
+    """
+
+    CHAT = "chat"
+    EMBED = "embed"
+    BACKGROUND = "background"
+    BACKFILL = "backfill"
 
 
 class PennyConstants:
@@ -102,6 +117,12 @@ class PennyConstants:
     BROWSE_RETRIES = 4
     BROWSE_RETRY_DELAY = 1.0
     BROWSE_REQUEST_TIMEOUT = 30.0
+    # Browse page cache (``penny.tools.page_cache``): how many recent page and
+    # search reads the in-process LRU keeps.
+    BROWSE_CACHE_MAX_ENTRIES = 128
+    # Long-page chunking (``penny.tools.page_chunks``): the size pages are
+    # split to for relevance selection and ``browse-passages`` entries.
+    BROWSE_CHUNK_CHARS = 1200
 
     # Egress image matching (side-channel media attach).  When an outgoing message
     # links no source page, we fall back to embedding-nearest and pick uniformly
@@ -109,6 +130,9 @@ class PennyConstants:
     # consecutive messages.  Exact-URL and same-domain matches are deterministic
     # (the cited page's own image is the right one) — jitter applies only here.
     MEDIA_MATCH_JITTER_TOPK = 5
+    # Directory beside the database file that holds media bytes, one file per
+    # sha256 (``penny.database.blob_store``).
+    MEDIA_BLOB_DIR = "media"
 
     # ``log_read`` window-mode look-back (seconds) for chat/schedule reads — the
     # "what just happened" range.  1 hour.
@@ -118,6 +142,64 @@ class PennyConstants:
     # TCP-handshake / TLS deadline — the per-request read/write deadline is the
     # separately configurable ``LLM_TIMEOUT``.
     LLM_CONNECT_TIMEOUT_SECONDS = 5.0
+
+    # Multi-endpoint LLM routing (``penny.llm.endpoints``).  A connection /
+    # timeout / 5xx failure takes an endpoint out of rotation for the backoff,
+    # doubled per consecutive failure up to the cap.  Hedging places its delay at
+    # a percentile of the last LLM_HEDGE_LATENCY_WINDOW first-response
+    # latencies, once there are enough of them.
+    LLM_ENDPOINT_BACKOFF_SECONDS = 5.0
+    LLM_ENDPOINT_MAX_BACKOFF_SECONDS = 60.0
+    LLM_HEDGE_LATENCY_WINDOW = 50
+    LLM_HEDGE_MIN_SAMPLES = 10
+
+    # Chat prefix warmer (``penny.scheduler.prefix_warmer``): how often it
+    # checks (idle-gated) whether the chat prefix is still cached, and the
+    # user turn of its max_tokens=1 probe request.
+    PREFIX_WARM_CHECK_INTERVAL = 30.0
+    PREFIX_WARM_PROBE = "."
+
+    # Model residency (``penny.llm.residency``).  How long an Ollama
+    # ``/api/ps`` reading is trusted, the keep-alive the pinned (chat /
+    # embedding) models get while the user is active and how long their
+    # requests must have gone quiet before it's re-sent, and the smoothing of
+    # each model's warm first-response latency — the baseline a load's "time
+    # lost" is measured against.
+    RESIDENCY_PS_TTL_SECONDS = 10.0
+    RESIDENCY_HTTP_TIMEOUT_SECONDS = 5.0
+    RESIDENCY_ACTIVE_KEEP_ALIVE = "30m"
+    RESIDENCY_PIN_SETTLE_SECONDS = 1.0
+    RESIDENCY_WARM_LATENCY_ALPHA = 0.2
+
+    # Channel ingress pipeline (``penny.channels.ingress``): how many inbound
+    # frames one channel may hold waiting or running before its receive loop
+    # stops reading, and how many run at once.
+    INGRESS_QUEUE_DEPTH = 64
+    INGRESS_WORKERS = 4
+
+    # Deterministic response cache (``penny.llm.response_cache``): how many
+    # responses the in-process LRU keeps in front of the SQLite tier.
+    LLM_CACHE_MEMORY_ENTRIES = 256
+
+    # LLM request scheduler (``penny.llm.scheduler``): how many requests each
+    # lane may have in flight at once (0 = uncapped).  Background and backfill
+    # are single-file so at most one long generation ever sits between a user
+    # message and the model.
+    LLM_LANE_CONCURRENCY = {
+        LlmLane.CHAT: 4,
+        LlmLane.EMBED: 4,
+        LlmLane.BACKGROUND: 1,
+        LlmLane.BACKFILL: 1,
+    }
+
+    # Shared outbound HTTP pool (``penny.http_transport``).  Every integration —
+    # LLM endpoints, Signal, JMAP, Zoho, Ollama's REST API — draws connections
+    # from one pool.  The keep-alive expiry is well above httpx's 5 s default so
+    # a connection to the LLM host survives the gaps between agent steps instead
+    # of being re-established for nearly every call.
+    HTTP_POOL_MAX_CONNECTIONS = 64
+    HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS = 32
+    HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS = 120.0
     MAX_SEARCH_LINKS = 10
     BROWSE_SEARCH_HEADER = "## browse search: "
     BROWSE_PAGE_HEADER = "## browse: "
@@ -200,6 +282,14 @@ class PennyConstants:
     # or "yes". Anything below this is treated as EMPTY and retried.
     MIN_RESPONSE_LETTERS = 3
     TOOL_FAILURE_ABORT_THRESHOLD = 2
+    # Characters per token for pre-send prompt-size estimates (``penny.llm.tokens``).
+    # ~4 is the usual ratio for English prose under BPE tokenizers; close enough
+    # for budgeting, never used where an exact count matters.
+    CHARS_PER_TOKEN = 4
+    # Marker closing a tool result the loop has compacted to a digest — how
+    # compaction recognises a result it already digested (it's sticky: a digest
+    # is never re-expanded, so the resent prefix stays byte-identical).
+    COMPACTED_RESULT_MARKER = "[compacted:"
 
     # Thinking constants
     MIN_THOUGHT_WORDS = 50
@@ -220,6 +310,31 @@ class PennyConstants:
     # while a suspended background script never processes the tool request, so
     # the protocol-level ping cannot detect it.  ~3 missed beats of slack.
     BROWSER_HEARTBEAT_TIMEOUT_SECONDS = 45.0
+    # Tool-request dispatch across connected browsers: how many requests one
+    # browser renders at once (one browse call's default MAX_QUERIES fits on a
+    # single browser), and how many times a request whose socket dropped
+    # mid-flight is re-sent on another browser before the error surfaces.
+    BROWSER_TOOL_CONCURRENCY = 3
+    BROWSER_TOOL_REDISPATCHES = 2
+    # Live updates to the addon (``penny.channels.browser.live``): how many
+    # updates one socket may have waiting before the oldest are dropped for a
+    # resync, how long memory changes settle before one coalesced event goes
+    # out, and how many new entries that event carries.
+    BROWSER_LIVE_QUEUE_DEPTH = 32
+    BROWSER_LIVE_DEBOUNCE_SECONDS = 0.25
+    BROWSER_LIVE_DELTA_ROWS = 20
+    # The longest prompt snippet a collapsed prompt row shows — sent in place of
+    # the full prompt by live updates and the prompt-log run index alike.
+    PROMPT_SNIPPET_CHARS = 200
+    # Prompts per ``run_detail_response`` frame when an expanded run card
+    # streams its turns in.
+    BROWSER_RUN_DETAIL_CHUNK = 4
+
+    # Discord channel constants
+    # Minimum gap between edits of a streaming reply preview.  Discord rate-limits
+    # message edits to ~5 per 5 s per channel; a faster cadence gets 429s that
+    # stall the stream callback, so intermediate prefixes are skipped instead.
+    DISCORD_PREVIEW_EDIT_INTERVAL_SECONDS = 1.0
 
     # System log memories (created by migration 0026) that the channel
     # adapter and browse tool side-effect-write to on every turn.
@@ -247,10 +362,11 @@ class PennyConstants:
     PUBLISHED_COLDSTART_LOOKBACK_SECONDS = 7 * 86400
     MEMORY_PENNY_MESSAGES_LOG = "penny-messages"
     MEMORY_BROWSE_RESULTS_LOG = "browse-results"
+    MEMORY_BROWSE_PASSAGES_LOG = "browse-passages"
 
     # The system logs are populated exclusively by Python side-effects —
     # channel ingress/egress (``user-messages`` / ``penny-messages``), the
-    # browse tool (``browse-results``), and the collector dispatcher
+    # browse tool (``browse-results`` / ``browse-passages``), and the collector dispatcher
     # (``collector-runs``).  Agents may *read* them but must never append via
     # the ``log_append`` tool: a model-authored entry would corrupt the
     # conversation-turn reconstruction or forge an audit row.  Enforced in
@@ -260,6 +376,7 @@ class PennyConstants:
             MEMORY_USER_MESSAGES_LOG,
             MEMORY_PENNY_MESSAGES_LOG,
             MEMORY_BROWSE_RESULTS_LOG,
+            MEMORY_BROWSE_PASSAGES_LOG,
             MEMORY_COLLECTOR_RUNS_LOG,
         }
     )
@@ -0,0 +1,95 @@
+"""Content-addressed blob store — media bytes on disk, beside the database.
+
+Each blob lives at ``<root>/<sha256[:2]>/<sha256>``; the ``media`` table keeps
+only the digest and metadata.  Images are the only large values Penny stores,
+and holding them in SQLite bloated the main file, slowed backups and VACUUM,
+and pulled megabytes through the page cache on every egress attach.
+
+- **Atomic.**  A blob is written to a temp file in its shard directory,
+  fsynced, then renamed into place — a reader never sees a partial file.
+- **Deduplicated.**  The same bytes hash to the same path, so a page image
+  captured twice is stored once.
+- **Mapped on read.**  ``open`` memory-maps the file, so attaching an image
+  base64-encodes straight from the OS page cache without copying it first.
+- **Collected.**  ``collect`` removes files no row references (a row dropped,
+  a crash between write and insert) and leftover temp files.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import mmap
+import os
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_TEMP_PREFIX = ".tmp-"
+
+
+class BlobStore:
+    """sha256-addressed files under ``root``."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+
+    def path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def put(self, data: bytes) -> str:
+        """Store ``data`` and return its sha256 hex digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        target = self.path(digest)
+        if target.exists():
+            return digest
+        target.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix=_TEMP_PREFIX, dir=target.parent)
+        try:
+            with os.fdopen(fd, "wb") as temp:
+                temp.write(data)
+                temp.flush()
+                os.fsync(temp.fileno())
+            os.replace(temp_name, target)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        return digest
+
+    def read(self, digest: str) -> bytes:
+        return self.path(digest).read_bytes()
+
+    @contextmanager
+    def open(self, digest: str) -> Iterator[bytes | mmap.mmap]:
+        """The blob's bytes as a read-only memory map (empty blobs can't be
+        mapped, so they come back as ``b""``)."""
+        with self.path(digest).open("rb") as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                yield b""
+                return
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                yield mapped
+
+    def collect(self, referenced: set[str]) -> int:
+        """Delete every file under ``root`` that isn't a ``referenced`` blob —
+        orphans and interrupted writes alike.  Returns how many were removed.
+
+        Only safe while nothing is writing: a blob put but not yet recorded in
+        its row would look orphaned."""
+        if not self.root.exists():
+            return 0
+        removed = 0
+        for shard in self.root.iterdir():
+            if not shard.is_dir():
+                continue
+            for file in shard.iterdir():
+                if file.name in referenced:
+                    continue
+                file.unlink(missing_ok=True)
+                removed += 1
+        if removed:
+            logger.info("Removed %d unreferenced media blob(s) from %s", removed, self.root)
+        return removed
@@ -6,9 +6,12 @@ from pathlib import Path
 from sqlmodel import Session, SQLModel, create_engine
 
 from penny.config_params import RuntimeParams
+from penny.constants import PennyConstants
+from penny.database.blob_store import BlobStore
 from penny.database.cursor_store import CursorStore
 from penny.database.device_store import DeviceStore
 from penny.database.domain_permission_store import DomainPermissionStore
+from penny.database.llm_cache_store import LlmCacheStore
 from penny.database.media_store import MediaStore
 from penny.database.memory import Memory, MemoryStore
 from penny.database.message_store import MessageStore
@@ -27,7 +30,8 @@ class Database:
         cursors: Per-agent read cursors into log-shaped memories
         devices: Device registration and lookup
         domain_permissions: Domain access permissions for browser tools
-        media: Binary media referenced by memory entries via <media:ID> tokens
+        llm_cache: Persistent tier of the deterministic LLM response cache
+        media: Browsed images — metadata rows, bytes in a content-addressed blob store
         memories: Unified collection + log access (task/memory framework)
         messages: Message/prompt/command logging, threading, queries
         preferences: User preference CRUD and dedup
@@ -44,7 +48,10 @@ class Database:
         self.cursors = CursorStore(self.engine)
         self.devices = DeviceStore(self.engine)
         self.domain_permissions = DomainPermissionStore(self.engine)
-        self.media = MediaStore(self.engine)
+        self.llm_cache = LlmCacheStore(self.engine)
+        self.media = MediaStore(
+            self.engine, BlobStore(Path(db_path).parent / PennyConstants.MEDIA_BLOB_DIR)
+        )
         self.memories = MemoryStore(self.engine, runtime=runtime)
         self.messages = MessageStore(self.engine)
         self.preferences = PreferenceStore(self.engine)
@@ -0,0 +1,32 @@
+"""FTS5 full-text matching — the shared query shape for the search indexes.
+
+``promptlog_fts`` (migration 0051) and ``memory_entry_fts`` (0080) are
+external-content FTS5 indexes kept in sync by triggers.  A ``LIKE '%text%'``
+can't use a B-tree index, so substring search scans the whole table; a MATCH
+walks the inverted index instead.  Both searches turn the user's text into the
+same per-word prefix query.
+"""
+
+from __future__ import annotations
+
+import re
+
+from sqlalchemy import column, text
+from sqlalchemy.sql.selectable import TextualSelect
+
+
+def prefix_match(search: str) -> str:
+    """The FTS5 query for ``search``: each word as a prefix term, implicitly
+    ANDed (``morning news`` → ``morning* news*``).  Empty when the text has no
+    searchable word characters — there is nothing to match."""
+    return " ".join(f"{token}*" for token in re.findall(r"\w+", search.lower()))
+
+
+def matching_rowids(fts_table: str, match: str) -> TextualSelect:
+    """A ``SELECT rowid`` of the ``fts_table`` rows matching ``match`` (a
+    ``prefix_match`` query), for an ``id IN (...)`` filter on the content table."""
+    return (
+        text(f"SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH :match")
+        .bindparams(match=match)
+        .columns(column("rowid"))
+    )
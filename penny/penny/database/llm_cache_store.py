@@ -0,0 +1,50 @@
+"""LLM cache store — the persistent tier of the deterministic response cache.
+
+``ResponseCache`` keeps recent responses in memory; this store keeps them
+across restarts, keyed by the request digest.  Freshness is the caller's
+call: reads take the oldest acceptable ``created_at`` and writes prune
+everything older, so the table never outgrows one TTL of traffic.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import UTC, datetime
+
+from sqlmodel import Session, delete
+
+from penny.database.models import LlmCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+class LlmCacheStore:
+    """Read and write cached LLM responses by request digest."""
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def _session(self) -> Session:
+        return Session(self.engine)
+
+    def get(self, key: str, since: datetime) -> LlmCacheEntry | None:
+        """The entry cached under ``key``, if it was stored at or after ``since``."""
+        with self._session() as session:
+            row = session.get(LlmCacheEntry, key)
+        if row is None or row.created_at.replace(tzinfo=UTC) < since:
+            return None
+        return row
+
+    def put(self, key: str, model: str, response: str, prune_before: datetime) -> None:
+        """Store ``response`` under ``key`` and drop entries older than ``prune_before``."""
+        with self._session() as session:
+            session.execute(delete(LlmCacheEntry).where(LlmCacheEntry.created_at < prune_before))
+            row = session.get(LlmCacheEntry, key)
+            if row is None:
+                row = LlmCacheEntry(key=key, model=model, response=response)
+            else:
+                row.response = response
+                row.created_at = datetime.now(UTC)
+            session.add(row)
+            session.commit()
+        logger.debug("Cached LLM response %s (model=%s)", key[:12], model)
@@ -1,19 +1,27 @@
-"""Media store — images captured while browsing, delivered side-channel at egress."""
+"""Media store — images captured while browsing, delivered side-channel at egress.
+
+Rows hold metadata and the sha256 of the image; the bytes live in the
+content-addressed ``BlobStore`` beside the database file.
+"""
 
 from __future__ import annotations
 
 import logging
+import mmap
 import random
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from typing import NamedTuple
 from urllib.parse import urlparse
 
-from similarity.embeddings import find_similar
+import numpy as np
 from sqlmodel import Session, select
 
 from penny.constants import PennyConstants
+from penny.database.blob_store import BlobStore
+from penny.database.memory._similarity import stack_normalized, stack_normalized_anchors
 from penny.database.models import Media
-from penny.llm.embeddings import deserialize_embedding
 
 logger = logging.getLogger(__name__)
 
@@ -32,14 +40,13 @@ def _domain(url: str) -> str:
         return ""
 
 
-class _Candidate(NamedTuple):
-    """A media row reduced to the columns egress matching needs — never the image
-    ``data`` blob, so selection doesn't load the whole (multi-GB) media table."""
+class _VectorIndex(NamedTuple):
+    """Every embedded media row's vector, stacked and unit-normalized once, so
+    a nearest-image lookup is one matrix-vector product instead of a pass
+    over every row."""
 
-    id: int
-    source_url: str
-    created_at: datetime
-    vector: list[float] | None
+    ids: np.ndarray
+    matrix: np.ndarray
 
 
 class MediaStore:
@@ -47,8 +54,11 @@ class MediaStore:
     message — the cited page's own image when the message links one, else a
     jittered embedding-nearest pick."""
 
-    def __init__(self, engine):
+    def __init__(self, engine, blobs: BlobStore):
         self.engine = engine
+        self.blobs = blobs
+        # One per embedding dimension, built on first lookup, dropped by ``put``.
+        self._vectors: dict[int, _VectorIndex] = {}
 
     def _session(self) -> Session:
         return Session(self.engine)
@@ -61,12 +71,17 @@ class MediaStore:
         title: str | None = None,
         embedding: bytes | None = None,
     ) -> int:
-        """Insert an image blob with its metadata and return its assigned id."""
+        """Store an image's bytes in the blob store and insert its metadata row;
+        return the row's assigned id."""
+        digest = self.blobs.put(data)
         with self._session() as session:
             row = Media(
                 mime_type=mime_type,
-                data=data,
+                sha256=digest,
+                size=len(data),
                 source_url=source_url,
+                normalized_url=_normalize_url(source_url) if source_url else None,
+                domain=_domain(source_url) if source_url else None,
                 title=title,
                 embedding=embedding,
                 created_at=datetime.now(UTC),
@@ -77,12 +92,39 @@ class MediaStore:
             if row.id is None:
                 raise RuntimeError("media row was inserted but has no id")
             logger.debug("Stored %d bytes as media %d (%s)", len(data), row.id, mime_type)
-            return row.id
+            media_id = row.id
+        if embedding is not None:
+            self._vectors.clear()
+        return media_id
 
     def get(self, media_id: int) -> Media | None:
         with self._session() as session:
             return session.get(Media, media_id)
 
+    def read(self, media: Media) -> bytes:
+        """The image bytes of ``media``."""
+        return self.blobs.read(media.sha256)
+
+    @contextmanager
+    def open(self, media: Media) -> Iterator[bytes | mmap.mmap]:
+        """The image bytes of ``media``, memory-mapped for the caller's block.
+
+        Raises ``OSError`` when the blob is missing or isn't the ``size`` the
+        row recorded (truncated or replaced on disk)."""
+        with self.blobs.open(media.sha256) as data:
+            if len(data) != media.size:
+                raise OSError(
+                    f"media blob {media.sha256} is {len(data)} bytes, expected {media.size}"
+                )
+            yield data
+
+    def collect_garbage(self) -> int:
+        """Delete blobs no media row references.  Run while nothing is storing
+        media (startup) — see ``BlobStore.collect``."""
+        with self._session() as session:
+            referenced = set(session.exec(select(Media.sha256)).all())
+        return self.blobs.collect(referenced)
+
     def select_image(self, urls: list[str], embedding: list[float] | None) -> Media | None:
         """Pick the image to attach to an egress message, most-relevant first.
 
@@ -99,80 +141,99 @@ class MediaStore:
            random pick among the top-K so a centroid "magnet" image can't repeat
            on consecutive messages (jitter applies *only* to this fallback).
 
-        Returns None only when nothing qualifies (no URL match and no embedded
-        media), so a reply still carries an image whenever one can be matched.
+        Tiers 1–2 seek the indexed ``normalized_url`` / ``domain`` columns; the
+        vector tiers score against the cached ``_VectorIndex`` of the query's
+        dimension.  Returns None
+        only when nothing qualifies (no URL match and no embedded media), so a
+        reply still carries an image whenever one can be matched.
         """
-        rows = self._candidates()
         chosen = (
-            self._cited_page_image(rows, urls)
-            or self._cited_domain_image(rows, urls, embedding)
-            or self._jittered_nearest(rows, embedding)
+            self._cited_page_image(urls)
+            or self._cited_domain_image(urls, embedding)
+            or self._jittered_nearest(embedding)
         )
         return self.get(chosen) if chosen is not None else None
 
-    def _candidates(self) -> list[_Candidate]:
-        """Every media row as a lightweight candidate (no ``data`` blob)."""
-        with self._session() as session:
-            rows = session.exec(
-                select(Media.id, Media.source_url, Media.created_at, Media.embedding)
-            ).all()
-        return [
-            _Candidate(
-                id=row[0],
-                source_url=row[1] or "",
-                created_at=row[2],
-                vector=deserialize_embedding(row[3]) if row[3] else None,
-            )
-            for row in rows
-            if row[0] is not None
-        ]
-
-    def _cited_page_image(self, rows: list[_Candidate], urls: list[str]) -> int | None:
+    def _cited_page_image(self, urls: list[str]) -> int | None:
         """Tier 1: the newest image captured from a page the message links."""
         linked = {_normalize_url(url) for url in urls}
-        matches = [row for row in rows if _normalize_url(row.source_url) in linked]
-        if not matches:
+        if not linked:
             return None
-        best = max(matches, key=lambda row: row.created_at)
-        logger.debug("Matched media %d by exact cited URL", best.id)
-        return best.id
-
-    def _cited_domain_image(
-        self, rows: list[_Candidate], urls: list[str], embedding: list[float] | None
-    ) -> int | None:
+        with self._session() as session:
+            best = session.exec(
+                select(Media.id)
+                .where(Media.normalized_url.in_(linked))
+                .order_by(Media.created_at.desc(), Media.id.desc())
+                .limit(1)
+            ).first()
+        if best is not None:
+            logger.debug("Matched media %d by exact cited URL", best)
+        return best
+
+    def _cited_domain_image(self, urls: list[str], embedding: list[float] | None) -> int | None:
         """Tier 2: embedding-nearest image from a domain the message links."""
         if embedding is None:
             return None
         domains = {_domain(url) for url in urls} - {""}
-        scoped = [row for row in rows if row.vector and _domain(row.source_url) in domains]
-        best_id = self._nearest_id(embedding, scoped, top_k=1)
-        if best_id is not None:
-            logger.debug("Matched media %d by cited domain", best_id)
-        return best_id
-
-    def _jittered_nearest(
-        self, rows: list[_Candidate], embedding: list[float] | None
-    ) -> int | None:
+        if not domains:
+            return None
+        with self._session() as session:
+            scoped = session.exec(
+                select(Media.id).where(
+                    Media.domain.in_(domains),
+                    Media.embedding != None,  # noqa: E711
+                )
+            ).all()
+        nearest = self._nearest_ids(embedding, top_k=1, within=[i for i in scoped if i])
+        if nearest:
+            logger.debug("Matched media %d by cited domain", nearest[0])
+        return nearest[0] if nearest else None
+
+    def _jittered_nearest(self, embedding: list[float] | None) -> int | None:
         """Tier 3: uniform random among the top-K embedding-nearest images."""
         if embedding is None:
             return None
-        scored = self._scored(embedding, [row for row in rows if row.vector])
-        if not scored:
+        pool = self._nearest_ids(embedding, top_k=PennyConstants.MEDIA_MATCH_JITTER_TOPK)
+        if not pool:
             return None
-        pool = [media_id for media_id, _ in scored[: PennyConstants.MEDIA_MATCH_JITTER_TOPK]]
         chosen = random.choice(pool)
         logger.debug("Matched media %d by jittered embedding (pool of %d)", chosen, len(pool))
         return chosen
 
-    def _scored(self, embedding: list[float], rows: list[_Candidate]) -> list[tuple[int, float]]:
-        """(id, cosine) for ``rows``, nearest first, no floor."""
-        return find_similar(
-            embedding,
-            [(row.id, row.vector) for row in rows if row.vector is not None],
-            top_k=len(rows) or 1,
-            threshold=-1.0,
-        )
-
-    def _nearest_id(self, embedding: list[float], rows: list[_Candidate], top_k: int) -> int | None:
-        scored = self._scored(embedding, rows)
-        return scored[0][0] if scored else None
+    def _nearest_ids(
+        self, embedding: list[float], top_k: int, within: list[int] | None = None
+    ) -> list[int]:
+        """Ids of the ``top_k`` embedded images nearest ``embedding``, nearest
+        first, no floor — over every embedded image, or only those ``within``.
+
+        ``argpartition`` finds the top-K without sorting every score; only the
+        K survivors are ordered."""
+        vectors = self._vector_index(len(embedding))
+        ids, matrix = vectors.ids, vectors.matrix
+        if within is not None:
+            keep = np.isin(ids, within)
+            ids, matrix = ids[keep], matrix[keep]
+        if not len(ids):
+            return []
+        scores = matrix @ stack_normalized_anchors([embedding])[0]
+        k = min(top_k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [int(ids[i]) for i in top]
+
+    def _vector_index(self, dim: int) -> _VectorIndex:
+        """The index of every ``dim``-dimensional embedding — rows embedded by
+        another model (or with an empty blob) can't be scored against the query."""
+        if dim not in self._vectors:
+            with self._session() as session:
+                rows = session.exec(
+                    select(Media.id, Media.embedding)
+                    .where(Media.embedding != None)  # noqa: E711
+                    .order_by(Media.id)
+                ).all()
+            rows = [row for row in rows if dim and row[1] and len(row[1]) == dim * 4]
+            self._vectors[dim] = _VectorIndex(
+                ids=np.array([row[0] for row in rows], dtype=np.int64),
+                matrix=stack_normalized(row[1] for row in rows),
+            )
+        return self._vectors[dim]
@@ -43,6 +43,7 @@ from sqlmodel import Session, select
 
 from penny.config_params import RuntimeParams
 from penny.constants import PennyConstants, RunOutcome
+from penny.database.fulltext import matching_rowids, prefix_match
 from penny.database.memory import _similarity as sim
 from penny.database.memory.types import (
     DedupThresholds,
@@ -59,6 +60,7 @@ from penny.database.memory.types import (
     slug,
 )
 from penny.database.models import MemoryEntry, MemoryRow, MessageLog, PromptLog
+from penny.database.paging import PageKey
 from penny.text_validity import degenerate_reason, half_formed_send_reason, is_low_info
 from penny.validation.conditions import ConditionKey, run_flag_conditions
 
@@ -194,14 +196,25 @@ class Memory:
     # ── Shared reads (every shape, via the row primitives below) ──────────────
 
     def newest_entries(
-        self, k: int | None = None, offset: int = 0, search: str | None = None
+        self,
+        k: int | None = None,
+        offset: int = 0,
+        search: str | None = None,
+        after: PageKey | None = None,
     ) -> list[MemoryEntry]:
         """Newest-first entries — the shape-independent internal read used by
         recall (recent mode), the log cursor's first read, and send_message's
         cooldown probe.  The model-facing ``collection_read_latest`` is the
         ``Collection.read_latest`` wrapper over this; logs reach it only through
-        ``read_batch``."""
-        return self._newest_rows(k, offset, search)
+        ``read_batch``.
+
+        ``search`` keeps entries whose key or content matches it word-by-word
+        as a prefix, via the ``memory_entry_fts`` full-text index (migration
+        0080) rather than a substring scan.  Ordered by ``(created_at, id)``
+        so ties page stably.  ``after`` resumes
+        past the previous page's last entry (keyset paging — the addon's detail
+        view), which unlike ``offset`` seeks rather than skips."""
+        return self._newest_rows(k, offset, search, after)
 
     def read_all(self) -> list[MemoryEntry]:
         return self._all_rows()
@@ -296,18 +309,26 @@ class Memory:
                 ).all()
             )
 
-    def _newest_rows(self, k: int | None, offset: int, search: str | None) -> list[MemoryEntry]:
+    def _newest_rows(
+        self, k: int | None, offset: int, search: str | None, after: PageKey | None
+    ) -> list[MemoryEntry]:
         with self._session() as session:
             query = (
                 select(MemoryEntry)
                 .where(MemoryEntry.memory_name == self.name)
-                .order_by(MemoryEntry.created_at.desc())  # type: ignore[union-attr]
+                .order_by(
+                    MemoryEntry.created_at.desc(),  # type: ignore[union-attr]
+                    MemoryEntry.id.desc(),  # type: ignore[union-attr]
+                )
             )
+            if after is not None:
+                query = query.where(after.older(MemoryEntry.created_at, MemoryEntry.id))
             if search:
-                like = f"%{search}%"
+                match = prefix_match(search)
+                if not match:
+                    return []
                 query = query.where(
-                    MemoryEntry.content.like(like)  # ty: ignore[unresolved-attribute]
-                    | MemoryEntry.key.like(like)  # ty: ignore[unresolved-attribute]
+                    MemoryEntry.id.in_(matching_rowids("memory_entry_fts", match))  # ty: ignore[unresolved-attribute]
                 )
             if offset:
                 query = query.offset(offset)
@@ -650,9 +671,16 @@ class MessageLogMemory(Log):
             rows = session.exec(self._select().order_by(MessageLog.timestamp.asc())).all()
         return [self._to_entry(row) for row in rows]
 
-    def _newest_rows(self, k: int | None, offset: int, search: str | None) -> list[MemoryEntry]:
+    def _newest_rows(
+        self, k: int | None, offset: int, search: str | None, after: PageKey | None
+    ) -> list[MemoryEntry]:
         with self._session() as session:
-            query = self._select().order_by(MessageLog.timestamp.desc())
+            query = self._select().order_by(
+                MessageLog.timestamp.desc(),  # type: ignore[union-attr]
+                MessageLog.id.desc(),  # type: ignore[union-attr]
+            )
+            if after is not None:
+                query = query.where(after.older(MessageLog.timestamp, MessageLog.id))
             if search:
                 query = query.where(MessageLog.content.like(f"%{search}%"))  # ty: ignore[union-attr]
             if offset:
@@ -1055,9 +1083,11 @@ class RunLog(Log):
     def _all_rows(self) -> list[MemoryEntry]:
         return self._records(newest_first=False)
 
-    def _newest_rows(self, k: int | None, offset: int, search: str | None) -> list[MemoryEntry]:
+    def _newest_rows(
+        self, k: int | None, offset: int, search: str | None, after: PageKey | None
+    ) -> list[MemoryEntry]:
         # ``search`` doesn't apply — runs are activity, not searchable entries.
-        return self._records(newest_first=True, limit=k, offset=offset)
+        return self._records(newest_first=True, limit=k, offset=offset, after=after)
 
     def _rows_since(self, cursor: datetime, cap: int | None) -> list[MemoryEntry]:
         return self._records(newest_first=False, cursor=cursor, limit=cap)
@@ -1076,11 +1106,14 @@ class RunLog(Log):
         window: tuple[datetime, datetime] | None = None,
         limit: int | None = None,
         offset: int = 0,
+        after: PageKey | None = None,
     ) -> list[MemoryEntry]:
         """Completion rows → rendered run records as ``MemoryEntry`` (content =
-        the record, created_at = completion time)."""
+        the record, created_at = completion time, id = the completion row)."""
         with self._session() as session:
-            rows = self._completion_rows(session, newest_first, cursor, window, limit, offset)
+            rows = self._completion_rows(
+                session, newest_first, cursor, window, limit, offset, after
+            )
             if not rows:
                 return []
             grouped = self._group_prompts(session, [run_id for run_id, _, _ in rows])
@@ -1094,6 +1127,7 @@ class RunLog(Log):
         window: tuple[datetime, datetime] | None,
         limit: int | None,
         offset: int,
+        after: PageKey | None = None,
     ) -> list:
         """The ``(run_id, completion_time, last_prompt_id)`` run-index rows for
         this scope — one per completed run, served by the partial index."""
@@ -1104,8 +1138,13 @@ class RunLog(Log):
             query = query.where(PromptLog.timestamp > cursor)
         if window is not None:
             query = query.where(PromptLog.timestamp >= window[0], PromptLog.timestamp <= window[1])
-        order = PromptLog.timestamp.desc() if newest_first else PromptLog.timestamp.asc()
-        query = query.order_by(order)  # type: ignore[union-attr]
+        if after is not None:
+            query = query.where(after.older(PromptLog.timestamp, PromptLog.id))
+        if newest_first:
+            order = (PromptLog.timestamp.desc(), PromptLog.id.desc())  # type: ignore[union-attr]
+        else:
+            order = (PromptLog.timestamp.asc(), PromptLog.id.asc())  # type: ignore[union-attr]
+        query = query.order_by(*order)
         if offset:
             query = query.offset(offset)
         if limit is not None:
@@ -22,6 +22,7 @@ from sqlmodel import Session, select
 
 from penny.config_params import RuntimeParams
 from penny.constants import PennyConstants
+from penny.database.fulltext import matching_rowids, prefix_match
 from penny.database.memory import _similarity as sim
 from penny.database.memory.objects import Collection, Log, Memory, MessageLogMemory, RunLog
 from penny.database.memory.types import (
@@ -55,7 +56,7 @@ class MemoryStore:
         * dispatch: memory, active_memories, run_log
         * metadata: create_collection, create_log, get, list_all, archive,
           unarchive, update_collection_metadata, mark_collected, set_cadence
-        * inventory: entry_counts, names_with_entry_match
+        * inventory: entry_counts, names_with_entry_match, latest_entry_with_prefix
         * dedup probe: exists
         * embedding backfill: get_entries_without_embeddings,
           get_memories_without_description_embedding, set_description_embedding,
@@ -256,20 +257,38 @@ class MemoryStore:
 
     def names_with_entry_match(self, search: str) -> set[str]:
         """Names of memories holding an entry whose ``key`` or ``content``
-        contains ``search`` — powers the addon's "search entries too" filter
-        (a substring LIKE; on-demand, so not indexed)."""
-        like = f"%{search}%"
+        matches ``search`` (each word as a prefix) — powers the addon's "search
+        entries too" filter.  Served by the ``memory_entry_fts`` index."""
+        match = prefix_match(search)
+        if not match:
+            return set()
         with self._session() as session:
             rows = session.exec(
                 select(MemoryEntry.memory_name)
-                .where(
-                    MemoryEntry.content.like(like)  # ty: ignore[unresolved-attribute]
-                    | MemoryEntry.key.like(like)  # ty: ignore[unresolved-attribute]
-                )
+                .where(MemoryEntry.id.in_(matching_rowids("memory_entry_fts", match)))  # ty: ignore[unresolved-attribute]
                 .distinct()
             ).all()
             return set(rows)
 
+    def latest_entry_with_prefix(
+        self, name: str, prefix: str, since: datetime
+    ) -> MemoryEntry | None:
+        """The newest entry of ``name`` written at or after ``since`` whose
+        content starts with ``prefix`` — how the browse page cache finds a
+        page already in ``browse-results``.  The window keeps it on
+        ``ix_memory_entry_name_created`` rather than the whole log."""
+        with self._session() as session:
+            return session.exec(
+                select(MemoryEntry)
+                .where(
+                    MemoryEntry.memory_name == name,
+                    MemoryEntry.created_at >= since,
+                    MemoryEntry.content.startswith(prefix, autoescape=True),  # ty: ignore[unresolved-attribute]
+                )
+                .order_by(MemoryEntry.created_at.desc())  # type: ignore[union-attr]
+                .limit(1)
+            ).first()
+
     def _notify_changed(self, name: str | None) -> None:
         if self._on_memory_changed is not None:
             self._on_memory_changed(name)
@@ -1,19 +1,22 @@
 """Message store — logging, threading, and queries for messages."""
 
+import contextlib
 import json
 import logging
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from datetime import datetime
 from typing import Any, NamedTuple
 
-from sqlalchemy import bindparam, func, text
+from sqlalchemy import DateTime, and_, bindparam, func, or_, text
 from sqlmodel import Session, select
 
 from penny.agents.models import MessageRole
-from penny.constants import PennyConstants, RunOutcome
+from penny.constants import ChatPromptType, PennyConstants, RunOutcome
+from penny.database.fulltext import prefix_match
 from penny.database.memory.objects import classify_run, render_run_record
 from penny.database.models import CommandLog, MemoryEntry, MessageLog, PromptLog
+from penny.database.paging import PageKey
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +26,54 @@ _STRIKETHROUGH_RE = re.compile(r"~{1,2}(.+?)~{1,2}")
 _MONOSPACE_RE = re.compile(r"`(.+?)`")
 _TILDE_OPERATOR = "\u223c"
 
+# Run outcomes that changed durable state \u2014 the "useful" half of a run's yield.
+_PRODUCTIVE_OUTCOMES = frozenset({RunOutcome.WORKED.value, RunOutcome.INCOMPLETE.value})
+
+
+def prompt_snippet(response: dict) -> str:
+    """The last turn of a logged prompt for its collapsed row: the tool calls
+    it made, or else its reply, whitespace-collapsed and clipped."""
+    choices = response.get("choices") or []
+    if not choices:
+        return ""
+    message = choices[0].get("message") or {}
+    tool_calls = message.get("tool_calls") or []
+    if tool_calls:
+        return _clip(", ".join(_tool_call_label(call) for call in tool_calls))
+    return _clip(message.get("content"))
+
+
+def user_snippet(messages: list[dict]) -> str:
+    """The last user message a prompt sent, whitespace-collapsed and clipped."""
+    for message in reversed(messages):
+        if message.get("role") != "user":
+            continue
+        snippet = _clip(message.get("content"))
+        if snippet:
+            return snippet
+    return ""
+
+
+def _tool_call_label(call: dict) -> str:
+    function = call.get("function") or {}
+    arguments = function.get("arguments")
+    if isinstance(arguments, str):
+        with contextlib.suppress(json.JSONDecodeError):
+            arguments = json.loads(arguments)
+    if isinstance(arguments, dict):
+        queries = arguments.get("queries")
+        if isinstance(queries, list):
+            arguments = ", ".join(str(query) for query in queries)
+        else:
+            arguments = json.dumps(arguments)
+    return f"{function.get('name') or 'tool'}({arguments or ''})"
+
+
+def _clip(content: object) -> str:
+    if not isinstance(content, str):
+        return ""
+    return " ".join(content.split())[: PennyConstants.PROMPT_SNIPPET_CHARS]
+
 
 class PromptPerf(NamedTuple):
     """Aggregate wall time + token usage across logged prompts.
@@ -35,6 +86,13 @@ class PromptPerf(NamedTuple):
     reasoning trace, so to expose how much of the generation was reasoning we
     also carry the character lengths of the stored ``thinking`` trace and the
     visible ``content``; their ratio gives the reasoning share of generation.
+
+    ``aborted_tokens`` counts decode that was cut off mid-stream as degenerate —
+    GPU work spent on calls whose output was thrown away.
+
+    ``budget_hits`` counts calls whose output ran into their ``LLM_BUDGETS``
+    token cap.  ``cache_hits`` counts calls answered from the response cache;
+    their replayed token usage isn't counted, since nothing was generated.
     """
 
     calls: int
@@ -43,6 +101,9 @@ class PromptPerf(NamedTuple):
     output_tokens: int
     thinking_chars: int = 0
     output_chars: int = 0
+    aborted_tokens: int = 0
+    budget_hits: int = 0
+    cache_hits: int = 0
 
     @property
     def tokens_per_second(self) -> float:
@@ -60,6 +121,30 @@ class PromptPerf(NamedTuple):
         return self.thinking_chars / total if total else 0.0
 
 
+class RunYield(NamedTuple):
+    """A collector target's recent track record: how many completed runs, how
+    many of them were productive (``worked`` / ``incomplete`` — durable state
+    changed), and the model wall time they cost in total.
+
+    ``duration_ms`` is the summed ``duration_ms`` of every prompt in those runs —
+    on a single local GPU that is GPU time, the budget the dispatcher spends."""
+
+    runs: int
+    productive_runs: int
+    duration_ms: int
+
+    @property
+    def productive_per_gpu_second(self) -> float:
+        """Expected productive cycles per GPU-second of a future run.
+
+        The productive rate is Laplace-smoothed (one productive + one idle run
+        of prior) so a short streak neither zeroes a collection out nor makes it
+        look perfect; it's divided by the mean seconds a run costs."""
+        rate = (self.productive_runs + 1) / (self.runs + 2)
+        mean_seconds = max(self.duration_ms, 1) / max(self.runs, 1) / 1000
+        return rate / mean_seconds
+
+
 class MessageStore:
     """Manages MessageLog, PromptLog, and CommandLog records."""
 
@@ -140,10 +225,15 @@ class MessageStore:
         tools: list[dict] | None = None,
         thinking: str | None = None,
         duration_ms: int | None = None,
+        ttft_ms: int | None = None,
+        aborted_tokens: int | None = None,
         agent_name: str | None = None,
         prompt_type: str | None = None,
         run_id: str | None = None,
         run_target: str | None = None,
+        budget: str | None = None,
+        budget_hit: bool | None = None,
+        cached: bool | None = None,
     ) -> None:
         """Log a prompt/response exchange with Ollama."""
         try:
@@ -155,10 +245,15 @@ class MessageStore:
                     response=json.dumps(response),
                     thinking=thinking,
                     duration_ms=duration_ms,
+                    ttft_ms=ttft_ms,
+                    aborted_tokens=aborted_tokens,
                     agent_name=agent_name,
                     prompt_type=prompt_type,
                     run_id=run_id,
                     run_target=run_target,
+                    budget=budget,
+                    budget_hit=budget_hit,
+                    cached=cached,
                 )
                 session.add(log)
                 session.commit()
@@ -174,6 +269,11 @@ class MessageStore:
                             "agent_name": agent_name or "",
                             "prompt_type": prompt_type or "",
                             "duration_ms": duration_ms or 0,
+                            "ttft_ms": ttft_ms,
+                            "aborted_tokens": aborted_tokens,
+                            "budget": budget,
+                            "budget_hit": budget_hit,
+                            "cached": cached,
                             "input_tokens": input_tokens,
                             "output_tokens": output_tokens,
                             "run_id": run_id,
@@ -569,6 +669,41 @@ class MessageStore:
             ).all()
         return [(timestamp, reason) for timestamp, reason in rows if reason]
 
+    def run_yield(self, run_target: str, limit: int) -> RunYield:
+        """Aggregate ``run_target``'s ``limit`` most recent completed runs into a
+        :class:`RunYield` — what the collector dispatcher ranks ready
+        collections by.
+
+        Light columns only: the completion rows (one per run, served by
+        ``ix_promptlog_target_runs``) give the outcomes, and a ``SUM`` over
+        ``duration_ms`` for just those run_ids (``ix_promptlog_run_id_timestamp``)
+        gives the cost — no ``messages`` / ``response`` blobs are read.
+        Cancelled runs (preempted, not a real outcome) are excluded.
+        """
+        if limit <= 0:
+            return RunYield(0, 0, 0)
+        with self._session() as session:
+            rows = session.exec(
+                select(PromptLog.run_id, PromptLog.run_outcome)
+                .where(
+                    PromptLog.run_outcome.isnot(None),  # ty: ignore[unresolved-attribute]
+                    PromptLog.run_target == run_target,
+                    PromptLog.run_outcome != RunOutcome.CANCELLED.value,
+                )
+                .order_by(PromptLog.timestamp.desc())
+                .limit(limit)
+            ).all()
+            run_ids = [run_id for run_id, _ in rows if run_id is not None]
+            if not run_ids:
+                return RunYield(0, 0, 0)
+            duration_ms = session.exec(
+                select(func.coalesce(func.sum(PromptLog.duration_ms), 0)).where(
+                    PromptLog.run_id.in_(run_ids)  # ty: ignore[unresolved-attribute]
+                )
+            ).one()
+        productive = sum(1 for _, outcome in rows if outcome in _PRODUCTIVE_OUTCOMES)
+        return RunYield(len(run_ids), productive, int(duration_ms))
+
     def target_run_records(self, run_target: str, limit: int) -> list[MemoryEntry]:
         """One collector's recent runs as rendered RECORDS (newest first) — the
         same ``render_run_record`` representation the model reads from
@@ -626,15 +761,23 @@ class MessageStore:
         agent_name: str | None = None,
         query: str | None = None,
         flagged_only: bool = False,
+        after: PageKey | None = None,
     ) -> list[dict]:
-        """Get prompt logs grouped by run_id, newest first.
-
-        Returns a list of run summaries with their individual prompts.
-        Pagination happens at the run level in SQL: stage one selects only
-        the requested page of run_ids (ordered by each run's newest prompt),
-        stage two loads the heavy prompt rows for just those runs.  This
-        keeps the query cost proportional to the page size, not to the whole
-        (multi-GB) promptlog table.
+        """Get the run index of the prompt log, grouped by run_id, newest first.
+
+        Returns a list of run summaries with their individual prompts — the
+        light half only (see ``_runs_for``); an expanded run's heavy half comes
+        from ``get_run_detail_pages`` + ``get_run_assessment``.  Pagination
+        happens at the run level in SQL: stage one selects only the requested
+        page of run_ids (ordered by each run's newest prompt), stage two loads
+        the light prompt columns for just those runs.  This keeps the query cost
+        proportional to the page size, not to the whole (multi-GB) promptlog
+        table.
+
+        Runs order by ``(newest prompt timestamp, newest prompt id)``, and each
+        carries its ``page_token``; passing the last run's as ``after`` resumes
+        the next page by keyset instead of ``offset``, so deep pages don't walk
+        the skipped runs and don't shift as new runs arrive.
 
         ``query`` filters to runs that have at least one prompt whose
         ``response`` or ``thinking`` (the output the run produced — not its
@@ -648,59 +791,129 @@ class MessageStore:
         with self._session() as session:
             if flagged_only:
                 return self._flagged_runs(session, agent_name, query)
-            run_ids_ordered = self._page_of_run_ids(session, limit, offset, agent_name, query)
+            run_ids_ordered = self._page_of_run_ids(
+                session, limit, offset, agent_name, query, after
+            )
             return self._runs_for(session, run_ids_ordered)
 
-    def get_target_runs(self, run_target: str, limit: int = 50, offset: int = 0) -> list[dict]:
-        """Full serialized runs for one collection's collector, newest-first —
-        the per-collection Activity panel (run → prompts → turns, the same shape
-        the prompts tab renders).  Each completed run stamps ``run_outcome`` on
-        exactly one row (its last prompt), so the completion rows ARE the run
-        index — one per run, served by ``ix_promptlog_target_runs`` (a bounded
-        ``ORDER BY ... LIMIT``, not a scan), matching the old record-only panel's
-        filter (``run_outcome IS NOT NULL AND run_target = ?``)."""
+    def get_target_runs(
+        self, run_target: str, limit: int = 50, offset: int = 0, after: PageKey | None = None
+    ) -> list[dict]:
+        """The run index for one collection's collector, newest-first — the
+        per-collection Activity panel (run → prompts → turns, the same cards the
+        prompts tab renders, expanded the same way).  Each completed run stamps
+        ``run_outcome`` on exactly one row (its last prompt), so the completion
+        rows ARE the run index — one per run, served by
+        ``ix_promptlog_target_runs`` (a bounded ``ORDER BY ... LIMIT``, not a
+        scan), matching the old record-only panel's filter
+        (``run_outcome IS NOT NULL AND run_target = ?``).  ``after`` pages by
+        keyset, as in ``get_prompt_log_runs``."""
         with self._session() as session:
-            run_ids = self._page_of_target_run_ids(session, run_target, limit, offset)
+            run_ids = self._page_of_target_run_ids(session, run_target, limit, offset, after)
             return self._runs_for(session, run_ids)
 
     @staticmethod
     def _page_of_target_run_ids(
-        session: Session, run_target: str, limit: int, offset: int
+        session: Session,
+        run_target: str,
+        limit: int,
+        offset: int,
+        after: PageKey | None = None,
     ) -> list[str]:
         """One newest-first page of completed run_ids for ``run_target``."""
+        query = select(PromptLog.run_id).where(
+            PromptLog.run_outcome.isnot(None),  # ty: ignore[unresolved-attribute]
+            PromptLog.run_target == run_target,
+        )
+        if after is not None:
+            query = query.where(after.older(PromptLog.timestamp, PromptLog.id))
         rows = session.exec(
-            select(PromptLog.run_id)
-            .where(
-                PromptLog.run_outcome.isnot(None),  # ty: ignore[unresolved-attribute]
-                PromptLog.run_target == run_target,
+            query.order_by(
+                PromptLog.timestamp.desc(),  # ty: ignore[unresolved-attribute]
+                PromptLog.id.desc(),  # ty: ignore[unresolved-attribute]
             )
-            .order_by(PromptLog.timestamp.desc())
             .limit(limit)
             .offset(offset)
         ).all()
         return [run_id for run_id in rows if run_id is not None]
 
     def _runs_for(self, session: Session, run_ids_ordered: list[str]) -> list[dict]:
-        """Load + serialize the given runs (heavy prompt rows), preserving order."""
+        """The light index of the given runs, preserving order.
+
+        Reads only the light prompt columns (``_light_prompts``) — never the
+        ``messages`` / ``thinking`` scaffolding that made a page of 50 runs
+        weigh megabytes.  Each prompt carries its collapsed row's snippets
+        instead.  Health is classified from the light columns, as the flagged
+        sweep does; the one flag read off the final prompt's browse results
+        (``no_writes``) and the run ``record`` come with the run's detail."""
         if not run_ids_ordered:
             return []
-        grouped: dict[str, list[PromptLog]] = {}
-        prompts = session.exec(
-            select(PromptLog)
-            .where(PromptLog.run_id.in_(run_ids_ordered))  # ty: ignore[unresolved-attribute]
-            .order_by(PromptLog.timestamp.asc())
-        ).all()
-        for prompt in prompts:
-            if prompt.run_id is None:
-                continue
-            grouped.setdefault(prompt.run_id, []).append(prompt)
+        grouped = self._light_prompts(session, run_ids_ordered)
         runs = []
         for run_id in run_ids_ordered:
-            run_prompts = grouped[run_id]
-            total_duration_ms = sum(p.duration_ms or 0 for p in run_prompts)
-            runs.append(self._serialize_run(run_id, run_prompts, total_duration_ms))
+            light = grouped[run_id]
+            prompts = [prompt for prompt, _ in light]
+            serialized = [self._index_prompt(prompt, user_text) for prompt, user_text in light]
+            page_key = PageKey(prompts[-1].timestamp, max(p.id or 0 for p in prompts))
+            runs.append(
+                {
+                    **self._run_summary(run_id, prompts, serialized),
+                    "health": classify_run(prompts).model_dump(),
+                    "prompts": serialized,
+                    "page_token": page_key.token(),
+                }
+            )
         return runs
 
+    @staticmethod
+    def _light_prompts(
+        session: Session, run_ids: list[str]
+    ) -> dict[str, list[tuple[PromptLog, str]]]:
+        """The given runs' prompts as LIGHT rows, oldest first, grouped by run.
+
+        Selects every column but the heavy ones: ``messages`` and ``thinking``
+        are left empty and ``tools`` is only marked present.  The one thing
+        read out of ``messages`` is the text of a user-message prompt's final
+        user turn (via ``json_extract``), paired with each row for its snippet.
+        The tool calls (``response``) and ``run_outcome``/``tool_failures`` are
+        all ``classify_run``'s boolean flags need."""
+        sql = text(
+            "SELECT id, run_id, timestamp, model, agent_name, prompt_type, duration_ms, "
+            "response, run_outcome, run_reason, run_target, tool_failures, "
+            "tools IS NOT NULL, "
+            "CASE WHEN prompt_type = :user_type "
+            "AND json_extract(messages, '$[#-1].role') = 'user' "
+            "AND json_type(messages, '$[#-1].content') = 'text' "
+            "THEN json_extract(messages, '$[#-1].content') END "
+            "FROM promptlog WHERE run_id IN :ids ORDER BY timestamp, id"
+        ).bindparams(bindparam("ids", expanding=True))
+        params = {"ids": run_ids, "user_type": ChatPromptType.USER_MESSAGE.value}
+        grouped: dict[str, list[tuple[PromptLog, str]]] = {}
+        for row in session.execute(sql, params).all():
+            (prompt_id, run_id, timestamp, model, agent_name, prompt_type, duration_ms) = row[:7]
+            response, run_outcome, run_reason, run_target, tool_failures = row[7:12]
+            has_tools, user_text = row[12:]
+            light = PromptLog(
+                id=prompt_id,
+                timestamp=datetime.fromisoformat(timestamp),
+                model=model,
+                messages="",
+                # A NULL response (no model reply logged) means no tool calls —
+                # classify_run reads "" as an empty call set, which is correct.
+                response=response if response is not None else "",
+                tools="" if has_tools else None,
+                agent_name=agent_name,
+                prompt_type=prompt_type,
+                duration_ms=duration_ms,
+                run_id=run_id,
+                run_outcome=run_outcome,
+                run_reason=run_reason,
+                run_target=run_target,
+                tool_failures=tool_failures,
+            )
+            grouped.setdefault(run_id, []).append((light, user_text or ""))
+        return grouped
+
     # The flagged-only triage is a view of RECENT regressions, so it scans a
     # bounded window of the newest runs rather than the whole multi-GB history.
     # Classification reads only light columns (no messages/thinking), so this
@@ -718,8 +931,8 @@ class MessageStore:
 
         Sweeps the newest ``_FLAGGED_SCAN_RUNS`` runs, classifying each from a
         LIGHT column read (no ``messages``/``thinking`` — the heavy fields), then
-        heavy-serializes only the flagged ones.  Single-shot (no pagination): a
-        triage of recent regressions, not a page into all history."""
+        indexes only the flagged ones.  Single-shot (no pagination): a triage of
+        recent regressions, not a page into all history."""
         flagged_ids: list[str] = []
         scanned = 0
         while scanned < self._FLAGGED_SCAN_RUNS:
@@ -736,34 +949,15 @@ class MessageStore:
 
     @staticmethod
     def _regressive_among(session: Session, run_ids: list[str]) -> list[str]:
-        """The subset of ``run_ids`` whose run is regressive, in input order.
-
-        Classifies from the LIGHT columns only — the run's tool calls
-        (``response``) plus the ``run_outcome``/``tool_failures`` the classifier's
-        boolean flags read — so the flagged sweep never loads the heavy
-        ``messages`` scaffolding.  Order within a run is irrelevant to the flags
-        (bail = any non-done call; degenerate = any bad send; the outcome and
-        failure count sit on a single row), so no ``ORDER BY`` is needed."""
-        sql = text(
-            "SELECT run_id, response, run_outcome, tool_failures "
-            "FROM promptlog WHERE run_id IN :ids"
-        ).bindparams(bindparam("ids", expanding=True))
-        grouped: dict[str, list[PromptLog]] = {}
-        for run_id, response, run_outcome, tool_failures in session.execute(
-            sql, {"ids": run_ids}
-        ).all():
-            light = PromptLog(
-                model="",
-                messages="",
-                # A NULL response (no model reply logged) means no tool calls —
-                # classify_run reads "" as an empty call set, which is correct.
-                response=response if response is not None else "",
-                run_id=run_id,
-                run_outcome=run_outcome,
-                tool_failures=tool_failures,
-            )
-            grouped.setdefault(run_id, []).append(light)
-        return [run_id for run_id in run_ids if classify_run(grouped.get(run_id, [])).regressive]
+        """The subset of ``run_ids`` whose run is regressive, in input order,
+        classified from the light rows — the flagged sweep never loads the
+        heavy ``messages`` scaffolding."""
+        grouped = MessageStore._light_prompts(session, run_ids)
+        return [
+            run_id
+            for run_id in run_ids
+            if classify_run([prompt for prompt, _ in grouped.get(run_id, [])]).regressive
+        ]
 
     @staticmethod
     def _page_of_run_ids(
@@ -772,10 +966,12 @@ class MessageStore:
         offset: int,
         agent_name: str | None,
         search: str | None = None,
+        after: PageKey | None = None,
     ) -> list[str]:
         """Return one page of run_ids, ordered newest-first by each run's most
-        recent prompt.  Touches only the indexed run_id/timestamp columns — no
-        heavy JSON payloads — so it stays cheap as the table grows.
+        recent prompt (its id breaking ties), and resuming past ``after`` when
+        given.  Touches only the indexed run_id/timestamp columns — no heavy
+        JSON payloads — so it stays cheap as the table grows.
 
         ``search`` keeps only runs with a prompt whose ``response`` or
         ``thinking`` matches it via the ``promptlog_fts`` full-text index
@@ -783,43 +979,118 @@ class MessageStore:
         multi-GB table instead of scanning every JSON blob.
         """
         if search:
-            return MessageStore._page_of_run_ids_fts(session, limit, offset, agent_name, search)
+            return MessageStore._page_of_run_ids_fts(
+                session, limit, offset, agent_name, search, after
+            )
         query = select(PromptLog.run_id).where(PromptLog.run_id.isnot(None))  # ty: ignore[unresolved-attribute]
         if agent_name:
             query = query.where(PromptLog.agent_name == agent_name)
-        query = (
-            query.group_by(PromptLog.run_id)
-            .order_by(func.max(PromptLog.timestamp).desc())
-            .limit(limit)
-            .offset(offset)
-        )
+        newest, newest_id = func.max(PromptLog.timestamp), func.max(PromptLog.id)
+        query = query.group_by(PromptLog.run_id)
+        if after is not None:
+            query = query.having(after.older(newest, newest_id))
+        query = query.order_by(newest.desc(), newest_id.desc()).limit(limit).offset(offset)
         return [run_id for run_id in session.exec(query).all() if run_id is not None]
 
     @staticmethod
     def _page_of_run_ids_fts(
-        session: Session, limit: int, offset: int, agent_name: str | None, search: str
+        session: Session,
+        limit: int,
+        offset: int,
+        agent_name: str | None,
+        search: str,
+        after: PageKey | None,
     ) -> list[str]:
         """Run-id page for a full-text search, newest-first, via promptlog_fts.
 
-        The user's text becomes a per-word prefix query (``morning news`` →
-        ``morning* news*``, implicit AND).  With no searchable word characters
-        there is nothing to match, so return no runs."""
-        match = " ".join(f"{token}*" for token in re.findall(r"\w+", search.lower()))
+        The user's text becomes a per-word prefix query (``prefix_match``).
+        With no searchable word characters there is nothing to match, so return
+        no runs.  The matching runs are
+        then ordered by their newest prompt, as in ``_page_of_run_ids``, so a
+        run's ``page_token`` resumes a search page as well."""
+        match = prefix_match(search)
         if not match:
             return []
         agent_clause = "AND p.agent_name = :agent" if agent_name else ""
+        having = "HAVING (MAX(timestamp), MAX(id)) < (:after_ts, :after_id) " if after else ""
         sql = text(
+            "SELECT run_id FROM promptlog WHERE run_id IN ("
             "SELECT p.run_id FROM promptlog p "
             "JOIN promptlog_fts f ON f.rowid = p.id "
-            f"WHERE p.run_id IS NOT NULL AND promptlog_fts MATCH :q {agent_clause} "
-            "GROUP BY p.run_id ORDER BY MAX(p.timestamp) DESC LIMIT :limit OFFSET :offset"
+            f"WHERE p.run_id IS NOT NULL AND promptlog_fts MATCH :q {agent_clause}) "
+            f"GROUP BY run_id {having}"
+            "ORDER BY MAX(timestamp) DESC, MAX(id) DESC LIMIT :limit OFFSET :offset"
         )
         params: dict[str, Any] = {"q": match, "limit": limit, "offset": offset}
         if agent_name:
             params["agent"] = agent_name
+        if after is not None:
+            sql = sql.bindparams(bindparam("after_ts", type_=DateTime()))
+            params.update(after_ts=after.created_at, after_id=after.id)
         rows = session.execute(sql, params).all()
         return [row[0] for row in rows if row[0] is not None]
 
+    def get_prompt_detail(self, prompt_id: int) -> dict | None:
+        """The heavy half of one logged prompt — its sent messages, response
+        and thinking — which live updates leave out until the row is expanded."""
+        with self._session() as session:
+            prompt = session.get(PromptLog, prompt_id)
+            if prompt is None:
+                return None
+            return {
+                "id": prompt.id,
+                "messages": json.loads(prompt.messages) if prompt.messages else [],
+                "response": json.loads(prompt.response) if prompt.response else {},
+                "thinking": prompt.thinking or "",
+            }
+
+    def get_run_detail_pages(self, run_id: str, page_size: int) -> Iterator[list[dict]]:
+        """One run's prompts in full — messages, response and thinking — oldest
+        first, ``page_size`` at a time.  Each page is its own short read keyed
+        on ``(timestamp, id)``, so an expanded run card renders its turns as
+        they arrive instead of waiting on the whole run."""
+        after: tuple[datetime, int] | None = None
+        while True:
+            query = select(PromptLog).where(PromptLog.run_id == run_id)
+            if after is not None:
+                query = query.where(
+                    or_(
+                        PromptLog.timestamp > after[0],
+                        and_(PromptLog.timestamp == after[0], PromptLog.id > after[1]),  # ty: ignore[unsupported-operator]
+                    )
+                )
+            query = query.order_by(
+                PromptLog.timestamp.asc(),  # ty: ignore[unresolved-attribute]
+                PromptLog.id.asc(),  # ty: ignore[unresolved-attribute]
+            ).limit(page_size)
+            with self._session() as session:
+                rows = list(session.exec(query).all())
+            if rows:
+                yield [self._serialize_prompt(row) for row in rows]
+            if len(rows) < page_size:
+                return
+            after = (rows[-1].timestamp, rows[-1].id or 0)
+
+    def get_run_assessment(self, run_id: str) -> dict | None:
+        """A run's health and concise ``record`` in full — the SAME
+        representation Penny's quality collector reads of her own runs
+        (``classify_run`` / ``render_run_record``), so the addon's badges and
+        Penny's self-review draw from one classifier.  ``record`` is
+        copy-pasteable straight back to a deeper analysis.
+
+        The run index leaves both out because they read the browse results off
+        the final prompt's ``messages``; this loads the light rows plus that one
+        blob."""
+        with self._session() as session:
+            light = self._light_prompts(session, [run_id]).get(run_id)
+            if not light:
+                return None
+            prompts = [prompt for prompt, _ in light]
+            prompts[-1].messages = session.exec(
+                select(PromptLog.messages).where(PromptLog.id == prompts[-1].id)
+            ).one()
+        return {"health": classify_run(prompts).model_dump(), "record": render_run_record(prompts)}
+
     def recent_prompts(self, limit: int = 200) -> list[PromptLog]:
         """The most recent prompt-log rows, newest first — for inspection/eval."""
         with self._session() as session:
@@ -838,20 +1109,51 @@ class MessageStore:
         """
         with self._session() as session:
             rows = list(session.exec(select(PromptLog)).all())
+        return self._perf(rows)
+
+    def prompt_perf_by_model(self, since: datetime | None = None) -> dict[str, PromptPerf]:
+        """``prompt_perf`` split by the model that served each prompt — how
+        tokens and time divide between the main and small model tiers.
+        ``since`` limits it to prompts logged from then on (e.g. this run)."""
+        query = select(PromptLog)
+        if since is not None:
+            query = query.where(PromptLog.timestamp >= since)
+        with self._session() as session:
+            rows = list(session.exec(query).all())
+        by_model: dict[str, list[PromptLog]] = {}
+        for row in rows:
+            by_model.setdefault(row.model, []).append(row)
+        return {model: self._perf(model_rows) for model, model_rows in by_model.items()}
+
+    @classmethod
+    def _perf(cls, rows: list[PromptLog]) -> PromptPerf:
         input_tokens = 0
         output_tokens = 0
         thinking_chars = 0
         output_chars = 0
         for row in rows:
+            if row.cached:
+                continue
             response = json.loads(row.response) if row.response else {}
-            prompt_tokens, completion_tokens = self._extract_token_usage(response)
+            prompt_tokens, completion_tokens = cls._extract_token_usage(response)
             input_tokens += prompt_tokens
             output_tokens += completion_tokens
             thinking_chars += len(row.thinking or "")
-            output_chars += len(self._extract_content(response))
+            output_chars += len(cls._extract_content(response))
         duration_ms = sum(row.duration_ms or 0 for row in rows)
+        aborted_tokens = sum(row.aborted_tokens or 0 for row in rows)
+        budget_hits = sum(1 for row in rows if row.budget_hit)
+        cache_hits = sum(1 for row in rows if row.cached)
         return PromptPerf(
-            len(rows), duration_ms, input_tokens, output_tokens, thinking_chars, output_chars
+            len(rows),
+            duration_ms,
+            input_tokens,
+            output_tokens,
+            thinking_chars,
+            output_chars,
+            aborted_tokens,
+            budget_hits,
+            cache_hits,
         )
 
     @staticmethod
@@ -871,38 +1173,46 @@ class MessageStore:
         return usage.get("prompt_tokens", 0) or 0, usage.get("completion_tokens", 0) or 0
 
     @staticmethod
-    def _serialize_run(
-        run_id: str,
-        prompts: list[PromptLog],
-        total_duration_ms: int,
-    ) -> dict:
-        """Serialize a single run and its prompts to a dict."""
-        total_input_tokens = 0
-        total_output_tokens = 0
-        serialized_prompts = []
-        for p in prompts:
-            response = json.loads(p.response) if p.response else {}
-            input_tokens, output_tokens = MessageStore._extract_token_usage(response)
-            total_input_tokens += input_tokens
-            total_output_tokens += output_tokens
-            serialized_prompts.append(
-                {
-                    "id": p.id,
-                    "timestamp": p.timestamp.isoformat(),
-                    "model": p.model,
-                    "agent_name": p.agent_name or "",
-                    "prompt_type": p.prompt_type or "",
-                    "duration_ms": p.duration_ms or 0,
-                    "input_tokens": input_tokens,
-                    "output_tokens": output_tokens,
-                    "run_target": p.run_target,
-                    "messages": json.loads(p.messages) if p.messages else [],
-                    "response": response,
-                    "thinking": p.thinking or "",
-                    "has_tools": p.tools is not None,
-                }
-            )
+    def _prompt_fields(p: PromptLog, response: dict) -> dict:
+        """A logged prompt's light fields — all but messages/response/thinking."""
+        input_tokens, output_tokens = MessageStore._extract_token_usage(response)
+        return {
+            "id": p.id,
+            "timestamp": p.timestamp.isoformat(),
+            "model": p.model,
+            "agent_name": p.agent_name or "",
+            "prompt_type": p.prompt_type or "",
+            "duration_ms": p.duration_ms or 0,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "run_target": p.run_target,
+            "has_tools": p.tools is not None,
+        }
 
+    @staticmethod
+    def _index_prompt(p: PromptLog, user_text: str) -> dict:
+        """A light prompt row for the run index, with its collapsed row's snippets."""
+        response = json.loads(p.response) if p.response else {}
+        return {
+            **MessageStore._prompt_fields(p, response),
+            "snippet": prompt_snippet(response),
+            "user_snippet": _clip(user_text),
+        }
+
+    @staticmethod
+    def _serialize_prompt(p: PromptLog) -> dict:
+        """A prompt with its heavy fields, for an expanded run's detail."""
+        response = json.loads(p.response) if p.response else {}
+        return {
+            **MessageStore._prompt_fields(p, response),
+            "messages": json.loads(p.messages) if p.messages else [],
+            "response": response,
+            "thinking": p.thinking or "",
+        }
+
+    @staticmethod
+    def _run_summary(run_id: str, prompts: list[PromptLog], serialized: list[dict]) -> dict:
+        """The run-level fields of a run index entry."""
         # Run outcome is set on the last prompt that has one
         run_outcome: str | None = None
         run_reason: str | None = None
@@ -920,24 +1230,16 @@ class MessageStore:
         # rendered the bare agent identity ("collector") instead of the name.
         run_target = prompts[0].run_target
 
-        # Run health + concise record: the SAME representation Penny's quality
-        # collector reads of her own runs (render_run_record / classify_run), so
-        # the addon's badges + "flagged only" filter and Penny's self-review draw
-        # from one classifier.  ``record`` is copy-pasteable straight back to a
-        # deeper analysis.
         return {
             "run_id": run_id,
             "agent_name": prompts[0].agent_name or "unknown",
             "prompt_count": len(prompts),
             "started_at": prompts[0].timestamp.isoformat(),
             "ended_at": prompts[-1].timestamp.isoformat(),
-            "total_duration_ms": total_duration_ms,
-            "total_input_tokens": total_input_tokens,
-            "total_output_tokens": total_output_tokens,
+            "total_duration_ms": sum(p.duration_ms or 0 for p in prompts),
+            "total_input_tokens": sum(s["input_tokens"] for s in serialized),
+            "total_output_tokens": sum(s["output_tokens"] for s in serialized),
             "run_outcome": run_outcome,
             "run_reason": run_reason,
             "run_target": run_target,
-            "health": classify_run(prompts).model_dump(),
-            "record": render_run_record(prompts),
-            "prompts": serialized_prompts,
         }
@@ -167,8 +167,8 @@ def migrate_test(db_path: str) -> bool:
         logger.exception("Migration test FAILED")
         return False
     finally:
-        test_path.unlink(missing_ok=True)
-        Path(temp_dir).rmdir()
+        # The copy's directory also holds any media blobs a migration wrote.
+        shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":
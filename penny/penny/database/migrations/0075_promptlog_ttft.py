@@ -0,0 +1,22 @@
+"""Add ``promptlog.ttft_ms`` — time to first decoded token.
+
+Type: schema
+
+Chat replies stream to the channel as they decode, so what the user waits on
+is the time until the first token arrives, not the full ``duration_ms``.  The
+LLM client measures it on every streamed call; this column records it so the
+two can be compared per prompt type.  NULL for non-streamed calls and old rows.
+"""
+
+
+def up(conn):
+    tables = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+    }
+    if "promptlog" not in tables:
+        return
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(promptlog)").fetchall()]
+    if "ttft_ms" not in columns:
+        conn.execute("ALTER TABLE promptlog ADD COLUMN ttft_ms INTEGER")
+    conn.commit()
@@ -0,0 +1,23 @@
+"""Add ``promptlog.aborted_tokens`` — decode cut short as degenerate.
+
+Type: schema
+
+Model calls stream, and the agent aborts a stream the moment its output
+collapses into a degenerate run instead of letting it decode to the token cap.
+An aborted call never receives the server's usage chunk, so this column records
+how many tokens were decoded before the abort.  NULL for completed calls (their
+usage lives in ``response``) and old rows.
+"""
+
+
+def up(conn):
+    tables = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+    }
+    if "promptlog" not in tables:
+        return
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(promptlog)").fetchall()]
+    if "aborted_tokens" not in columns:
+        conn.execute("ALTER TABLE promptlog ADD COLUMN aborted_tokens INTEGER")
+    conn.commit()
@@ -0,0 +1,24 @@
+"""Add ``promptlog.budget`` / ``promptlog.budget_hit`` — generation budgets.
+
+Type: schema
+
+The ``LLM_BUDGETS`` runtime param caps reasoning effort and output tokens per
+agent / prompt type.  ``budget`` records the budget a call ran under
+(``effort:max_tokens``); ``budget_hit`` is 1 when its output stopped at the
+token cap.  Both NULL for unbudgeted calls and old rows.
+"""
+
+
+def up(conn):
+    tables = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+    }
+    if "promptlog" not in tables:
+        return
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(promptlog)").fetchall()]
+    if "budget" not in columns:
+        conn.execute("ALTER TABLE promptlog ADD COLUMN budget TEXT")
+    if "budget_hit" not in columns:
+        conn.execute("ALTER TABLE promptlog ADD COLUMN budget_hit INTEGER")
+    conn.commit()
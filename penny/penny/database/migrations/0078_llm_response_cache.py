@@ -0,0 +1,37 @@
+"""Add the ``llm_cache`` table and ``promptlog.cached`` — deterministic response cache.
+
+Type: schema
+
+LLM calls marked cacheable and sampled at temperature 0 are answered from
+``ResponseCache``: an in-process LRU backed by ``llm_cache``, keyed by a
+digest of the request and aged out after ``LLM_CACHE_TTL_SECONDS``.  A hit is
+still logged to the prompt log as a zero-duration row with ``cached`` = 1;
+NULL for every generated call and old rows.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+
+def up(conn: sqlite3.Connection) -> None:
+    tables = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+    }
+    if "llm_cache" not in tables:
+        conn.execute("""
+            CREATE TABLE llm_cache (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                response TEXT NOT NULL,
+                created_at TIMESTAMP NOT NULL
+            )
+        """)
+        # Every write prunes expired rows by age.
+        conn.execute("CREATE INDEX ix_llm_cache_created_at ON llm_cache (created_at)")
+    if "promptlog" in tables:
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(promptlog)").fetchall()]
+        if "cached" not in columns:
+            conn.execute("ALTER TABLE promptlog ADD COLUMN cached INTEGER")
+    conn.commit()
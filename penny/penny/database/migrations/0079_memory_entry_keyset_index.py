@@ -0,0 +1,32 @@
+"""Index memory entries by ``(memory_name, created_at)`` — keyset paging.
+
+The addon pages a memory's entries newest-first with a ``(created_at, id)``
+continuation cursor instead of an OFFSET:
+
+    WHERE memory_name = ? AND (created_at, id) < (?, ?)
+    ORDER BY created_at DESC, id DESC LIMIT 50
+
+``memory_entry`` has single-column indexes on ``memory_name`` and
+``created_at`` only, so this either collects a whole memory's entries and
+sorts them, or walks every memory's entries newest-first testing the name.
+The composite index seeks straight to the cursor within one memory and reads
+the page in order; ``id`` is the rowid, which every SQLite index entry already
+ends with, so it breaks ties without being listed.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+
+
+def up(conn: sqlite3.Connection) -> None:
+    tables = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+    }
+    if "memory_entry" in tables:
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_memory_entry_name_created "
+            "ON memory_entry (memory_name, created_at)"
+        )
+    conn.commit()
@@ -0,0 +1,51 @@
+"""Full-text index over memory_entry key/content for entry search.
+
+Type: schema
+
+The addon's "search entries too" memory filter and the memory-detail entry
+search matched with ``LIKE '%text%'`` over ``content`` and ``key`` — a full
+table scan, since no B-tree index serves a leading wildcard.  This adds an
+FTS5 index over both columns and the triggers that keep it in sync, then
+builds it from the existing entries (the same shape as 0051's promptlog_fts).
+
+External-content mode (``content='memory_entry'``) stores only the inverted
+index.  Embedding backfills write only the embedding column, so the UPDATE
+trigger is guarded to fire only when ``key`` or ``content`` changes.
+"""
+
+
+def up(conn):
+    tables = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+    }
+    if "memory_entry" not in tables:
+        return
+    if "memory_entry_fts" in tables:
+        return
+
+    conn.execute(
+        "CREATE VIRTUAL TABLE memory_entry_fts USING fts5("
+        "key, content, content='memory_entry', content_rowid='id')"
+    )
+    conn.execute(
+        "CREATE TRIGGER memory_entry_fts_ai AFTER INSERT ON memory_entry BEGIN "
+        "INSERT INTO memory_entry_fts(rowid, key, content) "
+        "VALUES (new.id, new.key, new.content); END"
+    )
+    conn.execute(
+        "CREATE TRIGGER memory_entry_fts_ad AFTER DELETE ON memory_entry BEGIN "
+        "INSERT INTO memory_entry_fts(memory_entry_fts, rowid, key, content) "
+        "VALUES ('delete', old.id, old.key, old.content); END"
+    )
+    conn.execute(
+        "CREATE TRIGGER memory_entry_fts_au AFTER UPDATE ON memory_entry "
+        "WHEN old.key IS NOT new.key OR old.content IS NOT new.content BEGIN "
+        "INSERT INTO memory_entry_fts(memory_entry_fts, rowid, key, content) "
+        "VALUES ('delete', old.id, old.key, old.content); "
+        "INSERT INTO memory_entry_fts(rowid, key, content) "
+        "VALUES (new.id, new.key, new.content); END"
+    )
+    # Backfill the index from every existing entry.
+    conn.execute("INSERT INTO memory_entry_fts(memory_entry_fts) VALUES ('rebuild')")
+    conn.commit()
@@ -0,0 +1,30 @@
+"""Create the ``browse-passages`` system log.
+
+Type: data
+
+The browse tool now splits pages over ``BROWSE_PAGE_TOKEN_BUDGET`` into
+chunks and shows the model only the most relevant ones.  Each chunk is also
+logged here with its own embedding, so a similarity read lands on the
+passage that answers it; ``browse-results`` keeps one entry per whole page
+for the knowledge extractor.
+
+Like ``browse-results`` it stays out of ambient recall (``inclusion=never``);
+agents reach it through the memory read tools.
+
+Idempotent — uses ``INSERT OR IGNORE`` so re-running is a no-op.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import UTC, datetime
+
+
+def up(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "INSERT OR IGNORE INTO memory "
+        "(name, type, description, inclusion, recall, archived, created_at) "
+        "VALUES ('browse-passages', 'log', ?, 'never', 'relevant', 0, ?)",
+        ("Each section of long browsed pages, embedded on its own", datetime.now(UTC).isoformat()),
+    )
+    conn.commit()
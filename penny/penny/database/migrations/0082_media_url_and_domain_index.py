@@ -0,0 +1,53 @@
+"""Add indexed ``media.normalized_url`` / ``media.domain`` — egress image lookup.
+
+Type: data + schema
+
+``MediaStore.select_image`` runs on every outgoing message.  Its first two
+tiers — the cited page's own image, then an image from the cited domain —
+loaded every media row and normalized each ``source_url`` in Python.  The
+store now writes both keys at ``put`` time, so the tiers become index seeks.
+
+Backfills existing rows with the same normalization the store applies
+(inlined here so the migration stays fixed if the store's rule changes).
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from urllib.parse import urlparse
+
+
+def _normalize_url(url: str) -> str:
+    return url.rstrip(".,);:'\"<>").lower()
+
+
+def _domain(url: str) -> str:
+    try:
+        return urlparse(url).netloc.lower().removeprefix("www.")
+    except ValueError:
+        return ""
+
+
+def up(conn: sqlite3.Connection) -> None:
+    tables = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+    }
+    if "media" not in tables:
+        return
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(media)").fetchall()}
+    if "normalized_url" not in columns:
+        conn.execute("ALTER TABLE media ADD COLUMN normalized_url TEXT")
+    if "domain" not in columns:
+        conn.execute("ALTER TABLE media ADD COLUMN domain TEXT")
+
+    rows = conn.execute(
+        "SELECT id, source_url FROM media WHERE source_url IS NOT NULL AND normalized_url IS NULL"
+    ).fetchall()
+    conn.executemany(
+        "UPDATE media SET normalized_url = ?, domain = ? WHERE id = ?",
+        [(_normalize_url(url), _domain(url), media_id) for media_id, url in rows],
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS ix_media_normalized_url ON media (normalized_url)")
+    conn.execute("CREATE INDEX IF NOT EXISTS ix_media_domain ON media (domain)")
+    conn.commit()
@@ -0,0 +1,71 @@
+"""Move ``media.data`` into the content-addressed blob store.
+
+Type: data + schema
+
+Image bytes lived in the ``media`` table, bloating the main database file
+and slowing backups and VACUUM.  Each row's bytes are written to
+``<db dir>/media/<sha256[:2]>/<sha256>`` (the ``BlobStore`` layout, inlined
+here so the migration stays fixed if the store changes), the row records
+``sha256`` and ``size``, and the ``data`` column is dropped.  Rows are copied
+one at a time, so a multi-GB table never sits in memory.
+
+Blob files are fsynced before the column is dropped.  If the migration fails
+partway, the transaction rolls back and the files already written are
+orphans that startup garbage collection removes.  The space is reclaimed
+with a VACUUM once the column is gone.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import tempfile
+from pathlib import Path
+
+
+def _write_blob(root: Path, data: bytes) -> str:
+    digest = hashlib.sha256(data).hexdigest()
+    target = root / digest[:2] / digest
+    if target.exists():
+        return digest
+    target.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_name = tempfile.mkstemp(prefix=".tmp-", dir=target.parent)
+    with os.fdopen(fd, "wb") as temp:
+        temp.write(data)
+        temp.flush()
+        os.fsync(temp.fileno())
+    os.replace(temp_name, target)
+    return digest
+
+
+def up(conn: sqlite3.Connection) -> None:
+    tables = {
+        row[0]
+        for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'").fetchall()
+    }
+    if "media" not in tables:
+        return
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(media)").fetchall()}
+    if "sha256" not in columns:
+        conn.execute("ALTER TABLE media ADD COLUMN sha256 TEXT")
+    if "size" not in columns:
+        conn.execute("ALTER TABLE media ADD COLUMN size INTEGER")
+    conn.execute("CREATE INDEX IF NOT EXISTS ix_media_sha256 ON media (sha256)")
+    if "data" not in columns:
+        conn.commit()
+        return
+
+    db_file = conn.execute("PRAGMA database_list").fetchone()[2]
+    root = Path(db_file).parent / "media"
+    ids = [row[0] for row in conn.execute("SELECT id FROM media WHERE sha256 IS NULL").fetchall()]
+    for media_id in ids:
+        (data,) = conn.execute("SELECT data FROM media WHERE id = ?", (media_id,)).fetchone()
+        data = bytes(data or b"")
+        conn.execute(
+            "UPDATE media SET sha256 = ?, size = ? WHERE id = ?",
+            (_write_blob(root, data), len(data), media_id),
+        )
+    conn.execute("ALTER TABLE media DROP COLUMN data")
+    conn.commit()
+    conn.execute("VACUUM")
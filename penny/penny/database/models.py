@@ -17,6 +17,11 @@ class PromptLog(SQLModel, table=True):
     response: str  # JSON-serialized response dict
     thinking: str | None = None  # Model's thinking/reasoning trace
     duration_ms: int | None = None  # How long the call took
+    ttft_ms: int | None = None  # Time to first decoded token (streamed calls only)
+    aborted_tokens: int | None = None  # Tokens decoded before a degenerate-stream abort
+    budget: str | None = None  # LLM_BUDGETS budget applied ("effort:max_tokens")
+    budget_hit: bool | None = None  # Output stopped at the budget's token cap
+    cached: bool | None = None  # Served from the response cache (duration 0)
     agent_name: str | None = None  # Which agent produced this call (chat, history, etc.)
     prompt_type: str | None = (
         None  # Which flow within the agent (user_message, free, daily_summary, etc.)
@@ -326,21 +331,44 @@ class SendQueueItem(SQLModel, table=True):
     sent_at: datetime | None = None
 
 
+class LlmCacheEntry(SQLModel, table=True):
+    """One cached LLM response — the SQLite tier of ``ResponseCache``.
+
+    ``key`` digests everything that shapes the completion (model, messages,
+    tools, response format, sampling params); ``response`` is the raw
+    completion dump, replayed as-is on a hit.  Rows older than
+    ``LLM_CACHE_TTL_SECONDS`` are ignored and pruned on the next write.
+    """
+
+    __tablename__ = "llm_cache"
+
+    key: str = Field(primary_key=True)
+    model: str
+    response: str  # JSON-serialized ChatCompletion dump
+    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC), index=True)
+
+
 class Media(SQLModel, table=True):
     """Binary media (images) captured while browsing, delivered side-channel.
 
     The browse tool stores each page's image here with its source URL, page
     title, and an embedding of that metadata. At channel egress the outgoing
     message text is embedded and matched against these vectors — the single
-    nearest image is attached, with no model involvement.
+    nearest image is attached, with no model involvement.  The image bytes
+    live in the on-disk ``BlobStore`` under ``sha256``.
     """
 
     __tablename__ = "media"
 
     id: int | None = Field(default=None, primary_key=True)
     mime_type: str
-    data: bytes
+    sha256: str = Field(index=True)
+    size: int = 0
     source_url: str | None = None
+    # ``source_url`` keyed for egress matching: the cited-page tier seeks
+    # ``normalized_url``, the cited-domain tier ``domain``.
+    normalized_url: str | None = Field(default=None, index=True)
+    domain: str | None = Field(default=None, index=True)
     title: str | None = None
     embedding: bytes | None = None
     created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
@@ -0,0 +1,48 @@
+"""Keyset pagination — opaque ``(created_at, id)`` page tokens.
+
+Newest-first reads page from the last row they returned instead of by OFFSET.
+``WHERE (created_at, id) < (?, ?)`` seeks straight to the next page through an
+index, where OFFSET walks and discards every skipped row.  A page also doesn't
+shift when new rows arrive at the head.  Callers outside the database only
+round-trip the token.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from datetime import datetime
+from typing import NamedTuple
+
+from sqlalchemy import tuple_
+
+
+class PageKey(NamedTuple):
+    """Where a newest-first page ended: its last row's ``(created_at, id)``."""
+
+    created_at: datetime
+    id: int
+
+    def token(self) -> str:
+        """The opaque continuation token handed to the addon."""
+        raw = f"{self.created_at.isoformat()}|{self.id}".encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def from_token(cls, token: str | None) -> PageKey | None:
+        """The key a token encodes, or ``None`` for no token (the first page).
+
+        Raises ``ValueError`` for a token this module didn't produce."""
+        if not token:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+            created_at, row_id = raw.rsplit("|", 1)
+            return cls(datetime.fromisoformat(created_at), int(row_id))
+        except (binascii.Error, UnicodeDecodeError) as e:
+            raise ValueError(f"Malformed page token: {token!r}") from e
+
+    def older(self, created_at, row_id):
+        """The predicate for rows strictly after this key in newest-first
+        order; the columns may be aggregates (a run's newest prompt)."""
+        return tuple_(created_at, row_id) < tuple_(self.created_at, self.id)
@@ -0,0 +1,257 @@
+"""Shared, pooled HTTP transport for every outbound integration.
+
+Each integration used to build its own ``httpx.AsyncClient`` (and so its own
+connection pool): the chat, vision and embedding ``LlmClient``s, Signal, JMAP,
+Zoho and the Ollama REST client.  Connections to the local LLM host were set
+up once per client rather than once per process, and nothing could show how
+busy any of those pools were.
+
+``HttpTransport`` owns one connection pool — httpx keys its connections by
+origin, so each host gets its own keep-alive set under the shared limits — and
+hands out lightweight ``httpx.AsyncClient`` *leases* on it.  A lease carries
+the integration's own timeout and headers; closing it leaves the pool alone
+(the process owner closes the transport once, at shutdown).
+
+The pool is metered per host: requests, in-flight and idle connections,
+connections opened and the time spent opening them.  A host whose in-flight
+requests reach the pool limit is logged once per saturation episode.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import logging
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import httpcore
+import httpx
+
+from penny.constants import PennyConstants
+
+# httpx speaks HTTP/2 only with the optional ``h2`` package installed.
+HAS_HTTP2 = importlib.util.find_spec("h2") is not None
+
+logger = logging.getLogger(__name__)
+
+TraceCallback = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+
+@dataclass
+class HostPoolStats:
+    """One host's view of the shared pool."""
+
+    host: str
+    requests: int = 0
+    active: int = 0
+    idle: int = 0
+    connections_opened: int = 0
+    connect_ms: float = 0.0
+    saturations: int = 0
+
+    @property
+    def mean_connect_ms(self) -> float:
+        return self.connect_ms / self.connections_opened if self.connections_opened else 0.0
+
+
+class HttpTransport:
+    """Process-wide connection pool shared by every outbound HTTP integration."""
+
+    def __init__(
+        self,
+        *,
+        http2: bool = False,
+        max_connections: int = PennyConstants.HTTP_POOL_MAX_CONNECTIONS,
+        max_keepalive_connections: int = PennyConstants.HTTP_POOL_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry: float = PennyConstants.HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS,
+    ) -> None:
+        if http2 and not HAS_HTTP2:
+            logger.warning("HTTP/2 requested but the h2 package is missing — using HTTP/1.1")
+            http2 = False
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._pool = _MeteredTransport(limits=limits, http2=http2)
+        logger.info(
+            "Initialized shared HTTP transport: max_connections=%d, keepalive=%d/%.0fs, http2=%s",
+            max_connections,
+            max_keepalive_connections,
+            keepalive_expiry,
+            http2,
+        )
+
+    def client(
+        self, *, timeout: float | httpx.Timeout, headers: dict[str, str] | None = None
+    ) -> httpx.AsyncClient:
+        """A client leasing the shared pool, with its caller's timeout and headers."""
+        return httpx.AsyncClient(transport=_PoolLease(self._pool), timeout=timeout, headers=headers)
+
+    def stats(self) -> list[HostPoolStats]:
+        """Per-host pool metrics, busiest host first."""
+        return self._pool.stats()
+
+    def log_stats(self) -> None:
+        """One INFO line per host the pool has served."""
+        for host in self.stats():
+            logger.info(
+                "HTTP pool %s: %d requests, %d active / %d idle, "
+                "%d connects (%.1fms mean), %d saturations",
+                host.host,
+                host.requests,
+                host.active,
+                host.idle,
+                host.connections_opened,
+                host.mean_connect_ms,
+                host.saturations,
+            )
+
+    async def aclose(self) -> None:
+        """Close every pooled connection.  Leases must not be used afterwards."""
+        await self._pool.aclose()
+
+
+def http_client(
+    transport: HttpTransport | None,
+    *,
+    timeout: float | httpx.Timeout,
+    headers: dict[str, str] | None = None,
+) -> httpx.AsyncClient:
+    """A lease on ``transport``, or a private client when none was injected
+    (one-off scripts and tests that build an integration on its own)."""
+    if transport is None:
+        return httpx.AsyncClient(timeout=timeout, headers=headers)
+    return transport.client(timeout=timeout, headers=headers)
+
+
+class _MeteredTransport(httpx.AsyncHTTPTransport):
+    """``AsyncHTTPTransport`` that keeps per-host pool counters."""
+
+    def __init__(self, *, limits: httpx.Limits, http2: bool) -> None:
+        super().__init__(limits=limits, http2=http2)
+        self._max_connections = limits.max_connections
+        self._hosts: dict[str, HostPoolStats] = {}
+        self._origins: dict[str, httpcore.Origin] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = self._track_host(request.url)
+        host.requests += 1
+        self._begin(host)
+        request.extensions = {
+            **request.extensions,
+            "trace": _ConnectTimer(host, request.extensions.get("trace")),
+        }
+        try:
+            response = await super().handle_async_request(request)
+        except BaseException:
+            host.active -= 1
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, host),
+            extensions=response.extensions,
+        )
+
+    def _track_host(self, url: httpx.URL) -> HostPoolStats:
+        key = f"{url.scheme}://{url.netloc.decode('ascii')}"
+        if key not in self._hosts:
+            self._hosts[key] = HostPoolStats(key)
+            self._origins[key] = httpcore.URL(
+                scheme=url.raw_scheme, host=url.raw_host, port=url.port, target=b"/"
+            ).origin
+        return self._hosts[key]
+
+    def _begin(self, host: HostPoolStats) -> None:
+        """Count the request in flight; note the moment the pool saturates."""
+        in_flight = sum(stats.active for stats in self._hosts.values())
+        host.active += 1
+        if in_flight + 1 == self._max_connections:
+            host.saturations += 1
+            logger.warning(
+                "HTTP pool saturated (%d in flight) — requests to %s now wait for a connection",
+                in_flight + 1,
+                host.host,
+            )
+
+    def stats(self) -> list[HostPoolStats]:
+        idle = self._idle_connections()
+        snapshot = [
+            HostPoolStats(
+                host=stats.host,
+                requests=stats.requests,
+                active=stats.active,
+                idle=idle.get(stats.host, 0),
+                connections_opened=stats.connections_opened,
+                connect_ms=stats.connect_ms,
+                saturations=stats.saturations,
+            )
+            for stats in self._hosts.values()
+        ]
+        return sorted(snapshot, key=lambda stats: stats.requests, reverse=True)
+
+    def _idle_connections(self) -> dict[str, int]:
+        """Idle keep-alive connections per host.  httpx exposes no pool view of
+        its own, so this reads the httpcore pool it wraps."""
+        connections = self._pool.connections
+        return {
+            key: sum(
+                1 for conn in connections if conn.is_idle() and conn.can_handle_request(origin)
+            )
+            for key, origin in self._origins.items()
+        }
+
+
+class _PoolLease(httpx.AsyncBaseTransport):
+    """The shared pool as seen by one client — closing the client must not
+    close connections every other integration is using."""
+
+    def __init__(self, pool: _MeteredTransport) -> None:
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._pool.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """A response body that takes its request off the in-flight count when closed."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, host: HostPoolStats) -> None:
+        self._stream = stream
+        self._host = host
+        self._released = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        if not self._released:
+            self._released = True
+            self._host.active -= 1
+        await self._stream.aclose()
+
+
+class _ConnectTimer:
+    """httpcore ``trace`` hook timing TCP connect + TLS handshake per new connection."""
+
+    def __init__(self, host: HostPoolStats, chained: TraceCallback | None) -> None:
+        self._host = host
+        self._chained = chained
+        self._started = 0.0
+
+    async def __call__(self, event: str, info: dict[str, Any]) -> None:
+        if event in ("connection.connect_tcp.started", "connection.start_tls.started"):
+            self._started = time.monotonic()
+        elif event in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+            self._host.connect_ms += (time.monotonic() - self._started) * 1000
+            if event == "connection.connect_tcp.complete":
+                self._host.connections_opened += 1
+        if self._chained is not None:
+            await self._chained(event, info)
@@ -5,10 +5,9 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-import httpx
-
 from penny.constants import PennyConstants
 from penny.html_utils import strip_html
+from penny.http_transport import HttpTransport, http_client
 from penny.jmap.models import EmailAddress, EmailDetail, EmailSummary, JmapSession
 
 logger = logging.getLogger(__name__)
@@ -29,12 +28,14 @@ class JmapClient:
         timeout: float,
         max_body_length: int,
         search_limit: int,
+        transport: HttpTransport | None = None,
     ) -> None:
         self._api_token = api_token
         self._max_body_length = max_body_length
         self._search_limit = search_limit
         self._session: JmapSession | None = None
-        self._http = httpx.AsyncClient(
+        self._http = http_client(
+            transport,
             timeout=timeout,
             headers={"Authorization": f"Bearer {api_token}"},
         )
@@ -9,6 +9,9 @@ from penny.llm.models import (
     LlmResponseError,
     LlmTimeoutError,
 )
+from penny.llm.response_cache import ResponseCache
+from penny.llm.scheduler import LlmScheduler
+from penny.llm.tiers import ModelTiers
 
 __all__ = [
     "LlmClient",
@@ -16,6 +19,9 @@ __all__ = [
     "LlmError",
     "LlmNotFoundError",
     "LlmResponseError",
+    "LlmScheduler",
     "LlmTimeoutError",
+    "ModelTiers",
     "OllamaImageClient",
+    "ResponseCache",
 ]
@@ -0,0 +1,85 @@
+"""Generation budgets — reasoning effort and token caps per agent / prompt type.
+
+gpt-oss spends a large share of its decode on reasoning (see
+``PromptPerf.reasoning_share``), and without a cap a collector bookkeeping
+step can think for thousands of tokens.  The ``LLM_BUDGETS`` runtime param
+assigns budgets as comma-separated ``key=effort:max_tokens`` entries, e.g.::
+
+    collector=low:2048,chat=medium,startup_announcement=:200
+
+Either half may be left out (``collector=low``, ``schedule=:256``).  A key
+is an agent name, a prompt type, ``agent/prompt_type`` for one flow of one
+agent, or ``*`` for everything else; the most specific match wins.
+``LlmClient`` resolves the budget for each call from its ``agent_name`` and
+``prompt_type``, sends ``reasoning_effort`` / ``max_tokens``, and the prompt
+log records the budget applied and whether the output ran into it.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+REASONING_EFFORTS = ("low", "medium", "high")
+WILDCARD = "*"
+
+
+@dataclass(frozen=True)
+class LlmBudget:
+    """What one model call may spend — ``None`` leaves it to the server."""
+
+    reasoning_effort: str | None = None
+    max_tokens: int | None = None
+
+    def __str__(self) -> str:
+        effort = self.reasoning_effort or ""
+        return f"{effort}:{self.max_tokens}" if self.max_tokens is not None else effort
+
+
+def parse_budgets(spec: str) -> dict[str, LlmBudget]:
+    """Parse an ``LLM_BUDGETS`` value; raises ``ValueError`` on a bad entry."""
+    budgets: dict[str, LlmBudget] = {}
+    for entry in spec.split(","):
+        if not entry.strip():
+            continue
+        key, separator, value = entry.partition("=")
+        key = key.strip()
+        if not separator or not key:
+            raise ValueError(f"expected key=effort:max_tokens, got {entry.strip()!r}")
+        budgets[key] = _parse_budget(value.strip())
+    return budgets
+
+
+def _parse_budget(value: str) -> LlmBudget:
+    effort, _, tokens = value.partition(":")
+    effort = effort.strip().lower() or None
+    if effort is not None and effort not in REASONING_EFFORTS:
+        raise ValueError(f"reasoning effort must be one of: {', '.join(REASONING_EFFORTS)}")
+    max_tokens = None
+    if tokens.strip():
+        try:
+            max_tokens = int(tokens)
+        except ValueError as e:
+            raise ValueError("max_tokens must be a positive integer") from e
+        if max_tokens <= 0:
+            raise ValueError("max_tokens must be a positive integer")
+    return LlmBudget(effort, max_tokens)
+
+
+def format_budgets(budgets: dict[str, LlmBudget]) -> str:
+    """The canonical ``LLM_BUDGETS`` spelling of ``budgets``."""
+    return ",".join(f"{key}={budget}" for key, budget in budgets.items())
+
+
+def resolve_budget(spec: str, agent_name: str | None, prompt_type: str | None) -> LlmBudget | None:
+    """The budget for one call: ``agent/prompt_type``, then the prompt type,
+    then the agent, then ``*``."""
+    if not spec:
+        return None
+    budgets = parse_budgets(spec)
+    keys = [prompt_type, agent_name, WILDCARD]
+    if agent_name and prompt_type:
+        keys.insert(0, f"{agent_name}/{prompt_type}")
+    for key in keys:
+        if key and key in budgets:
+            return budgets[key]
+    return None
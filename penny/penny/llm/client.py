@@ -1,24 +1,34 @@
 """LLM client for chat completions and embeddings.
 
 Uses the OpenAI Python SDK, which works with any OpenAI-compatible API:
-Ollama, omlx, OpenAI cloud, etc. Just change the base_url.
+Ollama, omlx, OpenAI cloud, etc. Just change the base_url — or list several,
+comma-separated, to spread requests across an ``EndpointPool``.
 """
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
 import re
 import time
-from typing import Any
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import AbstractAsyncContextManager, nullcontext
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import httpx
 import openai
+from openai.types.chat import ChatCompletionChunk
 
-from penny.constants import PennyConstants
+from penny.constants import LlmLane, PennyConstants
+from penny.http_transport import HttpTransport
+from penny.llm.budgets import LlmBudget, resolve_budget
+from penny.llm.endpoints import EndpointPool, LlmEndpoint
 from penny.llm.models import (
     LlmConnectionError,
+    LlmDegenerateOutputError,
+    LlmDelta,
     LlmError,
     LlmMessage,
     LlmNotFoundError,
@@ -29,6 +39,13 @@ from penny.llm.models import (
     LlmToolCallFunction,
     LlmToolParseError,
 )
+from penny.llm.residency import ModelResidency
+from penny.llm.response_cache import ResponseCache, is_deterministic, request_key
+from penny.llm.scheduler import LlmScheduler, current_lane
+from penny.llm.streaming import StreamAssembler
+
+if TYPE_CHECKING:
+    from penny.config_params import RuntimeParams
 
 logger = logging.getLogger(__name__)
 
@@ -36,10 +53,52 @@ logger = logging.getLogger(__name__)
 _DEFAULT_API_KEY = "not-needed"
 
 
+def prefix_fingerprint(
+    messages: list[dict], tools: list[dict] | None, reasoning_effort: str | None = None
+) -> str:
+    """Digest of a request's cacheable prefix: its system message, tools and
+    reasoning effort (gpt-oss renders the effort into the system message).
+
+    Two requests with the same fingerprint share the server-side KV prefix."""
+    head = messages[:1] if messages else []
+    payload = json.dumps([head, tools or [], reasoning_effort], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class _StreamedCompletion(NamedTuple):
+    """One streamed request: the reassembled completion (partial if aborted),
+    time to first token, the consumer's abort (if it cut the decode short), and
+    how many tokens were decoded before the stream ended."""
+
+    completion: openai.types.chat.ChatCompletion
+    ttft_ms: int | None
+    abort: LlmDegenerateOutputError | None
+    decoded_tokens: int
+
+
+class _Opened(NamedTuple):
+    """A request that has started answering on ``endpoint``: the whole
+    completion, or a live stream with its first chunk already read."""
+
+    endpoint: LlmEndpoint
+    completion: openai.types.chat.ChatCompletion | None = None
+    stream: openai.AsyncStream[ChatCompletionChunk] | None = None
+    chunks: AsyncIterator[ChatCompletionChunk] | None = None
+    first_chunk: ChatCompletionChunk | None = None
+
+
 class LlmClient:
     """Client for LLM inference via OpenAI-compatible APIs.
 
-    Works with Ollama, omlx, or any OpenAI-compatible server.
+    Works with Ollama, omlx, or any OpenAI-compatible server.  ``api_url`` may
+    list several servers, comma-separated; requests are then routed across
+    them by ``EndpointPool`` (least outstanding, health-aware, optionally
+    hedged).  With a ``scheduler``, every request first waits for a slot in
+    its ``LlmLane``; with a ``residency``, every request reports whether its
+    model had to be loaded.  With ``runtime``, each chat call gets the
+    ``LLM_BUDGETS`` budget for its agent and prompt type.  With a
+    ``response_cache``, deterministic calls marked ``cacheable`` are answered
+    from it when they can be.
     """
 
     def __init__(
@@ -52,15 +111,48 @@ class LlmClient:
         retry_delay: float,
         api_key: str = _DEFAULT_API_KEY,
         timeout: float | None = None,
+        transport: HttpTransport | None = None,
+        scheduler: LlmScheduler | None = None,
+        residency: ModelResidency | None = None,
+        runtime: RuntimeParams | None = None,
+        response_cache: ResponseCache | None = None,
     ):
-        self.api_url = api_url.rstrip("/")
+        urls = [url.strip().rstrip("/") for url in api_url.split(",") if url.strip()]
+        if not urls:
+            raise ValueError(f"LlmClient needs at least one API URL, got {api_url!r}")
+        self.api_url = urls[0]
         self.model = model
         self.db = db
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self._scheduler = scheduler
+        self._residency = residency
+        self._runtime = runtime
+        self._response_cache = response_cache
+        # What the server's prefix cache most likely holds: the fingerprint of
+        # the last chat request sent, and when this model last served anything.
+        self.last_prefix: str | None = None
+        self._last_request_at: float | None = None
+        self._pool = EndpointPool(
+            [
+                LlmEndpoint(url, self._build_sdk_client(url, api_key, timeout, transport))
+                for url in urls
+            ]
+        )
+
+        logger.info("Initialized LLM client: url=%s, model=%s", ", ".join(urls), model)
 
+    @property
+    def client(self) -> openai.AsyncOpenAI:
+        """The SDK client of the first (primary) endpoint."""
+        return self._pool.endpoints[0].client
+
+    @staticmethod
+    def _build_sdk_client(
+        url: str, api_key: str, timeout: float | None, transport: HttpTransport | None
+    ) -> openai.AsyncOpenAI:
         client_kwargs: dict[str, Any] = {
-            "base_url": f"{self.api_url}/v1",
+            "base_url": f"{url}/v1",
             "api_key": api_key,
             "max_retries": 0,  # We handle retries ourselves
         }
@@ -69,10 +161,45 @@ class LlmClient:
             client_kwargs["timeout"] = httpx.Timeout(
                 timeout=timeout, connect=PennyConstants.LLM_CONNECT_TIMEOUT_SECONDS
             )
-
-        self.client = openai.AsyncOpenAI(**client_kwargs)
-
-        logger.info("Initialized LLM client: url=%s, model=%s", api_url, model)
+        if transport is not None:
+            # Connections to the LLM host come from the process-wide pool rather
+            # than a pool private to this client.
+            client_kwargs["http_client"] = transport.client(
+                timeout=client_kwargs.get("timeout", openai.DEFAULT_TIMEOUT)
+            )
+        return openai.AsyncOpenAI(**client_kwargs)
+
+    def seconds_since_last_request(self) -> float | None:
+        """How long this model has gone without a request (``None`` = never used)."""
+        if self._last_request_at is None:
+            return None
+        return time.monotonic() - self._last_request_at
+
+    def _note_request(self, prefix: str | None = None) -> None:
+        self._last_request_at = time.monotonic()
+        if prefix is not None:
+            self.last_prefix = prefix
+
+    def _slot(self, default_lane: LlmLane) -> AbstractAsyncContextManager[Any]:
+        """A scheduler slot for one request, in the caller's lane — or in
+        ``default_lane`` when the caller's context doesn't name one."""
+        if self._scheduler is None:
+            return nullcontext()
+        return self._scheduler.slot(current_lane(default_lane), self.model)
+
+    def _model_loaded(self, endpoint: LlmEndpoint) -> bool:
+        if self._residency is None:
+            return True
+        return self._residency.is_loaded(self.model, endpoint.url)
+
+    def _observe_first_response(
+        self, endpoint: LlmEndpoint, started: float, *, was_loaded: bool
+    ) -> float:
+        """Seconds since ``started``, reported to the residency tracker."""
+        seconds = time.monotonic() - started
+        if self._residency is not None:
+            self._residency.observe(self.model, endpoint.url, seconds, was_loaded=was_loaded)
+        return seconds
 
     # ── Chat ─────────────────────────────────────────────────────────────
 
@@ -85,20 +212,97 @@ class LlmClient:
         prompt_type: str | None = None,
         run_id: str | None = None,
         run_target: str | None = None,
+        on_delta: Callable[[LlmDelta], Awaitable[None]] | None = None,
+        hedge_percentile: int = 0,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+        cacheable: bool = False,
+        accept: Callable[[LlmResponse], bool] | None = None,
+        budget_as: tuple[str | None, str | None] | None = None,
     ) -> LlmResponse:
-        """Generate a chat completion with optional tool calling."""
+        """Generate a chat completion with optional tool calling.
+
+        With ``on_delta`` the request streams: every content, reasoning and
+        tool-call fragment is handed to the callback as it decodes, and the
+        response returned is the reassembled whole — callers validate and act
+        on it exactly as on a non-streamed one.  A retried attempt first sends
+        a ``restart`` delta so the consumer can drop the abandoned fragments.
+        A callback that raises ``LlmDegenerateOutputError`` cancels the decode:
+        the partial call is logged with its ``aborted_tokens`` and the error
+        propagates, unretried.
+
+        A non-zero ``hedge_percentile`` hedges the request: if its endpoint
+        hasn't answered (first chunk, when streaming) within that percentile of
+        recent latencies, a duplicate goes to another endpoint and whichever
+        answers first is used.  Each retry goes to the pool's current pick, so a
+        failing endpoint is skipped on the next attempt.
+
+        ``max_tokens`` caps the completion length, overriding the call's
+        ``LLM_BUDGETS`` cap (``None`` = the budget's, else the server default).
+        An explicit cap is the caller's, not a budget: the prompt log records
+        only what ``LLM_BUDGETS`` applied, so a capped probe never counts as a
+        budget hit.  ``budget_as`` resolves the budget as another
+        ``(agent_name, prompt_type)`` — the prefix warmer's probe takes chat's
+        reasoning effort, so the prefix it warms is the one chat sends.
+
+        ``cacheable`` marks the call as a pure function of its request: with
+        ``temperature=0`` and no ``on_delta``, a fresh cached answer is
+        returned (and logged as a zero-duration cached prompt) instead of
+        sending it, and a new answer is cached for next time.  With ``accept``
+        only an answer it passes is cached (or replayed) — the caller's check,
+        e.g. ``ModelTiers``' escalation test, decides what is worth reusing.
+        """
         last_error: Exception | None = None
+        budget, sent_budget = self._budgets(*(budget_as or (agent_name, prompt_type)), max_tokens)
+        prefix = prefix_fingerprint(
+            messages, tools, sent_budget.reasoning_effort if sent_budget is not None else None
+        )
+        cache_key = None
+        if cacheable and on_delta is None:
+            cache_key = self._cache_key(messages, tools, format, sent_budget, temperature)
+        if cache_key is not None:
+            cached = self._from_cache(
+                cache_key,
+                messages,
+                tools,
+                agent_name,
+                prompt_type,
+                run_id,
+                run_target,
+                budget,
+                accept,
+            )
+            if cached is not None:
+                return cached
 
         for attempt in range(self.max_retries):
             try:
                 logger.debug("Sending chat request (attempt %d/%d)", attempt + 1, self.max_retries)
 
-                start = time.time()
                 messages_snapshot = list(messages)
                 translated_messages = self._translate_messages(messages)
 
-                kwargs = self._build_chat_kwargs(translated_messages, tools, format)
-                raw = await self.client.chat.completions.create(**kwargs)
+                kwargs = self._build_chat_kwargs(
+                    translated_messages, tools, format, sent_budget, temperature
+                )
+                ttft_ms: int | None = None
+                abort: LlmDegenerateOutputError | None = None
+                aborted_tokens: int | None = None
+                if attempt > 0 and on_delta is not None:
+                    await on_delta(LlmDelta(restart=True))
+                async with self._slot(LlmLane.CHAT):
+                    # Timed from admission: queueing shows in the lane stats,
+                    # not in the prompt's own duration / TTFT.
+                    start = time.time()
+                    self._note_request(prefix)
+                    if on_delta is None:
+                        opened = await self._open(kwargs, False, hedge_percentile)
+                        raw = opened.completion
+                    else:
+                        opened = await self._open(kwargs, True, hedge_percentile)
+                        streamed = await self._stream_completion(opened, start, on_delta)
+                        raw, ttft_ms, abort = streamed.completion, streamed.ttft_ms, streamed.abort
+                        aborted_tokens = streamed.decoded_tokens if abort is not None else None
                 duration_ms = int((time.time() - start) * 1000)
 
                 response = self._parse_response(raw)
@@ -110,12 +314,23 @@ class LlmClient:
                     tools,
                     thinking,
                     duration_ms,
+                    ttft_ms,
+                    aborted_tokens,
                     agent_name,
                     prompt_type,
                     run_id,
                     run_target,
+                    budget,
                 )
 
+                if abort is not None:
+                    raise abort
+                if (
+                    cache_key is not None
+                    and self._response_cache is not None
+                    and (accept is None or accept(response))
+                ):
+                    self._response_cache.put(cache_key, self.model, raw.model_dump())
                 return response
 
             except LlmError:
@@ -145,10 +360,7 @@ class LlmClient:
                 # 500 "error parsing tool call" means the model produced plain text
                 # instead of a JSON tool call. Retrying with the same messages won't
                 # help — raise immediately so the agent can inject a format nudge.
-                if (
-                    getattr(error, "status_code", None) == 500
-                    and "error parsing tool call" in error_str
-                ):
+                if self._is_tool_parse_error(error):
                     logger.warning(
                         "Tool parse error — model returned plain text instead of JSON tool call"
                     )
@@ -165,6 +377,166 @@ class LlmClient:
             raise LlmResponseError("LLM chat exhausted retries without a recorded error")
         raise last_error
 
+    async def _open(self, kwargs: dict, streamed: bool, hedge_percentile: int) -> _Opened:
+        """Send one request to the pool's pick, hedged when history allows."""
+        primary = self._pool.pick()
+        delay = self._pool.hedge_delay(hedge_percentile, streamed=streamed)
+        if delay is None:
+            return await self._open_on(primary, kwargs, streamed)
+        first = asyncio.create_task(self._open_on(primary, kwargs, streamed))
+        try:
+            done, _ = await asyncio.wait({first}, timeout=delay)
+        except asyncio.CancelledError:
+            # ``wait`` doesn't cancel what it waits on — left running, the
+            # request would open a stream nobody closes or releases.
+            await self._abandon([first])
+            raise
+        secondary = self._pool.pick_other(primary)
+        if done or secondary is None:
+            return await first
+        logger.info(
+            "Hedging LLM request: %s silent past p%d (%.1fs), duplicating to %s",
+            primary.url,
+            hedge_percentile,
+            delay,
+            secondary.url,
+        )
+        second = asyncio.create_task(self._open_on(secondary, kwargs, streamed))
+        return await self._first_to_answer([first, second])
+
+    async def _open_on(self, endpoint: LlmEndpoint, kwargs: dict, streamed: bool) -> _Opened:
+        """Send the request to ``endpoint`` and wait for it to start answering.
+
+        A streamed request stays counted against the endpoint until
+        ``_stream_completion`` (or ``_discard``) releases it."""
+        was_loaded = self._model_loaded(endpoint)
+        self._pool.acquire(endpoint)
+        started = time.monotonic()
+        stream = None
+        try:
+            if streamed:
+                stream = await endpoint.client.chat.completions.create(
+                    **kwargs, stream=True, stream_options={"include_usage": True}
+                )
+                chunks = aiter(stream)
+                first_chunk = await anext(chunks, None)
+            else:
+                completion = await endpoint.client.chat.completions.create(**kwargs)
+        except BaseException as error:
+            if stream is not None:
+                await stream.close()
+            self._pool.release(endpoint, failed=self._is_endpoint_failure(error))
+            raise
+        latency = self._observe_first_response(endpoint, started, was_loaded=was_loaded)
+        self._pool.record_latency(latency, streamed=streamed)
+        if not streamed:
+            self._pool.release(endpoint, failed=False)
+            return _Opened(endpoint, completion=completion)
+        return _Opened(endpoint, stream=stream, chunks=chunks, first_chunk=first_chunk)
+
+    async def _first_to_answer(self, racers: list[asyncio.Task[_Opened]]) -> _Opened:
+        """The first racer to answer wins; the rest are cancelled, or discarded
+        if they answered too.  Raises the last failure if every racer fails."""
+        pending = set(racers)
+        winner: _Opened | None = None
+        failure: BaseException | None = None
+        while pending and winner is None:
+            try:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            except asyncio.CancelledError:
+                await self._abandon(pending)
+                raise
+            for task in done:
+                if task.exception() is not None:
+                    failure = task.exception()
+                elif winner is None:
+                    winner = task.result()
+                else:
+                    await self._discard(task.result())
+        await self._abandon(pending)
+        if winner is None:
+            raise failure or LlmResponseError("every hedged LLM request failed")
+        return winner
+
+    async def _abandon(self, racers: Iterable[asyncio.Task[_Opened]]) -> None:
+        """Cancel requests nobody will read, discarding any that already opened."""
+        racers = list(racers)
+        for task in racers:
+            task.cancel()
+        for leftover in await asyncio.gather(*racers, return_exceptions=True):
+            if isinstance(leftover, _Opened):
+                await self._discard(leftover)
+
+    async def _discard(self, opened: _Opened) -> None:
+        """Drop a hedged request that lost the race."""
+        if opened.stream is not None:
+            await opened.stream.close()
+            self._pool.release(opened.endpoint, failed=False)
+
+    async def _stream_completion(
+        self,
+        opened: _Opened,
+        start: float,
+        on_delta: Callable[[LlmDelta], Awaitable[None]],
+    ) -> _StreamedCompletion:
+        """Consume an opened stream, forwarding deltas to ``on_delta``.
+
+        Closing the stream closes the HTTP response, which is what stops the
+        server decoding — so an abort raised by the callback frees the GPU at
+        the token that triggered it rather than after the full generation.
+        """
+        assembler = StreamAssembler()
+        ttft_ms: int | None = None
+        abort: LlmDegenerateOutputError | None = None
+        failed = False
+        try:
+            async for chunk in self._replay_first(opened):
+                for delta in assembler.add(chunk):
+                    if ttft_ms is None:
+                        ttft_ms = int((time.time() - start) * 1000)
+                    await on_delta(delta)
+        except LlmDegenerateOutputError as error:
+            logger.warning(
+                "Aborted streamed decode after %d tokens: %s", assembler.decoded_tokens, error
+            )
+            abort = error
+        except BaseException as error:
+            failed = self._is_endpoint_failure(error)
+            raise
+        finally:
+            if opened.stream is not None:
+                await opened.stream.close()
+            self._pool.release(opened.endpoint, failed=failed)
+        return _StreamedCompletion(assembler.completion(), ttft_ms, abort, assembler.decoded_tokens)
+
+    @staticmethod
+    async def _replay_first(opened: _Opened) -> AsyncIterator[ChatCompletionChunk]:
+        """The opened stream's chunks, starting with the one already read."""
+        if opened.first_chunk is not None:
+            yield opened.first_chunk
+        if opened.chunks is not None:
+            async for chunk in opened.chunks:
+                yield chunk
+
+    @classmethod
+    def _is_endpoint_failure(cls, error: BaseException) -> bool:
+        """Does ``error`` count against the endpoint's health?  Connection
+        errors, timeouts and 5xx do; a model-level tool-parse 500 and 4xx don't."""
+        if isinstance(error, openai.APIConnectionError):
+            return True
+        return isinstance(error, openai.InternalServerError) and not cls._is_tool_parse_error(error)
+
+    @staticmethod
+    def _is_tool_parse_error(error: openai.OpenAIError) -> bool:
+        """Did the server fail to parse the model's tool call?
+
+        Non-streamed, that's an HTTP 500; streamed, the response has already
+        begun with a 200 and the same message arrives as an in-stream error
+        event (an ``APIError`` with no status of its own)."""
+        if "error parsing tool call" not in str(error):
+            return False
+        return not isinstance(error, openai.APIStatusError) or error.status_code == 500
+
     # ── Generate (chat wrapper) ──────────────────────────────────────────
 
     async def generate(
@@ -175,6 +547,9 @@ class LlmClient:
         agent_name: str | None = None,
         prompt_type: str | None = None,
         run_id: str | None = None,
+        temperature: float | None = None,
+        cacheable: bool = False,
+        accept: Callable[[LlmResponse], bool] | None = None,
     ) -> LlmResponse:
         """Generate a completion for a prompt (converts to chat format internally)."""
         messages = [{"role": "user", "content": prompt}]
@@ -185,6 +560,9 @@ class LlmClient:
             agent_name=agent_name,
             prompt_type=prompt_type,
             run_id=run_id,
+            temperature=temperature,
+            cacheable=cacheable,
+            accept=accept,
         )
 
     # ── Embeddings ───────────────────────────────────────────────────────
@@ -197,7 +575,7 @@ class LlmClient:
             try:
                 logger.debug("Sending embed request (attempt %d/%d)", attempt + 1, self.max_retries)
 
-                response = await self.client.embeddings.create(model=self.model, input=text)
+                response = await self._embed_once(text)
                 embeddings = [list(item.embedding) for item in response.data]
 
                 logger.debug(
@@ -230,11 +608,31 @@ class LlmClient:
             raise LlmResponseError("LLM embed exhausted retries without a recorded error")
         raise last_error
 
+    async def _embed_once(self, text: str | list[str]) -> openai.types.CreateEmbeddingResponse:
+        """One embedding request on the pool's pick."""
+        async with self._slot(LlmLane.EMBED):
+            self._note_request()
+            endpoint = self._pool.pick()
+            was_loaded = self._model_loaded(endpoint)
+            self._pool.acquire(endpoint)
+            started = time.monotonic()
+            failed = False
+            try:
+                response = await endpoint.client.embeddings.create(model=self.model, input=text)
+                self._observe_first_response(endpoint, started, was_loaded=was_loaded)
+                return response
+            except BaseException as error:
+                failed = self._is_endpoint_failure(error)
+                raise
+            finally:
+                self._pool.release(endpoint, failed=failed)
+
     # ── Cleanup ──────────────────────────────────────────────────────────
 
     async def close(self) -> None:
         """Close the client."""
-        await self.client.close()
+        for endpoint in self._pool.endpoints:
+            await endpoint.client.close()
         logger.info("LLM client closed")
 
     # ── Internal: request building ───────────────────────────────────────
@@ -244,6 +642,8 @@ class LlmClient:
         messages: list[dict],
         tools: list[dict] | None,
         format: dict | str | None,
+        budget: LlmBudget | None = None,
+        temperature: float | None = None,
     ) -> dict:
         """Build kwargs for the OpenAI chat completions call."""
         kwargs: dict[str, Any] = {"model": self.model, "messages": messages}
@@ -251,8 +651,92 @@ class LlmClient:
             kwargs["tools"] = self._translate_tools(tools)
         if format is not None:
             kwargs["response_format"] = self._translate_format(format)
+        if budget is not None and budget.max_tokens is not None:
+            kwargs["max_tokens"] = budget.max_tokens
+        if budget is not None and budget.reasoning_effort is not None:
+            kwargs["reasoning_effort"] = budget.reasoning_effort
+        if temperature is not None:
+            kwargs["temperature"] = temperature
         return kwargs
 
+    def _cache_key(
+        self,
+        messages: list[dict],
+        tools: list[dict] | None,
+        format: dict | str | None,
+        budget: LlmBudget | None,
+        temperature: float | None,
+    ) -> str | None:
+        """The response-cache key for a request — ``None`` when the cache is
+        off or the request's sampling isn't deterministic."""
+        if self._response_cache is None or not self._response_cache.enabled:
+            return None
+        kwargs = self._build_chat_kwargs(
+            self._translate_messages(messages), tools, format, budget, temperature
+        )
+        if not is_deterministic(kwargs):
+            logger.debug("Bypassing response cache: non-deterministic sampling")
+            return None
+        return request_key(kwargs)
+
+    def _from_cache(
+        self,
+        cache_key: str,
+        messages: list[dict],
+        tools: list[dict] | None,
+        agent_name: str | None,
+        prompt_type: str | None,
+        run_id: str | None,
+        run_target: str | None,
+        budget: LlmBudget | None,
+        accept: Callable[[LlmResponse], bool] | None,
+    ) -> LlmResponse | None:
+        """Replay a cached response, logging it as a zero-duration cached prompt."""
+        assert self._response_cache is not None
+        cached = self._response_cache.get(cache_key)
+        if cached is None:
+            return None
+        raw = openai.types.chat.ChatCompletion.model_validate(cached)
+        response = self._parse_response(raw)
+        if accept is not None and not accept(response):
+            return None
+        thinking = response.thinking or response.message.thinking
+        logger.info("Response cache hit (%s, %s/%s)", self.model, agent_name, prompt_type)
+        self._log_to_database(
+            list(messages),
+            raw,
+            tools,
+            thinking,
+            0,
+            None,
+            None,
+            agent_name,
+            prompt_type,
+            run_id,
+            run_target,
+            budget,
+            cached=True,
+        )
+        return response
+
+    def reasoning_effort(self, agent_name: str | None, prompt_type: str | None) -> str | None:
+        """The reasoning effort ``LLM_BUDGETS`` gives this agent / prompt type."""
+        budget, _ = self._budgets(agent_name, prompt_type, None)
+        return budget.reasoning_effort if budget is not None else None
+
+    def _budgets(
+        self, agent_name: str | None, prompt_type: str | None, max_tokens: int | None
+    ) -> tuple[LlmBudget | None, LlmBudget | None]:
+        """The call's ``LLM_BUDGETS`` budget as applied (what the prompt log
+        records) and as sent — with an explicit ``max_tokens`` taking the
+        place of its cap, which then no longer counts as the budget's."""
+        spec = str(self._runtime.LLM_BUDGETS) if self._runtime is not None else ""
+        budget = resolve_budget(spec, agent_name, prompt_type)
+        if max_tokens is None:
+            return budget, budget
+        effort = budget.reasoning_effort if budget is not None else None
+        return (LlmBudget(effort) if effort else None), LlmBudget(effort, max_tokens)
+
     @staticmethod
     def _translate_messages(messages: list[dict]) -> list[dict]:
         """Translate messages to OpenAI format, handling vision images."""
@@ -403,14 +887,24 @@ class LlmClient:
         tools: list[dict] | None,
         thinking: str | None,
         duration_ms: int,
+        ttft_ms: int | None,
+        aborted_tokens: int | None,
         agent_name: str | None,
         prompt_type: str | None,
         run_id: str | None,
         run_target: str | None,
+        budget: LlmBudget | None,
+        cached: bool = False,
     ) -> None:
-        """Log prompt exchange to database if available."""
+        """Log prompt exchange to database if available.
+
+        A call under an ``LLM_BUDGETS`` token cap that stopped for ``length``
+        hit its budget."""
         if not self.db:
             return
+        budget_hit = None
+        if budget is not None and budget.max_tokens is not None:
+            budget_hit = any(choice.finish_reason == "length" for choice in raw.choices)
         self.db.messages.log_prompt(
             model=self.model,
             messages=messages_snapshot,
@@ -418,10 +912,15 @@ class LlmClient:
             tools=tools,
             thinking=thinking,
             duration_ms=duration_ms,
+            ttft_ms=ttft_ms,
+            aborted_tokens=aborted_tokens,
             agent_name=agent_name,
             prompt_type=prompt_type,
             run_id=run_id,
             run_target=run_target,
+            budget=str(budget) if budget is not None else None,
+            budget_hit=budget_hit,
+            cached=cached or None,
         )
 
 
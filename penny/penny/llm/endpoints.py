@@ -0,0 +1,122 @@
+"""Endpoint pool for an LlmClient spread across several inference servers.
+
+An ``LlmClient`` built with a comma-separated ``api_url`` talks to every listed
+OpenAI-compatible server; one built with a single URL is a pool of one and
+behaves exactly as before.  ``EndpointPool`` decides where each request goes:
+
+- **Least outstanding requests.**  The healthy endpoint with the fewest
+  requests in flight wins; ties go to the one that has served fewer requests,
+  so a sequential workload alternates instead of pinning the first server.
+- **Health.**  An endpoint that fails with a connection error, a timeout or a
+  5xx leaves rotation for ``LLM_ENDPOINT_BACKOFF_SECONDS``, doubled for each
+  further failure in a row (capped), so ``LlmClient``'s retry loop sends the
+  retry to another server and later calls keep away until the backoff ends.
+  If every endpoint is down, the pool still picks one: the one that recovers
+  soonest.  A single-endpoint pool therefore behaves as before.
+- **Hedging latency.**  The pool records how long recent requests took to
+  answer (the full response, or the first chunk of a stream).  A hedged
+  request duplicates itself to a second endpoint once the first has been
+  silent past a chosen percentile of that history.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+
+import openai
+
+from penny.constants import PennyConstants
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LlmEndpoint:
+    """One inference server and its live routing state."""
+
+    url: str
+    client: openai.AsyncOpenAI
+    outstanding: int = 0
+    served: int = 0
+    consecutive_failures: int = 0
+    down_until: float = 0.0
+
+    def is_up(self, now: float) -> bool:
+        return now >= self.down_until
+
+
+class EndpointPool:
+    """Routes requests across ``LlmEndpoint``s and tracks their health."""
+
+    def __init__(self, endpoints: list[LlmEndpoint]) -> None:
+        self.endpoints = endpoints
+        window = PennyConstants.LLM_HEDGE_LATENCY_WINDOW
+        # First-response latency, kept separately for streamed requests (time
+        # to first chunk) and non-streamed ones (time to the whole response).
+        self._latencies: dict[bool, deque[float]] = {
+            True: deque(maxlen=window),
+            False: deque(maxlen=window),
+        }
+
+    def pick(self) -> LlmEndpoint:
+        """The endpoint the next request should go to."""
+        now = time.monotonic()
+        up = [endpoint for endpoint in self.endpoints if endpoint.is_up(now)]
+        if not up:
+            return min(self.endpoints, key=lambda endpoint: endpoint.down_until)
+        return self._least_loaded(up)
+
+    def pick_other(self, exclude: LlmEndpoint) -> LlmEndpoint | None:
+        """A healthy endpoint other than ``exclude`` to hedge to, if any."""
+        now = time.monotonic()
+        others = [e for e in self.endpoints if e is not exclude and e.is_up(now)]
+        return self._least_loaded(others) if others else None
+
+    @staticmethod
+    def _least_loaded(endpoints: list[LlmEndpoint]) -> LlmEndpoint:
+        return min(endpoints, key=lambda endpoint: (endpoint.outstanding, endpoint.served))
+
+    def acquire(self, endpoint: LlmEndpoint) -> None:
+        """Count a request in flight on ``endpoint``."""
+        endpoint.outstanding += 1
+        endpoint.served += 1
+
+    def release(self, endpoint: LlmEndpoint, *, failed: bool) -> None:
+        """Take a finished request off ``endpoint`` and update its health."""
+        endpoint.outstanding -= 1
+        if not failed:
+            endpoint.consecutive_failures = 0
+            return
+        endpoint.consecutive_failures += 1
+        backoff = min(
+            PennyConstants.LLM_ENDPOINT_BACKOFF_SECONDS * 2 ** (endpoint.consecutive_failures - 1),
+            PennyConstants.LLM_ENDPOINT_MAX_BACKOFF_SECONDS,
+        )
+        endpoint.down_until = time.monotonic() + backoff
+        if len(self.endpoints) > 1:
+            logger.warning(
+                "LLM endpoint %s failed (%d in a row) — out of rotation for %.0fs",
+                endpoint.url,
+                endpoint.consecutive_failures,
+                backoff,
+            )
+
+    def record_latency(self, seconds: float, *, streamed: bool) -> None:
+        self._latencies[streamed].append(seconds)
+
+    def hedge_delay(self, percentile: int, *, streamed: bool) -> float | None:
+        """Seconds to wait before hedging, or ``None`` when hedging can't apply:
+        it's disabled (``percentile`` 0), there's no second endpoint, or too
+        little latency history to place the percentile."""
+        samples = self._latencies[streamed]
+        if percentile <= 0 or len(self.endpoints) < 2:
+            return None
+        if len(samples) < PennyConstants.LLM_HEDGE_MIN_SAMPLES:
+            return None
+        ordered = sorted(samples)
+        rank = math.ceil(percentile / 100 * len(ordered)) - 1
+        return ordered[min(max(rank, 0), len(ordered) - 1)]
@@ -8,12 +8,19 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 
 import httpx
 from pydantic import BaseModel, Field
 
+from penny.http_transport import HttpTransport, http_client
+from penny.llm.residency import ModelResidency
+
 logger = logging.getLogger(__name__)
 
+_GENERATE_TIMEOUT_SECONDS = 120.0
+_LIST_MODELS_TIMEOUT_SECONDS = 10.0
+
 
 class _GenerateResponse(BaseModel):
     """Response from Ollama's /api/generate endpoint."""
@@ -38,11 +45,15 @@ class OllamaImageClient:
         *,
         max_retries: int,
         retry_delay: float,
+        transport: HttpTransport | None = None,
+        residency: ModelResidency | None = None,
     ):
         self.api_url = api_url.rstrip("/")
         self.model = model
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self._residency = residency
+        self._http = http_client(transport, timeout=_GENERATE_TIMEOUT_SECONDS)
 
     async def generate_image(self, prompt: str) -> str:
         """Generate an image from a text prompt.
@@ -60,13 +71,8 @@ class OllamaImageClient:
                     self.max_retries,
                 )
 
-                async with httpx.AsyncClient(timeout=120) as http_client:
-                    response = await http_client.post(
-                        f"{self.api_url}/api/generate",
-                        json={"model": self.model, "prompt": prompt, "stream": False},
-                    )
-                    response.raise_for_status()
-                    parsed = _GenerateResponse(**response.json())
+                response = await self._post_generate(prompt)
+                parsed = _GenerateResponse(**response.json())
 
                 image_data = parsed.image
                 if not image_data:
@@ -103,14 +109,36 @@ class OllamaImageClient:
         assert last_error is not None
         raise last_error
 
+    async def _post_generate(self, prompt: str) -> httpx.Response:
+        """One ``/api/generate`` call, reported to the residency tracker."""
+        was_loaded = True
+        if self._residency is not None:
+            was_loaded = self._residency.is_loaded(self.model, self.api_url)
+        started = time.monotonic()
+        response = await self._http.post(
+            f"{self.api_url}/api/generate",
+            json={"model": self.model, "prompt": prompt, "stream": False},
+        )
+        response.raise_for_status()
+        if self._residency is not None:
+            self._residency.observe(
+                self.model, self.api_url, time.monotonic() - started, was_loaded=was_loaded
+            )
+        return response
+
     async def list_models(self) -> list[str]:
         """List all locally available Ollama models."""
         try:
-            async with httpx.AsyncClient(timeout=10) as http_client:
-                response = await http_client.get(f"{self.api_url}/api/tags")
-                response.raise_for_status()
-                data = response.json()
+            response = await self._http.get(
+                f"{self.api_url}/api/tags", timeout=_LIST_MODELS_TIMEOUT_SECONDS
+            )
+            response.raise_for_status()
+            data = response.json()
             return [m["name"] for m in data.get("models", []) if m.get("name")]
         except Exception as error:
             logger.warning("Failed to list Ollama models: %s", error)
             return []
+
+    async def close(self) -> None:
+        """Close the HTTP client."""
+        await self._http.aclose()
@@ -43,6 +43,16 @@ class LlmToolParseError(LlmError):
     """
 
 
+class LlmDegenerateOutputError(LlmError):
+    """A streamed generation collapsed into a degeneration run mid-decode.
+
+    Raised by a stream consumer the moment the collapse appears; the client
+    closes the HTTP stream (cancelling the rest of the decode), records the
+    aborted call, and propagates it so the agent re-rolls immediately.
+    Never retried by the client — a fresh draw is the agent's decision.
+    """
+
+
 # ── Response types ───────────────────────────────────────────────────────
 
 
@@ -102,3 +112,20 @@ class LlmResponse(BaseModel):
     def has_tool_calls(self) -> bool:
         """Check if response has tool calls."""
         return bool(self.message.tool_calls)
+
+
+class LlmDelta(BaseModel):
+    """One increment of a streamed chat completion.
+
+    Carries a content fragment, a reasoning fragment, or a fragment of one tool
+    call (``tool_call_index`` set; ``tool_name`` on the call's first fragment,
+    ``tool_arguments`` a slice of its JSON).  ``restart`` marks a retried
+    request: everything delivered before it belonged to an abandoned attempt.
+    """
+
+    content: str = ""
+    thinking: str = ""
+    tool_call_index: int | None = None
+    tool_name: str | None = None
+    tool_arguments: str = ""
+    restart: bool = False
@@ -0,0 +1,268 @@
+"""Model residency: which models each inference host has loaded.
+
+Penny uses up to four models — chat, vision, embedding and image generation.
+On a single GPU, Ollama evicts one to load another, so a ``/draw`` or an image
+caption in the middle of a conversation costs a multi-second reload of the
+chat model on the next reply.  ``ModelResidency`` sees every request
+(``LlmClient`` and ``OllamaImageClient`` report to it) and does three jobs:
+
+- **Track.**  A host's loaded models come from Ollama's ``/api/ps``, re-read
+  in the background after ``RESIDENCY_PS_TTL_SECONDS`` or whenever the host
+  switches models — a request only ever reads the last known state, never
+  waits on the host.  Between readings a switch is assumed to have evicted
+  the previous model, which is all a host without ``/api/ps`` (omlx, vLLM, a
+  cloud API) ever gets.
+- **Count loads.**  A request to a model that wasn't loaded is a load.  The
+  time it lost is its first-response latency beyond that model's warm
+  baseline (a moving average of its latency when already loaded).
+  ``stats()`` / ``log_stats()`` expose loads and time lost per model.
+- **Hint keep-alive.**  While the user is active, an Ollama host is told to
+  keep the *pinned* models (chat, embedding) loaded for
+  ``RESIDENCY_ACTIVE_KEEP_ALIVE`` — through ``/api/embed`` for an embedding
+  model, which can't serve ``/api/generate`` — and to unload a *transient* model (vision,
+  image) as soon as it has answered, so the chat model isn't crowded out for
+  longer than the one request.  Every ordinary request resets Ollama's
+  keep-alive to its default, so the pin is re-sent once a burst of requests
+  to the model has settled, not just the first time.
+
+Grouping background work by model lives in ``LlmScheduler``, which prefers
+queued background requests for the model it served last.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from penny.constants import PennyConstants
+from penny.http_transport import HttpTransport, http_client
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ModelResidencyStats:
+    """One model's request and load counters."""
+
+    model: str
+    requests: int = 0
+    loads: int = 0
+    load_ms: float = 0.0
+
+    @property
+    def mean_load_ms(self) -> float:
+        return self.load_ms / self.loads if self.loads else 0.0
+
+
+@dataclass
+class _HostState:
+    """What one host has loaded, as far as we know."""
+
+    loaded: set[str] = field(default_factory=set)
+    # Unknown until the first /api/ps read answers.
+    has_ps: bool | None = None
+    checked_at: float | None = None
+    last_model: str | None = None
+    # Bumped by every observed request — a ``/api/ps`` reading taken before
+    # one is stale and dropped.
+    observations: int = 0
+
+
+class ModelResidency:
+    """Tracks loaded models across hosts and steers their keep-alive."""
+
+    def __init__(
+        self,
+        *,
+        pinned: set[str],
+        transient: set[str],
+        user_active: Callable[[], bool],
+        embedding: set[str] | None = None,
+        transport: HttpTransport | None = None,
+    ) -> None:
+        self._pinned = pinned
+        self._transient = transient
+        self._embedding = embedding or set()
+        self._user_active = user_active
+        self._http = http_client(transport, timeout=PennyConstants.RESIDENCY_HTTP_TIMEOUT_SECONDS)
+        self._hosts: dict[str, _HostState] = {}
+        self._stats: dict[str, ModelResidencyStats] = {}
+        self._warm_seconds: dict[str, float] = {}
+        self._repins: dict[tuple[str, str], asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def is_loaded(self, model: str, host: str) -> bool:
+        """Whether ``host`` has ``model`` loaded right now (best knowledge).
+
+        Answers from the last known state; an expired ``/api/ps`` reading is
+        refreshed in the background for the next request."""
+        state = self._hosts.setdefault(host, _HostState())
+        self._refresh_if_expired(host, state)
+        return model in state.loaded
+
+    def observe(self, model: str, host: str, seconds: float, *, was_loaded: bool) -> None:
+        """Record a request that got its first response after ``seconds``."""
+        state = self._hosts.setdefault(host, _HostState())
+        stats = self._stats.setdefault(model, ModelResidencyStats(model))
+        stats.requests += 1
+        if was_loaded:
+            self._update_warm_latency(model, seconds)
+        else:
+            self._record_load(stats, host, seconds)
+        state.observations += 1
+        if state.last_model != model:
+            # Loading this model may have evicted another: assume it did
+            # until /api/ps says otherwise.
+            state.loaded = {model}
+            state.checked_at = None
+            self._refresh_if_expired(host, state)
+        state.last_model = model
+        state.loaded.add(model)
+        if state.has_ps and self._user_active():
+            self._hint_keep_alive(model, host)
+
+    def stats(self) -> list[ModelResidencyStats]:
+        """Per-model counters, most time lost to loads first."""
+        return sorted(self._stats.values(), key=lambda stats: -stats.load_ms)
+
+    def log_stats(self) -> None:
+        for stats in self.stats():
+            logger.info(
+                "Model %s: %d requests, %d loads, %.1fs lost to loading",
+                stats.model,
+                stats.requests,
+                stats.loads,
+                stats.load_ms / 1000,
+            )
+
+    async def close(self) -> None:
+        for handle in self._repins.values():
+            handle.cancel()
+        self._repins.clear()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self._http.aclose()
+
+    # ── Tracking ─────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _ps_expired(state: _HostState) -> bool:
+        if state.checked_at is None:
+            return True
+        return time.monotonic() - state.checked_at >= PennyConstants.RESIDENCY_PS_TTL_SECONDS
+
+    def _refresh_if_expired(self, host: str, state: _HostState) -> None:
+        if state.has_ps is False or not self._ps_expired(state):
+            return
+        # Stamped now, not when the read lands, so one refresh runs at a time.
+        state.checked_at = time.monotonic()
+        self._spawn(self._read_ps(host, state))
+
+    async def _read_ps(self, host: str, state: _HostState) -> None:
+        """Refresh ``state`` from the host's ``/api/ps``.
+
+        A status error means the host has no such endpoint: it switches to the
+        local stand-in for good.  A connection error keeps the old reading, as
+        does a request observed while the read was in flight."""
+        observations = state.observations
+        try:
+            response = await self._http.get(f"{host}/api/ps")
+            response.raise_for_status()
+        except httpx.HTTPStatusError:
+            logger.info("No /api/ps on %s — tracking model residency locally", host)
+            state.has_ps = False
+            return
+        except httpx.HTTPError as error:
+            logger.debug("Failed to read /api/ps on %s: %s", host, error)
+            return
+        state.has_ps = True
+        if state.observations != observations:
+            return
+        state.loaded = self._loaded_names(response.json())
+
+    @staticmethod
+    def _loaded_names(payload: dict[str, Any]) -> set[str]:
+        """Model names in an ``/api/ps`` payload, with and without ``:latest``."""
+        names: set[str] = set()
+        for entry in payload.get("models", []):
+            for name in (entry.get("name"), entry.get("model")):
+                if name:
+                    names.add(name)
+                    names.add(name.removesuffix(":latest"))
+        return names
+
+    def _update_warm_latency(self, model: str, seconds: float) -> None:
+        alpha = PennyConstants.RESIDENCY_WARM_LATENCY_ALPHA
+        previous = self._warm_seconds.get(model)
+        self._warm_seconds[model] = (
+            seconds if previous is None else alpha * seconds + (1 - alpha) * previous
+        )
+
+    def _record_load(self, stats: ModelResidencyStats, host: str, seconds: float) -> None:
+        lost = max(seconds - self._warm_seconds.get(stats.model, 0.0), 0.0)
+        stats.loads += 1
+        stats.load_ms += lost * 1000
+        logger.info(
+            "Model %s loaded on %s: %.1fs lost (%d loads, %.1fs total)",
+            stats.model,
+            host,
+            lost,
+            stats.loads,
+            stats.load_ms / 1000,
+        )
+
+    # ── Keep-alive hints ─────────────────────────────────────────────────
+
+    def _hint_keep_alive(self, model: str, host: str) -> None:
+        """Unload a transient model in the background, or (re)arm a pinned
+        one's trailing pin — it fires once requests to the model have been
+        quiet for ``RESIDENCY_PIN_SETTLE_SECONDS``, after the last of them
+        reset the keep-alive."""
+        if model in self._transient:
+            self._spawn(self._set_keep_alive(host, model, 0))
+            return
+        if model not in self._pinned:
+            return
+        key = (host, model)
+        if (handle := self._repins.pop(key, None)) is not None:
+            handle.cancel()
+        self._repins[key] = asyncio.get_running_loop().call_later(
+            PennyConstants.RESIDENCY_PIN_SETTLE_SECONDS, self._pin, host, model
+        )
+
+    def _pin(self, host: str, model: str) -> None:
+        self._repins.pop((host, model), None)
+        if self._user_active():
+            self._spawn(
+                self._set_keep_alive(host, model, PennyConstants.RESIDENCY_ACTIVE_KEEP_ALIVE)
+            )
+
+    async def _set_keep_alive(self, host: str, model: str, keep_alive: str | int) -> None:
+        """Ollama's documented way to (un)load a model: an empty generate —
+        or an empty embed for an embedding model."""
+        if model in self._embedding:
+            url, body = f"{host}/api/embed", {"model": model, "input": [], "keep_alive": keep_alive}
+        else:
+            url, body = f"{host}/api/generate", {"model": model, "keep_alive": keep_alive}
+        try:
+            response = await self._http.post(url, json=body)
+            response.raise_for_status()
+        except httpx.HTTPError as error:
+            logger.warning("keep_alive=%s for %s on %s failed: %s", keep_alive, model, host, error)
+            return
+        logger.debug("keep_alive=%s set for %s on %s", keep_alive, model, host)
+        if keep_alive == 0:
+            state = self._hosts.setdefault(host, _HostState())
+            state.loaded.discard(model)
+
+    def _spawn(self, work: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(work)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
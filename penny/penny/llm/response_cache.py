@@ -0,0 +1,106 @@
+"""Deterministic response cache — reuse answers to idempotent LLM calls.
+
+Some calls are pure functions of their input: parsing a ``/schedule`` timing
+into cron, captioning the same image twice.  A caller marks such a call
+``cacheable`` and pins its sampling (``temperature=0``); ``LlmClient`` then
+looks it up here before sending it.  A call at any other temperature — or
+the server's default sampling — bypasses the cache, since its answer isn't a
+function of the request.
+
+The key digests the whole request as sent: model, messages, tools, response
+format and sampling params.  Two tiers sit behind it: an in-process LRU of
+``LLM_CACHE_MEMORY_ENTRIES`` responses, and the ``llm_cache`` table, which
+survives restarts.  Both honour the ``LLM_CACHE_TTL_SECONDS`` runtime param
+(0 turns the cache off).  A hit is still logged to the prompt log — as a
+zero-duration ``cached`` row — so run traces stay complete.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from penny.constants import PennyConstants
+
+if TYPE_CHECKING:
+    from penny.config_params import RuntimeParams
+    from penny.database import Database
+
+logger = logging.getLogger(__name__)
+
+
+def is_deterministic(kwargs: dict[str, Any]) -> bool:
+    """Whether a chat request's sampling makes its answer repeatable."""
+    return kwargs.get("temperature") == 0
+
+
+def request_key(kwargs: dict[str, Any]) -> str:
+    """Digest of everything in a chat request that shapes its completion."""
+    payload = json.dumps(kwargs, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ResponseCache:
+    """Two-tier (memory LRU, then SQLite) cache of raw completion dumps."""
+
+    def __init__(
+        self,
+        db: Database | None,
+        runtime: RuntimeParams,
+        max_entries: int = PennyConstants.LLM_CACHE_MEMORY_ENTRIES,
+    ) -> None:
+        self._db = db
+        self._runtime = runtime
+        self._max_entries = max_entries
+        # key → (when it was generated, response dump), least recently used first
+        self._memory: OrderedDict[str, tuple[datetime, dict]] = OrderedDict()
+
+    @property
+    def ttl_seconds(self) -> int:
+        return int(self._runtime.LLM_CACHE_TTL_SECONDS)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get(self, key: str) -> dict | None:
+        """The cached response for ``key``, if one is still fresh."""
+        since = self._fresh_since()
+        response = self._get_memory(key, since)
+        if response is None and self._db is not None:
+            stored = self._db.llm_cache.get(key, since)
+            if stored is not None:
+                response = json.loads(stored.response)
+                self._remember(key, stored.created_at.replace(tzinfo=UTC), response)
+        return response
+
+    def put(self, key: str, model: str, response: dict) -> None:
+        """Store a fresh response in both tiers."""
+        self._remember(key, datetime.now(UTC), response)
+        if self._db is not None:
+            self._db.llm_cache.put(key, model, json.dumps(response), self._fresh_since())
+
+    def _fresh_since(self) -> datetime:
+        """The oldest generation time still inside the TTL."""
+        return datetime.now(UTC) - timedelta(seconds=self.ttl_seconds)
+
+    def _get_memory(self, key: str, since: datetime) -> dict | None:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        created_at, response = entry
+        if created_at < since:
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return response
+
+    def _remember(self, key: str, created_at: datetime, response: dict) -> None:
+        self._memory[key] = (created_at, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
@@ -0,0 +1,213 @@
+"""Priority-aware admission control for LLM requests.
+
+Every ``LlmClient`` request — chat or embed, from any client — takes a slot
+from one process-wide ``LlmScheduler`` before it reaches a server.  Requests
+wait in lanes (``LlmLane``), highest priority first:
+
+- **Strict priority.**  A lane is only served while no higher lane has a
+  request waiting, so a user's message never queues behind background work.
+- **Foreground hold.**  Background and backfill also wait while an interactive
+  request is in flight, and while a foreground turn holds them
+  (``hold_background``) — the whole time a user message is being handled, so
+  between its model calls too.  Background work therefore pauses at the next
+  request instead of being cancelled mid-cycle; a request already running
+  finishes.
+- **Per-lane caps.**  ``LLM_LANE_CONCURRENCY`` bounds each lane's in-flight
+  requests.
+- **Grouped by model.**  Background and backfill waiters for the model served
+  last go first, so queued background work doesn't swap models back and forth
+  on a single GPU.  Interactive lanes stay strictly first-come.
+- **Queue-time metrics.**  Each lane counts its requests and the time they
+  spent waiting for a slot; ``log_stats`` reports them.
+
+The lane comes from context: ``llm_lane(LlmLane.BACKGROUND)`` around a unit of
+work tags every request made inside it, including by tasks it spawns.
+Untagged requests are interactive — chat or embed by kind.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import NamedTuple
+
+from penny.constants import LlmLane, PennyConstants
+
+logger = logging.getLogger(__name__)
+
+_LANES = list(LlmLane)
+_INTERACTIVE_LANES = (LlmLane.CHAT, LlmLane.EMBED)
+
+_current_lane: ContextVar[LlmLane | None] = ContextVar("llm_lane", default=None)
+
+
+@contextlib.contextmanager
+def llm_lane(lane: LlmLane) -> Iterator[None]:
+    """Tag every LLM request made inside the block with ``lane``."""
+    token = _current_lane.set(lane)
+    try:
+        yield
+    finally:
+        _current_lane.reset(token)
+
+
+def current_lane(default: LlmLane) -> LlmLane:
+    """The lane the caller's context is tagged with, else ``default``."""
+    return _current_lane.get() or default
+
+
+class _Waiter(NamedTuple):
+    future: asyncio.Future[None]
+    model: str | None
+
+
+@dataclass
+class LaneStats:
+    """One lane's admission counters."""
+
+    lane: LlmLane
+    requests: int = 0
+    queued: int = 0
+    wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+    active: int = 0
+    waiting: int = 0
+
+    @property
+    def mean_wait_ms(self) -> float:
+        return self.wait_ms / self.requests if self.requests else 0.0
+
+
+class LlmScheduler:
+    """Process-wide lanes, caps and priority for every LLM request."""
+
+    def __init__(self, caps: dict[LlmLane, int] | None = None) -> None:
+        self._caps = dict(PennyConstants.LLM_LANE_CONCURRENCY if caps is None else caps)
+        self._queues: dict[LlmLane, deque[_Waiter]] = {lane: deque() for lane in _LANES}
+        self._stats = {lane: LaneStats(lane) for lane in _LANES}
+        self._holds = 0
+        self._last_model: str | None = None
+
+    @contextlib.asynccontextmanager
+    async def slot(self, lane: LlmLane, model: str | None = None) -> AsyncIterator[None]:
+        """Hold one of ``lane``'s request slots for the block, waiting for it
+        first if the lane is capped or outranked.  ``model`` is the model the
+        request is for, used to group background work."""
+        started = time.monotonic()
+        queued = await self._admit(lane, model)
+        self._record_wait(lane, started, queued)
+        try:
+            yield
+        finally:
+            self._stats[lane].active -= 1
+            self._dispatch()
+
+    def hold_background(self) -> None:
+        """Keep background and backfill requests waiting until released.
+
+        Counted, so overlapping foreground turns each hold until they end."""
+        self._holds += 1
+
+    def release_background(self) -> None:
+        """End one ``hold_background``; lower lanes resume once none remain."""
+        self._holds = max(self._holds - 1, 0)
+        self._dispatch()
+
+    def stats(self) -> list[LaneStats]:
+        """A snapshot of every lane, highest priority first."""
+        return [
+            dataclasses.replace(self._stats[lane], waiting=len(self._queues[lane]))
+            for lane in _LANES
+        ]
+
+    def log_stats(self) -> None:
+        for stats in self.stats():
+            if not stats.requests:
+                continue
+            logger.info(
+                "LLM lane %s: %d requests, %d queued, wait mean %.0fms / max %.0fms",
+                stats.lane,
+                stats.requests,
+                stats.queued,
+                stats.mean_wait_ms,
+                stats.max_wait_ms,
+            )
+
+    async def _admit(self, lane: LlmLane, model: str | None) -> bool:
+        """Take a slot in ``lane``; returns whether the request had to queue."""
+        if not self._queues[lane] and self._can_start(lane):
+            self._grant(lane, model)
+            return False
+        waiter = _Waiter(asyncio.get_running_loop().create_future(), model)
+        self._queues[lane].append(waiter)
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Admitted just as the caller gave up — hand the slot back.
+                self._stats[lane].active -= 1
+            else:
+                with contextlib.suppress(ValueError):
+                    self._queues[lane].remove(waiter)
+            self._dispatch()
+            raise
+        return True
+
+    def _can_start(self, lane: LlmLane) -> bool:
+        cap = self._caps.get(lane, 0)
+        if cap and self._stats[lane].active >= cap:
+            return False
+        if any(self._queues[higher] for higher in _LANES[: _LANES.index(lane)]):
+            return False
+        if lane in _INTERACTIVE_LANES:
+            return True
+        return not self._holds and not any(
+            self._stats[interactive].active for interactive in _INTERACTIVE_LANES
+        )
+
+    def _dispatch(self) -> None:
+        """Admit waiters in priority order; a lane left waiting blocks every
+        lane below it."""
+        for lane in _LANES:
+            queue = self._queues[lane]
+            while queue and self._can_start(lane):
+                waiter = self._next_waiter(lane)
+                if waiter.future.done():
+                    continue
+                self._grant(lane, waiter.model)
+                waiter.future.set_result(None)
+            if queue:
+                return
+
+    def _grant(self, lane: LlmLane, model: str | None) -> None:
+        self._stats[lane].active += 1
+        if model is not None:
+            self._last_model = model
+
+    def _next_waiter(self, lane: LlmLane) -> _Waiter:
+        """Pop the lane's next waiter: the oldest, except that a background
+        lane takes its oldest request for the last-served model first."""
+        queue = self._queues[lane]
+        if lane not in _INTERACTIVE_LANES and self._last_model is not None:
+            for waiter in queue:
+                if waiter.model == self._last_model and not waiter.future.done():
+                    queue.remove(waiter)
+                    return waiter
+        return queue.popleft()
+
+    def _record_wait(self, lane: LlmLane, started: float, queued: bool) -> None:
+        waited_ms = (time.monotonic() - started) * 1000
+        stats = self._stats[lane]
+        stats.requests += 1
+        stats.wait_ms += waited_ms
+        stats.max_wait_ms = max(stats.max_wait_ms, waited_ms)
+        if queued:
+            stats.queued += 1
+            logger.debug("LLM %s request waited %.0fms for a slot", lane, waited_ms)
@@ -0,0 +1,145 @@
+"""Reassembly and inspection of streamed chat completions.
+
+A streamed request delivers ``ChatCompletionChunk`` increments instead of one
+``ChatCompletion``.  ``StreamAssembler`` turns each chunk into our own
+``LlmDelta`` objects for the caller to forward, and accumulates the same
+increments back into a complete ``ChatCompletion`` — so response parsing,
+validation and the promptlog row are identical whether or not the request
+streamed.
+
+``DegenerateStreamGuard`` is a delta consumer that watches the decode for a
+degeneration collapse and aborts the stream at its first token.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from openai.types.chat import ChatCompletion, ChatCompletionChunk
+from openai.types.chat.chat_completion_chunk import ChoiceDeltaToolCall
+
+from penny.llm.models import LlmDegenerateOutputError, LlmDelta
+from penny.text_validity import DegenerateRunWatch
+
+
+@dataclass
+class _ToolCallParts:
+    """The fragments of one streamed tool call, keyed by its chunk ``index``."""
+
+    id: str = ""
+    name: str = ""
+    arguments: list[str] = field(default_factory=list)
+
+
+class StreamAssembler:
+    """Accumulates a chat-completion stream into deltas and a final completion."""
+
+    def __init__(self) -> None:
+        self._content: list[str] = []
+        self._thinking: list[str] = []
+        self._tool_calls: dict[int, _ToolCallParts] = {}
+        self._finish_reason: str | None = None
+        self._usage: dict[str, Any] | None = None
+        self._header: dict[str, Any] = {}
+        self.decoded_tokens = 0
+
+    def add(self, chunk: ChatCompletionChunk) -> list[LlmDelta]:
+        """Absorb one chunk; return the deltas it carried (possibly none)."""
+        if not self._header:
+            self._header = {"id": chunk.id, "created": chunk.created, "model": chunk.model}
+        if chunk.usage is not None:
+            self._usage = chunk.usage.model_dump()
+        deltas: list[LlmDelta] = []
+        for choice in chunk.choices[:1]:
+            self._finish_reason = choice.finish_reason or self._finish_reason
+            delta = choice.delta
+            extras = delta.model_extra or {}
+            thinking = extras.get("reasoning_content") or extras.get("reasoning") or ""
+            if thinking:
+                self._thinking.append(thinking)
+                deltas.append(LlmDelta(thinking=thinking))
+            if delta.content:
+                self._content.append(delta.content)
+                deltas.append(LlmDelta(content=delta.content))
+            for call in delta.tool_calls or []:
+                deltas.append(self._add_tool_call_fragment(call))
+        # Servers stream one chunk per decoded token, so counting the chunks
+        # that carried output counts tokens even when the stream is cut short
+        # before the final ``usage`` chunk arrives.
+        if deltas:
+            self.decoded_tokens += 1
+        return deltas
+
+    def _add_tool_call_fragment(self, call: ChoiceDeltaToolCall) -> LlmDelta:
+        """Merge one tool-call fragment into its call's accumulated parts."""
+        parts = self._tool_calls.setdefault(call.index, _ToolCallParts())
+        name = call.function.name if call.function else None
+        arguments = (call.function.arguments if call.function else None) or ""
+        parts.id = call.id or parts.id
+        parts.name = name or parts.name
+        parts.arguments.append(arguments)
+        return LlmDelta(tool_call_index=call.index, tool_name=name, tool_arguments=arguments)
+
+    def completion(self) -> ChatCompletion:
+        """The accumulated stream as a complete ``ChatCompletion``."""
+        tool_calls = [
+            {
+                "id": parts.id or f"call_{index}",
+                "type": "function",
+                "function": {"name": parts.name, "arguments": "".join(parts.arguments)},
+            }
+            for index, parts in sorted(self._tool_calls.items())
+        ]
+        message: dict[str, Any] = {
+            "role": "assistant",
+            "content": "".join(self._content) or None,
+            "tool_calls": tool_calls or None,
+        }
+        if self._thinking:
+            message["reasoning"] = "".join(self._thinking)
+        default_finish = "tool_calls" if tool_calls else "stop"
+        return ChatCompletion.model_validate(
+            {
+                "id": self._header.get("id", ""),
+                "object": "chat.completion",
+                "created": self._header.get("created", 0),
+                "model": self._header.get("model", ""),
+                "choices": [
+                    {
+                        "index": 0,
+                        "finish_reason": self._finish_reason or default_finish,
+                        "message": message,
+                    }
+                ],
+                "usage": self._usage,
+            }
+        )
+
+
+class DegenerateStreamGuard:
+    """Aborts a stream at the first token of a degeneration collapse.
+
+    Watches the same surfaces the agent's post-hoc ``_response_is_degenerate``
+    check reads — the content and each tool call's arguments — each through its
+    own ``DegenerateRunWatch``, and raises ``LlmDegenerateOutputError`` from the
+    delta callback when one trips; ``LlmClient`` then closes the HTTP stream.
+    Clean deltas are passed on to ``forward`` (e.g. a reply preview).
+    """
+
+    def __init__(self, forward: Callable[[LlmDelta], Awaitable[None]] | None = None) -> None:
+        self._forward = forward
+        self._watches: dict[int | None, DegenerateRunWatch] = {}
+
+    async def on_delta(self, delta: LlmDelta) -> None:
+        """``LlmClient.chat`` stream callback."""
+        if delta.restart:
+            self._watches.clear()
+        text = delta.content if delta.tool_call_index is None else delta.tool_arguments
+        watch = self._watches.setdefault(delta.tool_call_index, DegenerateRunWatch())
+        if text and watch.feed(text):
+            where = "content" if delta.tool_call_index is None else "tool-call arguments"
+            raise LlmDegenerateOutputError(f"degeneration collapse in streamed {where}")
+        if self._forward is not None:
+            await self._forward(delta)
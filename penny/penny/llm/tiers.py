@@ -0,0 +1,99 @@
+"""Model tiers — a small, fast model for cheap prompts, escalating on failure.
+
+Every prompt used to go through the one configured ``LLM_MODEL``, including
+trivial ones: parsing a ``/schedule`` timing into cron, rewording the restart
+announcement, simple extraction collectors.  With ``LLM_SMALL_MODEL`` set,
+the tasks named in the ``SMALL_MODEL_TASKS`` runtime param — agent names,
+command names (``schedule``), ``startup``, or collection names for single
+collector targets — run on the small model instead.
+
+The small model is tried first, never trusted blindly: when its output is
+rejected (the agent's validator chain asks for a retry, the degenerate check
+fires, or a command's own check fails) the work is redone on the main model.
+Each prompt-log row records the model that served it, so
+``MessageStore.prompt_perf_by_model`` splits tokens and time by tier.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from penny.llm.models import LlmError, LlmResponse
+
+if TYPE_CHECKING:
+    from penny.config_params import RuntimeParams
+    from penny.llm.client import LlmClient
+
+logger = logging.getLogger(__name__)
+
+
+class ModelTiers:
+    """The main model client, an optional small one, and which tasks use it."""
+
+    def __init__(self, main: LlmClient, small: LlmClient | None, runtime: RuntimeParams) -> None:
+        self.main = main
+        self.small = small
+        self._runtime = runtime
+
+    def uses_small(self, *tasks: str | None) -> bool:
+        """Whether any of ``tasks`` is routed to the small model."""
+        if self.small is None:
+            return False
+        names = set(str(self._runtime.SMALL_MODEL_TASKS).split(","))
+        return any(task in names for task in tasks if task)
+
+    def client_for(self, *tasks: str | None) -> LlmClient:
+        """The client that serves ``tasks`` first."""
+        if self.small is not None and self.uses_small(*tasks):
+            return self.small
+        return self.main
+
+    def log_escalation(self, task: str | None, reason: str) -> None:
+        assert self.small is not None
+        logger.info(
+            "Escalating %s from %s to %s: %s", task, self.small.model, self.main.model, reason
+        )
+
+    async def generate(
+        self,
+        task: str,
+        prompt: str,
+        accept: Callable[[LlmResponse], bool],
+        *,
+        format: dict | str | None = None,
+        agent_name: str | None = None,
+        prompt_type: str | None = None,
+        temperature: float | None = None,
+        cacheable: bool = False,
+    ) -> LlmResponse:
+        """``LlmClient.generate`` on ``task``'s tier; a small-model response
+        ``accept`` rejects (or a small-model error) is redone on the main model.
+        With ``cacheable``, only a response ``accept`` passes is cached."""
+        if self.small is not None and self.uses_small(task):
+            try:
+                response = await self.small.generate(
+                    prompt,
+                    format=format,
+                    agent_name=agent_name,
+                    prompt_type=prompt_type,
+                    temperature=temperature,
+                    cacheable=cacheable,
+                    accept=accept,
+                )
+                if accept(response):
+                    return response
+                reason = "output rejected"
+            except LlmError as error:
+                reason = str(error)
+            self.log_escalation(task, reason)
+        return await self.main.generate(
+            prompt,
+            format=format,
+            agent_name=agent_name,
+            prompt_type=prompt_type,
+            temperature=temperature,
+            cacheable=cacheable,
+            accept=accept,
+        )
@@ -0,0 +1,30 @@
+"""Cheap prompt-size estimates for context budgeting.
+
+Budgets are applied *before* a request is sent, so there's no tokenizer
+round-trip here — a characters-per-token ratio is close enough to decide what
+to keep and what to compact.  The authoritative counts are the
+``usage.prompt_tokens`` the server reports back, stored on every promptlog row.
+"""
+
+from __future__ import annotations
+
+from penny.constants import PennyConstants
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of ``text`` (``CHARS_PER_TOKEN`` characters each)."""
+    return -(-len(text) // PennyConstants.CHARS_PER_TOKEN)
+
+
+def estimate_message_tokens(messages: list[dict]) -> int:
+    """Approximate token count of a chat message list — every turn's content plus
+    the serialized arguments of any tool calls it carries."""
+    total = 0
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            total += estimate_tokens(content)
+        for tool_call in message.get("tool_calls") or []:
+            function = tool_call.get("function") or {}
+            total += estimate_tokens(str(function.get("arguments") or ""))
+    return total
@@ -6,7 +6,7 @@ import asyncio
 import logging
 import signal
 import sys
-from datetime import datetime
+from datetime import UTC, datetime
 from typing import Any
 
 from penny.agents import (
@@ -21,13 +21,18 @@ from penny.channels.permission_manager import PermissionManager
 from penny.channels.signal.channel import SignalChannel
 from penny.commands import create_command_registry
 from penny.config import Config, setup_logging
-from penny.constants import ChannelType, PennyConstants
+from penny.constants import ChannelType, LlmLane, PennyConstants
 from penny.database import Database
 from penny.database.migrate import migrate
+from penny.http_transport import HttpTransport
 from penny.llm.client import LlmClient
 from penny.llm.embeddings import serialize_embedding
 from penny.llm.image_client import OllamaImageClient
 from penny.llm.models import LlmError
+from penny.llm.residency import ModelResidency
+from penny.llm.response_cache import ResponseCache
+from penny.llm.scheduler import LlmScheduler, llm_lane
+from penny.llm.tiers import ModelTiers
 from penny.responses import PennyResponse
 from penny.scheduler import (
     AlwaysRunSchedule,
@@ -35,9 +40,11 @@ from penny.scheduler import (
     PeriodicSchedule,
     Schedule,
 )
+from penny.scheduler.prefix_warmer import PrefixWarmer
 from penny.scheduler.schedule_runner import ScheduleExecutor
 from penny.scheduler.send_queue_drainer import SendQueueDrainer
 from penny.startup import get_restart_message
+from penny.tools.page_cache import PageCache
 from penny.zoho.models import ZohoCredentials
 
 logger = logging.getLogger(__name__)
@@ -51,6 +58,8 @@ class Penny:
         self.config = config
         self.start_time = datetime.now()
         self._init_database(config)
+        self.http = HttpTransport(http2=config.http2_enabled)
+        self.llm_scheduler = LlmScheduler()
         self._init_llm_clients(config)
         self._init_agents(config)
         self._init_commands(config)
@@ -66,10 +75,12 @@ class Penny:
         exist (fresh deploy), so ``create_tables()`` must run first to
         materialise the schema. Migrations then apply on top — including
         data-insert migrations like 0026 that seed system log memories.
+        Orphaned media blobs are collected last, before anything can store one.
         """
         self.db = Database(config.db_path, runtime=config.runtime)
         self.db.create_tables()
         migrate(config.db_path)
+        self.db.media.collect_garbage()
         config.runtime._db = self.db
 
     def _create_llm_client(
@@ -88,11 +99,30 @@ class Penny:
             retry_delay=self.config.llm_retry_delay,
             api_key=api_key or self.config.llm_api_key,
             timeout=self.config.llm_timeout,
+            transport=self.http,
+            scheduler=self.llm_scheduler,
+            residency=self.residency,
+            runtime=self.config.runtime,
+            response_cache=self.response_cache,
         )
 
     def _init_llm_clients(self, config: Config) -> None:
         """Create shared LLM model clients."""
+        # Chat and embedding models stay loaded through a conversation; vision
+        # and image models make room again as soon as they've answered.
+        self.residency = ModelResidency(
+            pinned={m for m in (config.llm_model, config.llm_embedding_model) if m},
+            transient={m for m in (config.llm_vision_model, config.llm_image_model) if m},
+            user_active=self._user_active,
+            embedding={config.llm_embedding_model} if config.llm_embedding_model else None,
+            transport=self.http,
+        )
+        self.response_cache = ResponseCache(self.db, config.runtime)
         self.model_client = self._create_llm_client(config.llm_model)
+        self.small_model_client = (
+            self._create_llm_client(config.llm_small_model) if config.llm_small_model else None
+        )
+        self.model_tiers = ModelTiers(self.model_client, self.small_model_client, config.runtime)
         self.vision_model_client = (
             self._create_llm_client(
                 config.llm_vision_model,
@@ -117,11 +147,17 @@ class Penny:
                 model=config.llm_image_model,
                 max_retries=config.llm_max_retries,
                 retry_delay=config.llm_retry_delay,
+                transport=self.http,
+                residency=self.residency,
             )
             if config.llm_image_model
             else None
         )
 
+    def _user_active(self) -> bool:
+        """The user has messaged within the idle threshold."""
+        return not self.scheduler.is_idle()
+
     def _init_agents(self, config: Config) -> None:
         """Create chat agent + collector dispatcher + schedule executor.
 
@@ -137,22 +173,31 @@ class Penny:
             config=config,
             vision_model_client=self.vision_model_client,
             embedding_model_client=self.embedding_model_client,
+            small_model_client=self.small_model_client,
         )
         self.collector = Collector(
             model_client=self.model_client,
             db=self.db,
             config=config,
             embedding_model_client=self.embedding_model_client,
+            small_model_client=self.small_model_client,
         )
         self.chat_agent.set_collector(self.collector)
         self.schedule_executor = ScheduleExecutor(
             model_client=self.model_client,
             db=self.db,
             config=config,
+            small_model_client=self.small_model_client,
         )
         # Deterministic task (no LLM) that delivers queued send_message output
         # once the autonomous-send cooldown clears.
         self.send_queue_drainer = SendQueueDrainer(db=self.db, config=config)
+        self.prefix_warmer = PrefixWarmer(
+            chat_agent=self.chat_agent,
+            model_client=self.model_client,
+            config=config,
+            user_quiet_seconds=lambda: self.scheduler.seconds_since_activity(),
+        )
 
     def _init_github_client(self, config: Config) -> Any:
         """Initialize GitHub API client if configured. Returns GitHubAPI or None."""
@@ -196,6 +241,7 @@ class Penny:
             image_model_client=self.image_client,
             fastmail_api_token=config.fastmail_api_token,
             zoho_credentials=zoho_credentials,
+            transport=self.http,
         )
 
     def _get_zoho_credentials(self, config: Config) -> ZohoCredentials | None:
@@ -215,6 +261,7 @@ class Penny:
             message_agent=self.chat_agent,
             db=self.db,
             command_registry=self.command_registry,
+            transport=self.http,
         )
         self.schedule_executor.set_channel(self.channel)
         self.chat_agent.set_channel(self.channel)
@@ -247,8 +294,10 @@ class Penny:
                 return None
             return browser_ch.send_tool_request, perm_mgr
 
-        self.chat_agent._browse_provider = browse_provider
-        self.collector._browse_provider = browse_provider
+        page_cache = PageCache(config.runtime, self.db)
+        for agent in (self.chat_agent, self.collector):
+            agent._browse_provider = browse_provider
+            agent._page_cache = page_cache
         self.collector._on_tool_start_factory = browser_ch.make_background_tool_callback
 
     def _init_scheduler(self, config: Config) -> None:
@@ -277,11 +326,19 @@ class Penny:
                 interval=lambda: config.runtime.COLLECTOR_TICK_INTERVAL,
                 requires_idle=True,
             ),
+            # Last: re-warm the chat prefix only once nothing else wants the
+            # model, so a collector cycle can't displace it straight after.
+            PeriodicSchedule(
+                agent=self.prefix_warmer,
+                interval=lambda: PennyConstants.PREFIX_WARM_CHECK_INTERVAL,
+                requires_idle=True,
+            ),
         ]
         self.scheduler = BackgroundScheduler(
             schedules=schedules,
             idle_threshold=lambda: config.runtime.IDLE_SECONDS,
             tick_interval=config.scheduler_tick_interval,
+            llm_scheduler=self.llm_scheduler,
         )
         self._connect_scheduler(config)
 
@@ -295,6 +352,7 @@ class Penny:
             model_client=self.model_client,
             embedding_model_client=self.embedding_model_client,
             image_model_client=self.image_client,
+            small_model_client=self.small_model_client,
         )
 
     def _signal_handler(self, signum: int, frame: Any) -> None:
@@ -450,22 +508,16 @@ class Penny:
                 break
         return total
 
-    async def run(self) -> None:
-        """Run the agent."""
-        logger.info("Starting Penny AI agent...")
-        logger.info("Channel: %s (sender_id=%s)", self.config.channel_type, self.channel.sender_id)
-        logger.info("Ollama model: %s", self.config.llm_model)
-        if self.config.llm_vision_model:
-            logger.info("Ollama model: %s (vision)", self.config.llm_vision_model)
-        if self.config.llm_image_model:
-            logger.info("Ollama model: %s (image generation)", self.config.llm_image_model)
-
-        # Validate channel connectivity before starting
-        await self.channel.validate_connectivity()
+    async def _run_embedding_backfill(self) -> None:
+        """Vectorize everything still missing an embedding.
 
-        await self._validate_optional_models()
-        if self.embedding_model_client:
-            batch_limit = int(self.config.runtime.EMBEDDING_BACKFILL_BATCH_LIMIT)
+        Runs alongside the channel in the backfill lane, so the listener starts
+        right away and a user message is never queued behind a backfill batch.
+        """
+        if not self.embedding_model_client:
+            return
+        batch_limit = int(self.config.runtime.EMBEDDING_BACKFILL_BATCH_LIMIT)
+        with llm_lane(LlmLane.BACKFILL):
             total_prefs = await self._backfill_preference_embeddings(batch_limit)
             if total_prefs:
                 logger.info("Startup embedding backfill complete: %d preferences", total_prefs)
@@ -481,6 +533,20 @@ class Penny:
             if total_messages:
                 logger.info("Startup embedding backfill complete: %d messages", total_messages)
 
+    async def run(self) -> None:
+        """Run the agent."""
+        logger.info("Starting Penny AI agent...")
+        logger.info("Channel: %s (sender_id=%s)", self.config.channel_type, self.channel.sender_id)
+        logger.info("Ollama model: %s", self.config.llm_model)
+        if self.config.llm_vision_model:
+            logger.info("Ollama model: %s (vision)", self.config.llm_vision_model)
+        if self.config.llm_image_model:
+            logger.info("Ollama model: %s (image generation)", self.config.llm_image_model)
+
+        # Validate channel connectivity before starting
+        await self.channel.validate_connectivity()
+
+        await self._validate_optional_models()
         await self._send_startup_announcement()
         await self._prompt_for_missing_profiles()
 
@@ -488,6 +554,7 @@ class Penny:
             await asyncio.gather(
                 self.channel.listen(),
                 self.scheduler.run(),
+                self._run_embedding_backfill(),
             )
         finally:
             await self.shutdown()
@@ -506,7 +573,7 @@ class Penny:
                 logger.info("No message history yet, skipping startup announcement")
                 return
 
-            restart_msg = await get_restart_message(self.model_client)
+            restart_msg = await get_restart_message(self.model_tiers)
             announcement = f"👋 {restart_msg}"
 
             logger.info("Sending startup announcement to %s", sender)
@@ -531,6 +598,20 @@ class Penny:
         except Exception as e:
             logger.warning("Failed to send profile prompts: %s", e)
 
+    def _log_model_usage(self) -> None:
+        """Tokens and model time this run, per model — the main/small tier split."""
+        since = self.start_time.astimezone(UTC)
+        for model, perf in self.db.messages.prompt_perf_by_model(since=since).items():
+            logger.info(
+                "Model %s: %d calls, %d input / %d output tokens, %.0fs (%.1f tok/s)",
+                model,
+                perf.calls,
+                perf.input_tokens,
+                perf.output_tokens,
+                perf.duration_ms / 1000,
+                perf.tokens_per_second,
+            )
+
     async def shutdown(self) -> None:
         """Clean shutdown of resources."""
         logger.info("Shutting down agent...")
@@ -538,10 +619,20 @@ class Penny:
         await self.channel.close()
         await Agent.close_all()
         await self.model_client.close()
+        if self.small_model_client:
+            await self.small_model_client.close()
         if self.vision_model_client:
             await self.vision_model_client.close()
         if self.embedding_model_client:
             await self.embedding_model_client.close()
+        if self.image_client:
+            await self.image_client.close()
+        self.llm_scheduler.log_stats()
+        self._log_model_usage()
+        self.residency.log_stats()
+        await self.residency.close()
+        self.http.log_stats()
+        await self.http.aclose()
         logger.info("Agent shutdown complete")
 
 
@@ -553,6 +644,8 @@ async def main() -> None:
     logger.info("Starting Penny with config:")
     logger.info("  channel_type: %s", config.channel_type)
     logger.info("  llm_model: %s", config.llm_model)
+    if config.llm_small_model:
+        logger.info("  llm_small_model: %s", config.llm_small_model)
     logger.info("  llm_api_url: %s", config.llm_api_url)
     logger.info("  idle_threshold: %.0fs", config.runtime.IDLE_SECONDS)
 
@@ -93,6 +93,15 @@ class Prompt:
         "Pick a URL from below and pass it in your next queries array to read it."
     )
 
+    # Marks a browse section served from the page cache instead of a fresh read
+    BROWSE_CACHED_NOTE = "(Cached — this was read {age} ago.)"
+
+    # Heads a long page cut down to the chunks most relevant to the lookup
+    BROWSE_PASSAGES_NOTE = (
+        "(Long page — showing the {shown} of its {total} sections most relevant "
+        "to this lookup; […] marks skipped text.)"
+    )
+
     # Email prompts
     EMAIL_SYSTEM_PROMPT = (
         "You are searching the user's email to answer their question. "
@@ -8,6 +8,9 @@ import time
 from collections.abc import Callable
 from typing import Protocol
 
+from penny.constants import LlmLane
+from penny.llm.scheduler import LlmScheduler, llm_lane
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,6 +62,7 @@ class BackgroundScheduler:
         schedules: list[Schedule],
         idle_threshold: Callable[[], float],
         tick_interval: float = 1.0,
+        llm_scheduler: LlmScheduler | None = None,
     ):
         """
         Initialize the scheduler.
@@ -67,6 +71,9 @@ class BackgroundScheduler:
             schedules: List of schedules in priority order (first checked first)
             idle_threshold: Callable returning current idle threshold in seconds (read each tick)
             tick_interval: How often to check schedules in seconds
+            llm_scheduler: Shared LLM request scheduler.  When given, background
+                tasks run in its background lane and foreground work pauses them
+                at their next LLM request instead of cancelling them.
         """
         self._schedules = schedules
         self._idle_threshold = idle_threshold
@@ -77,6 +84,7 @@ class BackgroundScheduler:
         self._last_run_times: dict[str, float] = {}
         self._foreground_active = False
         self._active_task: asyncio.Task[bool] | None = None
+        self._llm_scheduler = llm_scheduler
 
     def notify_message(self) -> None:
         """Called when a new message arrives. Resets all schedules."""
@@ -97,10 +105,15 @@ class BackgroundScheduler:
     def notify_foreground_start(self) -> None:
         """Called when foreground work (message/command processing) starts.
 
-        Cancels any running background task so Ollama is immediately free
-        to serve the user's message.
+        With an LLM scheduler, the running background task keeps going but its
+        next model request waits until the foreground work ends.  Without one,
+        the task is cancelled so the model is immediately free to serve the
+        user's message.
         """
         self._foreground_active = True
+        if self._llm_scheduler is not None:
+            self._llm_scheduler.hold_background()
+            return
         if self._active_task and not self._active_task.done():
             self._active_task.cancel()
             logger.info(
@@ -111,8 +124,18 @@ class BackgroundScheduler:
     def notify_foreground_end(self) -> None:
         """Called when foreground work (message/command processing) ends."""
         self._foreground_active = False
+        if self._llm_scheduler is not None:
+            self._llm_scheduler.release_background()
         logger.debug("Scheduler: foreground work ended, background tasks resumed")
 
+    def seconds_since_activity(self) -> float:
+        """Seconds since the last message or browser activity."""
+        return time.monotonic() - self._last_message_time
+
+    def is_idle(self) -> bool:
+        """Whether the user has been quiet for at least the idle threshold."""
+        return self.seconds_since_activity() >= self._idle_threshold()
+
     def stop(self) -> None:
         """Signal the scheduler to stop."""
         self._running = False
@@ -144,8 +167,7 @@ class BackgroundScheduler:
         )
 
         while self._running:
-            idle_seconds = time.monotonic() - self._last_message_time
-            is_idle = idle_seconds >= self._idle_threshold()
+            is_idle = self.is_idle()
 
             # Skip all background tasks if foreground work is active
             if not self._foreground_active:
@@ -156,7 +178,7 @@ class BackgroundScheduler:
                         self._current_task = agent.name
 
                         try:
-                            self._active_task = asyncio.create_task(agent.execute())
+                            self._active_task = asyncio.create_task(self._execute(agent))
                             did_work = await self._active_task
                             self._last_run_times[agent.name] = time.monotonic()
                             # Always reset the schedule's timer.  Skipping the
@@ -184,3 +206,9 @@ class BackgroundScheduler:
             await asyncio.sleep(self._tick_interval)
 
         logger.info("Background scheduler stopped")
+
+    @staticmethod
+    async def _execute(agent: ScheduledTask) -> bool:
+        """Run one background task with its LLM requests in the background lane."""
+        with llm_lane(LlmLane.BACKGROUND):
+            return await agent.execute()
@@ -0,0 +1,111 @@
+"""PrefixWarmer — keeps the chat prompt prefix hot in the server's KV cache.
+
+``Agent._build_messages`` keeps the chat system prefix byte-stable (date,
+``INJECTED_CONTEXT_NOTE``, identity, profile, inventory, instructions) so the
+inference server can reuse its prefill across turns.  That only helps while the
+server still holds it: after the model sits unused past its keep-alive, after a
+collector cycle displaces it with a different prompt, or once the prefix itself
+drifts (the inventory's entry counts move with every conversation, a memory is
+added, the date rolls over), the next user message pays the full prefill again.
+
+This idle-gated task checks each tick whether the prefix is cold — the model's
+last request didn't start with the current chat prefix, or the model has been
+unused for ``PREFIX_WARM_IDLE_SECONDS`` — and if so sends the chat agent's
+``prefix_probe`` twice with ``max_tokens=1`` — under chat's own reasoning
+effort, which gpt-oss renders into the system message.  The first request pays the cold
+prefill and the second hits the warm cache, so the log line pairs cold and
+warm first-token latency for the same prefix; both are also logged as
+``prefix_warm`` prompts.  It runs in the background lane, so a user message
+never waits behind it.  Warming is only worth it while a next message is
+likely: once the user has been quiet for ``PREFIX_WARM_WINDOW_SECONDS`` the
+warmer stands down until they're back.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from penny.constants import ChatPromptType
+from penny.llm.client import prefix_fingerprint
+from penny.llm.models import LlmError
+
+if TYPE_CHECKING:
+    from penny.agents.chat import ChatAgent
+    from penny.config import Config
+    from penny.llm.client import LlmClient
+
+logger = logging.getLogger(__name__)
+
+
+class PrefixWarmer:
+    """Re-warm the chat prefix whenever it has gone cold or drifted."""
+
+    name = "prefix_warmer"
+
+    def __init__(
+        self,
+        chat_agent: ChatAgent,
+        model_client: LlmClient,
+        config: Config,
+        user_quiet_seconds: Callable[[], float],
+    ) -> None:
+        self._chat_agent = chat_agent
+        self._model_client = model_client
+        self._config = config
+        self._user_quiet_seconds = user_quiet_seconds
+
+    async def execute(self) -> bool:
+        """Warm the chat prefix if it's cold; return whether requests were sent."""
+        max_idle = int(self._config.runtime.PREFIX_WARM_IDLE_SECONDS)
+        if max_idle <= 0:
+            return False
+        window = int(self._config.runtime.PREFIX_WARM_WINDOW_SECONDS)
+        if window > 0 and self._user_quiet_seconds() >= window:
+            return False
+        messages, tools = await self._chat_agent.prefix_probe()
+        effort = self._model_client.reasoning_effort(*self._chat_budget_key())
+        reason = self._cold_reason(prefix_fingerprint(messages, tools, effort), max_idle)
+        if reason is None:
+            return False
+        try:
+            cold_ms = await self._probe(messages, tools)
+            warm_ms = await self._probe(messages, tools)
+        except LlmError as error:
+            logger.warning("Prefix warm failed: %s", error)
+            return False
+        logger.info(
+            "Warmed chat prefix (%s): first token %dms cold, %dms warm", reason, cold_ms, warm_ms
+        )
+        return True
+
+    def _chat_budget_key(self) -> tuple[str, str]:
+        """Chat's budget key: its reasoning effort is part of the prefix."""
+        return self._chat_agent.name, ChatPromptType.USER_MESSAGE
+
+    def _cold_reason(self, fingerprint: str, max_idle: int) -> str | None:
+        """Why the server's cached prefix no longer matches the chat prefix,
+        or ``None`` if it's still warm."""
+        idle = self._model_client.seconds_since_last_request()
+        if idle is None:
+            return "never warmed"
+        if self._model_client.last_prefix != fingerprint:
+            return "prefix drifted"
+        if idle >= max_idle:
+            return f"idle {idle:.0f}s"
+        return None
+
+    async def _probe(self, messages: list[dict], tools: list[dict]) -> int:
+        """Send one single-token request; returns its latency in ms."""
+        started = time.monotonic()
+        await self._model_client.chat(
+            messages=messages,
+            tools=tools,
+            agent_name=self.name,
+            prompt_type=ChatPromptType.PREFIX_WARM,
+            max_tokens=1,
+            budget_as=self._chat_budget_key(),
+        )
+        return int((time.monotonic() - started) * 1000)
@@ -3,19 +3,27 @@
 import logging
 import os
 
-from penny.llm.client import LlmClient
-from penny.llm.models import LlmError
+from penny.llm.models import LlmError, LlmResponse
+from penny.llm.tiers import ModelTiers
 from penny.responses import PennyResponse
 
 logger = logging.getLogger(__name__)
 
+_MAX_ANNOUNCEMENT_LENGTH = 150
 
-async def get_restart_message(ollama_client: LlmClient) -> str:
+
+def _is_announcement(response: LlmResponse) -> bool:
+    announcement = response.content.strip()
+    return 0 < len(announcement) <= _MAX_ANNOUNCEMENT_LENGTH
+
+
+async def get_restart_message(model_tiers: ModelTiers) -> str:
     """
     Generate a casual restart announcement based on the latest git commit.
 
     Args:
-        ollama_client: Ollama client for transforming commit message
+        model_tiers: Model clients for transforming commit message — the
+            ``startup`` task, so the small model when it's routed there
 
     Returns:
         A casual, first-person restart message (e.g., "I added a new command! /debug")
@@ -45,12 +53,16 @@ async def get_restart_message(ollama_client: LlmClient) -> str:
     )
 
     try:
-        response = await ollama_client.generate(
-            prompt, agent_name="startup", prompt_type="startup_announcement"
+        response = await model_tiers.generate(
+            "startup",
+            prompt,
+            _is_announcement,
+            agent_name="startup",
+            prompt_type="startup_announcement",
         )
         announcement = response.content.strip()
 
-        if not announcement or len(announcement) > 150:
+        if not _is_announcement(response):
             logger.warning("LLM response invalid, using fallback")
             return PennyResponse.RESTART_FALLBACK
 
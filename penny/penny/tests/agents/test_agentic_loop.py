@@ -1,5 +1,6 @@
 """Tests for agentic loop changes: reasoning, last step, and after_step hook."""
 
+import copy
 import logging
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -65,11 +66,12 @@ class StubSearchTool(Tool):
         return ToolResult(message="Mock search results for testing")
 
 
-def _make_agent(test_db, mock_llm, *, max_steps=3, runtime_overrides=None):
+def _make_agent(test_db, mock_llm, *, max_steps=3, runtime_overrides=None, small_model=None):
     """Create a minimal Agent for loop testing.
 
     Returns (agent, db, max_steps) — max_steps must be passed to agent.run().
-    Pass runtime_overrides={key: value} to override runtime config params for the test.
+    Pass runtime_overrides={key: value} to override runtime config params for the test,
+    and small_model= to give the agent a small-model tier.
     """
     db = Database(test_db)
     db.create_tables()
@@ -93,9 +95,21 @@ def _make_agent(test_db, mock_llm, *, max_steps=3, runtime_overrides=None):
         max_retries=1,
         retry_delay=0.1,
     )
+    small_client = (
+        LlmClient(
+            api_url="http://localhost:11434",
+            model=small_model,
+            db=db,
+            max_retries=1,
+            retry_delay=0.1,
+        )
+        if small_model
+        else None
+    )
     agent = Agent(
         system_prompt="test",
         model_client=client,
+        small_model_client=small_client,
         tools=[stub_tool],
         db=db,
         config=config,
@@ -305,6 +319,73 @@ class TestRepeatCallGuard:
         await agent.close()
 
 
+class TestContextCompaction:
+    """Older tool results past ``TOOL_RESULT_TOKEN_BUDGET`` are digested in place,
+    leaving the cached prefix untouched and the call re-openable."""
+
+    @pytest.mark.asyncio
+    async def test_old_results_digested_prefix_stable_and_reopenable(
+        self, test_db, mock_llm, caplog
+    ):
+        agent, db, max_steps = _make_agent(
+            test_db, mock_llm, max_steps=5, runtime_overrides={"TOOL_RESULT_TOKEN_BUDGET": 1000}
+        )
+        page = f"{PennyConstants.BROWSE_PAGE_HEADER}https://example.com/a\n" + "word " * 3000
+        agent._tool_executor.execute = AsyncMock(return_value=ToolResult(message=page))
+        sent: list[list[dict]] = []
+        queries = ["first", "second", "first"]
+
+        def handler(request, count):
+            sent.append(copy.deepcopy(request["messages"]))
+            if count <= len(queries):
+                return mock_llm._make_tool_call_response(
+                    request, "search", {"query": queries[count - 1]}
+                )
+            return mock_llm._make_text_response(request, "done")
+
+        mock_llm.set_response_handler(handler)
+        with caplog.at_level(logging.INFO, logger="penny.agents.base"):
+            response = await agent.run("test", max_steps=max_steps)
+
+        assert response.answer == "done"
+        # The prefix (system + opening user turn) is byte-identical on every step.
+        assert all(request[:2] == sent[0][:2] for request in sent)
+        # Step 3: the answered first result is digested; the unseen second is whole.
+        first_result, second_result = sent[2][3]["content"], sent[2][5]["content"]
+        assert PennyConstants.COMPACTED_RESULT_MARKER in first_result
+        assert f"{PennyConstants.BROWSE_PAGE_HEADER}https://example.com/a" in first_result
+        assert "word word" not in first_result
+        assert second_result.endswith("word ")
+        # Digesting released the dedup key — repeating the first call re-opens it.
+        assert [record.arguments["query"] for record in response.tool_calls] == queries
+        assert "before compaction" in caplog.text
+
+        await agent.close()
+
+    @pytest.mark.asyncio
+    async def test_inline_thinking_dropped_from_resent_turns(self, test_db, mock_llm):
+        agent, db, max_steps = _make_agent(test_db, mock_llm)
+        agent._tool_executor.execute = AsyncMock(return_value=ToolResult(message="result"))
+        sent: list[list[dict]] = []
+
+        def handler(request, count):
+            sent.append(copy.deepcopy(request["messages"]))
+            if count == 1:
+                response = mock_llm._make_tool_call_response(request, "search", {"query": "x"})
+                response.message.content = "<think>private plan</think>"
+                return response
+            return mock_llm._make_text_response(request, "done")
+
+        mock_llm.set_response_handler(handler)
+        await agent.run("test", max_steps=max_steps)
+
+        assistant_turn = sent[1][2]
+        assert assistant_turn["role"] == "assistant"
+        assert "private plan" not in assistant_turn["content"]
+
+        await agent.close()
+
+
 class TestModelErrorHandling:
     """`_invoke_model` swallows LlmError → returns AGENT_MODEL_ERROR; other exceptions propagate."""
 
@@ -479,6 +560,33 @@ class TestDegenerateOutputGuard:
 
         await agent.close()
 
+    @pytest.mark.asyncio
+    async def test_collapse_aborts_stream_mid_decode(self, test_db, mock_llm):
+        """The stream is cut off at the collapse, not decoded to the end: the logged
+        call holds only the text up to it, and records how many tokens it cost."""
+        agent, db, max_steps = _make_agent(test_db, mock_llm, max_steps=3)
+
+        def handler(request, count):
+            if count == 1:
+                return mock_llm._make_text_response(
+                    request, "Here you go … … … … and then a long tail after"
+                )
+            return mock_llm._make_text_response(request, "here is the real answer")
+
+        mock_llm.set_response_handler(handler)
+
+        response = await agent.run("test", max_steps=max_steps)
+        assert response.answer == "here is the real answer"
+        assert len(mock_llm.requests) == 2
+
+        with Session(db.engine) as session:
+            aborted, completed = session.exec(select(PromptLog).order_by(PromptLog.id)).all()
+        assert aborted.aborted_tokens is not None and aborted.aborted_tokens > 0
+        assert "tail" not in aborted.response
+        assert completed.aborted_tokens is None
+
+        await agent.close()
+
     @pytest.mark.asyncio
     async def test_persistent_degeneration_aborts_run(self, test_db, mock_llm):
         """When every reroll is still degenerate, the run is thrown out with
@@ -498,6 +606,139 @@ class TestDegenerateOutputGuard:
         await agent.close()
 
 
+class TestModelTiers:
+    """An agent named in SMALL_MODEL_TASKS runs on the small model; output the
+    small model gets rejected for is redone on the main model, which keeps the
+    rest of the run."""
+
+    @pytest.mark.asyncio
+    async def test_unrouted_agent_stays_on_main_model(self, test_db, mock_llm):
+        agent, _db, max_steps = _make_agent(test_db, mock_llm, small_model="small-model")
+        mock_llm.set_response_handler(
+            lambda request, count: mock_llm._make_text_response(request, "main answer")
+        )
+
+        response = await agent.run("test", max_steps=max_steps)
+        assert response.answer == "main answer"
+        assert [request["model"] for request in mock_llm.requests] == ["test-model"]
+
+        await agent.close()
+
+    @pytest.mark.asyncio
+    async def test_validator_rejection_escalates_to_main_model(self, test_db, mock_llm):
+        """An empty small-model answer isn't nudged and retried on the small model —
+        the main model answers the unchanged context instead."""
+        agent, db, max_steps = _make_agent(
+            test_db,
+            mock_llm,
+            small_model="small-model",
+            runtime_overrides={"SMALL_MODEL_TASKS": Agent.name},
+        )
+
+        def handler(request, count):
+            if request["model"] == "small-model":
+                return mock_llm._make_text_response(request, "")
+            return mock_llm._make_text_response(request, "main answer")
+
+        mock_llm.set_response_handler(handler)
+
+        response = await agent.run("test", max_steps=max_steps)
+        assert response.answer == "main answer"
+        assert [request["model"] for request in mock_llm.requests] == [
+            "small-model",
+            "test-model",
+        ]
+        assert mock_llm.requests[1]["messages"] == mock_llm.requests[0]["messages"]
+        assert set(db.messages.prompt_perf_by_model()) == {"small-model", "test-model"}
+
+        await agent.close()
+
+    @pytest.mark.asyncio
+    async def test_degenerate_small_output_escalates_for_rest_of_run(self, test_db, mock_llm):
+        agent, _db, max_steps = _make_agent(
+            test_db,
+            mock_llm,
+            small_model="small-model",
+            runtime_overrides={"SMALL_MODEL_TASKS": Agent.name},
+        )
+
+        def handler(request, count):
+            if request["model"] == "small-model":
+                return mock_llm._make_tool_call_response(request, "search", {"query": "...??…?.."})
+            if count == 2:
+                return mock_llm._make_tool_call_response(request, "search", {"query": "weather"})
+            return mock_llm._make_text_response(request, "main answer")
+
+        mock_llm.set_response_handler(handler)
+
+        response = await agent.run("test", max_steps=max_steps)
+        assert response.answer == "main answer"
+        assert [request["model"] for request in mock_llm.requests] == [
+            "small-model",
+            "test-model",
+            "test-model",
+        ]
+
+        await agent.close()
+
+    @pytest.mark.asyncio
+    async def test_escalation_does_not_spend_a_reroll(self, test_db, mock_llm):
+        """The main model still gets every degenerate re-roll after taking over."""
+        agent, _db, max_steps = _make_agent(
+            test_db,
+            mock_llm,
+            small_model="small-model",
+            runtime_overrides={"SMALL_MODEL_TASKS": Agent.name},
+        )
+        mock_llm.set_response_handler(
+            lambda request, count: mock_llm._make_text_response(request, "...??…?..")
+        )
+
+        response = await agent.run("test", max_steps=max_steps)
+        assert response.answer == PennyResponse.AGENT_MODEL_ERROR
+        assert [request["model"] for request in mock_llm.requests] == [
+            "small-model",
+            *["test-model"] * PennyConstants.DEGENERATE_REROLL_ATTEMPTS,
+        ]
+
+        await agent.close()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "error",
+        [
+            LlmConnectionError("small backend down"),
+            LlmToolParseError("error parsing tool call: raw='plain text'"),
+        ],
+    )
+    async def test_small_model_error_escalates_to_main_model(self, test_db, mock_llm, error):
+        """A small-model error is answered by the main model on the unchanged
+        context — no format nudge, no model-error reply."""
+        agent, _db, max_steps = _make_agent(
+            test_db,
+            mock_llm,
+            small_model="small-model",
+            runtime_overrides={"SMALL_MODEL_TASKS": Agent.name},
+        )
+
+        def handler(request, count):
+            if request["model"] == "small-model":
+                raise error
+            return mock_llm._make_text_response(request, "main answer")
+
+        mock_llm.set_response_handler(handler)
+
+        response = await agent.run("test", max_steps=max_steps)
+        assert response.answer == "main answer"
+        assert [request["model"] for request in mock_llm.requests] == [
+            "small-model",
+            "test-model",
+        ]
+        assert mock_llm.requests[1]["messages"] == mock_llm.requests[0]["messages"]
+
+        await agent.close()
+
+
 class TestEmptyContentFallback:
     """Test that an empty model response falls back to AGENT_EMPTY_RESPONSE."""
 
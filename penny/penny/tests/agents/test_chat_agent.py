@@ -17,8 +17,9 @@ from unittest.mock import AsyncMock
 import pytest
 from sqlmodel import Session, select
 
+from penny.channels.base import PageContext, ReplyPreview
 from penny.database.memory import EntryInput, Inclusion, LogEntryInput, RecallMode
-from penny.database.models import MemoryEntry, MessageLog
+from penny.database.models import MemoryEntry, MessageLog, PromptLog
 from penny.tests.conftest import TEST_SENDER, wait_until
 
 # ── 1. Full integration (happy path) ─────────────────────────────────────
@@ -159,6 +160,7 @@ Just wrap them in conversational text, not a clinical dump.
 The user's name is Test User.
 
 ### Memory Inventory
+- browse-passages (log, 0 entries) — Each section of long browsed pages, embedded on its own
 - browse-results (log, 0 entries) — Every browse-tool fetch result
 - collector-runs (log, 0 entries) — One entry per Collector cycle: \
 target + success marker + done() summary
@@ -1107,6 +1109,98 @@ async def test_recall_archived_memory_skipped(signal_server, mock_llm, test_conf
         assert result is None or "stale content" not in result
 
 
+@pytest.mark.asyncio
+async def test_context_budget_drops_lowest_ranked_recall_not_inventory(
+    signal_server, mock_llm, make_config, running_penny, caplog
+):
+    """A tight CONTEXT_TOKEN_BUDGET keeps the top-ranked recall entries, drops the
+    rest, and logs it — but never trims the system prompt's inventory, so the
+    cached prefix is the same whatever the turn's volatile sections cost."""
+    config = make_config(context_token_budget=120)
+    async with running_penny(config) as penny:
+        penny.db.memories.create_collection(
+            "notes-test", "saved notes", Inclusion.ALWAYS, RecallMode.ALL
+        )
+        penny.db.memory("notes-test").write(
+            [EntryInput(key=f"note-{i}", content=f"note {i} " + "x" * 120) for i in range(8)],
+            author="test",
+        )
+
+        with caplog.at_level("INFO", logger="penny.agents.context_budget"):
+            await penny.chat_agent.handle(content="hi", sender=TEST_SENDER)
+
+        system, *_, live_turn = mock_llm.requests[0]["messages"]
+        assert "[note-0]" in live_turn["content"]
+        assert "[note-4]" not in live_turn["content"]
+        assert "- notes-test (collection, 8 entries)" in system["content"]
+        assert "- user-messages (log" in system["content"]
+        assert "Context budget 120: recall" in caplog.text
+        assert "inventory" not in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_context_budget_truncates_page_text(
+    signal_server, mock_llm, make_config, running_penny
+):
+    """The browser page is truncated to the budget rather than dropped."""
+    config = make_config(context_token_budget=100)
+    async with running_penny(config) as penny:
+        page = PageContext(title="Long read", url="https://example.com/a", text="y" * 2000)
+
+        await penny.chat_agent.handle(content="hi", sender=TEST_SENDER, page_context=page)
+
+        tool_turn = next(m for m in mock_llm.requests[0]["messages"] if m["role"] == "tool")
+        assert tool_turn["content"].count("y") == 400
+
+
+class _RecordingPreview(ReplyPreview):
+    """Records each preview update; ``None`` marks a retract."""
+
+    def __init__(self) -> None:
+        self.events: list[str | None] = []
+
+    async def show(self, text: str) -> None:
+        self.events.append(text)
+
+    async def retract(self) -> None:
+        self.events.append(None)
+
+
+@pytest.mark.asyncio
+async def test_reply_streams_to_preview_and_retracts_rejected_decode(
+    signal_server, mock_llm, test_config, running_penny
+):
+    """With a reply preview the turn streams: a decode the validators reject is
+    shown then retracted, the accepted answer grows token by token, and the
+    streamed promptlog rows carry a time-to-first-token."""
+
+    def handler(request, count):
+        if count == 1:
+            return mock_llm._make_text_response(request, "<function=browse>x</function>")
+        return mock_llm._make_text_response(request, "here you go friend")
+
+    mock_llm.set_response_handler(handler)
+    async with running_penny(test_config) as penny:
+        preview = _RecordingPreview()
+        response = await penny.chat_agent.handle(
+            content="hi", sender=TEST_SENDER, reply_preview=preview
+        )
+
+        assert response.answer == "here you go friend"
+        assert preview.events == [
+            "<function=browse>x</function>",
+            None,
+            "here",
+            "here you",
+            "here you go",
+            "here you go friend",
+        ]
+        with Session(penny.db.engine) as session:
+            rows = session.exec(select(PromptLog).where(PromptLog.agent_name == "chat")).all()
+        assert len(rows) == 2
+        assert all(row.ttft_ms is not None for row in rows)
+
+
 # ── 6. Tool surface ──────────────────────────────────────────────────────
 
 
@@ -9,6 +9,7 @@ plus the migrated likes/dislikes/knowledge prompts.
 from __future__ import annotations
 
 import re
+import uuid
 from datetime import UTC, datetime, timedelta
 
 import pytest
@@ -225,6 +226,81 @@ def test_dispatcher_picks_most_overdue(test_config, tmp_path):
     assert target.name == "stale"
 
 
+def _log_run(db: Database, target: str, outcome: RunOutcome, *, duration_ms: int) -> None:
+    """One completed single-prompt collector run for ``target`` in promptlog."""
+    run_id = uuid.uuid4().hex
+    db.messages.log_prompt(
+        model="m",
+        messages=[],
+        response={},
+        duration_ms=duration_ms,
+        agent_name="collector",
+        run_id=run_id,
+        run_target=target,
+    )
+    db.messages.set_run_outcome(run_id, outcome.value, "summary")
+
+
+def _ready_pair(db: Database, *, stale_minutes: int) -> None:
+    """Two ready collections on a 2-minute interval: ``cheap`` collected 3 minutes
+    ago, ``costly`` collected ``stale_minutes`` ago (so it's the most overdue)."""
+    for name in ("cheap", "costly"):
+        db.memories.create_collection(
+            name,
+            "x",
+            Inclusion.NEVER,
+            RecallMode.RECENT,
+            extraction_prompt=_VALID_EXTRACTION_PROMPT,
+            collector_interval_seconds=120,
+        )
+    _backdate_collected(db, "cheap", minutes=3)
+    _backdate_collected(db, "costly", minutes=stale_minutes)
+
+
+def test_dispatcher_ranks_by_yield_per_gpu_second(test_config, make_config, tmp_path):
+    """With history on both, the collection whose recent runs produced the most
+    work per GPU-second wins over a more-overdue but wasteful one.  Cancelled runs
+    don't count toward a yield, and the ranking is off at window 0."""
+    collector, db = _make_collector(test_config, tmp_path)
+    _ready_pair(db, stale_minutes=5)  # 2.5 intervals — overdue, not starving
+    for _ in range(3):
+        _log_run(db, "cheap", RunOutcome.WORKED, duration_ms=2_000)
+        _log_run(db, "costly", RunOutcome.NO_WORK, duration_ms=60_000)
+    _log_run(db, "costly", RunOutcome.CANCELLED, duration_ms=1)
+
+    assert db.messages.run_yield("costly", 20) == (3, 0, 180_000)
+    target = collector._next_ready_collection()
+    assert target is not None and target.name == "cheap"
+
+    collector.config = make_config(collector_yield_window=0)
+    target = collector._next_ready_collection()
+    assert target is not None and target.name == "costly"
+
+
+def test_dispatcher_runs_starving_or_unmeasured_collection_first(test_config, tmp_path):
+    """Starvation protection: a low-yield collection left uncollected for
+    ``COLLECTOR_STARVATION_FACTOR`` intervals jumps the yield ranking — and so
+    does a collection with no completed runs to estimate from."""
+    collector, db = _make_collector(test_config, tmp_path)
+    _ready_pair(db, stale_minutes=10)  # 5 intervals > default factor 3
+    for _ in range(3):
+        _log_run(db, "cheap", RunOutcome.WORKED, duration_ms=2_000)
+        _log_run(db, "costly", RunOutcome.NO_WORK, duration_ms=60_000)
+    target = collector._next_ready_collection()
+    assert target is not None and target.name == "costly"
+
+    db.memories.create_collection(
+        "newcomer",
+        "x",
+        Inclusion.NEVER,
+        RecallMode.RECENT,
+        extraction_prompt=_VALID_EXTRACTION_PROMPT,
+        collector_interval_seconds=60,
+    )
+    target = collector._next_ready_collection()
+    assert target is not None and target.name == "newcomer"
+
+
 def test_dispatcher_skips_collection_without_interval(test_config, tmp_path):
     """The interval is required: a collector collection with NULL
     collector_interval_seconds is skipped entirely — never run at a default
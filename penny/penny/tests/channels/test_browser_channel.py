@@ -22,6 +22,7 @@ from penny.tests.conftest import wait_until
 from penny.tests.mocks.llm_patches import MockLlmClient
 from penny.tools.browse import BrowseTool
 from penny.tools.models import ToolResult
+from penny.tools.page_cache import PageCache
 from penny.tools.read_emails import ReadEmailsTool
 from penny.tools.search_emails import SearchEmailsTool
 
@@ -244,7 +245,7 @@ class TestBrowseTool:
         assert not hasattr(result, "image_base64")
         rows = _all_media(db)
         assert len(rows) == 1
-        assert rows[0].data == raw
+        assert db.media.read(rows[0]) == raw
         assert rows[0].mime_type == "image/jpeg"
         assert rows[0].source_url == "https://ex.com/r"
         assert rows[0].title == "Tasty Recipe"
@@ -400,10 +401,165 @@ class TestBrowseToolMediaCapture:
         assert isinstance(result, ToolResult)
         rows = sorted(_all_media(db), key=lambda r: r.source_url or "")
         assert [r.source_url for r in rows] == ["https://a.com", "https://b.com"]
-        assert [r.data for r in rows] == [b"aaa", b"bbb"]
+        assert [db.media.read(r) for r in rows] == [b"aaa", b"bbb"]
         assert [r.title for r in rows] == ["A", "B"]
 
 
+class TestBrowsePageCache:
+    """BrowseTools sharing a PageCache reuse recent reads and in-flight requests."""
+
+    @staticmethod
+    def _make_tool(
+        request_fn, cache: PageCache, db: Database | None = None, permissions=None
+    ) -> BrowseTool:
+        tool = BrowseTool(
+            max_calls=3,
+            db=db,
+            embedding_client=cast(Any, MockLlmClient()) if db else None,
+            author="penny",
+            page_cache=cache,
+        )
+        perm = permissions or MagicMock(check_domain=AsyncMock())
+        tool.set_browse_provider(lambda: (request_fn, perm))
+        return tool
+
+    @pytest.mark.asyncio
+    async def test_repeat_read_is_served_from_cache_and_log(self, tmp_path):
+        """A re-read of the same page (modulo cosmetic URL differences) or
+        search skips the browser, is marked cached and isn't logged again; a
+        fresh cache (a restart) still finds the page in browse-results."""
+        db = _make_db(tmp_path)
+        request_fn = AsyncMock(return_value=("Title: Ex\nURL: https://ex.com/a\n\nContent.", None))
+        cache = PageCache(RuntimeParams(), db)
+        await self._make_tool(request_fn, cache, db).execute(
+            queries=["https://ex.com/a", "guitar amps"]
+        )
+
+        other_agent = self._make_tool(request_fn, cache, db)
+        result = await other_agent.execute(
+            queries=["https://EX.com/a/?utm_source=feed#top", "Guitar  amps"]
+        )
+
+        assert request_fn.await_count == 2
+        assert result.message.count("(Cached — this was read moments ago.)") == 2
+        assert (cache.hits, cache.misses, cache.round_trips_saved) == (2, 2, 2)
+        browse_log = db.memory(PennyConstants.MEMORY_BROWSE_RESULTS_LOG)
+        assert browse_log is not None
+        assert len(browse_log.newest_entries()) == 1
+
+        restarted = PageCache(RuntimeParams(), db)
+        result = await self._make_tool(request_fn, restarted, db).execute(
+            queries=["https://ex.com/a"]
+        )
+        assert request_fn.await_count == 2
+        assert "Content." in result.message and restarted.hits == 1
+
+    @pytest.mark.asyncio
+    async def test_denied_domain_is_not_served_from_cache(self, tmp_path):
+        """A domain denied after its page was cached is refused on the cached
+        read — from memory and from the browse-results log alike."""
+        db = _make_db(tmp_path)
+        request_fn = AsyncMock(return_value=("Title: Ex\nURL: https://ex.com/a\n\nSecret.", None))
+        cache = PageCache(RuntimeParams(), db)
+        await self._make_tool(request_fn, cache, db).execute(queries=["https://ex.com/a"])
+
+        denied = MagicMock(
+            check_domain=AsyncMock(side_effect=RuntimeError("User denied access to ex.com"))
+        )
+        for reader in (cache, PageCache(RuntimeParams(), db)):
+            result = await self._make_tool(request_fn, reader, db, denied).execute(
+                queries=["https://ex.com/a"]
+            )
+            assert "Secret." not in result.message
+            assert "User denied access to ex.com" in result.message
+            assert reader.hits == 0
+        assert request_fn.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_one_request(self):
+        """Identical reads in flight together make one browser request; a zero
+        TTL turns the cache off entirely."""
+        release = asyncio.Event()
+        calls: list[str] = []
+
+        async def request_fn(method: str, params: dict):
+            calls.append(params["url"])
+            await release.wait()
+            return ("Title: Ex\nURL: https://ex.com\n\nShared.", None)
+
+        cache = PageCache(RuntimeParams())
+        reads = [
+            asyncio.create_task(self._make_tool(request_fn, cache).execute(queries=[url]))
+            for url in ("https://ex.com", "https://ex.com/")
+        ]
+        await wait_until(lambda: cache.shared == 1)
+        release.set()
+        results = await asyncio.gather(*reads)
+
+        assert calls == ["https://ex.com"]
+        assert all("Shared." in result.message for result in results)
+        assert (cache.misses, cache.shared) == (1, 1)
+
+        uncached = PageCache(RuntimeParams(env_overrides={"BROWSE_CACHE_PAGE_TTL_SECONDS": "0"}))
+        for _ in range(2):
+            await self._make_tool(request_fn, uncached).execute(queries=["https://ex.com"])
+        assert len(calls) == 3
+
+
+class TestBrowseLongPages:
+    """Pages over the token budget show their most relevant chunks."""
+
+    @pytest.mark.asyncio
+    async def test_long_page_shows_relevant_chunks_and_logs_passages(self, tmp_path):
+        """Only the chunk embedding closest to the lookup's reasoning is shown,
+        with gap markers; browse-results keeps the whole page and every chunk
+        lands in browse-passages with its own embedding from one batch call."""
+        db = _make_db(tmp_path)
+        filler = [f"Filler paragraph {n}. " + "lorem ipsum " * 95 for n in range(4)]
+        answer = "The amp weighs 12 kg and ships in March."
+        body = "\n\n".join([filler[0], filler[1], answer, filler[2], filler[3]])
+        request_fn = AsyncMock(
+            return_value=(f"Title: Amp\nURL: https://ex.com/amp\n\n{body}", None)
+        )
+
+        client = MockLlmClient()
+        client.set_embed_handler(
+            lambda model, texts: [
+                [1.0, 0.0] if "weighs" in text or "Anchor" in text else [0.0, 1.0]
+                for text in ([texts] if isinstance(texts, str) else texts)
+            ]
+        )
+        tool = BrowseTool(
+            max_calls=3,
+            db=db,
+            embedding_client=cast(Any, client),
+            author="penny",
+            page_token_budget=300,
+        )
+        tool.set_browse_provider(lambda: (request_fn, MagicMock(check_domain=AsyncMock())))
+
+        result = await tool.execute(queries=["https://ex.com/amp"], reasoning="Anchor: amp weight")
+
+        assert answer in result.message
+        assert "Filler paragraph 0" not in result.message
+        assert "sections most relevant to this lookup" in result.message
+        assert result.message.count("[…]") == 3  # the note, then a gap either side
+        assert any(isinstance(r["input"], list) for r in client.embed_requests)
+
+        browse_log = db.memory(PennyConstants.MEMORY_BROWSE_RESULTS_LOG)
+        assert browse_log is not None
+        [page] = browse_log.newest_entries()
+        assert "Filler paragraph 0" in page.content and answer in page.content
+
+        passage_log = db.memory(PennyConstants.MEMORY_BROWSE_PASSAGES_LOG)
+        assert passage_log is not None
+        passages = passage_log.newest_entries()
+        assert len(passages) == 5
+        assert all(
+            entry.content.startswith("## browse: https://ex.com/amp [") for entry in passages
+        )
+
+
 class _MockWs:
     """Minimal mock WebSocket that captures sent JSON messages."""
 
@@ -795,6 +951,72 @@ class TestCapabilitiesAndToolRouting:
         )
         assert channel._get_tool_connection() is ws_live
 
+    @staticmethod
+    def _tool_requests(ws) -> list[dict]:
+        return [frame for frame in ws.sent if frame["type"] == "tool_request"]
+
+    @staticmethod
+    def _respond(channel, request: dict, result: str) -> None:
+        channel._handle_tool_response(
+            {"type": "tool_response", "request_id": request["request_id"], "result": result}
+        )
+
+    @pytest.mark.asyncio
+    async def test_tool_requests_spread_by_load_under_a_cap(self, tmp_path, monkeypatch):
+        """Parallel requests go to the least-loaded browser; once every browser
+        is at its cap the next request waits for a slot to free up."""
+        monkeypatch.setattr(PennyConstants, "BROWSER_TOOL_CONCURRENCY", 1)
+        db = _make_db(tmp_path)
+        channel = BrowserChannel(host="localhost", port=9999, message_agent=MagicMock(), db=db)
+        sockets = []
+        for label in ("firefox-1", "firefox-2"):
+            ws = await self._register(channel, label)
+            await self._set_capabilities(channel, label, ws, True)
+            sockets.append(ws)
+
+        reads = [
+            asyncio.create_task(
+                channel.send_tool_request("browse_url", {"url": f"https://{n}.com"})
+            )
+            for n in ("a", "b", "c")
+        ]
+        await wait_until(lambda: len(channel._pending_requests) == 2)
+        assert [len(self._tool_requests(ws)) for ws in sockets] == [1, 1]
+
+        self._respond(channel, self._tool_requests(sockets[1])[0], "b")
+        await wait_until(lambda: len(self._tool_requests(sockets[1])) == 2)
+        self._respond(channel, self._tool_requests(sockets[0])[0], "a")
+        self._respond(channel, self._tool_requests(sockets[1])[1], "c")
+
+        results = await asyncio.gather(*reads)
+        assert sorted(text for text, _ in results) == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_request_on_dropped_socket_is_resent_to_another_browser(self, tmp_path):
+        """A socket closing mid-request re-sends that request on another
+        browser, leaving requests in flight elsewhere alone."""
+        db = _make_db(tmp_path)
+        channel = BrowserChannel(host="localhost", port=9999, message_agent=MagicMock(), db=db)
+        ws_a = await self._register(channel, "firefox-a")
+        await self._set_capabilities(channel, "firefox-a", ws_a, True)
+        ws_b = await self._register(channel, "firefox-b")
+        await self._set_capabilities(channel, "firefox-b", ws_b, True)
+
+        reads = [
+            asyncio.create_task(channel.send_tool_request("browse_url", {"url": url}))
+            for url in ("https://one.com", "https://two.com")
+        ]
+        await wait_until(lambda: len(channel._pending_requests) == 2)
+        dropped = self._tool_requests(ws_a)[0]
+        channel._cleanup_connection(ws_a, "firefox-a")  # ty: ignore[invalid-argument-type]
+
+        await wait_until(lambda: len(self._tool_requests(ws_b)) == 2)
+        resent, survivor = self._tool_requests(ws_b)[1], self._tool_requests(ws_b)[0]
+        assert resent["arguments"] == dropped["arguments"]
+        self._respond(channel, survivor, "kept")
+        self._respond(channel, resent, "resent")
+        assert {text for text, _ in await asyncio.gather(*reads)} == {"kept", "resent"}
+
 
 class TestBrowserPermissionDelegation:
     """BrowserChannel delegates permission checks to PermissionManager."""
@@ -948,6 +1170,71 @@ class TestMakeHandleKwargs:
         assert msg["content"] == "Searching for stuff"
 
 
+class TestBrowserReplyPreview:
+    """A streaming reply renders as message_delta frames until the final message."""
+
+    @pytest.mark.asyncio
+    async def test_preview_streams_then_final_message_supersedes(self, tmp_path):
+        db = _make_db(tmp_path)
+        channel = BrowserChannel(host="localhost", port=9999, message_agent=MagicMock(), db=db)
+        ws = _MockWs()
+        cast(dict, channel._connections)["browser-user"] = ConnectionInfo(ws=ws)  # ty: ignore[invalid-argument-type]
+        message = IncomingMessage(sender="browser-user", content="hello")
+
+        preview = await channel._begin_reply_preview(message)
+        assert preview is not None
+        await preview.show("**partial**")
+        await channel._send_raw("browser-user", "final answer")
+        await preview.retract()
+
+        assert ws.sent == [
+            {"type": "message_delta", "content": "<strong>partial</strong>", "active": True},
+            {"type": "message", "content": "final answer"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_retract_clears_an_undelivered_preview(self, tmp_path):
+        db = _make_db(tmp_path)
+        channel = BrowserChannel(host="localhost", port=9999, message_agent=MagicMock(), db=db)
+        ws = _MockWs()
+        cast(dict, channel._connections)["browser-user"] = ConnectionInfo(ws=ws)  # ty: ignore[invalid-argument-type]
+        message = IncomingMessage(sender="browser-user", content="hello")
+
+        preview = await channel._begin_reply_preview(message)
+        assert preview is not None
+        await preview.show("thinking out loud")
+        await preview.retract()
+        await preview.retract()
+
+        assert ws.sent[-1] == {"type": "message_delta", "active": False}
+        assert len(ws.sent) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_run_forgets_its_preview(self, tmp_path, monkeypatch):
+        """A run that raises before replying drops its preview — the next
+        message to the recipient isn't treated as superseding it."""
+        db = _make_db(tmp_path)
+        monkeypatch.setattr(db.users, "get_primary_sender", lambda: "browser-user")
+
+        async def failing_handle(**kwargs):
+            await kwargs["reply_preview"].show("half an answer")
+            raise RuntimeError("model went away")
+
+        agent = MagicMock(handle=AsyncMock(side_effect=failing_handle))
+        channel = BrowserChannel(host="localhost", port=9999, message_agent=agent, db=db)
+        ws = _MockWs()
+        cast(dict, channel._connections)["browser-user"] = ConnectionInfo(ws=ws)  # ty: ignore[invalid-argument-type]
+
+        with pytest.raises(RuntimeError):
+            await channel._dispatch_to_agent(
+                IncomingMessage(sender="browser-user", content="hello")
+            )
+
+        assert channel._reply_previews == {}
+        deltas = [m for m in ws.sent if m["type"] == "message_delta"]
+        assert deltas[-1] == {"type": "message_delta", "active": False}
+
+
 class TestBrowserScheduleHandlers:
     """Schedule request/add/update/delete handlers for browser extension."""
 
@@ -1240,6 +1527,15 @@ class TestBrowserPromptLogHandlers:
         )
         return ws.sent[0]
 
+    async def _request_run_detail(self, channel: BrowserChannel, run_id: str) -> list[dict]:
+        ws = _MockWs()
+        await channel._process_raw_message(
+            ws,  # ty: ignore[invalid-argument-type]
+            json.dumps({"type": "run_detail_request", "run_id": run_id}),
+            None,
+        )
+        return ws.sent
+
     @pytest.mark.asyncio
     async def test_prompt_logs_request_returns_runs(self, tmp_path):
         """Basic prompt logs request returns grouped runs."""
@@ -1333,6 +1629,35 @@ class TestBrowserPromptLogHandlers:
         assert len(second["runs"]) == 1
         assert second["has_more"] is False
 
+    @pytest.mark.asyncio
+    async def test_prompt_logs_page_token_is_stable_under_new_runs(self, tmp_path):
+        """The next page resumes from the previous page's token (a keyset on
+        each run's newest prompt), so a run logged in between neither shifts
+        the page nor repeats a run the way an offset would — with or without
+        a search."""
+        channel, db = self._channel(tmp_path)
+        channel._PROMPT_LOG_PAGE_SIZE = 2
+        for run_id in ("run1", "run2", "run3"):
+            db.messages.log_prompt(
+                model="test-model",
+                messages=[{"role": "user", "content": "q"}],
+                response={"choices": []},
+                thinking="hoops",
+                agent_name="chat",
+                run_id=run_id,
+            )
+
+        for search in ({}, {"query": "hoops"}):
+            first = await self._request_prompt_logs(channel, search)
+            assert [r["run_id"] for r in first["runs"]] == ["run3", "run2"]
+            assert first["next_page_token"] == first["runs"][-1]["page_token"]
+
+            self._log_prompt(db, "chat", f"newer-{len(search)}")
+            token = first["next_page_token"]
+            second = await self._request_prompt_logs(channel, {"page_token": token, **search})
+            assert [r["run_id"] for r in second["runs"]] == ["run1"]
+            assert (second["has_more"], second["next_page_token"]) == (False, None)
+
     @pytest.mark.asyncio
     async def test_prompt_logs_include_run_outcome(self, tmp_path):
         """Run outcome (outcome / reason / target) is included in the response when set.
@@ -1356,11 +1681,51 @@ class TestBrowserPromptLogHandlers:
         # Outcome-less run keeps its collection name (the bug: it was dropped).
         assert runs["run2"]["run_outcome"] is None
         assert runs["run2"]["run_target"] == "knowledge"
-        # Each run carries the shared run-health (badges + filter) and the concise
-        # record (the SAME representation Penny's quality collector reads).
+        # Each run carries the shared run-health (badges + filter); the concise
+        # record (the SAME representation Penny's quality collector reads) comes
+        # with the run's detail.
         assert runs["run1"]["health"]["regressive"] is False
         assert runs["run1"]["health"]["flags"] == []
-        assert runs["run1"]["record"].startswith("[board-games] wrote 2 new games")
+        assert "record" not in runs["run1"]
+        detail = await self._request_run_detail(channel, "run1")
+        assert detail[-1]["record"].startswith("[board-games] wrote 2 new games")
+
+    @pytest.mark.asyncio
+    async def test_run_index_is_light_and_detail_streams_on_expand(self, tmp_path):
+        """The run index leaves out every prompt's messages / response /
+        thinking — each row carries snippets instead — and expanding the run
+        streams its prompts in full, a few per frame, then its health + record."""
+        channel, db = self._channel(tmp_path)
+        for step in range(5):
+            db.messages.log_prompt(
+                model="test-model",
+                messages=[
+                    {"role": "system", "content": "x" * 10_000},
+                    {"role": "user", "content": f"question  {step}"},
+                ],
+                response={"choices": [{"message": {"content": f"answer {step}"}}]},
+                thinking="t" * 10_000,
+                agent_name="chat",
+                prompt_type="user_message",
+                run_id="run1",
+            )
+        db.messages.set_run_outcome("run1", "worked", "replied")
+
+        response = await self._request_prompt_logs(channel)
+        prompts = response["runs"][0]["prompts"]
+        assert len(json.dumps(response)) < 5_000
+        assert not {"messages", "response", "thinking"} & prompts[0].keys()
+        assert (prompts[0]["user_snippet"], prompts[0]["snippet"]) == ("question 0", "answer 0")
+
+        frames = await self._request_run_detail(channel, "run1")
+        assert [len(frame["prompts"]) for frame in frames] == [4, 1, 0]
+        assert [frame["done"] for frame in frames] == [False, False, True]
+        streamed = [prompt for frame in frames for prompt in frame["prompts"]]
+        assert [prompt["id"] for prompt in streamed] == [prompt["id"] for prompt in prompts]
+        assert streamed[4]["messages"][1]["content"] == "question  4"
+        assert streamed[4]["thinking"] == "t" * 10_000
+        assert frames[-1]["health"]["flags"] == []
+        assert frames[-1]["record"] == "[?] replied"
 
     @pytest.mark.asyncio
     async def test_prompt_logs_flagged_only(self, tmp_path):
@@ -1705,16 +2070,19 @@ class TestBrowserMemoryHandlers:
         resp = ws.sent[0]
         runs = resp["collector_runs"]
         assert len(runs) == 2
-        # Full serialized runs (run_id, prompts, health, record), newest first.
+        # Run-index runs (run_id, prompts, health), newest first.
         assert all(r["run_target"] == "board-games" for r in runs)
         assert all(r["prompts"] for r in runs)
-        # The shared run record carries the [target] summary + run-health flags.
-        # r2 failed with no tool calls — it spun until the step ceiling, which is
-        # capacity (⚠ INCOMPLETE, ignored by quality), not a deliberate NO WORK
-        # DONE bail (which requires a recorded done() with no real work first).
-        assert "[board-games] no source URL found" in runs[0]["record"]
-        assert "⚠ INCOMPLETE" in runs[0]["record"]
-        assert runs[1]["record"] == "[board-games] wrote 2 games"
+        # The shared run record (fetched with the run's detail) carries the
+        # [target] summary + run-health flags.  r2 failed with no tool calls — it
+        # spun until the step ceiling, which is capacity (⚠ INCOMPLETE, ignored by
+        # quality), not a deliberate NO WORK DONE bail (which requires a recorded
+        # done() with no real work first).
+        records = [db.messages.get_run_assessment(r["run_id"]) or {} for r in runs]
+        assert "[board-games] no source URL found" in records[0]["record"]
+        assert "⚠ INCOMPLETE" in records[0]["record"]
+        assert "incomplete" in runs[0]["health"]["flags"]
+        assert records[1]["record"] == "[board-games] wrote 2 games"
         assert runs[1]["run_reason"] == "wrote 2 games"
         # Both target runs fit in one page.
         assert resp["collector_runs_has_more"] is False
@@ -1769,6 +2137,59 @@ class TestBrowserMemoryHandlers:
         assert [e["content"] for e in page["entries"]] == ["[knowledge] first"]
         assert page["has_more"] is False
 
+    @pytest.mark.asyncio
+    async def test_memory_entries_page_token_survives_new_writes(self, tmp_path):
+        """Entries page by an opaque ``(created_at, id)`` token: entries that
+        share a timestamp still page in a stable order, and a write between
+        pages doesn't repeat an entry the way an offset would."""
+        channel, db = self._channel(tmp_path)
+        channel._MEMORY_PAGE_SIZE = 2
+        db.memories.create_log("notes", "scratch notes", Inclusion.ALWAYS, RecallMode.RECENT)
+        log = db.memory("notes")
+        assert log is not None
+        log.append([LogEntryInput(content=word) for word in ("a", "b", "c")], author="user")
+
+        ws = _MockWs()
+        await channel._handle_memory_detail_request(
+            ws,  # ty: ignore[invalid-argument-type]
+            {"type": "memory_detail_request", "name": "notes"},
+        )
+        first = ws.sent[0]
+        shown = [e["content"] for e in first["entries"]]
+        assert first["entries_has_more"] is True
+
+        log.append([LogEntryInput(content="d")], author="user")
+        ws = _MockWs()
+        await channel._handle_memory_page_request(
+            ws,  # ty: ignore[invalid-argument-type]
+            {
+                "type": "memory_page_request",
+                "name": "notes",
+                "section": "entries",
+                "page_token": first["entries_next_page_token"],
+            },
+        )
+        page = ws.sent[0]
+        assert sorted(shown + [e["content"] for e in page["entries"]]) == ["a", "b", "c"]
+        assert (page["has_more"], page["next_page_token"]) == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_memory_page_request_rejects_malformed_token(self, tmp_path):
+        """A token the server didn't issue is dropped (logged), not misread."""
+        channel, db = self._channel(tmp_path)
+        db.memories.create_log("notes", "scratch notes", Inclusion.ALWAYS, RecallMode.RECENT)
+        ws = _MockWs()
+        await channel._handle_memory_page_request(
+            ws,  # ty: ignore[invalid-argument-type]
+            {
+                "type": "memory_page_request",
+                "name": "notes",
+                "section": "entries",
+                "page_token": "not a token",
+            },
+        )
+        assert ws.sent == []
+
     @pytest.mark.asyncio
     async def test_memory_page_request_collector_runs_paginate(self, tmp_path):
         """The Activity section paginates independently of the entries section,
@@ -1787,10 +2208,7 @@ class TestBrowserMemoryHandlers:
             {"type": "memory_detail_request", "name": "board-games"},
         )
         first = ws.sent[0]
-        assert [r["record"] for r in first["collector_runs"]] == [
-            "[board-games] cycle-3",
-            "[board-games] cycle-2",
-        ]
+        assert [r["run_reason"] for r in first["collector_runs"]] == ["cycle-3", "cycle-2"]
         assert first["collector_runs_has_more"] is True
 
         ws = _MockWs()
@@ -1805,7 +2223,7 @@ class TestBrowserMemoryHandlers:
         )
         page = ws.sent[0]
         assert page["section"] == "collector_runs"
-        assert [r["record"] for r in page["runs"]] == ["[board-games] cycle-1"]
+        assert [r["run_reason"] for r in page["runs"]] == ["cycle-1"]
         assert page["has_more"] is False
 
     @pytest.mark.asyncio
@@ -0,0 +1,186 @@
+"""Tests for the browser live-update protocol — subscriptions, compact prompt
+updates with fetch-on-expand, coalesced memory events, and the per-socket
+outbox that drops stale updates when the addon falls behind."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from penny.channels.browser import BrowserChannel
+from penny.channels.browser.live import LiveOutbox
+from penny.database import Database
+from penny.database.memory import Inclusion, LogEntryInput, RecallMode
+from penny.database.migrate import migrate
+from penny.tests.conftest import wait_until
+
+
+class _MockWs:
+    """Captures sent JSON; ``release`` gates each send to model a slow client."""
+
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def send(self, data: str) -> None:
+        await self.release.wait()
+        self.sent.append(json.loads(data))
+
+
+def _make_channel(tmp_path) -> tuple[BrowserChannel, Database]:
+    db_path = str(tmp_path / "test.db")
+    db = Database(db_path)
+    db.create_tables()
+    migrate(db_path)
+    channel = BrowserChannel(host="localhost", port=9999, message_agent=MagicMock(), db=db)
+    return channel, db
+
+
+async def _connect(channel: BrowserChannel, label: str, topics: list[str]) -> _MockWs:
+    ws = _MockWs()
+    await channel._process_raw_message(
+        ws,  # ty: ignore[invalid-argument-type]
+        json.dumps({"type": "register", "sender": label}),
+        None,
+    )
+    await channel._process_raw_message(
+        ws,  # ty: ignore[invalid-argument-type]
+        json.dumps({"type": "subscribe", "topics": topics}),
+        label,
+    )
+    return ws
+
+
+def _of_type(ws: _MockWs, frame_type: str) -> list[dict]:
+    return [frame for frame in ws.sent if frame["type"] == frame_type]
+
+
+@pytest.mark.asyncio
+async def test_prompt_update_is_a_summary_and_detail_is_fetched_on_expand(tmp_path):
+    channel, db = _make_channel(tmp_path)
+    prompts_ws = await _connect(channel, "prompts-tab", ["prompts"])
+    memories_ws = await _connect(channel, "memories-tab", ["memories"])
+    messages = [
+        {"role": "system", "content": "x" * 50_000},
+        {"role": "user", "content": "what's  the\nweather?"},
+    ]
+    response = {
+        "choices": [
+            {
+                "message": {
+                    "tool_calls": [
+                        {"function": {"name": "search", "arguments": '{"queries": ["weather"]}'}}
+                    ]
+                }
+            }
+        ]
+    }
+
+    db.messages.log_prompt(
+        model="m", messages=messages, response=response, thinking="hmm", run_id="run-1"
+    )
+    await wait_until(lambda: _of_type(prompts_ws, "prompt_log_update"))
+
+    update = _of_type(prompts_ws, "prompt_log_update")[0]
+    prompt = update["prompt"]
+    assert "messages" not in prompt and "response" not in prompt and "thinking" not in prompt
+    assert (prompt["snippet"], prompt["user_snippet"]) == ("search(weather)", "what's the weather?")
+    assert len(json.dumps(update)) < 1000
+    assert _of_type(memories_ws, "prompt_log_update") == []
+
+    await channel._process_raw_message(
+        prompts_ws,  # ty: ignore[invalid-argument-type]
+        json.dumps({"type": "prompt_detail_request", "id": prompt["id"]}),
+        "prompts-tab",
+    )
+    detail = prompts_ws.sent[-1]
+    assert detail["type"] == "prompt_detail_response"
+    assert (detail["messages"], detail["response"], detail["thinking"]) == (
+        messages,
+        response,
+        "hmm",
+    )
+
+
+@pytest.mark.asyncio
+async def test_memory_writes_coalesce_into_one_event_with_count_and_delta(tmp_path):
+    channel, db = _make_channel(tmp_path)
+    ws = await _connect(channel, "firefox", ["memories"])
+    db.memories.create_log("notes", "scratch notes", Inclusion.ALWAYS, RecallMode.RECENT)
+    log = db.memory("notes")
+    assert log is not None
+
+    for word in ("alpha", "beta", "gamma"):
+        log.append([LogEntryInput(content=word)], author="user")
+    await wait_until(lambda: any(event.get("name") == "notes" for event in ws.sent))
+    await asyncio.sleep(0.3)
+
+    events = [event for event in ws.sent if event.get("name") == "notes"]
+    assert len(events) == 1
+    assert events[0]["entry_count"] == 3
+    assert [entry["content"] for entry in events[0]["new_entries"]] == ["gamma", "beta", "alpha"]
+    assert events[0]["more"] is False
+
+    log.append([LogEntryInput(content="delta")], author="user")
+    await wait_until(lambda: len([e for e in ws.sent if e.get("name") == "notes"]) == 2)
+    latest = [event for event in ws.sent if event.get("name") == "notes"][-1]
+    assert latest["entry_count"] == 4
+    assert [entry["content"] for entry in latest["new_entries"]] == ["delta"]
+
+
+@pytest.mark.asyncio
+async def test_outbox_coalesces_by_key_and_resyncs_a_client_that_fell_behind():
+    ws = _MockWs()
+    ws.release.clear()
+    outbox = LiveOutbox(ws.send, max_depth=3)
+
+    outbox.offer("memories", "memory:notes", '{"name": "notes", "n": 1}')
+    await asyncio.sleep(0)  # the first frame is now in flight, blocked on the socket
+    outbox.offer("memories", "memory:notes", '{"name": "notes", "n": 2}')
+    outbox.offer("memories", "memory:notes", '{"name": "notes", "n": 3}')
+    for step in range(3):
+        outbox.offer("prompts", f"prompt:{step}", json.dumps({"prompt": step}))
+
+    ws.release.set()
+    await wait_until(lambda: len(ws.sent) == 5)
+    await asyncio.sleep(0.05)
+
+    assert ws.sent == [
+        {"name": "notes", "n": 1},
+        {"type": "live_resync", "topic": "memories"},
+        {"prompt": 0},
+        {"prompt": 1},
+        {"prompt": 2},
+    ]
+    assert (outbox.coalesced, outbox.dropped) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_prompt_without_subscribers_is_not_summarized(tmp_path, monkeypatch):
+    channel, db = _make_channel(tmp_path)
+    ws = await _connect(channel, "memories-tab", ["memories"])
+    summarize = MagicMock()
+    monkeypatch.setattr("penny.channels.browser.channel.prompt_summary", summarize)
+
+    db.messages.log_prompt(model="m", messages=[], response={}, run_id="run-1")
+
+    summarize.assert_not_called()
+    assert _of_type(ws, "prompt_log_update") == []
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_a_blocked_outbox_drain(tmp_path):
+    channel, _db = _make_channel(tmp_path)
+    ws = await _connect(channel, "prompts-tab", ["prompts"])
+    ws.release.clear()
+    outbox = channel._connections["prompts-tab"].outbox
+    outbox.offer("prompts", "prompt:1", json.dumps({"prompt": 1}))
+    outbox.offer("prompts", "prompt:2", json.dumps({"prompt": 2}))
+    await asyncio.sleep(0)
+
+    await channel.close()
+
+    assert outbox._drain is not None and outbox._drain.cancelled()
+    assert {"prompt": 1} not in ws.sent
@@ -0,0 +1,111 @@
+"""Tests for IngressQueue — per-sender ordering, worker cap, backpressure —
+and the browser socket's fast lane."""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from penny.channels.browser import BrowserChannel
+from penny.channels.ingress import IngressQueue
+from penny.database import Database
+from penny.database.migrate import migrate
+from penny.tests.conftest import wait_until
+
+
+def _work(log: list[str], name: str, gate: asyncio.Event):
+    async def run() -> None:
+        log.append(f"start {name}")
+        await gate.wait()
+        log.append(f"end {name}")
+
+    return run
+
+
+@pytest.mark.asyncio
+async def test_same_sender_runs_in_order_other_senders_alongside():
+    queue = IngressQueue("test", max_depth=8, workers=2)
+    log: list[str] = []
+    gate = asyncio.Event()
+
+    await queue.submit("alice", _work(log, "a1", gate))
+    await queue.submit("alice", _work(log, "a2", gate))
+    await queue.submit("bob", _work(log, "b1", gate))
+    await wait_until(lambda: len(log) == 2)
+    assert log == ["start a1", "start b1"]
+
+    gate.set()
+    await wait_until(lambda: len(log) == 6)
+    assert log.index("end a1") < log.index("start a2")
+    stats = queue.stats()
+    assert (stats.processed, stats.depth, stats.max_depth) == (3, 0, 3)
+
+
+@pytest.mark.asyncio
+async def test_full_queue_holds_the_submitter_until_room_frees():
+    queue = IngressQueue("test", max_depth=2, workers=1)
+    log: list[str] = []
+    gate = asyncio.Event()
+
+    await queue.submit("alice", _work(log, "a1", gate))
+    await queue.submit("bob", _work(log, "b1", gate))
+    third = asyncio.create_task(queue.submit("carol", _work(log, "c1", gate)))
+    await asyncio.sleep(0.05)
+    assert not third.done()
+    assert log == ["start a1"]
+
+    gate.set()
+    await third
+    await wait_until(lambda: "end c1" in log)
+    assert queue.stats().full == 1
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_an_in_flight_drain():
+    queue = IngressQueue("test", max_depth=4, workers=1)
+    log: list[str] = []
+    gate = asyncio.Event()
+    await queue.submit("alice", _work(log, "a1", gate))
+    await queue.submit("alice", _work(log, "a2", gate))
+    await wait_until(lambda: log == ["start a1"])
+
+    await queue.close()
+
+    assert log == ["start a1"]
+    assert not queue._drains
+    assert queue.stats().depth == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_browser_request_does_not_hold_up_fast_frames(tmp_path):
+    """A queued request that's still running doesn't delay a tool response
+    read off the same socket after it."""
+    db_path = str(tmp_path / "test.db")
+    db = Database(db_path)
+    db.create_tables()
+    migrate(db_path)
+    channel = BrowserChannel(host="localhost", port=9999, message_agent=MagicMock(), db=db)
+    release = asyncio.Event()
+
+    async def slow_memories_request(ws, data) -> None:
+        await release.wait()
+
+    channel._handle_memories_request = slow_memories_request  # ty: ignore[invalid-assignment]
+    future = asyncio.get_running_loop().create_future()
+    channel._pending_requests["req-1"] = future
+    ws = MagicMock()
+
+    await channel._ingest_raw(ws, json.dumps({"type": "memories_request"}), "firefox")
+    await channel._ingest_raw(
+        ws,
+        json.dumps({"type": "tool_response", "request_id": "req-1", "result": "page text"}),
+        "firefox",
+    )
+
+    assert future.done()
+    assert future.result()[0] == "page text"
+    stats = channel._ingress.stats()
+    assert (stats.fast, stats.depth) == (1, 1)
+    release.set()
+    await wait_until(lambda: channel._ingress.stats().depth == 0)
@@ -0,0 +1,115 @@
+"""Tests for MessageCoalescer — debounced bursts, superseded turns, and the
+Signal channel coalescing a burst into one agent turn."""
+
+import asyncio
+
+import pytest
+
+from penny.channels.base import IncomingMessage
+from penny.channels.coalescer import MessageCoalescer
+from penny.tests.conftest import TEST_SENDER, wait_until
+
+WINDOW = 0.05
+
+
+def _message(content: str) -> IncomingMessage:
+    return IncomingMessage(sender=TEST_SENDER, content=content)
+
+
+class _Dispatcher:
+    """Records the turns it's asked to run; each runs until ``release`` is set."""
+
+    def __init__(self) -> None:
+        self.started: list[str] = []
+        self.finished: list[str] = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.coalescer = MessageCoalescer(self.dispatch, lambda: WINDOW)
+
+    async def dispatch(self, message: IncomingMessage) -> None:
+        self.started.append(message.content)
+        await self.release.wait()
+        self.coalescer.begin_delivery(message.sender)
+        self.finished.append(message.content)
+
+
+@pytest.mark.asyncio
+async def test_burst_becomes_one_turn_and_typing_extends_the_wait():
+    dispatcher = _Dispatcher()
+    await dispatcher.coalescer.submit(_message("hey"))
+    await dispatcher.coalescer.submit(_message("quick question"))
+    for _ in range(3):
+        await asyncio.sleep(WINDOW * 0.6)
+        dispatcher.coalescer.typing(TEST_SENDER)
+    assert dispatcher.started == []
+
+    await dispatcher.coalescer.submit(_message("what's the weather?"))
+    await wait_until(lambda: dispatcher.finished)
+    assert dispatcher.finished == ["hey\nquick question\nwhat's the weather?"]
+
+
+@pytest.mark.asyncio
+async def test_follow_up_supersedes_a_turn_still_thinking():
+    """A message arriving mid-turn cancels it; the next turn answers both."""
+    dispatcher = _Dispatcher()
+    dispatcher.release.clear()
+    await dispatcher.coalescer.submit(_message("book a table"))
+    await wait_until(lambda: dispatcher.started)
+
+    await dispatcher.coalescer.submit(_message("for four people"))
+    dispatcher.release.set()
+    await wait_until(lambda: dispatcher.finished)
+    await asyncio.sleep(WINDOW * 2)
+
+    assert dispatcher.started == ["book a table", "book a table\nfor four people"]
+    assert dispatcher.finished == ["book a table\nfor four people"]
+
+
+@pytest.mark.asyncio
+async def test_turn_delivering_its_answer_is_not_superseded():
+    dispatcher = _Dispatcher()
+    await dispatcher.coalescer.submit(_message("first"))
+    await wait_until(lambda: dispatcher.finished)
+
+    await dispatcher.coalescer.submit(_message("second"))
+    await wait_until(lambda: len(dispatcher.finished) == 2)
+    assert dispatcher.finished == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_close_cancels_waiting_bursts_and_running_turns():
+    dispatcher = _Dispatcher()
+    dispatcher.release.clear()
+    await dispatcher.coalescer.submit(_message("running"))
+    await wait_until(lambda: dispatcher.started)
+    await dispatcher.coalescer.submit(IncomingMessage(sender="other", content="waiting"))
+
+    await dispatcher.coalescer.close()
+    dispatcher.release.set()
+    await asyncio.sleep(WINDOW * 2)
+
+    assert dispatcher.started == ["running"]
+    assert dispatcher.finished == []
+
+
+@pytest.mark.asyncio
+async def test_signal_burst_gets_one_reply(
+    signal_server, mock_llm, make_config, test_user_info, running_penny
+):
+    """Two quick Signal messages reach the chat model as one turn."""
+    config = make_config(message_coalesce_seconds=0.3)
+    mock_llm.set_response_handler(
+        lambda request, count: mock_llm._make_text_response(request, "sure, tacos it is! 🌮")
+    )
+
+    async with running_penny(config):
+        await signal_server.push_message(sender=TEST_SENDER, content="dinner idea?")
+        await signal_server.push_message(sender=TEST_SENDER, content="something mexican")
+        response = await signal_server.wait_for_message(timeout=10.0)
+        assert "tacos" in response["message"]
+        await asyncio.sleep(0.5)
+
+    assert len(signal_server.outgoing_messages) == 1
+    assert len(mock_llm.requests) == 1
+    user_turn = mock_llm.requests[0]["messages"][-1]["content"]
+    assert "dinner idea?\nsomething mexican" in user_turn
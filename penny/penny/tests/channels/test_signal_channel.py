@@ -746,3 +746,50 @@ async def test_send_response_attaches_matching_media(signal_server, test_config,
     assert sent.get("base64_attachments") == [expected]
 
     await channel.close()
+
+
+@pytest.mark.asyncio
+async def test_send_response_without_media_when_blob_is_missing(
+    signal_server, test_config, mock_llm
+):
+    """A matched image whose blob is gone from disk is skipped — the reply is
+    still delivered, just without the attachment."""
+    from typing import Any, cast
+    from unittest.mock import MagicMock
+
+    from penny.database.migrate import migrate
+    from penny.llm.embeddings import serialize_embedding
+    from penny.tests.mocks.llm_patches import MockLlmClient
+
+    db = Database(test_config.db_path)
+    db.create_tables()
+    migrate(test_config.db_path)
+    channel = SignalChannel(
+        api_url=test_config.signal_api_url,
+        phone_number=test_config.signal_number or "+15551234567",
+        message_agent=MagicMock(),
+        db=db,
+    )
+    channel._embedding_model_client = cast(Any, MockLlmClient())
+
+    media_id = db.media.put(
+        b"\xff\xd8 jpeg bytes",
+        "image/jpeg",
+        source_url="https://ex.com",
+        title="Ex",
+        embedding=serialize_embedding([1.0, 0.0, 0.0, 0.0]),
+    )
+    media = db.media.get(media_id)
+    assert media is not None
+    db.media.blobs.path(media.sha256).unlink()
+
+    sent_id = await channel.send_response(
+        TEST_SENDER, "tell me about ex", parent_id=None, author="penny"
+    )
+
+    assert sent_id is not None
+    sent = signal_server.outgoing_messages[-1]
+    assert sent["message"] == "tell me about ex"
+    assert not sent.get("base64_attachments")
+
+    await channel.close()
@@ -10,6 +10,7 @@ import pytest
 from penny.commands.email import EmailCommand
 from penny.commands.models import CommandContext
 from penny.config import Config
+from penny.http_transport import HttpTransport
 from penny.jmap.models import EmailAddress, EmailDetail, EmailSummary
 from penny.responses import PennyResponse
 from penny.tests.conftest import TEST_SENDER
@@ -164,7 +165,7 @@ async def test_email_agent_cleanup_on_error(mock_jmap_client, email_context):
 
 @pytest.mark.asyncio
 async def test_email_jmap_client_created_with_token(email_context):
-    """Test that JmapClient is created with the configured token."""
+    """Test that JmapClient is created with the configured token and shared transport."""
     with (
         patch("penny.commands.email.JmapClient") as mock_jmap_cls,
         patch("penny.commands.email.Agent") as mock_agent_cls,
@@ -176,7 +177,8 @@ async def test_email_jmap_client_created_with_token(email_context):
         mock_agent_instance.run.return_value = MagicMock(answer="test")
         mock_agent_cls.return_value = mock_agent_instance
 
-        cmd = EmailCommand(FAKE_TOKEN)
+        transport = HttpTransport()
+        cmd = EmailCommand(FAKE_TOKEN, transport)
         await cmd.execute("anything", email_context)
 
     mock_jmap_cls.assert_called_once_with(
@@ -184,6 +186,7 @@ async def test_email_jmap_client_created_with_token(email_context):
         timeout=30.0,
         max_body_length=4000,
         search_limit=10,
+        transport=transport,
     )
 
 
@@ -159,6 +159,50 @@ async def test_schedule_create_and_list(signal_server, test_config, mock_llm, ru
         await wait_until(lambda: _has_message(signal_server, "1. **daily 9am**: what's the news?"))
 
 
+@pytest.mark.asyncio
+async def test_schedule_parse_escalates_from_small_model(
+    signal_server, make_config, mock_llm, running_penny
+):
+    """/schedule parses on the small model; a reply that isn't a valid schedule
+    is redone on the main model."""
+    config = make_config(llm_small_model="small-model")
+    schedule_json = (
+        '{"timing_description": "daily 9am", '
+        '"prompt_text": "what\'s the news?", '
+        '"cron_expression": "0 9 * * *"}'
+    )
+
+    def handler(request, count):
+        if request["model"] == "small-model":
+            return mock_llm._make_text_response(request, '{"cron_expression": "every day"}')
+        return mock_llm._make_text_response(request, schedule_json)
+
+    mock_llm.set_response_handler(handler)
+
+    async with running_penny(config) as penny:
+        with penny.db.get_session() as session:
+            session.add(
+                UserInfo(
+                    sender=TEST_SENDER,
+                    name="Test User",
+                    location="Seattle",
+                    timezone="America/Los_Angeles",
+                    date_of_birth="1990-01-01",
+                )
+            )
+            session.commit()
+
+        await signal_server.push_message(
+            sender=TEST_SENDER, content="/schedule daily 9am what's the news?"
+        )
+
+        await wait_until(lambda: _has_message(signal_server, "Added daily 9am: what's the news?"))
+        assert [request["model"] for request in mock_llm.requests] == [
+            "small-model",
+            "test-model",
+        ]
+
+
 @pytest.mark.asyncio
 async def test_schedule_delete(signal_server, test_config, mock_llm, running_penny):
     """Test deleting a schedule."""
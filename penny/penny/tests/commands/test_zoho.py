@@ -10,6 +10,7 @@ import pytest
 from penny.commands.models import CommandContext
 from penny.commands.zoho import ZohoCommand
 from penny.config import Config
+from penny.http_transport import HttpTransport
 from penny.jmap.models import EmailAddress, EmailDetail, EmailSummary
 from penny.responses import PennyResponse
 from penny.tests.conftest import TEST_SENDER
@@ -164,7 +165,7 @@ async def test_zoho_agent_cleanup_on_error(mock_zoho_client, zoho_context):
 
 @pytest.mark.asyncio
 async def test_zoho_client_created_with_credentials(zoho_context):
-    """Test that ZohoClient is created with the configured credentials."""
+    """Test that ZohoClient is created with the configured credentials and shared transport."""
     with (
         patch("penny.commands.zoho.ZohoClient") as mock_zoho_cls,
         patch("penny.commands.zoho.Agent") as mock_agent_cls,
@@ -176,7 +177,8 @@ async def test_zoho_client_created_with_credentials(zoho_context):
         mock_agent_instance.run.return_value = MagicMock(answer="test")
         mock_agent_cls.return_value = mock_agent_instance
 
-        cmd = ZohoCommand(FAKE_CLIENT_ID, FAKE_CLIENT_SECRET, FAKE_REFRESH_TOKEN)
+        transport = HttpTransport()
+        cmd = ZohoCommand(FAKE_CLIENT_ID, FAKE_CLIENT_SECRET, FAKE_REFRESH_TOKEN, transport)
         await cmd.execute("anything", zoho_context)
 
     mock_zoho_cls.assert_called_once_with(
@@ -187,4 +189,5 @@ async def test_zoho_client_created_with_credentials(zoho_context):
         max_body_length=4000,
         search_limit=10,
         list_limit=10,
+        transport=transport,
     )
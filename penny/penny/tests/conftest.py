@@ -46,6 +46,12 @@ DEFAULT_TEST_RUNTIME_OVERRIDES: dict[str, int | float] = {
     # Bump every background-agent interval past any test timeout so the
     # scheduler never fires them mid-test.
     "COLLECTOR_TICK_INTERVAL": 99999.0,
+    # No idle-time prefix warming: its probe requests would show up in
+    # tests that count model calls.
+    "PREFIX_WARM_IDLE_SECONDS": 0,
+    # Dispatch each message as it arrives: tests send one message and wait
+    # for its reply, and a coalescing window would only slow them down.
+    "MESSAGE_COALESCE_SECONDS": 0,
 }
 
 
@@ -8,6 +8,7 @@ enforcement, log append, cursor monotonicity, and the similarity-based
 from __future__ import annotations
 
 import asyncio
+import hashlib
 from datetime import UTC, datetime, timedelta
 
 import pytest
@@ -24,6 +25,7 @@ from penny.database.memory import (
     RecallMode,
 )
 from penny.database.memory._similarity import hybrid_rank_ids
+from penny.database.migrate import migrate
 from penny.llm.embeddings import deserialize_embedding, serialize_embedding
 from penny.tools.memory_tools import MemoryMetadataTool
 
@@ -754,6 +756,66 @@ class TestReads:
         assert db.memories.memory("likes").keys() == ["first", "second"]
 
 
+class TestEntrySearch:
+    """Entry search through the ``memory_entry_fts`` index (migration 0080)."""
+
+    @staticmethod
+    def _db(tmp_path) -> Database:
+        db = _make_db(tmp_path)
+        migrate(str(tmp_path / "test.db"))
+        db.memories.create_collection("gear", "x", Inclusion.RELEVANT, RecallMode.RELEVANT)
+        db.memories.create_collection("records", "x", Inclusion.RELEVANT, RecallMode.RELEVANT)
+        db.memories.memory("gear").write(
+            [
+                EntryInput(key="coffee grinder", content="burr grinder, 40mm steel burrs"),
+                EntryInput(key="kettle", content="gooseneck, temperature control"),
+            ],
+            author="chat",
+        )
+        db.memories.memory("records").write(
+            [EntryInput(key="music", content="late-night jazz")], author="chat"
+        )
+        return db
+
+    def test_words_match_as_prefixes(self, tmp_path):
+        db = self._db(tmp_path)
+
+        assert db.memories.names_with_entry_match("grind") == {"gear"}
+        assert db.memories.names_with_entry_match("gooseneck temp") == {"gear"}
+        assert db.memories.names_with_entry_match("jaz") == {"records"}
+        hits = db.memories.memory("gear").newest_entries(search="grind")
+        assert [e.key for e in hits] == ["coffee grinder"]
+
+    def test_mid_word_substrings_no_longer_match(self, tmp_path):
+        """The index matches word prefixes only — the old ``LIKE '%rind%'``
+        found "grinder"; the full-text search deliberately doesn't."""
+        db = self._db(tmp_path)
+
+        assert db.memories.names_with_entry_match("rind") == set()
+        assert db.memories.memory("gear").newest_entries(search="rind") == []
+
+    @pytest.mark.parametrize(
+        ("search", "expected"),
+        [
+            ('"grinder', {"gear"}),
+            ("grinder*", {"gear"}),
+            ("(burr) -steel", {"gear"}),
+            ("NOT jazz", set()),
+            ("jazz OR (", set()),
+            ("key:music", set()),
+            ('^-+*"', set()),
+        ],
+    )
+    def test_fts_operator_characters_are_plain_text(self, tmp_path, search, expected):
+        """Quotes, stars, parentheses and keywords are words or dropped, never
+        FTS5 syntax — so user text can't raise a query error."""
+        db = self._db(tmp_path)
+
+        assert db.memories.names_with_entry_match(search) == expected
+        hits = db.memories.memory("gear").newest_entries(search=search)
+        assert bool(hits) == ("gear" in expected)
+
+
 class TestExists:
     def test_exists_by_exact_key(self, tmp_path):
         db = _make_db(tmp_path)
@@ -830,7 +892,7 @@ class TestMediaStore:
         entry = db.media.get(media_id)
 
         assert entry is not None
-        assert entry.data == b"binary payload"
+        assert db.media.read(entry) == b"binary payload"
         assert entry.mime_type == "image/png"
         assert entry.source_url == "https://x.test/a.png"
         assert entry.title == "A Page"
@@ -841,6 +903,26 @@ class TestMediaStore:
         db = _make_db(tmp_path)
         assert db.media.get(99999) is None
 
+    def test_blobs_are_content_addressed_and_collected(self, tmp_path):
+        """Bytes live on disk under their sha256, identical images share one
+        file, and garbage collection removes only unreferenced files."""
+        db = _make_db(tmp_path)
+        first = db.media.get(db.media.put(b"same", "image/png"))
+        second = db.media.get(db.media.put(b"same", "image/png"))
+        assert first is not None and second is not None
+        assert first.sha256 == second.sha256 == hashlib.sha256(b"same").hexdigest()
+        assert first.size == 4
+        blob = db.media.blobs.path(first.sha256)
+        assert blob.read_bytes() == b"same"
+        with db.media.open(first) as data:
+            assert bytes(data) == b"same"
+
+        orphan = db.media.blobs.path(db.media.blobs.put(b"orphan"))
+        leftover = blob.parent / ".tmp-interrupted"
+        leftover.write_bytes(b"partial")
+        assert db.media.collect_garbage() == 2
+        assert blob.exists() and not orphan.exists() and not leftover.exists()
+
     def _put(self, db, data, url, vector=None):
         return db.media.put(
             data,
@@ -861,7 +943,7 @@ class TestMediaStore:
         match = db.media.select_image(["https://cited.test/p."], [1.0, 0.0])
         assert match is not None
         assert match.id == newest
-        assert match.data == b"new"
+        assert db.media.read(match) == b"new"
 
     def test_select_image_exact_url_works_without_embedding(self, tmp_path):
         """Tier 1 needs no embedding — the cited page's image attaches even when
@@ -915,6 +997,28 @@ class TestMediaStore:
         match = db.media.select_image([], [0.0, 1.0])  # orthogonal
         assert match is not None and match.id == only
 
+    def test_select_image_vector_cache_sees_new_media(self, tmp_path, monkeypatch):
+        """The cached vector matrix is rebuilt after ``put`` — an image stored
+        after a lookup is a candidate for the next one."""
+        db = _make_db(tmp_path)
+        monkeypatch.setattr("penny.database.media_store.random.choice", lambda pool: pool[0])
+        first = self._put(db, b"a", "https://a.test", [0.0, 1.0])
+        match = db.media.select_image([], [1.0, 0.0])
+        assert match is not None and match.id == first
+        closer = self._put(db, b"b", "https://b.test", [1.0, 0.0])
+        match = db.media.select_image([], [1.0, 0.0])
+        assert match is not None and match.id == closer
+
+    def test_select_image_skips_other_dimensions_and_empty_embeddings(self, tmp_path):
+        """Images embedded by a different model (another dimension) or with an
+        empty blob aren't candidates — the rest are still scored."""
+        db = _make_db(tmp_path)
+        self._put(db, b"wide", "https://a.test", [1.0, 0.0, 0.0])
+        db.media.put(b"empty", "image/png", source_url="https://b.test", embedding=b"")
+        match_2d = self._put(db, b"narrow", "https://c.test", [0.0, 1.0])
+        match = db.media.select_image([], [1.0, 0.0])
+        assert match is not None and match.id == match_2d
+
     def test_select_image_none_when_no_url_match_and_no_embedded_media(self, tmp_path):
         db = _make_db(tmp_path)
         self._put(db, b"a", "https://a.test")  # no embedding
@@ -1,5 +1,6 @@
 """Tests for the database migration system."""
 
+import hashlib
 import importlib.util
 import sqlite3
 from pathlib import Path
@@ -80,7 +81,7 @@ class TestMigrate:
         conn.close()
 
         count = migrate(db_path)
-        assert count == 74
+        assert count == 83
 
         conn = sqlite3.connect(db_path)
         tables = {
@@ -120,7 +121,7 @@ class TestMigrate:
 
         count1 = migrate(db_path)
         count2 = migrate(db_path)
-        assert count1 == 74
+        assert count1 == 83
         assert count2 == 0
 
     def test_tracks_in_migrations_table(self, tmp_path):
@@ -158,8 +159,8 @@ class TestMigrate:
         conn.close()
 
         count = migrate(db_path)
-        # 0001 is skipped; 0002 through 0074 run = 73 migrations
-        assert count == 73
+        # 0001 is skipped; 0002 through 0083 run = 82 migrations
+        assert count == 82
 
     def test_bootstrap_with_tables_already_present(self, tmp_path):
         """If tables already exist (from SQLModel.create_tables), migration should succeed."""
@@ -185,7 +186,7 @@ class TestMigrate:
         conn.close()
 
         count = migrate(db_path)
-        assert count == 74  # all migrations applied
+        assert count == 83  # all migrations applied
 
         conn = sqlite3.connect(db_path)
         cursor = conn.execute("SELECT name FROM _migrations")
@@ -733,3 +734,136 @@ class TestMigrate:
         # 1 (clean) and 2 (ordinary trailing ellipsis) survive; 3/4/5 (poison in
         # content or key) are deleted.
         assert surviving == {1, 2}
+
+    def test_0080_indexes_memory_entries_and_tracks_writes(self, tmp_path):
+        """Migration 0080 backfills memory_entry_fts from existing entries, and
+        its triggers keep the index in step with inserts, edits and deletes."""
+        db_path = str(tmp_path / "test.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE memory_entry (id INTEGER PRIMARY KEY, memory_name TEXT, "
+            "key TEXT, content TEXT, embedding BLOB)"
+        )
+        conn.execute(
+            "INSERT INTO memory_entry (id, memory_name, key, content) "
+            "VALUES (1, 'gear', 'grinder', 'Niche Zero burr grinder')"
+        )
+        conn.commit()
+        conn.close()
+
+        migration_path = (
+            Path(__file__).parents[3]
+            / "penny"
+            / "database"
+            / "migrations"
+            / "0080_memory_entry_fts.py"
+        )
+        spec = importlib.util.spec_from_file_location("m0080", migration_path)
+        assert spec is not None
+        mod = importlib.util.module_from_spec(spec)
+        assert spec.loader is not None
+        spec.loader.exec_module(mod)  # type: ignore[attr-defined]
+
+        conn = sqlite3.connect(db_path)
+        mod.up(conn)
+
+        def matches(query: str) -> set[int]:
+            sql = "SELECT rowid FROM memory_entry_fts WHERE memory_entry_fts MATCH ?"
+            return {row[0] for row in conn.execute(sql, (query,)).fetchall()}
+
+        assert matches("nich*") == {1}  # backfilled, prefix-matched
+        conn.execute(
+            "INSERT INTO memory_entry (id, memory_name, key, content) "
+            "VALUES (2, 'gear', 'machine', 'Gaggia Classic')"
+        )
+        conn.execute("UPDATE memory_entry SET content = 'Lagom P64' WHERE id = 1")
+        conn.execute("UPDATE memory_entry SET embedding = x'00' WHERE id = 2")
+        assert matches("gaggia") == {2}
+        assert matches("niche") == set()
+        assert matches("lagom") == {1}
+        assert matches("grinder") == {1}  # the key is indexed too
+        conn.execute("DELETE FROM memory_entry WHERE id = 2")
+        assert matches("gaggia") == set()
+        conn.close()
+
+    def test_0082_backfills_media_url_and_domain(self, tmp_path):
+        """Migration 0082 adds the egress lookup keys and fills them from each
+        existing row's source_url the way MediaStore.put does."""
+        db_path = str(tmp_path / "test.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE media (id INTEGER PRIMARY KEY, mime_type TEXT, data BLOB, "
+            "source_url TEXT, title TEXT, embedding BLOB, created_at TEXT)"
+        )
+        conn.execute(
+            "INSERT INTO media (id, mime_type, data, source_url) VALUES "
+            "(1, 'image/png', x'00', 'https://WWW.Example.com/Page.'), "
+            "(2, 'image/png', x'00', NULL)"
+        )
+        conn.commit()
+        conn.close()
+
+        migration_path = (
+            Path(__file__).parents[3]
+            / "penny"
+            / "database"
+            / "migrations"
+            / "0082_media_url_and_domain_index.py"
+        )
+        spec = importlib.util.spec_from_file_location("m0082", migration_path)
+        assert spec is not None
+        mod = importlib.util.module_from_spec(spec)
+        assert spec.loader is not None
+        spec.loader.exec_module(mod)  # type: ignore[attr-defined]
+
+        conn = sqlite3.connect(db_path)
+        mod.up(conn)
+        rows = conn.execute("SELECT id, normalized_url, domain FROM media ORDER BY id").fetchall()
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(media)").fetchall()}
+        conn.close()
+
+        assert rows == [(1, "https://www.example.com/page", "example.com"), (2, None, None)]
+        assert {"ix_media_normalized_url", "ix_media_domain"} <= indexes
+
+    def test_0083_externalizes_media_blobs(self, tmp_path):
+        """Migration 0083 writes each row's bytes to the blob store beside the
+        database (identical bytes once), records sha256 + size, and drops the
+        data column."""
+        db_path = str(tmp_path / "test.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE media (id INTEGER PRIMARY KEY, mime_type TEXT, data BLOB NOT NULL, "
+            "source_url TEXT, title TEXT, embedding BLOB, created_at TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO media (id, mime_type, data) VALUES (?, 'image/png', ?)",
+            [(1, b"pixels"), (2, b"pixels"), (3, b"other")],
+        )
+        conn.commit()
+        conn.close()
+
+        migration_path = (
+            Path(__file__).parents[3]
+            / "penny"
+            / "database"
+            / "migrations"
+            / "0083_externalize_media_blobs.py"
+        )
+        spec = importlib.util.spec_from_file_location("m0083", migration_path)
+        assert spec is not None
+        mod = importlib.util.module_from_spec(spec)
+        assert spec.loader is not None
+        spec.loader.exec_module(mod)  # type: ignore[attr-defined]
+
+        conn = sqlite3.connect(db_path)
+        mod.up(conn)
+        rows = conn.execute("SELECT id, sha256, size FROM media ORDER BY id").fetchall()
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(media)").fetchall()}
+        conn.close()
+
+        pixels = hashlib.sha256(b"pixels").hexdigest()
+        assert rows[:2] == [(1, pixels, 6), (2, pixels, 6)]
+        assert "data" not in columns
+        blob_dir = tmp_path / "media"
+        assert (blob_dir / pixels[:2] / pixels).read_bytes() == b"pixels"
+        assert len([path for path in blob_dir.rglob("*") if path.is_file()]) == 2
@@ -17,6 +17,7 @@ import re
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from math import ceil
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -76,6 +77,8 @@ class _Perf:
     output_tokens: int = 0
     thinking_chars: int = 0
     output_chars: int = 0
+    aborted_tokens: int = 0
+    budget_hits: int = 0
 
     def add(self, perf: PromptPerf) -> None:
         self.calls += perf.calls
@@ -84,6 +87,8 @@ class _Perf:
         self.output_tokens += perf.output_tokens
         self.thinking_chars += perf.thinking_chars
         self.output_chars += perf.output_chars
+        self.aborted_tokens += perf.aborted_tokens
+        self.budget_hits += perf.budget_hits
 
     def report(self, case_id: str, samples: int) -> None:
         if not self.calls:
@@ -102,19 +107,26 @@ class _Perf:
             f"{seconds:.1f}s wall · {per_call_ms:.0f}ms/call · "
             f"{self.input_tokens} in / {self.output_tokens} out tok "
             f"({reasoning_tokens} reasoning, {share * 100:.0f}%) · "
-            f"{tokens_per_second:.1f} end-to-end tok/s"
+            f"{tokens_per_second:.1f} end-to-end tok/s · "
+            f"{self.aborted_tokens} tok aborted as degenerate · "
+            f"{self.budget_hits} calls hit their token budget"
         )
 
 
 def _real_model_config(
-    make_config: Callable[..., Config], *, signal_api_url: str, db_path: str
+    make_config: Callable[..., Config],
+    *,
+    signal_api_url: str,
+    db_path: str,
+    overrides: dict[str, Any] | None = None,
 ) -> Config:
     """A test Config pointed at the real Ollama text + embedding models.
 
     Reads endpoint/model from the environment so the same suite runs on the
     host (localhost) and inside the penny container (host.docker.internal),
     falling back to local defaults.  ``signal_api_url`` binds to the sample's
-    own mock server so samples never share a channel.
+    own mock server so samples never share a channel.  ``overrides`` are extra
+    ``make_config`` settings (config fields or runtime params) for the case.
     """
     return make_config(
         signal_api_url=signal_api_url,
@@ -122,6 +134,7 @@ def _real_model_config(
         llm_api_url=os.environ.get("LLM_API_URL", "http://localhost:11434"),
         llm_embedding_model=os.environ.get("LLM_EMBEDDING_MODEL", "embeddinggemma"),
         db_path=db_path,
+        **(overrides or {}),
     )
 
 
@@ -431,6 +444,7 @@ def collector_eval(make_config: Callable[..., Config], tmp_path) -> CollectorEva
     input logs/entries), embeddings backfill, then ``run_for`` executes the real
     cycle against the real model.  The scorer reads persisted state, the pre-cycle
     snapshot, and any messages the cycle sent the user (captured off the server).
+    ``overrides`` runs the case under other settings (e.g. ``LLM_BUDGETS``).
     """
 
     async def _run(
@@ -443,6 +457,7 @@ def collector_eval(make_config: Callable[..., Config], tmp_path) -> CollectorEva
         browse: list[CannedPage] | None = None,
         samples: int = SAMPLES,
         min_pass_rate: float | None = 0.75,
+        overrides: dict[str, Any] | None = None,
     ) -> None:
         results: list[SampleResult] = []
         perf = _Perf()
@@ -454,6 +469,7 @@ def collector_eval(make_config: Callable[..., Config], tmp_path) -> CollectorEva
                     make_config,
                     signal_api_url=f"http://localhost:{server.port}",
                     db_path=str(tmp_path / f"{case_id}-{sample_index}.db"),
+                    overrides=overrides,
                 )
                 async with run_penny_with_server(config, server) as penny:
                     seed_user(penny.db)
@@ -820,7 +836,7 @@ def startup_eval(make_config: Callable[..., Config], tmp_path) -> StartupEval:
                     prior = os.environ.get("GIT_COMMIT_MESSAGE")
                     os.environ["GIT_COMMIT_MESSAGE"] = commit_message
                     try:
-                        announcement = await get_restart_message(penny.model_client)
+                        announcement = await get_restart_message(penny.model_tiers)
                     finally:
                         if prior is None:
                             os.environ.pop("GIT_COMMIT_MESSAGE", None)
@@ -0,0 +1,94 @@
+"""Generation-budget comparison — the same collector cases under each
+``LLM_BUDGETS`` level, so quality and decode time can be read side by side.
+
+  budget-<level>-extract-likes      a like in the user-messages log → an entry
+  budget-<level>-extract-knowledge  a browsed page → a knowledge summary
+
+Each level runs the cases report-only: the RESULT line is the quality at that
+budget and the PERF line its wall time, reasoning share and budget hits.  A
+level worth shipping keeps the pass rate of ``default`` while cutting the
+wall time; pick it from the printout, then set ``LLM_BUDGETS`` to match.
+"""
+
+from __future__ import annotations
+
+from typing import cast
+
+import pytest
+
+from penny.constants import PennyConstants
+from penny.database import Database
+from penny.database.memory import LogEntryInput
+from penny.tests.eval.conftest import collection_entries, tool_was_called
+from penny.tests.eval.fixtures import KNOWLEDGE_PAGE_CONTENT
+
+pytestmark = pytest.mark.eval
+
+# Level name → LLM_BUDGETS value for the collector.
+BUDGET_LEVELS = {
+    "default": "",
+    "low": "collector=low",
+    "low-2k": "collector=low:2048",
+    "medium-4k": "collector=medium:4096",
+    "high": "collector=high",
+}
+
+
+def _seed_like(db: Database) -> None:
+    db.messages.log_message(
+        PennyConstants.MessageDirection.INCOMING,
+        "user",
+        "honestly i've been obsessed with single-origin pour-over coffee lately",
+    )
+
+
+def _seed_page(db: Database) -> None:
+    db.memory(PennyConstants.MEMORY_BROWSE_RESULTS_LOG).append(
+        [LogEntryInput(content=KNOWLEDGE_PAGE_CONTENT)], author="chat"
+    )
+
+
+def _snapshot(name: str):
+    def _take(db: Database) -> dict[str, str]:
+        return collection_entries(db, name)
+
+    return _take
+
+
+def _score_new_entry(name: str):
+    def _score(db: Database, before: object, sent: list[str]) -> list[str]:
+        before_entries = cast("dict[str, str]", before)
+        fails = []
+        if not set(collection_entries(db, name)) - set(before_entries):
+            fails.append(f"expected a new {name!r} entry, none added")
+        if not tool_was_called(db, "done"):
+            fails.append("cycle did not close with done()")
+        return fails
+
+    return _score
+
+
+@pytest.mark.parametrize("level", list(BUDGET_LEVELS))
+async def test_budget_extract_likes(collector_eval, level: str) -> None:
+    await collector_eval(
+        case_id=f"budget-{level}-extract-likes",
+        collection="likes",
+        seed=_seed_like,
+        snapshot=_snapshot("likes"),
+        score=_score_new_entry("likes"),
+        min_pass_rate=None,
+        overrides={"LLM_BUDGETS": BUDGET_LEVELS[level]},
+    )
+
+
+@pytest.mark.parametrize("level", list(BUDGET_LEVELS))
+async def test_budget_extract_knowledge(collector_eval, level: str) -> None:
+    await collector_eval(
+        case_id=f"budget-{level}-extract-knowledge",
+        collection="knowledge",
+        seed=_seed_page,
+        snapshot=_snapshot("knowledge"),
+        score=_score_new_entry("knowledge"),
+        min_pass_rate=None,
+        overrides={"LLM_BUDGETS": BUDGET_LEVELS[level]},
+    )
@@ -0,0 +1,68 @@
+"""Content-cleaner benchmark over a saved corpus of raw browser pages.
+
+Point ``PAGE_CORPUS_DIR`` at a directory of raw extension output — one page
+per file, exactly as the browser returns it (``Title: …`` / ``URL: …``
+header, then the Turndown markdown).  The case cleans every page, prints
+throughput and the raw → cleaned byte ratio per domain, and asserts only
+that it ran: it measures, it does not gate.  Domains near 1.0 with bulky
+pages are where to look for new cruft patterns.
+
+Marked ``eval`` so it runs only under ``make eval``; skipped without a corpus.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import urllib.parse
+from pathlib import Path
+
+import pytest
+
+from penny.constants import PennyConstants
+from penny.tools.content_cleaning import DomainRatios, clean_browser_content, domain_ratios
+
+pytestmark = pytest.mark.eval
+
+_CORPUS_DIR = os.environ.get("PAGE_CORPUS_DIR", "")
+# Passes over the corpus — enough to swamp timer noise on small corpora.
+_ROUNDS = int(os.environ.get("PAGE_CORPUS_ROUNDS", "5"))
+
+
+def _domain(page: str) -> str:
+    """The host from the page's ``URL:`` header line, if it has one."""
+    for line in page.split("\n", 3)[:3]:
+        if line.startswith(PennyConstants.BROWSE_URL_PREFIX):
+            url = line[len(PennyConstants.BROWSE_URL_PREFIX) :].strip()
+            return urllib.parse.urlsplit(url).hostname or ""
+    return ""
+
+
+@pytest.mark.skipif(not _CORPUS_DIR, reason="PAGE_CORPUS_DIR not set")
+def test_content_cleaning_bench() -> None:
+    pages = [
+        (_domain(text), text)
+        for path in sorted(Path(_CORPUS_DIR).iterdir())
+        if path.is_file()
+        for text in [path.read_text(encoding="utf-8", errors="replace")]
+    ]
+    assert pages, f"no pages in {_CORPUS_DIR}"
+    raw_bytes = sum(len(text.encode()) for _, text in pages)
+
+    started = time.perf_counter()
+    for _ in range(_ROUNDS):
+        for domain, text in pages:
+            clean_browser_content(text, domain)
+    elapsed = time.perf_counter() - started
+
+    ratios = DomainRatios()
+    for domain, text in pages:
+        ratios.record(domain, len(text.encode()), len(clean_browser_content(text).encode()))
+    per_page_ms = elapsed / (_ROUNDS * len(pages)) * 1000
+    print(
+        f"\nCLEAN {len(pages)} pages, {raw_bytes / 1e6:.1f} MB: "
+        f"{per_page_ms:.2f} ms/page, {raw_bytes * _ROUNDS / elapsed / 1e6:.0f} MB/s"
+    )
+    for domain, raw, cleaned, ratio in ratios.table():
+        print(f"  {domain or '(no URL)':40} {raw:>10} -> {cleaned:>10} bytes  {ratio:6.1%}")
+    assert domain_ratios.table()
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import json
+import re
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
 import pytest
+from openai.types.chat import ChatCompletionChunk
 
 from penny.llm.models import LlmMessage, LlmResponse, LlmToolCall, LlmToolCallFunction
 
@@ -57,9 +60,11 @@ class MockLlmClient:
         agent_name: str | None = None,
         prompt_type: str | None = None,
         run_id: str | None = None,
+        budget: dict[str, Any] | None = None,
     ) -> LlmResponse:
-        """Mock chat() call."""
-        request_data = {"model": self.model, "messages": messages, "tools": tools}
+        """Mock chat() call.  ``budget`` carries the wire request's
+        ``reasoning_effort`` / ``max_tokens``, when it set them."""
+        request_data = {"model": self.model, "messages": messages, "tools": tools, **(budget or {})}
         self.requests.append(request_data)
         self._request_count += 1
 
@@ -189,8 +194,11 @@ def mock_llm(monkeypatch: pytest.MonkeyPatch) -> MockLlmClient:
             model = kwargs.get("model", _mock_client.model)
             old_model = _mock_client.model
             _mock_client.model = model
-            response = await _mock_client.chat(messages=messages, tools=tools)
+            budget = {k: kwargs[k] for k in ("reasoning_effort", "max_tokens") if k in kwargs}
+            response = await _mock_client.chat(messages=messages, tools=tools, budget=budget)
             _mock_client.model = old_model
+            if kwargs.get("stream"):
+                return _FakeStream(response)
             return _FakeCompletion(response)
 
         @property
@@ -248,6 +256,7 @@ class _FakeChoice:
 
     def __init__(self, response: LlmResponse):
         self.message = _FakeMessage(response)
+        self.finish_reason = "tool_calls" if response.has_tool_calls else "stop"
 
 
 class _FakeMessage:
@@ -270,8 +279,6 @@ class _FakeToolCall:
     """Wraps an LlmToolCall to look like an OpenAI tool call."""
 
     def __init__(self, tool_call: Any):
-        import json
-
         self.id = tool_call.id
         self.type = "function"
         self.function = type(
@@ -282,3 +289,54 @@ class _FakeToolCall:
                 "arguments": json.dumps(tool_call.function.arguments),
             },
         )()
+
+
+class _FakeStream:
+    """Replays an LlmResponse as ``ChatCompletionChunk``s, like a streamed create().
+
+    Reasoning first, then the content a word at a time, then each tool call
+    whole, then a finish chunk — the order a streaming server decodes them in.
+    """
+
+    def __init__(self, response: LlmResponse):
+        self._chunks = _stream_chunks(response)
+        self.closed = False
+
+    def __aiter__(self) -> AsyncIterator[ChatCompletionChunk]:
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[ChatCompletionChunk]:
+        for chunk in self._chunks:
+            if self.closed:
+                return
+            yield chunk
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _stream_chunks(response: LlmResponse) -> list[ChatCompletionChunk]:
+    """Split an LlmResponse into the delta chunks a server would stream."""
+    deltas: list[dict[str, Any]] = [{"role": "assistant"}]
+    if response.message.thinking:
+        deltas.append({"reasoning_content": response.message.thinking})
+    deltas.extend({"content": word} for word in re.findall(r"\S+\s*", response.content))
+    for index, call in enumerate(response.message.tool_calls or []):
+        function = {"name": call.function.name, "arguments": json.dumps(call.function.arguments)}
+        tool_call = {"index": index, "id": call.id, "type": "function", "function": function}
+        deltas.append({"tool_calls": [tool_call]})
+    finish = "tool_calls" if response.has_tool_calls else "stop"
+    choices = [[{"index": 0, "delta": delta, "finish_reason": None}] for delta in deltas]
+    choices.append([{"index": 0, "delta": {}, "finish_reason": finish}])
+    return [
+        ChatCompletionChunk.model_validate(
+            {
+                "id": "chatcmpl-mock",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": response.model or "test-model",
+                "choices": choice,
+            }
+        )
+        for choice in choices
+    ]
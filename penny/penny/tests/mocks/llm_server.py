@@ -0,0 +1,138 @@
+"""Mock OpenAI-compatible inference server for LLM client tests."""
+
+import asyncio
+import json
+import re
+import time
+
+from aiohttp import web
+
+
+class MockLlmServer:
+    """Minimal ``/v1/chat/completions`` + ``/v1/embeddings`` server.
+
+    Replies with a fixed ``reply`` text (prefixed by ``name`` so tests can tell
+    which server answered), optionally after ``delay`` seconds, or with
+    ``fail_status`` instead.  Streamed requests are answered as SSE chunks.
+
+    Also plays a single-GPU Ollama host: one model ``loaded`` at a time, a
+    request for another costs ``load_delay`` seconds and evicts it, and
+    ``/api/ps`` (404 unless ``has_ps``) and keep-alive ``/api/generate`` /
+    ``/api/embed`` calls work as Ollama's do.
+    """
+
+    def __init__(self, name: str, reply: str = "hello from") -> None:
+        self.name = name
+        self.reply = f"{reply} {name}"
+        self.delay = 0.0
+        self.fail_status: int | None = None
+        self.requests: list[dict] = []
+        self.load_delay = 0.0
+        self.loaded: list[str] = []
+        self.has_ps = True
+        self.keep_alive_calls: list[dict] = []
+        self.keep_alive_paths: list[str] = []
+        self.keep_alive_status: int | None = None
+        self._runner: web.AppRunner | None = None
+        self.port: int | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://localhost:{self.port}"
+
+    async def start(self) -> None:
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self._handle_chat)
+        app.router.add_post("/v1/embeddings", self._handle_embeddings)
+        app.router.add_get("/api/ps", self._handle_ps)
+        app.router.add_post("/api/generate", self._handle_keep_alive)
+        app.router.add_post("/api/embed", self._handle_keep_alive)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "localhost", 0)
+        await site.start()
+        assert site._server is not None
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        if self._runner:
+            await self._runner.cleanup()
+
+    async def _handle_chat(self, request: web.Request) -> web.StreamResponse:
+        body = await request.json()
+        self.requests.append(body)
+        await self._load(body["model"])
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail_status is not None:
+            return web.json_response({"error": {"message": "unavailable"}}, status=self.fail_status)
+        if body.get("stream"):
+            return await self._stream_reply(request, body["model"])
+        # One word per token: a reply longer than max_tokens stops at the cap.
+        words = re.findall(r"\S+\s*", self.reply)
+        max_tokens = body.get("max_tokens")
+        finish_reason = "stop"
+        if max_tokens is not None and len(words) > max_tokens:
+            words, finish_reason = words[:max_tokens], "length"
+        message = {"role": "assistant", "content": "".join(words)}
+        return web.json_response(
+            self._completion(body["model"], message, "chat.completion", finish_reason=finish_reason)
+        )
+
+    async def _stream_reply(self, request: web.Request, model: str) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        words = re.findall(r"\S+\s*", self.reply)
+        deltas = [{"role": "assistant"}, *({"content": word} for word in words)]
+        for delta in deltas:
+            chunk = self._completion(model, delta, "chat.completion.chunk", key="delta")
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    @staticmethod
+    def _completion(
+        model: str, message: dict, kind: str, key: str = "message", finish_reason: str = "stop"
+    ) -> dict:
+        return {
+            "id": "chatcmpl-mock",
+            "object": kind,
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, key: message, "finish_reason": finish_reason}],
+        }
+
+    async def _handle_embeddings(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        self.requests.append(body)
+        await self._load(body["model"])
+        texts = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        data = [
+            {"object": "embedding", "index": index, "embedding": [1.0, 0.0]}
+            for index in range(len(texts))
+        ]
+        return web.json_response({"object": "list", "data": data, "model": body["model"]})
+
+    async def _load(self, model: str) -> None:
+        if model in self.loaded:
+            return
+        await asyncio.sleep(self.load_delay)
+        self.loaded = [model]
+
+    async def _handle_ps(self, request: web.Request) -> web.Response:
+        if not self.has_ps:
+            return web.json_response({"error": "not found"}, status=404)
+        return web.json_response({"models": [{"name": m, "model": m} for m in self.loaded]})
+
+    async def _handle_keep_alive(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        self.keep_alive_calls.append({"model": body["model"], "keep_alive": body["keep_alive"]})
+        self.keep_alive_paths.append(request.path)
+        if self.keep_alive_status is not None:
+            return web.json_response({"error": "keep_alive failed"}, status=self.keep_alive_status)
+        if body["keep_alive"] == 0:
+            self.loaded = [m for m in self.loaded if m != body["model"]]
+        else:
+            await self._load(body["model"])
+        return web.json_response({"model": body["model"], "done": True})
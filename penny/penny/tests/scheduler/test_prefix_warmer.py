@@ -0,0 +1,101 @@
+"""Tests for PrefixWarmer — idle-time re-warming of the chat prompt prefix.
+
+The warmer compares the chat agent's current prefix (system prompt + tools)
+with the one the model client last sent, and re-sends it with
+``max_tokens=1`` when they differ or the model has sat unused too long — but
+only while the user has been around recently.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from penny.database.memory import Inclusion, RecallMode
+from penny.tests.conftest import TEST_SENDER, wait_until
+
+
+@pytest.mark.asyncio
+async def test_cold_prefix_is_warmed_once_then_left_alone(
+    mock_llm, make_config, test_user_info, running_penny
+):
+    """A never-warmed prefix gets a cold + warm probe pair; a second check
+    with nothing changed sends nothing."""
+    config = make_config(PREFIX_WARM_IDLE_SECONDS=600)
+
+    async with running_penny(config) as penny:
+        assert await penny.prefix_warmer.execute()
+        assert len(mock_llm.requests) == 2
+        cold, warm = mock_llm.requests
+        assert cold["messages"][0] == warm["messages"][0]
+        assert cold["messages"][0]["role"] == "system"
+        assert cold["tools"]
+
+        assert not await penny.prefix_warmer.execute()
+        assert len(mock_llm.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_prefix_drift_and_idle_trigger_rewarm(
+    signal_server, mock_llm, make_config, test_user_info, running_penny
+):
+    """A chat turn moves the inventory's message counts and a new memory adds
+    an inventory line — either drift re-warms the prefix, as does a model left
+    idle past ``PREFIX_WARM_IDLE_SECONDS``."""
+    config = make_config(PREFIX_WARM_IDLE_SECONDS=600)
+    mock_llm.set_default_flow(final_response="sure thing")
+
+    async with running_penny(config) as penny:
+        await signal_server.push_message(sender=TEST_SENDER, content="hello")
+        await signal_server.wait_for_message(timeout=5.0)
+        await wait_until(lambda: not penny.scheduler._foreground_active)
+
+        assert await penny.prefix_warmer.execute()
+        assert "user-messages (log, 1 entries)" in mock_llm.requests[-1]["messages"][0]["content"]
+        assert not await penny.prefix_warmer.execute()
+
+        penny.db.memories.create_collection(
+            "gadgets", "gadgets to look at", Inclusion.ALWAYS, RecallMode.ALL
+        )
+        sent = len(mock_llm.requests)
+        assert await penny.prefix_warmer.execute()
+        assert "gadgets" in mock_llm.requests[-1]["messages"][0]["content"]
+        assert len(mock_llm.requests) == sent + 2
+
+        penny.model_client._last_request_at -= 600
+        assert await penny.prefix_warmer.execute()
+        assert len(mock_llm.requests) == sent + 4
+
+
+@pytest.mark.asyncio
+async def test_warming_stops_once_the_user_has_been_away(
+    mock_llm, make_config, test_user_info, running_penny
+):
+    """Past ``PREFIX_WARM_WINDOW_SECONDS`` since the user's last message a cold
+    prefix is left cold; a new message brings warming back."""
+    config = make_config(PREFIX_WARM_IDLE_SECONDS=600, PREFIX_WARM_WINDOW_SECONDS=1800)
+
+    async with running_penny(config) as penny:
+        penny.scheduler._last_message_time -= 1800
+        assert not await penny.prefix_warmer.execute()
+        assert mock_llm.requests == []
+
+        penny.scheduler.notify_message()
+        assert await penny.prefix_warmer.execute()
+        assert len(mock_llm.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_probe_carries_chat_reasoning_effort(
+    mock_llm, make_config, test_user_info, running_penny
+):
+    """gpt-oss renders the reasoning effort into the system message, so the
+    probe sends chat's — otherwise the warmed prefix never matches a real turn."""
+    config = make_config(PREFIX_WARM_IDLE_SECONDS=600, LLM_BUDGETS="chat=low")
+
+    async with running_penny(config) as penny:
+        assert await penny.prefix_warmer.execute()
+        assert [r.get("reasoning_effort") for r in mock_llm.requests] == ["low", "low"]
+        assert [r["max_tokens"] for r in mock_llm.requests] == [1, 1]
+        # The fingerprint the probe left matches the one the warmer expects
+        # under chat's effort — the prefix now counts as warm.
+        assert not await penny.prefix_warmer.execute()
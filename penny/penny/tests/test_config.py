@@ -1,6 +1,7 @@
 """Tests for ``Config.load()`` env-var → ``Config`` field wiring."""
 
 import httpx
+import pytest
 
 from penny.config import Config
 from penny.constants import PennyConstants
@@ -62,3 +63,27 @@ class TestLlmTimeoutEnvWiring:
         # the read deadline is 600s, not our caller-supplied number.
         timeout_obj = client.client.timeout
         assert timeout_obj.read == 600.0
+
+
+class TestLlmUrlValidation:
+    """LLM URL settings that name no endpoint fail at load, naming the setting."""
+
+    @pytest.mark.parametrize(
+        ("key", "value"),
+        [("LLM_API_URL", ""), ("LLM_API_URL", " , "), ("LLM_EMBEDDING_API_URL", ",")],
+    )
+    def test_url_setting_without_a_url_is_rejected(self, monkeypatch, key, value):
+        monkeypatch.setenv("SIGNAL_NUMBER", "+15551234567")
+        monkeypatch.setenv(key, value)
+
+        with pytest.raises(ValueError, match=key):
+            Config.load()
+
+    def test_empty_optional_url_falls_back(self, monkeypatch):
+        monkeypatch.setenv("SIGNAL_NUMBER", "+15551234567")
+        monkeypatch.setenv("LLM_VISION_API_URL", "")
+        monkeypatch.setenv("LLM_API_URL", "http://a:11434, http://b:11434")
+
+        config = Config.load()
+
+        assert config.llm_api_url == "http://a:11434, http://b:11434"
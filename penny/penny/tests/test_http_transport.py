@@ -0,0 +1,53 @@
+"""Tests for the shared, pooled outbound HTTP transport."""
+
+import pytest
+
+from penny.http_transport import HttpTransport
+from penny.tests.conftest import TEST_SENDER, wait_until
+
+
+@pytest.mark.asyncio
+async def test_leases_share_one_keepalive_pool(signal_server):
+    """Clients leased for different integrations reuse the same connection to a
+    host, and closing one lease leaves the pool serving the others."""
+    transport = HttpTransport()
+    base = f"http://localhost:{signal_server.port}"
+    first = transport.client(timeout=5.0)
+    second = transport.client(timeout=5.0, headers={"Authorization": "Bearer token"})
+
+    for client in (first, second, first):
+        response = await client.put(f"{base}/v1/typing-indicator/+1", json={"recipient": "a"})
+        assert response.status_code == 200
+    await first.aclose()
+    response = await second.put(f"{base}/v1/typing-indicator/+1", json={"recipient": "b"})
+    assert response.status_code == 200
+
+    [host] = transport.stats()
+    assert host.host == base
+    assert host.requests == 4
+    assert host.connections_opened == 1
+    assert host.active == 0
+    assert host.idle == 1
+    assert len(signal_server.typing_events) == 4
+
+    await second.aclose()
+    await transport.aclose()
+
+
+@pytest.mark.asyncio
+async def test_penny_integrations_draw_from_the_shared_pool(
+    signal_server, mock_llm, make_config, test_user_info, running_penny
+):
+    """The Signal channel's sends go through Penny's shared transport and reuse
+    its keep-alive connections across the typing, reaction and send calls."""
+    config = make_config()
+    mock_llm.set_default_flow(final_response="pooled hello 🌟")
+
+    async with running_penny(config) as penny:
+        await signal_server.push_message(sender=TEST_SENDER, content="hi there")
+        await wait_until(lambda: len(signal_server.outgoing_messages) >= 1)
+
+        signal_host = next(
+            host for host in penny.http.stats() if host.host.endswith(f":{signal_server.port}")
+        )
+        assert signal_host.requests > signal_host.connections_opened >= 1
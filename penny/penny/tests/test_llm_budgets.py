@@ -0,0 +1,93 @@
+"""Tests for LLM_BUDGETS — parsing, resolution, and budgets on the wire."""
+
+import pytest
+
+from penny.config_params import RuntimeParams
+from penny.database import Database
+from penny.llm import LlmClient
+from penny.llm.budgets import LlmBudget, parse_budgets, resolve_budget
+from penny.tests.mocks.llm_server import MockLlmServer
+
+SPEC = "collector=low:2048,chat=medium,collector/notify=:64,*=high"
+
+
+def test_most_specific_budget_wins():
+    assert resolve_budget(SPEC, "collector", "notify") == LlmBudget(None, 64)
+    assert resolve_budget(SPEC, "collector", "collector") == LlmBudget("low", 2048)
+    assert resolve_budget(SPEC, "chat", "user_message") == LlmBudget("medium", None)
+    assert resolve_budget(SPEC, "startup", None) == LlmBudget("high", None)
+    assert resolve_budget("", "chat", "user_message") is None
+
+
+@pytest.mark.parametrize("spec", ["collector", "chat=extreme", "chat=low:0", "chat=low:lots"])
+def test_malformed_budgets_are_rejected(spec):
+    with pytest.raises(ValueError):
+        parse_budgets(spec)
+
+
+@pytest.mark.asyncio
+async def test_budget_is_sent_and_hits_are_logged(test_db):
+    """A budgeted call carries reasoning_effort and max_tokens; output cut off
+    at the cap is logged as a budget hit."""
+    server = MockLlmServer("gpu", reply="one two three four five six")
+    await server.start()
+    db = Database(test_db)
+    db.create_tables()
+    client = LlmClient(
+        api_url=server.url,
+        model="test-model",
+        db=db,
+        max_retries=1,
+        retry_delay=0.0,
+        runtime=RuntimeParams(env_overrides={"LLM_BUDGETS": "collector=low:3"}),
+    )
+    try:
+        capped = await client.chat(
+            [{"role": "user", "content": "hi"}], agent_name="collector", prompt_type="likes"
+        )
+        await client.chat([{"role": "user", "content": "hi"}], agent_name="chat")
+    finally:
+        await client.close()
+        await server.stop()
+
+    assert capped.content == "one two three "
+    assert server.requests[0]["reasoning_effort"] == "low"
+    assert server.requests[0]["max_tokens"] == 3
+    assert "max_tokens" not in server.requests[1]
+    budgeted, unbudgeted = db.messages.recent_prompts()[::-1]
+    assert (budgeted.budget, budgeted.budget_hit) == ("low:3", True)
+    assert (unbudgeted.budget, unbudgeted.budget_hit) == (None, None)
+    assert db.messages.prompt_perf().budget_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_explicit_max_tokens_is_not_a_budget_hit(test_db):
+    """A caller's own cap (the prefix warmer's one-token probe) is sent but not
+    logged as a budget — cutting off at it isn't ``LLM_BUDGETS`` biting."""
+    server = MockLlmServer("gpu", reply="one two three")
+    await server.start()
+    db = Database(test_db)
+    db.create_tables()
+    client = LlmClient(
+        api_url=server.url,
+        model="test-model",
+        db=db,
+        max_retries=1,
+        retry_delay=0.0,
+        runtime=RuntimeParams(env_overrides={"LLM_BUDGETS": "chat=low:512"}),
+    )
+    try:
+        for agent_name in ("prefix_warmer", "chat"):
+            await client.chat(
+                [{"role": "user", "content": "hi"}], agent_name=agent_name, max_tokens=1
+            )
+    finally:
+        await client.close()
+        await server.stop()
+
+    assert [request["max_tokens"] for request in server.requests] == [1, 1]
+    assert server.requests[1]["reasoning_effort"] == "low"
+    unbudgeted, effort_only = db.messages.recent_prompts()[::-1]
+    assert (unbudgeted.budget, unbudgeted.budget_hit) == (None, None)
+    assert (effort_only.budget, effort_only.budget_hit) == ("low", None)
+    assert db.messages.prompt_perf().budget_hits == 0
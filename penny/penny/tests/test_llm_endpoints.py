@@ -0,0 +1,161 @@
+"""Tests for multi-endpoint LLM routing — two real mock inference servers."""
+
+import asyncio
+import time
+
+import pytest
+
+from penny.constants import PennyConstants
+from penny.llm import LlmClient
+from penny.llm.models import LlmDelta
+from penny.tests.mocks.llm_server import MockLlmServer
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+@pytest.fixture
+async def servers():
+    """Two mock OpenAI-compatible servers, ``a`` and ``b``."""
+    pair = MockLlmServer("a"), MockLlmServer("b")
+    for server in pair:
+        await server.start()
+    yield pair
+    for server in pair:
+        await server.stop()
+
+
+def _client(servers, *, max_retries: int = 3) -> LlmClient:
+    return LlmClient(
+        api_url=",".join(server.url for server in servers),
+        model="test-model",
+        max_retries=max_retries,
+        retry_delay=0.0,
+    )
+
+
+@pytest.mark.asyncio
+async def test_requests_spread_across_endpoints(servers):
+    """Sequential chat and embed calls alternate between the two servers."""
+    a, b = servers
+    client = _client(servers)
+
+    replies = [(await client.chat(MESSAGES)).content for _ in range(4)]
+    await client.embed("some text")
+    await client.embed("more text")
+
+    assert sorted(replies) == ["hello from a"] * 2 + ["hello from b"] * 2
+    assert len(a.requests) == len(b.requests) == 3
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_failing_endpoint_is_retried_elsewhere_and_backed_off(servers):
+    """A 503 from one server moves the retry to the other, and the failed
+    server stays out of rotation for its backoff instead of being retried."""
+    a, b = servers
+    a.fail_status = 503
+    client = _client(servers)
+
+    for _ in range(4):
+        assert (await client.chat(MESSAGES)).content == "hello from b"
+
+    assert len(a.requests) == 1
+    assert len(b.requests) == 4
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_streamed_chat_is_hedged_past_latency_percentile(servers):
+    """Once latency history exists, a request whose endpoint stays silent past
+    the percentile is duplicated to the other server, and the faster answer
+    streams to the caller."""
+    a, b = servers
+    client = _client(servers)
+    deltas: list[LlmDelta] = []
+
+    async def on_delta(delta: LlmDelta) -> None:
+        deltas.append(delta)
+
+    for _ in range(PennyConstants.LLM_HEDGE_MIN_SAMPLES):
+        await client.chat(MESSAGES, on_delta=on_delta)
+    a.delay = 1.0
+    a_before, b_before = len(a.requests), len(b.requests)
+    deltas.clear()
+
+    started = time.monotonic()
+    response = await client.chat(MESSAGES, on_delta=on_delta, hedge_percentile=95)
+
+    assert time.monotonic() - started < a.delay / 2
+    assert response.content == "hello from b"
+    assert "".join(delta.content for delta in deltas) == "hello from b"
+    # The slow primary got the request too — it was hedged, not re-routed.
+    assert len(a.requests) == a_before + 1
+    assert len(b.requests) == b_before + 1
+    await client.close()
+
+
+async def _warm_hedge_history(client: LlmClient) -> None:
+    async def on_delta(delta: LlmDelta) -> None:
+        pass
+
+    for _ in range(PennyConstants.LLM_HEDGE_MIN_SAMPLES):
+        await client.chat(MESSAGES, on_delta=on_delta)
+
+
+async def _ignore(delta: LlmDelta) -> None:
+    pass
+
+
+@pytest.mark.asyncio
+async def test_chat_cancelled_during_hedge_delay_leaves_nothing_outstanding(servers):
+    """A caller cancelled while its hedged request waits out the delay (a
+    superseded turn) takes the request down with it — nothing stays counted
+    against an endpoint once the server would have answered."""
+    a, b = servers
+    a.delay = b.delay = 0.3
+    client = _client(servers)
+    await _warm_hedge_history(client)
+
+    call = asyncio.create_task(client.chat(MESSAGES, on_delta=_ignore, hedge_percentile=95))
+    await asyncio.sleep(0.05)
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    await asyncio.sleep(a.delay * 2)
+
+    assert [endpoint.outstanding for endpoint in client._pool.endpoints] == [0, 0]
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_stream_opened_as_the_caller_is_cancelled_is_closed(servers, monkeypatch):
+    """A request that opens its stream just as the caller is cancelled is
+    discarded: the stream is closed and the endpoint released."""
+    client = _client(servers)
+    await _warm_hedge_history(client)
+    call: asyncio.Task | None = None
+    open_on = client._open_on
+    discard = client._discard
+    closed: list[object] = []
+
+    async def open_then_cancel_caller(endpoint, kwargs, streamed):
+        opened = await open_on(endpoint, kwargs, streamed)
+        assert call is not None
+        call.cancel()
+        return opened
+
+    async def recording_discard(opened):
+        closed.append(opened)
+        await discard(opened)
+
+    monkeypatch.setattr(client, "_open_on", open_then_cancel_caller)
+    monkeypatch.setattr(client, "_discard", recording_discard)
+    monkeypatch.setattr(client._pool, "hedge_delay", lambda percentile, streamed: 5.0)
+
+    call = asyncio.create_task(client.chat(MESSAGES, on_delta=_ignore, hedge_percentile=95))
+    with pytest.raises(asyncio.CancelledError):
+        await call
+
+    assert len(closed) == 1
+    assert [endpoint.outstanding for endpoint in client._pool.endpoints] == [0, 0]
+    await client.close()
@@ -0,0 +1,120 @@
+"""Tests for ResponseCache — deterministic calls answered from the cache."""
+
+import pytest
+
+from penny.config_params import RuntimeParams
+from penny.database import Database
+from penny.llm import LlmClient, ResponseCache
+from penny.llm.tiers import ModelTiers
+from penny.tests.mocks.llm_server import MockLlmServer
+
+MESSAGES = [{"role": "user", "content": "every morning at 9"}]
+
+
+def _client(
+    server: MockLlmServer, db: Database, runtime: RuntimeParams, model: str = "test-model"
+) -> LlmClient:
+    return LlmClient(
+        api_url=server.url,
+        model=model,
+        db=db,
+        max_retries=1,
+        retry_delay=0.0,
+        runtime=runtime,
+        response_cache=ResponseCache(db, runtime),
+    )
+
+
+@pytest.mark.asyncio
+async def test_deterministic_cacheable_call_is_served_from_cache(test_db):
+    """The second identical call never reaches the server — it's replayed and
+    logged as a zero-duration cached prompt — and the SQLite tier answers a
+    fresh process too."""
+    server = MockLlmServer("gpu", reply='{"cron_expression": "0 9 * * *"}')
+    await server.start()
+    db = Database(test_db)
+    db.create_tables()
+    runtime = RuntimeParams()
+    first, restarted = _client(server, db, runtime), _client(server, db, runtime)
+    try:
+        sent = await first.chat(MESSAGES, agent_name="schedule", temperature=0.0, cacheable=True)
+        replayed = await first.chat(
+            MESSAGES, agent_name="schedule", temperature=0.0, cacheable=True
+        )
+        from_disk = await restarted.chat(
+            MESSAGES, agent_name="schedule", temperature=0.0, cacheable=True
+        )
+    finally:
+        await first.close()
+        await restarted.close()
+        await server.stop()
+
+    assert len(server.requests) == 1
+    assert server.requests[0]["temperature"] == 0.0
+    assert sent.content == replayed.content == from_disk.content
+    prompts = db.messages.recent_prompts()[::-1]
+    assert [(row.cached, row.duration_ms == 0) for row in prompts] == [
+        (None, False),
+        (True, True),
+        (True, True),
+    ]
+    perf = db.messages.prompt_perf()
+    assert (perf.calls, perf.cache_hits) == (3, 2)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("temperature", "cacheable", "ttl"),
+    [(None, True, 86400), (0.7, True, 86400), (0.0, False, 86400), (0.0, True, 0)],
+    ids=["default-sampling", "sampled", "not-marked", "cache-off"],
+)
+async def test_cache_is_bypassed(test_db, temperature, cacheable, ttl):
+    """Sampled calls, unmarked calls and a zero TTL always go to the model."""
+    server = MockLlmServer("gpu", reply="hello")
+    await server.start()
+    db = Database(test_db)
+    db.create_tables()
+    client = _client(server, db, RuntimeParams(env_overrides={"LLM_CACHE_TTL_SECONDS": str(ttl)}))
+    try:
+        for _ in range(2):
+            await client.chat(MESSAGES, temperature=temperature, cacheable=cacheable)
+    finally:
+        await client.close()
+        await server.stop()
+
+    assert len(server.requests) == 2
+    assert db.messages.prompt_perf().cache_hits == 0
+
+
+@pytest.mark.asyncio
+async def test_only_tier_accepted_responses_are_cached(test_db):
+    """A small-model answer the tier check rejects isn't cached — the next call
+    asks the small model again — while the main model's accepted answer is."""
+    small_server = MockLlmServer("small", reply="not json")
+    main_server = MockLlmServer("main", reply='{"cron_expression": "0 9 * * *"}')
+    await small_server.start()
+    await main_server.start()
+    db = Database(test_db)
+    db.create_tables()
+    runtime = RuntimeParams(env_overrides={"SMALL_MODEL_TASKS": "schedule"})
+    small = _client(small_server, db, runtime, model="small-model")
+    main = _client(main_server, db, runtime, model="main-model")
+    tiers = ModelTiers(main, small, runtime)
+    try:
+        for _ in range(2):
+            response = await tiers.generate(
+                "schedule",
+                "every morning at 9",
+                lambda response: response.content.startswith("{"),
+                temperature=0.0,
+                cacheable=True,
+            )
+            assert "cron_expression" in response.content
+    finally:
+        await small.close()
+        await main.close()
+        await small_server.stop()
+        await main_server.stop()
+
+    assert len(small_server.requests) == 2
+    assert len(main_server.requests) == 1
@@ -0,0 +1,130 @@
+"""Tests for LlmScheduler — lane priority, caps, foreground hold."""
+
+import asyncio
+
+import pytest
+
+from penny.constants import LlmLane
+from penny.llm.scheduler import LlmScheduler, current_lane, llm_lane
+
+CAPS = {LlmLane.CHAT: 1, LlmLane.EMBED: 1, LlmLane.BACKGROUND: 1, LlmLane.BACKFILL: 1}
+
+
+async def _request(
+    scheduler: LlmScheduler, lane: LlmLane, order: list[str], release: asyncio.Event
+) -> None:
+    async with scheduler.slot(lane):
+        order.append(lane)
+        await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_interactive_lanes_outrank_queued_background_work():
+    """Queued work is admitted strictly by lane, whatever order it arrived in."""
+    scheduler = LlmScheduler(CAPS)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    holder = asyncio.create_task(_request(scheduler, LlmLane.CHAT, order, release))
+    await asyncio.sleep(0)
+    waiters = [
+        asyncio.create_task(_request(scheduler, lane, order, release))
+        for lane in (LlmLane.BACKFILL, LlmLane.BACKGROUND, LlmLane.EMBED, LlmLane.CHAT)
+    ]
+    await asyncio.sleep(0)
+    # Embed has its own slot, so it starts beside the running chat; the rest
+    # wait behind the chat cap or behind the interactive requests in flight.
+    assert order == [LlmLane.CHAT, LlmLane.EMBED]
+
+    release.set()
+    await asyncio.gather(holder, *waiters)
+
+    assert order == [
+        LlmLane.CHAT,
+        LlmLane.EMBED,
+        LlmLane.CHAT,
+        LlmLane.BACKGROUND,
+        LlmLane.BACKFILL,
+    ]
+    stats = {lane_stats.lane: lane_stats for lane_stats in scheduler.stats()}
+    assert stats[LlmLane.CHAT].requests == 2
+    assert stats[LlmLane.CHAT].queued == 1
+    assert stats[LlmLane.BACKFILL].queued == 1
+    assert all(lane_stats.active == lane_stats.waiting == 0 for lane_stats in stats.values())
+
+
+@pytest.mark.asyncio
+async def test_foreground_hold_pauses_background_until_released():
+    """A held scheduler keeps background requests waiting — interactive ones
+    still run — and admits them once the last hold is released."""
+    scheduler = LlmScheduler(CAPS)
+    order: list[str] = []
+    release = asyncio.Event()
+    release.set()
+
+    scheduler.hold_background()
+    scheduler.hold_background()
+    background = asyncio.create_task(_request(scheduler, LlmLane.BACKGROUND, order, release))
+    await _request(scheduler, LlmLane.CHAT, order, release)
+    scheduler.release_background()
+    await asyncio.sleep(0)
+    assert order == [LlmLane.CHAT]
+
+    scheduler.release_background()
+    await background
+    assert order == [LlmLane.CHAT, LlmLane.BACKGROUND]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_gives_up_its_place():
+    """A waiter cancelled in the queue doesn't block the lanes below it."""
+    scheduler = LlmScheduler(CAPS)
+    order: list[str] = []
+    release = asyncio.Event()
+
+    holder = asyncio.create_task(_request(scheduler, LlmLane.CHAT, order, release))
+    await asyncio.sleep(0)
+    queued_chat = asyncio.create_task(_request(scheduler, LlmLane.CHAT, order, release))
+    embed = asyncio.create_task(_request(scheduler, LlmLane.EMBED, order, release))
+    await asyncio.sleep(0)
+    assert order == [LlmLane.CHAT]
+
+    queued_chat.cancel()
+    await asyncio.gather(queued_chat, return_exceptions=True)
+    await asyncio.sleep(0)
+    assert order == [LlmLane.CHAT, LlmLane.EMBED]
+
+    release.set()
+    await asyncio.gather(holder, embed)
+
+
+@pytest.mark.asyncio
+async def test_background_waiters_for_the_last_model_go_first():
+    """Queued background work for the model just served is admitted before
+    older work for another model, so the GPU doesn't swap back and forth."""
+    scheduler = LlmScheduler(CAPS)
+    order: list[str] = []
+
+    async def request(lane: LlmLane, model: str) -> None:
+        async with scheduler.slot(lane, model):
+            order.append(model)
+            await asyncio.sleep(0)
+
+    scheduler.hold_background()
+    waiters = [
+        asyncio.create_task(request(LlmLane.BACKGROUND, model))
+        for model in ("vision-model", "chat-model", "vision-model", "chat-model")
+    ]
+    await asyncio.sleep(0)
+    await request(LlmLane.CHAT, "chat-model")
+    scheduler.release_background()
+    await asyncio.gather(*waiters)
+
+    assert order == ["chat-model", "chat-model", "chat-model", "vision-model", "vision-model"]
+
+
+def test_lane_comes_from_context():
+    assert current_lane(LlmLane.EMBED) == LlmLane.EMBED
+    with llm_lane(LlmLane.BACKFILL):
+        assert current_lane(LlmLane.EMBED) == LlmLane.BACKFILL
+    assert current_lane(LlmLane.CHAT) == LlmLane.CHAT
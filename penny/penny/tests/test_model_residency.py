@@ -0,0 +1,187 @@
+"""Tests for ModelResidency — load tracking, time lost and keep-alive hints,
+against a mock single-GPU Ollama host."""
+
+import logging
+
+import pytest
+
+from penny.constants import PennyConstants
+from penny.llm import LlmClient
+from penny.llm.residency import ModelResidency
+from penny.tests.conftest import wait_until
+from penny.tests.mocks.llm_server import MockLlmServer
+
+MESSAGES = [{"role": "user", "content": "hi"}]
+
+
+@pytest.fixture
+async def server():
+    mock = MockLlmServer("gpu")
+    await mock.start()
+    yield mock
+    await mock.stop()
+
+
+@pytest.fixture(autouse=True)
+def quick_pin(monkeypatch):
+    monkeypatch.setattr(PennyConstants, "RESIDENCY_PIN_SETTLE_SECONDS", 0.05)
+
+
+def _clients(server: MockLlmServer, residency: ModelResidency) -> tuple[LlmClient, LlmClient]:
+    def client(model: str) -> LlmClient:
+        return LlmClient(
+            api_url=server.url, model=model, max_retries=1, retry_delay=0.0, residency=residency
+        )
+
+    return client("chat-model"), client("vision-model")
+
+
+def _residency(*, user_active: bool) -> ModelResidency:
+    return ModelResidency(
+        pinned={"chat-model"}, transient={"vision-model"}, user_active=lambda: user_active
+    )
+
+
+@pytest.mark.asyncio
+async def test_model_swaps_are_counted_with_time_lost(server):
+    """Each swap back to the chat model is a load, and the load's extra latency
+    over the warm baseline is booked as time lost."""
+    server.load_delay = 0.2
+    residency = _residency(user_active=False)
+    chat, vision = _clients(server, residency)
+
+    await chat.chat(MESSAGES)
+    await chat.chat(MESSAGES)
+    await vision.chat(MESSAGES)
+    await chat.chat(MESSAGES)
+
+    stats = {stats.model: stats for stats in residency.stats()}
+    assert (stats["chat-model"].requests, stats["chat-model"].loads) == (3, 2)
+    assert (stats["vision-model"].requests, stats["vision-model"].loads) == (1, 1)
+    assert stats["chat-model"].load_ms >= 2 * 0.8 * server.load_delay * 1000
+    assert server.keep_alive_calls == []
+    await residency.close()
+
+
+@pytest.mark.asyncio
+async def test_active_user_pins_chat_model_and_unloads_transient_one(server):
+    """While the user is active the vision model is unloaded right after it
+    answers, and the chat model is pinned once its requests settle."""
+    residency = _residency(user_active=True)
+    chat, vision = _clients(server, residency)
+
+    await chat.chat(MESSAGES)
+    await chat.chat(MESSAGES)
+    await vision.chat(MESSAGES)
+    await wait_until(lambda: len(server.keep_alive_calls) == 2)
+
+    assert server.keep_alive_calls == [
+        {"model": "vision-model", "keep_alive": 0},
+        {"model": "chat-model", "keep_alive": PennyConstants.RESIDENCY_ACTIVE_KEEP_ALIVE},
+    ]
+    assert "vision-model" not in server.loaded
+    await residency.close()
+
+
+@pytest.mark.asyncio
+async def test_request_after_pin_is_followed_by_a_fresh_pin(server):
+    """Every ordinary request resets Ollama's keep-alive to its default, so a
+    request after the pin earns another one once the model goes idle."""
+    residency = _residency(user_active=True)
+    chat, _ = _clients(server, residency)
+    await chat.chat(MESSAGES)
+    await chat.chat(MESSAGES)
+    await wait_until(lambda: len(server.keep_alive_calls) == 1)
+
+    await chat.chat(MESSAGES)
+    await wait_until(lambda: len(server.keep_alive_calls) == 2)
+
+    assert {call["model"] for call in server.keep_alive_calls} == {"chat-model"}
+    await residency.close()
+
+
+@pytest.mark.asyncio
+async def test_burst_of_requests_is_pinned_once(server):
+    residency = _residency(user_active=True)
+    chat, _ = _clients(server, residency)
+    for _ in range(4):
+        await chat.chat(MESSAGES)
+    await wait_until(lambda: len(server.keep_alive_calls) == 1)
+    await wait_until(lambda: not residency._repins and not residency._tasks)
+
+    assert len(server.keep_alive_calls) == 1
+    await residency.close()
+
+
+@pytest.mark.asyncio
+async def test_host_without_ps_uses_last_model_stand_in(server):
+    """Without /api/ps, the last model used is assumed to be the loaded one,
+    and no keep-alive hints are sent."""
+    server.has_ps = False
+    residency = _residency(user_active=True)
+    chat, vision = _clients(server, residency)
+
+    for client in (chat, chat, vision, chat):
+        await client.chat(MESSAGES)
+
+    stats = {stats.model: stats for stats in residency.stats()}
+    assert stats["chat-model"].loads == 2
+    assert stats["vision-model"].loads == 1
+    assert server.keep_alive_calls == []
+    await residency.close()
+
+
+@pytest.mark.asyncio
+async def test_embedding_model_is_pinned_through_embed(server):
+    """An embedding model can't serve /api/generate, so its keep-alive goes
+    through /api/embed."""
+    residency = ModelResidency(
+        pinned={"embed-model"},
+        transient=set(),
+        embedding={"embed-model"},
+        user_active=lambda: True,
+    )
+    embedder = LlmClient(
+        api_url=server.url, model="embed-model", max_retries=1, retry_delay=0.0, residency=residency
+    )
+
+    await embedder.embed("hello")
+    await embedder.embed("again")
+    await wait_until(lambda: len(server.keep_alive_calls) == 1)
+
+    assert server.keep_alive_calls == [
+        {"model": "embed-model", "keep_alive": PennyConstants.RESIDENCY_ACTIVE_KEEP_ALIVE}
+    ]
+    assert server.keep_alive_paths == ["/api/embed"]
+    await residency.close()
+
+
+@pytest.mark.asyncio
+async def test_failed_pin_is_logged_as_warning(server, caplog):
+    server.keep_alive_status = 400
+    residency = _residency(user_active=True)
+    chat, _ = _clients(server, residency)
+
+    with caplog.at_level(logging.WARNING, logger="penny.llm.residency"):
+        await chat.chat(MESSAGES)
+        await chat.chat(MESSAGES)
+        await wait_until(lambda: "keep_alive=" in caplog.text)
+
+    assert "chat-model" in caplog.text
+    await residency.close()
+
+
+@pytest.mark.asyncio
+async def test_is_loaded_answers_from_known_state_and_refreshes_behind(server, monkeypatch):
+    """The request path answers from the last known state and never waits on
+    the host; an expired /api/ps reading is refreshed in the background."""
+    monkeypatch.setattr(PennyConstants, "RESIDENCY_PS_TTL_SECONDS", 0.0)
+    residency = _residency(user_active=False)
+    chat, _ = _clients(server, residency)
+    await chat.chat(MESSAGES)
+    await wait_until(lambda: not residency._tasks)
+    server.loaded = []
+
+    assert residency.is_loaded("chat-model", server.url)
+    await wait_until(lambda: not residency.is_loaded("chat-model", server.url))
+    await residency.close()
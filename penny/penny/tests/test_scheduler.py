@@ -8,6 +8,8 @@ from typing import Any
 
 import pytest
 
+from penny.constants import LlmLane
+from penny.llm.scheduler import LlmScheduler, current_lane
 from penny.scheduler.base import BackgroundScheduler, Schedule
 from penny.tests.conftest import TEST_SENDER, wait_until
 
@@ -34,6 +36,27 @@ class _SlowAgent:
             raise
 
 
+class _TwoRequestAgent:
+    """Agent that makes two LLM requests, pausing between them."""
+
+    name = "two_request_agent"
+
+    def __init__(self, llm_scheduler: LlmScheduler) -> None:
+        self.llm_scheduler = llm_scheduler
+        self.between = asyncio.Event()
+        self.proceed = asyncio.Event()
+        self.lanes: list[LlmLane] = []
+
+    async def execute(self) -> bool:
+        for index in range(2):
+            async with self.llm_scheduler.slot(current_lane(LlmLane.CHAT)):
+                self.lanes.append(current_lane(LlmLane.CHAT))
+            if index == 0:
+                self.between.set()
+                await self.proceed.wait()
+        return True
+
+
 class _SimpleAgent:
     """Agent that returns a fixed value from execute()."""
 
@@ -105,6 +128,39 @@ async def test_foreground_cancels_active_background_task():
             await scheduler_task
 
 
+@pytest.mark.asyncio
+async def test_foreground_pauses_background_task_at_next_llm_request():
+    """With an LLM scheduler, foreground work doesn't cancel the background
+    task — its next model request waits until the foreground work ends."""
+    llm_scheduler = LlmScheduler()
+    agent = _TwoRequestAgent(llm_scheduler)
+    scheduler = BackgroundScheduler(
+        schedules=[_AlwaysRunSchedule(agent)],
+        idle_threshold=lambda: 0.0,
+        tick_interval=0.01,
+        llm_scheduler=llm_scheduler,
+    )
+
+    scheduler_task = asyncio.create_task(scheduler.run())
+    try:
+        await asyncio.wait_for(agent.between.wait(), timeout=2.0)
+        scheduler.notify_foreground_start()
+        agent.proceed.set()
+        await asyncio.sleep(0.05)
+
+        assert scheduler._active_task is not None, "Background task should not be cancelled"
+        assert agent.lanes == [LlmLane.BACKGROUND]
+
+        scheduler.notify_foreground_end()
+        await wait_until(lambda: scheduler._active_task is None, timeout=2.0)
+        assert agent.lanes == [LlmLane.BACKGROUND, LlmLane.BACKGROUND]
+    finally:
+        scheduler.stop()
+        scheduler_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await scheduler_task
+
+
 @pytest.mark.asyncio
 async def test_foreground_during_idle_prevents_task_start():
     """Background tasks don't start while foreground is active."""
@@ -10,7 +10,7 @@ shapes captured from the prompt log that must always match.
 
 from __future__ import annotations
 
-from penny.text_validity import degenerate_reason, is_degenerate_run
+from penny.text_validity import DegenerateRunWatch, degenerate_reason, is_degenerate_run
 
 # Legitimate punctuation that must NEVER be flagged — conversational ellipses,
 # emphatic marks, list/code notation.  A hit here would throw out good output.
@@ -63,6 +63,22 @@ def test_is_degenerate_run_flags_every_collapse_shape():
     assert missed == [], f"missed degeneration collapses: {missed}"
 
 
+def _watch_trips(fragments: list[str]) -> bool:
+    watch = DegenerateRunWatch()
+    return any(watch.feed(fragment) for fragment in fragments)
+
+
+def test_degenerate_run_watch_agrees_with_whole_text_check_on_streamed_fragments():
+    """Fed a token at a time, the incremental watch must reach the same verdict
+    as ``is_degenerate_run`` on the finished text — a run split across fragments
+    still trips it, and legitimate punctuation split the same way never does."""
+    for text in LEGITIMATE + DEGENERATE:
+        expected = is_degenerate_run(text)
+        assert _watch_trips(list(text)) == expected, f"char-by-char disagreed on {text!r}"
+        words = [word + " " for word in text.split(" ")]
+        assert _watch_trips(words) == expected, f"word-by-word disagreed on {text!r}"
+
+
 def test_degenerate_reason_rejects_wordful_poison():
     """A collapse embedded in otherwise-wordful text clears the blank/URL/bail-out
     checks, so the run detector is what keeps it out of the corpus and off the wire."""
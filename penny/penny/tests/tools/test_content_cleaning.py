@@ -0,0 +1,71 @@
+"""Tests for clean_browser_content — the single-pass line classifier.
+
+Each rule is an alternative of one compiled regex, so these cover the
+interactions that ordering decides: cruft lines dropped, a Kagi image grid
+skipped up to the next ``### `` result, blank-line runs collapsed in the
+same pass, and the per-domain byte ratios the cleaner records.
+"""
+
+from __future__ import annotations
+
+from penny.tools.content_cleaning import DomainRatios, clean_browser_content, domain_ratios
+
+
+def test_drops_cruft_lines_and_keeps_content():
+    """Anchored rules, exact-line sets and the Openverse substrings all drop
+    their line; prose that merely mentions them survives."""
+    text = "\n".join(
+        [
+            "Skip to main content",
+            "# Guitar amps",
+            "[](https://ex.com/pixel)",
+            "1920 x 1080",
+            "![a](https://ads.ex.com/transparent-pixel.gif)",
+            '{"price": "' + "9" * 60 + '"}',
+            "[Sign in](https://ex.com/auth?" + "x" * 320 + ")",
+            "NewsCategory: News.|TechCategory: Tech.",
+            "Size",
+            "Photo Made with [Openverse] under CC",
+            "The Size of the cabinet matters. Skip to content if bored.",
+        ]
+    )
+
+    assert clean_browser_content(text) == (
+        "# Guitar amps\nThe Size of the cabinet matters. Skip to content if bored."
+    )
+
+
+def test_skips_kagi_grid_until_next_result_and_collapses_blanks():
+    text = "\n".join(
+        [
+            "### First result",
+            "",
+            "",
+            "   ",
+            "Snippet one.",
+            "[Images](https://kagi.com/images?q=amps)",
+            "Grid caption",
+            "",
+            "[www.ex.com](https://ex.com)",
+            "### Second result",
+            "Snippet two.",
+        ]
+    )
+
+    assert clean_browser_content(text) == (
+        "### First result\n\nSnippet one.\n### Second result\nSnippet two."
+    )
+
+
+def test_records_byte_ratios_per_domain():
+    ratios = DomainRatios()
+    ratios.record("ex.com", 100, 40)
+    ratios.record("ex.com", 100, 60)
+    ratios.record("kagi.com", 300, 300)
+
+    assert ratios.ratio("ex.com") == 0.5
+    assert ratios.ratio("unseen.org") == 1.0
+    assert [row[0] for row in ratios.table()] == ["kagi.com", "ex.com"]
+
+    clean_browser_content("Skip to content\nKept.", domain="ratio-test.example")
+    assert domain_ratios.ratio("ratio-test.example") == len("Kept.") / len("Skip to content\nKept.")
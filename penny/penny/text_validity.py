@@ -112,6 +112,36 @@ def is_degenerate_run(content: str) -> bool:
     return bool(_DEGENERATE_RUN_RE.search(content))
 
 
+# The maximal trailing run of characters a collapse is built from.  Every
+# `_DEGENERATE_RUN_RE` match consists only of these, so a match that ends inside a
+# newly-arrived fragment can start no earlier than this run's first character.
+_DEGENERATE_ALPHABET_TAIL_RE = re.compile(r"[" + _DEGEN_SEP + r".?!…]*\Z")
+
+
+class DegenerateRunWatch:
+    """:func:`is_degenerate_run` over text that arrives in fragments (a token stream).
+
+    ``feed`` reports whether the text so far now carries a collapse run, without
+    rescanning it: only the trailing run of collapse characters is carried
+    forward, which is all a new match could extend.  Feeding every fragment of a
+    string trips exactly when ``is_degenerate_run`` on the whole would — which is
+    what lets a streamed generation be cancelled at the first collapse token
+    instead of after the full decode.
+    """
+
+    def __init__(self) -> None:
+        self._tail = ""
+
+    def feed(self, fragment: str) -> bool:
+        """Append ``fragment``; True once the accumulated text is degenerate."""
+        window = self._tail + fragment
+        if _DEGENERATE_RUN_RE.search(window):
+            return True
+        tail = _DEGENERATE_ALPHABET_TAIL_RE.search(window)
+        self._tail = window[tail.start() :] if tail else ""
+        return False
+
+
 # A message cut off mid-thought on an ellipsis TAIL — one-or-more "…" or 3+ ASCII
 # dots, optionally a single trailing ?/!/. — the model self-truncating.  Real
 # failures: "...the original …", "all-time-best ‑ …?", "Hello world...".  A
@@ -2,7 +2,9 @@
 
 The model packs everything into a single queries array; the tool detects URLs
 and reads them directly, while plain text is converted to search URLs.
-Queries are dispatched in parallel.
+Queries are dispatched in parallel, through the shared ``PageCache`` when one
+is wired in.  Pages longer than the token budget come back as their most
+relevant chunks (``page_chunks``).
 """
 
 from __future__ import annotations
@@ -14,21 +16,27 @@ import logging
 import re
 import urllib.parse
 from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 from penny.constants import PennyConstants, ProgressEmoji
 from penny.database.memory import LogEntryInput
 from penny.llm.embeddings import serialize_embedding
+from penny.llm.models import LlmError
 from penny.llm.similarity import embed_text
+from penny.llm.tokens import estimate_tokens
 from penny.prompts import Prompt
 from penny.tools.base import Tool
 from penny.tools.content_cleaning import clean_browser_content
 from penny.tools.models import BrowseArgs, BrowsePage, ToolResult
+from penny.tools.page_cache import page_key, search_key
+from penny.tools.page_chunks import join_chunks, select_chunks, split_chunks
 
 if TYPE_CHECKING:
     from penny.channels.permission_manager import PermissionManager
     from penny.database import Database
     from penny.llm import LlmClient
+    from penny.tools.page_cache import PageCache
 
 logger = logging.getLogger(__name__)
 
@@ -67,6 +75,16 @@ def _trim_search_result(text: str, context_lines: int = 2) -> str:
     return f"{Prompt.SEARCH_RESULT_HEADER}\n\n{trimmed}"
 
 
+def _age(since: datetime) -> str:
+    """How long ago ``since`` was, coarsely: "moments", "12 min", "2 h"."""
+    minutes = int((datetime.now(UTC) - since).total_seconds() // 60)
+    if minutes < 1:
+        return "moments"
+    if minutes < 60:
+        return f"{minutes} min"
+    return f"{minutes // 60} h"
+
+
 class BrowseTool(Tool):
     """Search the web and read pages via the browser extension.
 
@@ -92,12 +110,16 @@ class BrowseTool(Tool):
         db: Database | None = None,
         embedding_client: LlmClient | None = None,
         author: str = "unknown",
+        page_cache: PageCache | None = None,
+        page_token_budget: int = 0,
     ):
         self._max_calls = max_calls
         self._search_url = search_url
         self._db = db
         self._embedding_client = embedding_client
         self._author = author
+        self._page_cache = page_cache
+        self._page_token_budget = page_token_budget
         self._browse_provider: Callable[[], tuple[RequestFn, PermissionManager] | None] | None = (
             None
         )
@@ -165,17 +187,34 @@ class BrowseTool(Tool):
         tasks: list[tuple[str, str, Any]] = []
         for q in args.queries[:cap]:
             if _URL_PATTERN.match(q):
-                tasks.append((PennyConstants.BROWSE_PAGE_HEADER, q, self._read_page(q)))
+                read = self._cached_read(page_key(q), q)
+                tasks.append((PennyConstants.BROWSE_PAGE_HEADER, q, read))
             else:
                 search_url = self._search_url + urllib.parse.quote(q)
-                tasks.append((PennyConstants.BROWSE_SEARCH_HEADER, q, self._read_page(search_url)))
+                read = self._cached_read(search_key(q), search_url)
+                tasks.append((PennyConstants.BROWSE_SEARCH_HEADER, q, read))
 
         results = await asyncio.gather(*[coro for _, _, coro in tasks], return_exceptions=True)
 
+        # Pages over the token budget show only their most relevant chunks —
+        # ranked against the model's stated reasoning and the call's searches.
+        long_pages = {
+            index: split_chunks(result.text)
+            for index, ((header, _, _), result) in enumerate(zip(tasks, results, strict=True))
+            if header == PennyConstants.BROWSE_PAGE_HEADER
+            and isinstance(result, BrowsePage)
+            and self._page_token_budget > 0
+            and estimate_tokens(result.text) > self._page_token_budget
+        }
+        searches = [q for q in args.queries[:cap] if not _URL_PATTERN.match(q)]
+        anchors = [text.strip() for text in (args.reasoning, *searches) if text and text.strip()]
+        chunk_vectors, anchor_vectors = await self._embed_chunks(long_pages, anchors)
+
         sections: list[str] = []
         page_sections: list[str] = []
+        passages: list[LogEntryInput] = []
         captures: list[BrowsePage] = []
-        for (header, value, _), result in zip(tasks, results, strict=True):
+        for index, ((header, value, _), result) in enumerate(zip(tasks, results, strict=True)):
             if isinstance(result, BaseException):
                 logger.warning("Browse sub-call failed (%s%s): %s", header, value, result)
                 error_label = f"{PennyConstants.BROWSE_ERROR_HEADER}{value}"
@@ -189,14 +228,32 @@ class BrowseTool(Tool):
             text = result.text
             if header == PennyConstants.BROWSE_SEARCH_HEADER:
                 text = _trim_search_result(text)
-            section = f"{label}\n{text}"
-            sections.append(section)
+            shown = text
+            chunks = long_pages.get(index)
+            if chunks is not None:
+                budget_chars = self._page_token_budget * PennyConstants.CHARS_PER_TOKEN
+                kept = select_chunks(chunks, chunk_vectors.get(index), anchor_vectors, budget_chars)
+                note = Prompt.BROWSE_PASSAGES_NOTE.format(shown=len(kept), total=len(chunks))
+                shown = f"{note}\n{join_chunks(chunks, kept)}"
+            if result.cached_at is not None:
+                # Already logged and its media stored by the read that fetched it.
+                note = Prompt.BROWSE_CACHED_NOTE.format(age=_age(result.cached_at))
+                sections.append(f"{label}\n{note}\n{shown}")
+                continue
+            sections.append(f"{label}\n{shown}")
             if header == PennyConstants.BROWSE_PAGE_HEADER:
-                page_sections.append(section)
+                page_sections.append(f"{label}\n{text}")
                 if result.image:
                     captures.append(result)
+            if chunks is not None:
+                vectors: list[list[float] | None] = [*chunk_vectors.get(index, [])]
+                vectors += [None] * (len(chunks) - len(vectors))
+                for n, (chunk, vector) in enumerate(zip(chunks, vectors, strict=True), start=1):
+                    content = f"{label} [{n}/{len(chunks)}]\n{chunk}"
+                    passages.append(LogEntryInput(content=content, content_embedding=vector))
 
         await self._append_pages_to_browse_results(page_sections)
+        self._append_passages(passages)
         await self._store_media(captures)
         # Browse is a *read* for work-accounting (its browse-results log write is
         # incidental), so ``mutated`` stays False — a collector cycle that only
@@ -221,6 +278,59 @@ class BrowseTool(Tool):
         if browse_log is not None:
             browse_log.append(entries, author=self._author)
 
+    async def _embed_chunks(
+        self, pages: dict[int, list[str]], anchors: list[str]
+    ) -> tuple[dict[int, list[list[float]]], list[list[float]]]:
+        """Embed every long page's chunks and the anchors in one batch.
+
+        Returns ``({task index: chunk vectors}, anchor vectors)`` — both empty
+        without an embedding model or when the batch fails, which leaves
+        ``select_chunks`` reading each page from the top."""
+        if self._embedding_client is None or not pages:
+            return {}, []
+        texts = anchors + [chunk for chunks in pages.values() for chunk in chunks]
+        try:
+            vectors = await self._embedding_client.embed(texts)
+        except LlmError:
+            logger.warning("Failed to embed %d page chunk(s); reading from the top", len(texts))
+            return {}, []
+        anchor_vectors, rest = vectors[: len(anchors)], vectors[len(anchors) :]
+        by_page: dict[int, list[list[float]]] = {}
+        for index, chunks in pages.items():
+            by_page[index], rest = rest[: len(chunks)], rest[len(chunks) :]
+        return by_page, anchor_vectors
+
+    def _append_passages(self, passages: list[LogEntryInput]) -> None:
+        """Side-effect-write each chunk of a long page as its own embedded
+        ``browse-passages`` entry, so similarity reads can land on the
+        paragraph that answers them rather than on the whole page."""
+        if self._db is None or not passages:
+            return
+        passage_log = self._db.memory(PennyConstants.MEMORY_BROWSE_PASSAGES_LOG)
+        if passage_log is not None:
+            passage_log.append(passages, author=self._author)
+
+    async def _cached_read(self, key: str, url: str) -> BrowsePage:
+        """Read ``url`` through the page cache (under ``key``) when one is wired."""
+        if self._page_cache is None:
+            return await self._read_page(url)
+        return await self._page_cache.read(
+            key, url, lambda: self._read_page(url), lambda: self._check_domain(url)
+        )
+
+    async def _check_domain(self, url: str) -> None:
+        """The domain permission check ``_read_page`` makes, for a cached read —
+        raises if the domain is blocked or denied, or no browser is connected to
+        check against."""
+        connection = self._browse_provider() if self._browse_provider else None
+        if not connection:
+            raise ConnectionError(
+                "no browser is connected, so this domain's permission can't be confirmed; "
+                "answer from what you already know or tell the user the browser is offline"
+            )
+        _, permission_manager = connection
+        await permission_manager.check_domain(url)
+
     async def _read_page(self, url: str) -> BrowsePage:
         """Read a single URL via the browser extension, retrying with backoff on disconnect.
 
@@ -280,7 +390,7 @@ class BrowseTool(Tool):
                 raise
 
             title = self._parse_title(text)
-            text = clean_browser_content(text)
+            text = clean_browser_content(text, urllib.parse.urlsplit(url).hostname or "")
             return BrowsePage(text=text, image=image_url, title=title, url=url)
 
         raise ConnectionError("no browser connected")
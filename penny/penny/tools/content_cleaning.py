@@ -7,8 +7,16 @@ Patterns are grouped by source:
   - Kagi search result pages (proxy images, image grids, Openverse)
   - Cross-site (tracking pixels, JSON blobs, nav headers, long auth URLs)
 
-To find new patterns: check the logs for large browse_url results, compare
-the raw and cleaned sizes, and look for repetitive non-content lines.
+Every rule is one alternative of a single compiled line classifier
+(``_line_kind``), so the cleaner makes one pass over the page with one regex
+match per line — pages run to hundreds of KB and the cleaner runs on the
+event loop, once per page in a parallel browse.  Blank-line runs are
+collapsed in the same pass.
+
+``domain_ratios`` keeps running raw → cleaned byte totals per domain; a
+domain whose ratio stays near 1.0 on bulky pages is where to look for new
+patterns (``tests/eval/test_content_cleaning_bench.py`` prints the same
+table over a saved corpus of raw pages).
 """
 
 from __future__ import annotations
@@ -20,31 +28,31 @@ logger = logging.getLogger(__name__)
 
 # ── Kagi-specific ─────────────────────────────────────────────────────────
 
-# Kagi image grid section starts with [Images] or [Videos] links
-_KAGI_IMAGE_VIDEO_HEADER = re.compile(r"^\[(Images|Videos)]\(https://kagi\.com/")
-
-# Bare domain attribution under Kagi thumbnail images: [www.example.com](https://...)
-_KAGI_DOMAIN_ATTRIBUTION = re.compile(r"^\[www\.\S+]\(https://")
-
 # Openverse metadata labels in the Kagi image lightbox
 _KAGI_METADATA_LABELS = frozenset({"Size", "Type", "Uploaded", "Aspect"})
 
-# ── Cross-site ────────────────────────────────────────────────────────────
-
-# Empty markdown links with no display text: [](https://...)
-_EMPTY_LINK = re.compile(r"^\[]\(https?://")
-
-# Image dimension lines: "1920 x 1080", "980 x 980"
-_DIMENSIONS = re.compile(r"^\d{2,5}\s*x\s*\d{2,5}$")
-
-# Tracking pixel images (Amazon, analytics, etc.)
-_TRACKING_PIXEL = re.compile(r"!\[.*?]\(https?://[^\)]*transparent-pixel[^\)]*\)")
+_KAGI_CRUFT = (
+    # Favicons beside each result
+    r"!\[Favicon",
+    # Proxied thumbnails, bare or wrapped in a link
+    r"\[?!\[]\(https://p\.kagi\.com/proxy/",
+    # Bare domain attribution under thumbnails: [www.example.com](https://...)
+    r"\[www\.\S+]\(https://",
+    # Image lightbox actions and Openverse licensing chrome
+    r"\[(?:View Image|Download|Visit Page)]",
+    r"Report to \[OpenVerse]",
+)
 
-# Inline JSON blobs (Amazon pricing, structured data) — line is >{...}<
-_JSON_BLOB = re.compile(r'^["\']?\{".{50,}\}["\']?$')
+# Openverse licensing chrome matched anywhere in a line.  An unanchored rule
+# costs a scan of every line, so it's only armed when the page contains one.
+_KAGI_SUBSTRINGS = (
+    "Made with [Openverse]",
+    "Upload time and",
+    "Loading source...",
+    "Loading license...",
+)
 
-# Links where the URL portion exceeds 300 chars (auth/signin, tracking)
-_LONG_URL_LINK = re.compile(r"^\[.*?\]\((https?://[^\)]{300,})\)$")
+# ── Cross-site ────────────────────────────────────────────────────────────
 
 # Navigation boilerplate lines
 _NAV_BOILERPLATE = frozenset(
@@ -61,102 +69,132 @@ _NAV_BOILERPLATE = frozenset(
     }
 )
 
-# Repeated category label pattern from listing pages
-# e.g. "NewsCategory: News.|TechnologyCategory: Technology."
-_CATEGORY_LABELS = re.compile(r"^(\w+Category:\s*\w+\.\|?){2,}$")
+_CROSS_SITE_CRUFT = (
+    # Empty markdown links with no display text: [](https://...)
+    r"\[]\(https?://",
+    # Image dimension lines: "1920 x 1080", "980 x 980"
+    r"\d{2,5}\s*x\s*\d{2,5}\Z",
+    # Tracking pixel images (Amazon, analytics, etc.)
+    r"!\[.*?]\(https?://[^\)]*transparent-pixel[^\)]*\)",
+    # Inline JSON blobs (Amazon pricing, structured data) — line is >{...}<
+    r"[\"']?\{\".{50,}\}[\"']?\Z",
+    # Links where the URL portion exceeds 300 chars (auth/signin, tracking)
+    r"\[.*?\]\(https?://[^\)]{300,}\)\Z",
+    # Repeated category labels from listing pages
+    # e.g. "NewsCategory: News.|TechnologyCategory: Technology."
+    r"(?:\w+Category:\s*\w+\.\|?){2,}\Z",
+)
+
 
+def _exact(lines: frozenset[str]) -> str:
+    return "(?:" + "|".join(re.escape(line) for line in sorted(lines)) + r")\Z"
 
-def clean_browser_content(text: str) -> str:
-    """Remove structural cruft from browser-extracted markdown content."""
-    lines = text.split("\n")
-    cleaned: list[str] = []
-    skipping_kagi_images = False
 
-    for line in lines:
-        stripped = line.strip()
+def _line_kind(*cruft: str) -> re.Pattern[str]:
+    """The line classifier: one match per stripped line says what it is.
+    Alternatives are tried in order, so cruft wins over what follows.
+
+    - ``cruft``    drop the line
+    - ``grid``     a Kagi [Images]/[Videos] grid starts — drop until the next result
+    - ``heading``  a "### " result heading — ends a grid
+    """
+    return re.compile(
+        f"(?P<cruft>{'|'.join(cruft)})"
+        r"|(?P<grid>\[(?:Images|Videos)]\(https://kagi\.com/)"
+        r"|(?P<heading>### )"
+    )
+
+
+_CRUFT = (
+    *_KAGI_CRUFT,
+    _exact(_KAGI_METADATA_LABELS),
+    *_CROSS_SITE_CRUFT,
+    _exact(_NAV_BOILERPLATE),
+)
+_LINE_KIND = _line_kind(*_CRUFT)
+_LINE_KIND_WITH_SUBSTRINGS = _line_kind(
+    *_CRUFT, ".*?(?:" + "|".join(re.escape(s) for s in _KAGI_SUBSTRINGS) + ")"
+)
 
-        if _should_skip_line(stripped):
-            continue
 
-        # Kagi image/video grid — skip everything until next search result
-        if _KAGI_IMAGE_VIDEO_HEADER.match(stripped):
-            skipping_kagi_images = True
+class DomainRatios:
+    """Running raw → cleaned byte totals per domain."""
+
+    def __init__(self) -> None:
+        self._bytes: dict[str, tuple[int, int]] = {}
+
+    def record(self, domain: str, raw: int, cleaned: int) -> float:
+        """Add one page's sizes; returns the domain's running ratio."""
+        raw_total, cleaned_total = self._bytes.get(domain, (0, 0))
+        self._bytes[domain] = (raw_total + raw, cleaned_total + cleaned)
+        return self.ratio(domain)
+
+    def ratio(self, domain: str) -> float:
+        """Cleaned ÷ raw bytes for ``domain`` — 1.0 means nothing was removed."""
+        raw, cleaned = self._bytes.get(domain, (0, 0))
+        return cleaned / raw if raw else 1.0
+
+    def table(self) -> list[tuple[str, int, int, float]]:
+        """``(domain, raw bytes, cleaned bytes, ratio)``, most raw bytes first."""
+        return sorted(
+            (
+                (domain, raw, cleaned, self.ratio(domain))
+                for domain, (raw, cleaned) in self._bytes.items()
+            ),
+            key=lambda row: -row[1],
+        )
+
+
+domain_ratios = DomainRatios()
+
+
+def clean_browser_content(text: str, domain: str = "") -> str:
+    """Remove structural cruft from browser-extracted markdown content.
+
+    ``domain`` (the page's host) keys the ``domain_ratios`` accounting."""
+    line_kind = _LINE_KIND
+    if any(substring in text for substring in _KAGI_SUBSTRINGS):
+        line_kind = _LINE_KIND_WITH_SUBSTRINGS
+    cleaned: list[str] = []
+    skipping_grid = False
+    blank_run = 0
+
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if not stripped:
+            # Collapse runs of blank lines to one
+            if blank_run == 0 and not skipping_grid:
+                cleaned.append("")
+            blank_run += 1
             continue
 
-        if skipping_kagi_images:
-            if stripped.startswith("### ") or stripped.startswith("![Favicon"):
-                skipping_kagi_images = False
-                if stripped.startswith("![Favicon"):
-                    continue
-            else:
+        kind = line_kind.match(stripped)
+        if kind is not None:
+            if kind.lastgroup == "cruft":
                 continue
+            if kind.lastgroup == "grid":
+                skipping_grid = True
+                continue
+            skipping_grid = False
+        elif skipping_grid:
+            continue
 
         cleaned.append(line)
+        blank_run = 0
 
     result = "\n".join(cleaned)
-    # Collapse runs of 3+ blank lines
-    result = re.sub(r"\n{3,}", "\n\n", result)
 
-    removed = len(text) - len(result)
-    if removed > 0:
+    raw_bytes = len(text.encode())
+    cleaned_bytes = len(result.encode())
+    ratio = domain_ratios.record(domain, raw_bytes, cleaned_bytes)
+    if cleaned_bytes < raw_bytes:
         logger.debug(
-            "content_cleaning: %d -> %d chars (removed %d, %.0f%%)",
-            len(text),
-            len(result),
-            removed,
-            removed / len(text) * 100,
+            "content_cleaning: %s %d -> %d bytes (%.0f%% kept; %.0f%% across the domain)",
+            domain or "(unknown)",
+            raw_bytes,
+            cleaned_bytes,
+            cleaned_bytes / raw_bytes * 100,
+            ratio * 100,
         )
 
     return result
-
-
-def _should_skip_line(stripped: str) -> bool:
-    """Return True if this line is structural cruft that should be removed."""
-    # ── Kagi-specific ──
-    if stripped.startswith("![Favicon"):
-        return True
-    if stripped.startswith(("[![](https://p.kagi.com/proxy/", "![](https://p.kagi.com/proxy/")):
-        return True
-    if _KAGI_DOMAIN_ATTRIBUTION.match(stripped):
-        return True
-    if stripped in _KAGI_METADATA_LABELS:
-        return True
-    if "Made with [Openverse]" in stripped:
-        return True
-    if "Upload time and" in stripped:
-        return True
-    if stripped.startswith(("[View Image]", "[Download]", "[Visit Page]")):
-        return True
-    if "Loading source..." in stripped or "Loading license..." in stripped:
-        return True
-    if stripped.startswith("Report to [OpenVerse]"):
-        return True
-
-    # ── Cross-site ──
-
-    # Empty links
-    if _EMPTY_LINK.match(stripped):
-        return True
-
-    # Image dimension lines
-    if _DIMENSIONS.match(stripped):
-        return True
-
-    # Tracking pixel images
-    if _TRACKING_PIXEL.match(stripped):
-        return True
-
-    # Inline JSON blobs
-    if _JSON_BLOB.match(stripped):
-        return True
-
-    # Links with extremely long URLs (auth/signin/tracking)
-    if _LONG_URL_LINK.match(stripped):
-        return True
-
-    # Navigation boilerplate
-    if stripped in _NAV_BOILERPLATE:
-        return True
-
-    # Repeated category labels from listing pages
-    return bool(_CATEGORY_LABELS.match(stripped))
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Annotated, Any
 
 from pydantic import AfterValidator, BaseModel, Field, field_validator, model_validator
@@ -112,12 +113,15 @@ class BrowsePage(BaseModel):
 
     Carries the page image (a base64 ``data:`` URI), source URL, and title out
     to the tool's media-capture step; none of these reach the model.
+    ``cached_at`` is set when the page cache answered instead of the browser —
+    the page was already logged and its media stored, and the section says so.
     """
 
     text: str
     image: str | None = None
     title: str | None = None
     url: str | None = None
+    cached_at: datetime | None = None
 
 
 class BrowseArgs(BaseModel):
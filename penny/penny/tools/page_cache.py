@@ -0,0 +1,204 @@
+"""Browse page cache — reuse recent reads instead of re-driving the browser.
+
+A browse read round-trips through the browser extension: the slowest tool
+in the system (``BROWSE_REQUEST_TIMEOUT`` per attempt, retried).  Collectors
+and chat often read the same page or run the same search minutes apart, so
+``PageCache`` sits in front of ``BrowseTool._read_page``:
+
+- **Keys.**  Page reads are keyed by the normalized URL (``page_key``: case
+  of scheme and host, default ports, fragments, tracking params and query
+  order don't split the entry); searches by the normalized query text
+  (``search_key``), independent of the search engine's URL.
+- **TTLs per kind.**  ``BROWSE_CACHE_PAGE_TTL_SECONDS`` and
+  ``BROWSE_CACHE_SEARCH_TTL_SECONDS`` — search results go stale sooner than
+  pages.  0 turns that kind off.
+- **Two tiers.**  An in-process LRU of ``BROWSE_CACHE_MAX_ENTRIES`` reads,
+  then — for pages — the ``browse-results`` log, which already holds every
+  page read as its own entry and survives restarts.
+- **Singleflight.**  Concurrent reads of one key share a single in-flight
+  request; the read runs shielded, so one caller timing out doesn't cancel
+  it for the others.
+- **Permission still applies.**  A read served from either tier or joined
+  in flight first passes the caller's ``authorize`` (the domain permission
+  check), so a domain denied since it was cached is not served from cache.
+
+``hits`` / ``shared`` / ``misses`` count how reads were served;
+``round_trips_saved`` and ``hit_rate`` summarise them in the hit log line.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import urllib.parse
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+from penny.constants import PennyConstants
+from penny.tools.models import BrowsePage
+
+if TYPE_CHECKING:
+    from penny.config_params import RuntimeParams
+    from penny.database import Database
+
+logger = logging.getLogger(__name__)
+
+_PAGE_PREFIX = "page:"
+_SEARCH_PREFIX = "search:"
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "ref_src"})
+
+
+def page_key(url: str) -> str:
+    """Cache key for a page read — the URL with cosmetic differences removed."""
+    parts = urllib.parse.urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port is not None and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = urllib.parse.urlencode(
+        sorted(
+            (name, value)
+            for name, value in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+            if not name.startswith("utm_") and name not in _TRACKING_PARAMS
+        )
+    )
+    path = parts.path.rstrip("/") or "/"
+    return _PAGE_PREFIX + urllib.parse.urlunsplit((scheme, host, path, query, ""))
+
+
+def search_key(query: str) -> str:
+    """Cache key for a search — the query, case- and whitespace-folded."""
+    return _SEARCH_PREFIX + " ".join(query.lower().split())
+
+
+class PageCache:
+    """Recent browse reads, shared by every agent's ``BrowseTool``."""
+
+    def __init__(
+        self,
+        runtime: RuntimeParams,
+        db: Database | None = None,
+        max_entries: int = PennyConstants.BROWSE_CACHE_MAX_ENTRIES,
+    ) -> None:
+        self._runtime = runtime
+        self._db = db
+        self._max_entries = max_entries
+        # key → (when it was read, page), least recently used first
+        self._pages: OrderedDict[str, tuple[datetime, BrowsePage]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Future[BrowsePage]] = {}
+        self.hits = 0
+        self.shared = 0
+        self.misses = 0
+
+    @property
+    def round_trips_saved(self) -> int:
+        """Reads answered without a browser request of their own."""
+        return self.hits + self.shared
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.round_trips_saved + self.misses
+        return self.round_trips_saved / total if total else 0.0
+
+    async def read(
+        self,
+        key: str,
+        url: str,
+        fetch: Callable[[], Awaitable[BrowsePage]],
+        authorize: Callable[[], Awaitable[None]],
+    ) -> BrowsePage:
+        """The page for ``key`` — cached while fresh, else joined onto an
+        in-flight read of the same key, else ``fetch``ed.  Only the caller
+        that fetched gets a page without ``cached_at``, so only it logs the
+        page.  ``url`` is the address actually read, for the log tier.
+
+        ``authorize`` runs before any page is served without a fetch of its
+        own and raises to refuse it; ``fetch`` does its own check."""
+        ttl = self._ttl_seconds(key)
+        if ttl <= 0:
+            return await fetch()
+        since = datetime.now(UTC) - timedelta(seconds=ttl)
+        cached = self._get_memory(key, since) or self._get_logged(key, url, since)
+        if cached is not None:
+            await authorize()
+            self.hits += 1
+            self._log_saved("hit", key)
+            return cached
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            await authorize()
+            self.shared += 1
+            self._log_saved("joined in-flight read", key)
+            page = await asyncio.shield(inflight)
+            return page.model_copy(update={"cached_at": datetime.now(UTC)})
+        self.misses += 1
+        task = asyncio.ensure_future(self._fetch_and_store(key, fetch))
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._settle(key, done))
+        return await asyncio.shield(task)
+
+    def _ttl_seconds(self, key: str) -> int:
+        if key.startswith(_SEARCH_PREFIX):
+            return int(self._runtime.BROWSE_CACHE_SEARCH_TTL_SECONDS)
+        return int(self._runtime.BROWSE_CACHE_PAGE_TTL_SECONDS)
+
+    async def _fetch_and_store(
+        self, key: str, fetch: Callable[[], Awaitable[BrowsePage]]
+    ) -> BrowsePage:
+        page = await fetch()
+        self._remember(key, datetime.now(UTC), page)
+        return page
+
+    def _settle(self, key: str, done: asyncio.Future[BrowsePage]) -> None:
+        """Drop a finished read from the in-flight table.  Retrieving its
+        exception keeps a failure every caller abandoned from being reported
+        as never retrieved; callers still awaiting it get it raised."""
+        self._inflight.pop(key, None)
+        if not done.cancelled():
+            done.exception()
+
+    def _get_memory(self, key: str, since: datetime) -> BrowsePage | None:
+        entry = self._pages.get(key)
+        if entry is None:
+            return None
+        read_at, page = entry
+        if read_at < since:
+            del self._pages[key]
+            return None
+        self._pages.move_to_end(key)
+        return page.model_copy(update={"cached_at": read_at})
+
+    def _get_logged(self, key: str, url: str, since: datetime) -> BrowsePage | None:
+        """A page read still in ``browse-results`` — each entry is the
+        ``## browse: <url>`` section the tool assembled, so the text after its
+        header line is the cleaned page.  Searches aren't logged there."""
+        if self._db is None or not key.startswith(_PAGE_PREFIX):
+            return None
+        header = f"{PennyConstants.BROWSE_PAGE_HEADER}{url}\n"
+        entry = self._db.memories.latest_entry_with_prefix(
+            PennyConstants.MEMORY_BROWSE_RESULTS_LOG, header, since
+        )
+        if entry is None:
+            return None
+        read_at = entry.created_at.replace(tzinfo=UTC)
+        page = BrowsePage(text=entry.content[len(header) :], url=url)
+        self._remember(key, read_at, page)
+        return page.model_copy(update={"cached_at": read_at})
+
+    def _remember(self, key: str, read_at: datetime, page: BrowsePage) -> None:
+        self._pages[key] = (read_at, page)
+        self._pages.move_to_end(key)
+        while len(self._pages) > self._max_entries:
+            self._pages.popitem(last=False)
+
+    def _log_saved(self, how: str, key: str) -> None:
+        logger.info(
+            "Browse cache %s for %s — %d browser round trip(s) saved (%.0f%% of reads)",
+            how,
+            key,
+            self.round_trips_saved,
+            self.hit_rate * 100,
+        )
@@ -0,0 +1,101 @@
+"""Relevance-based chunk selection for long browsed pages.
+
+A cleaned article still runs to thousands of tokens, and the browse tool used
+to hand the whole thing to the model — long pages dominated prefill, and one
+embedding for the whole page blurred what it was about.  Pages over the
+``BROWSE_PAGE_TOKEN_BUDGET`` are split into paragraph-packed chunks
+(``split_chunks``), embedded in one batch with the lookup's anchors, and only
+the chunks closest to those anchors are shown, in page order, up to the
+budget (``select_chunks``).  The tool logs every chunk as its own embedded
+``browse-passages`` entry, so similarity reads address paragraphs rather
+than pages; ``browse-results`` keeps the whole page for the knowledge
+extractor.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from penny.constants import PennyConstants
+
+# Marks where selected chunks skip over part of the page.
+CHUNK_GAP = "\n\n[…]\n\n"
+
+
+def split_chunks(text: str, target_chars: int = PennyConstants.BROWSE_CHUNK_CHARS) -> list[str]:
+    """Split ``text`` into chunks of about ``target_chars``.
+
+    Whole paragraphs are packed together; a paragraph longer than the target
+    is split at line breaks, and a single overlong line is cut hard."""
+    pieces: list[str] = []
+    for paragraph in (p.strip() for p in text.split("\n\n")):
+        if len(paragraph) <= target_chars:
+            if paragraph:
+                pieces.append(paragraph)
+            continue
+        for line in (line.strip() for line in paragraph.split("\n")):
+            pieces.extend(
+                line[start : start + target_chars] for start in range(0, len(line), target_chars)
+            )
+
+    chunks: list[str] = []
+    current = ""
+    for piece in pieces:
+        if current and len(current) + 2 + len(piece) > target_chars:
+            chunks.append(current)
+            current = piece
+        else:
+            current = f"{current}\n\n{piece}" if current else piece
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def select_chunks(
+    chunks: list[str],
+    chunk_vectors: list[list[float]] | None,
+    anchor_vectors: list[list[float]],
+    budget_chars: int,
+) -> list[int]:
+    """Indices of the chunks to show, in page order, within ``budget_chars``.
+
+    Chunks are taken best-first by their highest cosine to any anchor.  With
+    no vectors or no anchors there is nothing to rank by, so the page is
+    read from the top.  The first pick always fits, so a page never comes
+    back empty."""
+    order = list(range(len(chunks)))
+    if chunk_vectors and anchor_vectors:
+        matrix = _unit_rows(np.array(chunk_vectors, dtype=np.float32))
+        anchors = _unit_rows(np.array(anchor_vectors, dtype=np.float32))
+        relevance = (matrix @ anchors.T).max(axis=1)
+        order = [int(i) for i in np.argsort(-relevance, kind="stable")]
+
+    kept: list[int] = []
+    used = 0
+    for index in order:
+        size = len(chunks[index]) + len(CHUNK_GAP)
+        if kept and used + size > budget_chars:
+            continue
+        kept.append(index)
+        used += size
+    return sorted(kept)
+
+
+def join_chunks(chunks: list[str], kept: list[int]) -> str:
+    """The kept chunks in page order, with ``CHUNK_GAP`` wherever chunks were
+    skipped between them (or before the first / after the last)."""
+    parts: list[str] = []
+    previous = -1
+    for index in kept:
+        if index != previous + 1:
+            parts.append(CHUNK_GAP.strip())
+        parts.append(chunks[index])
+        previous = index
+    if kept and kept[-1] != len(chunks) - 1:
+        parts.append(CHUNK_GAP.strip())
+    return "\n\n".join(parts)
+
+
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1.0, norms)
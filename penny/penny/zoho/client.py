@@ -8,10 +8,9 @@ import time
 from datetime import UTC, datetime
 from typing import Any
 
-import httpx
-
 from penny.constants import PennyConstants
 from penny.html_utils import strip_html
+from penny.http_transport import HttpTransport, http_client
 from penny.jmap.models import EmailAddress, EmailDetail, EmailSummary
 from penny.zoho.models import ZohoAccount, ZohoFolder, ZohoSession
 
@@ -54,6 +53,7 @@ class ZohoClient:
         max_body_length: int,
         search_limit: int,
         list_limit: int,
+        transport: HttpTransport | None = None,
     ) -> None:
         self._client_id = client_id
         self._client_secret = client_secret
@@ -64,7 +64,7 @@ class ZohoClient:
         self._session: ZohoSession | None = None
         self._account: ZohoAccount | None = None
         self._folders: list[ZohoFolder] | None = None
-        self._http = httpx.AsyncClient(timeout=timeout)
+        self._http = http_client(transport, timeout=timeout)
 
     async def _ensure_access_token(self) -> str:
         """Ensure we have a valid access token, refreshing if needed."""